@@ -9,12 +9,12 @@
 # =============================================================================
 
 import asyncio
+import logging
 import os
 from pathlib import Path
 import signal
 import sys
 import time
-import traceback
 from typing import Optional
 
 import psutil
@@ -46,12 +46,17 @@ from src.core.webhook_logger import ModernWebhookLogger
 from src.data.models import PlaybackMode
 
 # Import modern services
-from src.services.audio_service import AudioService
+from src.services.audio_service import AudioService, PlaybackStatus
 from src.services.metadata_cache import MetadataCache
 from src.services.state_service import StateService
 from src.utils.control_panel import setup_control_panel
 from src.utils.daily_verses import setup_daily_verses
+from src.utils.panel_roles import PanelRoleReconciler
+from src.utils.playback_clock import get_heartbeat
 from src.utils.rich_presence import RichPresenceManager
+from src.utils.scheduler import get_event_scheduler
+from src.utils.shuffle_playlist import ShuffleMode
+from src.utils.startup_orchestrator import StartupOrchestrator
 from src.utils.surah_mapper import get_surah_info
 
 # Import tree logging for compatibility
@@ -78,293 +83,126 @@ class AudioServiceAdapter:
     This adapter bridges the gap by providing the expected interface.
     """
 
-    def __init__(self, audio_service: AudioService):
+    def __init__(self, audio_service: AudioService, logger: StructuredLogger):
         self.audio_service = audio_service
+        self.logger = logger
 
-    def get_playback_status(self) -> dict:
+    async def _debug(self, message: str, context: dict | None = None):
+        """Debug trace, skipped unless the logger is at DEBUG level."""
+        if self.logger.is_enabled_for(logging.DEBUG):
+            await self.logger.debug(message, context)
+
+    def get_playback_status(self) -> PlaybackStatus:
         """Get playback status in the format expected by the control panel."""
         try:
-            print("[DEBUG] AudioServiceAdapter.get_playback_status called")
-
-            # Can't use asyncio.run() within Discord's event loop, so access internal state directly
-            # but make sure we get the most recent state
-            state = self.audio_service._current_state
-
-            # Force refresh the state by calling the internal update method if available
-            try:
-                if hasattr(self.audio_service, "_update_playback_state"):
-                    self.audio_service._update_playback_state()
-                elif hasattr(self.audio_service, "update_position"):
-                    self.audio_service.update_position()
-            except:
-                pass  # Continue with existing state if update fails
-
-            print(f"[DEBUG] Got state: {state}")
-
-            if not state:
-                print("[DEBUG] No state found, returning defaults")
-                return self._get_default_status()
-
-            # Get available reciters from the audio service
-            available_reciters = []
-            try:
-                reciters_info = self.audio_service._available_reciters
-                available_reciters = (
-                    [r.name for r in reciters_info]
-                    if reciters_info
-                    else ["Saad Al Ghamdi"]
-                )
-                print(f"[DEBUG] Found reciters: {available_reciters}")
-            except:
-                available_reciters = ["Saad Al Ghamdi"]
-
-            # Get current time and total time
-            current_time = (
-                getattr(getattr(state, "current_position", None), "position_seconds", 0)
-                if hasattr(state, "current_position")
-                else 0
-            )
-            total_time = (
-                getattr(
-                    getattr(state, "current_position", None), "total_duration", None
-                )
-                or 0
-                if hasattr(state, "current_position")
-                else 0
-            )
-
-            # If total_time is 0, try to get from cache
-            if total_time == 0:
-                print("[DEBUG] Total time is 0, trying to get from cache...")
-                try:
-                    current_surah = getattr(
-                        getattr(state, "current_position", None), "surah_number", 1
-                    )
-                    current_reciter = getattr(
-                        state, "current_reciter", "Saad Al Ghamdi"
-                    )
-
-                    # Build file path
-                    file_path = f"audio/{current_reciter}/{current_surah:03d}.mp3"
-                    print(f"[DEBUG] Looking for file: {file_path}")
-
-                    # Try to access cache directly from the audio service
-                    cache_service = getattr(self.audio_service, "_cache", None)
-
-                    if cache_service and hasattr(cache_service, "get"):
-                        cache_key = f"duration_{file_path}"
-                        try:
-                            cached_duration = cache_service.get(cache_key)
-                            if cached_duration:
-                                total_time = cached_duration
-                                print(f"[DEBUG] Got duration from cache: {total_time}s")
-                        except:
-                            pass
-
-                    # If no cache hit, try to read MP3 metadata directly
-                    if total_time == 0:
-                        from pathlib import Path
-
-                        full_path = Path(file_path)
-                        if full_path.exists():
-                            try:
-                                from mutagen.mp3 import MP3
-
-                                audio_file = MP3(str(full_path))
-                                total_time = audio_file.info.length
-                                print(f"[DEBUG] Got duration from MP3: {total_time}s")
-                            except Exception as e:
-                                print(f"[DEBUG] Error reading MP3: {e}")
-                                # Fallback: use some known durations for testing
-                                if current_surah == 1:
-                                    total_time = 47.0625  # Al-Fatiha
-                                elif current_surah == 2:
-                                    total_time = 7054.331125  # Al-Baqarah
-                                else:
-                                    total_time = 300  # Default 5 minutes
-                                print(f"[DEBUG] Using fallback duration: {total_time}s")
-                        else:
-                            print(f"[DEBUG] File not found: {full_path}")
-
-                except Exception as e:
-                    print(f"[DEBUG] Error getting duration: {e}")
-
-            # Convert AudioService state to control panel format
-            result = {
-                "is_playing": getattr(state, "is_playing", False),
-                "is_paused": getattr(state, "is_paused", False),
-                "current_surah": getattr(
-                    getattr(state, "current_position", None), "surah_number", 1
-                ),
-                "current_reciter": getattr(state, "current_reciter", "Saad Al Ghamdi"),
-                "is_loop_enabled": getattr(state, "mode", None) == "loop",
-                "is_shuffle_enabled": getattr(state, "mode", None) == "shuffle",
-                "current_track": getattr(
-                    getattr(state, "current_position", None), "surah_number", 1
-                ),
-                "total_tracks": 114,
-                "available_reciters": available_reciters,
-                "current_time": current_time,
-                "total_time": total_time,
-            }
-
-            print(f"[DEBUG] Returning result: {result}")
-            return result
-
+            # Precomputed by AudioService on state changes; no I/O per render
+            return self.audio_service.get_playback_status()
         except Exception as e:
-            print(f"[DEBUG] Error in get_playback_status: {e}")
-            traceback.print_exc()
+            log_error_with_traceback("Error getting playback status from AudioService", e)
             return self._get_default_status()
 
-    def _get_default_status(self) -> dict:
+    def _get_default_status(self) -> PlaybackStatus:
         """Return safe default status when AudioService is unavailable."""
-        return {
-            "is_playing": False,
-            "is_paused": False,
-            "current_surah": 1,
-            "current_reciter": "Saad Al Ghamdi",
-            "is_loop_enabled": False,
-            "is_shuffle_enabled": False,
-            "current_track": 1,
-            "total_tracks": 114,
-            "available_reciters": ["Saad Al Ghamdi"],
-            "current_time": 0,
-            "total_time": 0,
-        }
+        return PlaybackStatus(
+            is_playing=False,
+            is_paused=False,
+            current_surah=1,
+            current_reciter="Saad Al Ghamdi",
+            is_loop_enabled=False,
+            is_shuffle_enabled=False,
+            current_track=1,
+            total_tracks=114,
+            available_reciters=["Saad Al Ghamdi"],
+            current_time=0,
+            total_time=0,
+        )
 
     # Control methods expected by the control panel
     async def jump_to_surah(self, surah_number: int):
         """Jump to a specific surah."""
         try:
-            print(f"[DEBUG] AudioServiceAdapter.jump_to_surah({surah_number}) called")
             await self.audio_service.set_surah(surah_number)
-            print(f"[DEBUG] Successfully jumped to surah {surah_number}")
+            await self._debug("Adapter jumped to surah", {"surah": surah_number})
         except Exception as e:
-            print(f"[DEBUG] Error jumping to surah {surah_number}: {e}")
-            traceback.print_exc()
+            log_error_with_traceback(f"Error jumping to surah {surah_number}", e)
 
     async def switch_reciter(self, reciter_name: str):
         """Switch to a different reciter."""
         try:
-            print(f"[DEBUG] AudioServiceAdapter.switch_reciter({reciter_name}) called")
             await self.audio_service.set_reciter(reciter_name)
-            print(f"[DEBUG] Successfully switched to reciter {reciter_name}")
+            await self._debug("Adapter switched reciter", {"reciter": reciter_name})
         except Exception as e:
-            print(f"[DEBUG] Error switching to reciter {reciter_name}: {e}")
-            traceback.print_exc()
+            log_error_with_traceback(f"Error switching to reciter {reciter_name}", e)
 
     async def skip_to_next(self):
         """Skip to the next surah."""
         try:
-            print("[DEBUG] AudioServiceAdapter.skip_to_next() called")
-            current_state = self.audio_service._current_state
-            current_surah = getattr(
-                getattr(current_state, "current_position", None), "surah_number", 1
-            )
+            current_surah = self.get_playback_status()["current_surah"]
             next_surah = current_surah + 1 if current_surah < 114 else 1
             await self.audio_service.set_surah(next_surah)
-            print(f"[DEBUG] Successfully skipped to next surah {next_surah}")
+            await self._debug("Adapter skipped to next surah", {"surah": next_surah})
         except Exception as e:
-            print(f"[DEBUG] Error skipping to next: {e}")
-            traceback.print_exc()
+            log_error_with_traceback("Error skipping to next surah", e)
 
     async def skip_to_previous(self):
         """Skip to the previous surah."""
         try:
-            print("[DEBUG] AudioServiceAdapter.skip_to_previous() called")
-            current_state = self.audio_service._current_state
-            current_surah = getattr(
-                getattr(current_state, "current_position", None), "surah_number", 1
-            )
+            current_surah = self.get_playback_status()["current_surah"]
             previous_surah = current_surah - 1 if current_surah > 1 else 114
             await self.audio_service.set_surah(previous_surah)
-            print(f"[DEBUG] Successfully skipped to previous surah {previous_surah}")
+            await self._debug(
+                "Adapter skipped to previous surah", {"surah": previous_surah}
+            )
         except Exception as e:
-            print(f"[DEBUG] Error skipping to previous: {e}")
-            traceback.print_exc()
+            log_error_with_traceback("Error skipping to previous surah", e)
 
     def toggle_loop(self):
         """Toggle loop mode."""
         try:
-            print("[DEBUG] AudioServiceAdapter.toggle_loop() called")
-            current_state = self.audio_service._current_state
-            if current_state and hasattr(current_state, "mode"):
-                current_mode = getattr(current_state, "mode", "normal")
-                if current_mode == PlaybackMode.LOOP_TRACK:
-                    asyncio.create_task(
-                        self.audio_service.set_playback_mode(PlaybackMode.NORMAL)
-                    )
-                else:
-                    asyncio.create_task(
-                        self.audio_service.set_playback_mode(PlaybackMode.LOOP_TRACK)
-                    )
-            print("[DEBUG] Successfully toggled loop mode")
+            loop_enabled = self.get_playback_status()["is_loop_enabled"]
+            mode = PlaybackMode.NORMAL if loop_enabled else PlaybackMode.LOOP_TRACK
+            asyncio.create_task(self.audio_service.set_playback_mode(mode))
         except Exception as e:
-            print(f"[DEBUG] Error toggling loop: {e}")
-            traceback.print_exc()
+            log_error_with_traceback("Error toggling loop mode", e)
 
     def toggle_shuffle(self):
         """Toggle shuffle mode."""
         try:
-            print("[DEBUG] AudioServiceAdapter.toggle_shuffle() called")
-            current_state = self.audio_service._current_state
-            if current_state and hasattr(current_state, "mode"):
-                current_mode = getattr(current_state, "mode", "normal")
-                if current_mode == PlaybackMode.SHUFFLE:
-                    asyncio.create_task(
-                        self.audio_service.set_playback_mode(PlaybackMode.NORMAL)
-                    )
-                else:
-                    asyncio.create_task(
-                        self.audio_service.set_playback_mode(PlaybackMode.SHUFFLE)
-                    )
-            print("[DEBUG] Successfully toggled shuffle mode")
+            shuffle_enabled = self.get_playback_status()["is_shuffle_enabled"]
+            mode = PlaybackMode.NORMAL if shuffle_enabled else PlaybackMode.SHUFFLE
+            asyncio.create_task(self.audio_service.set_playback_mode(mode))
         except Exception as e:
-            print(f"[DEBUG] Error toggling shuffle: {e}")
-            traceback.print_exc()
+            log_error_with_traceback("Error toggling shuffle mode", e)
 
     async def pause_playback(self):
         """Pause audio playback."""
         try:
-            print("[DEBUG] AudioServiceAdapter.pause_playback() called")
             success = await self.audio_service.pause_playback()
-            if success:
-                print("[DEBUG] Successfully paused playback")
-            else:
-                print("[DEBUG] Nothing to pause")
+            await self._debug("Adapter pause requested", {"paused": success})
         except Exception as e:
-            print(f"[DEBUG] Error pausing playback: {e}")
-            traceback.print_exc()
+            log_error_with_traceback("Error pausing playback", e)
 
     async def resume_playback(self):
         """Resume audio playback."""
         try:
-            print("[DEBUG] AudioServiceAdapter.resume_playback() called")
             success = await self.audio_service.resume_playback()
-            if success:
-                print("[DEBUG] Successfully resumed playback")
-            else:
-                print("[DEBUG] Nothing to resume")
+            await self._debug("Adapter resume requested", {"resumed": success})
         except Exception as e:
-            print(f"[DEBUG] Error resuming playback: {e}")
-            traceback.print_exc()
+            log_error_with_traceback("Error resuming playback", e)
 
     async def toggle_playback(self):
         """Toggle play/pause state."""
         try:
-            print("[DEBUG] AudioServiceAdapter.toggle_playback() called")
-            state = self.audio_service._current_state
-            if state.is_playing:
+            status = self.get_playback_status()
+            if status["is_playing"]:
                 await self.pause_playback()
-            elif state.is_paused:
+            elif status["is_paused"]:
                 await self.resume_playback()
             else:
-                print("[DEBUG] Starting playback from stopped state")
                 await self.audio_service.start_playback(resume_position=True)
-                print("[DEBUG] Successfully started playback")
+                await self._debug("Adapter started playback from stopped state")
         except Exception as e:
-            print(f"[DEBUG] Error toggling playback: {e}")
-            traceback.print_exc()
+            log_error_with_traceback("Error toggling playback", e)
 
 
 class ModernizedQuranBot:
@@ -376,6 +214,7 @@ class ModernizedQuranBot:
         self.logger: StructuredLogger | None = None
         self.config: BotConfig | None = None
         self.config_service: ConfigService | None = None
+        self.panel_roles: PanelRoleReconciler | None = None
         self.is_running = False
         self._startup_start_time = time.time()
 
@@ -412,8 +251,8 @@ class ModernizedQuranBot:
             self.container.register_singleton(BotConfig, self.config)
             self.container.register_singleton(ConfigService, self.config_service)
 
-            # 3. Initialize core services
-            log_status("Initializing core services", "🛠️")
+            # 3. Configure core services
+            log_status("Configuring core services", "🛠️")
 
             # Structured Logger
             logger_factory = lambda: StructuredLogger(
@@ -466,7 +305,7 @@ class ModernizedQuranBot:
                         bot=self,
                     )
                     self.container.register_singleton(
-                        ModernWebhookLogger, webhook_factory
+                        ModernWebhookLogger, webhook_factory, optional=True
                     )
                     log_status("Webhook logger configured", "🔗")
                 else:
@@ -477,27 +316,10 @@ class ModernizedQuranBot:
                     {"error": str(e), "fallback": "Continuing without webhook logging"},
                 )
 
-            # Initialize all core services
-            await self.container.get(CacheService).initialize()
-            await self.container.get(PerformanceMonitor).initialize()
-            await self.container.get(ResourceManager).initialize()
-            # SecurityService initializes in constructor, no separate initialize() method
-
-            # Initialize webhook logger if available
-            try:
-                webhook_logger = self.container.get(ModernWebhookLogger)
-                if webhook_logger:
-                    await webhook_logger.initialize()
-                    log_status("Webhook logger initialized", "✅")
-            except Exception as e:
-                await self.logger.warning(
-                    "Webhook logger initialization failed", {"error": str(e)}
-                )
-
-            log_status("Core services initialized", "✅")
+            log_status("Core services configured", "✅")
 
-            # 4. Initialize modern services
-            log_status("Initializing modern services", "🎵")
+            # 4. Configure modern services
+            log_status("Configuring modern services", "🎵")
 
             # Create Discord bot first (needed for audio service)
             intents = discord.Intents.default()
@@ -525,6 +347,7 @@ class ModernizedQuranBot:
                 config=audio_config,
                 logger=self.logger,
                 metadata_cache=metadata_cache,
+                shuffle_mode=ShuffleMode(self.config.SHUFFLE_MODE),
             )
             self.container.register_singleton(AudioService, audio_factory)
 
@@ -536,11 +359,55 @@ class ModernizedQuranBot:
             )
             self.container.register_singleton(StateService, state_factory)
 
-            # Initialize modern services
-            await self.container.get(AudioService).initialize()
-            await self.container.get(StateService).initialize()
+            # Build every registered service once so wiring errors surface here
+            validation_started = time.perf_counter()
+            resolution_times = await self.container.validate()
+            validation_duration = time.perf_counter() - validation_started
+            for name, error in self.container.optional_failures.items():
+                await self.logger.warning(
+                    "Optional service unavailable",
+                    {
+                        "service": name,
+                        "error": error,
+                        "fallback": "Continuing without it",
+                    },
+                )
+            log_perfect_tree_section(
+                "Service Graph Validation",
+                [
+                    (name, f"{seconds * 1000:.1f}ms")
+                    for name, seconds in sorted(
+                        resolution_times.items(), key=lambda item: -item[1]
+                    )
+                ]
+                + [("total", f"{validation_duration * 1000:.1f}ms")],
+                "🔧",
+            )
 
-            log_status("Modern services initialized", "✅")
+            # Initialize services concurrently; each waits only for what it uses
+            startup = StartupOrchestrator("Service Startup")
+            startup.add("cache_service", self.container.get(CacheService).initialize)
+            startup.add(
+                "performance_monitor",
+                self.container.get(PerformanceMonitor).initialize,
+            )
+            startup.add(
+                "resource_manager", self.container.get(ResourceManager).initialize
+            )
+            # SecurityService initializes in constructor, no separate initialize() method
+            startup.add(
+                "webhook_logger", self._initialize_webhook_logger, critical=False
+            )
+            startup.add("state_service", self.container.get(StateService).initialize)
+            # AudioService restores the saved playback state from StateService
+            startup.add(
+                "audio_service",
+                self.container.get(AudioService).initialize,
+                depends_on=("state_service",),
+            )
+            await startup.run()
+
+            log_status("Core and modern services initialized", "✅")
 
             # 5. Initialize Rich Presence Manager
             log_status("Setting up Rich Presence", "🎮")
@@ -593,6 +460,18 @@ class ModernizedQuranBot:
             log_error_with_traceback("Detailed error", e)
             return False
 
+    async def _initialize_webhook_logger(self):
+        """Initialize the webhook logger if it is configured."""
+        try:
+            webhook_logger = self.container.get(ModernWebhookLogger)
+            if webhook_logger:
+                await webhook_logger.initialize()
+                log_status("Webhook logger initialized", "✅")
+        except Exception as e:
+            await self.logger.warning(
+                "Webhook logger initialization failed", {"error": str(e)}
+            )
+
     async def _setup_bot_events(self):
         """Set up Discord bot events with modern service integration."""
 
@@ -623,112 +502,129 @@ class ModernizedQuranBot:
                 ],
             )
 
-            # Send startup webhook notification
-            try:
-                webhook_logger = self.container.get(ModernWebhookLogger)
-                if webhook_logger and webhook_logger.initialized:
-                    # Update webhook logger's bot reference now that bot is ready and has user info
-                    webhook_logger.bot = self.bot
-                    webhook_logger.formatter.bot = self.bot
+            async def send_startup_webhook_phase():
+                try:
+                    webhook_logger = self.container.get(ModernWebhookLogger)
+                    if webhook_logger and webhook_logger.initialized:
+                        # Update webhook logger's bot reference now that bot is ready and has user info
+                        webhook_logger.bot = self.bot
+                        webhook_logger.formatter.bot = self.bot
                     
-                    # Debug: Log bot avatar info
-                    if self.bot.user and self.bot.user.avatar:
+                        # Debug: Log bot avatar info
+                        if self.bot.user and self.bot.user.avatar:
+                            await self.logger.info(
+                                "Webhook logger bot avatar updated",
+                                {
+                                    "bot_name": self.bot.user.name,
+                                    "avatar_url": self.bot.user.avatar.url,
+                                    "webhook_ready": "✅ Bot avatar available"
+                                }
+                            )
+                        else:
+                            await self.logger.warning(
+                                "Bot avatar not available for webhook",
+                                {"bot_user": str(self.bot.user) if self.bot.user else "None"}
+                            )
+
+                        await webhook_logger.log_bot_startup(
+                            version=BOT_VERSION,
+                            startup_duration=startup_duration,
+                            services_loaded=(
+                                len(self.container._singletons)
+                                if hasattr(self.container, "_singletons")
+                                else 0
+                            ),
+                            guild_count=len(self.bot.guilds),
+                        )
+                except Exception as e:
+                    await self.logger.warning(
+                        "Failed to send startup webhook", {"error": str(e)}
+                    )
+
+            async def setup_daily_verses_phase():
+                try:
+                    daily_verse_channel_id = self.config.DAILY_VERSE_CHANNEL_ID
+                    if daily_verse_channel_id:
+                        await setup_daily_verses(self.bot, daily_verse_channel_id)
                         await self.logger.info(
-                            "Webhook logger bot avatar updated",
-                            {
-                                "bot_name": self.bot.user.name,
-                                "avatar_url": self.bot.user.avatar.url,
-                                "webhook_ready": "✅ Bot avatar available"
-                            }
+                            "Daily verses system initialized",
+                            {"channel_id": daily_verse_channel_id},
                         )
                     else:
                         await self.logger.warning(
-                            "Bot avatar not available for webhook",
-                            {"bot_user": str(self.bot.user) if self.bot.user else "None"}
+                            "Daily verses system not initialized - channel ID not configured"
                         )
-
-                    await webhook_logger.log_bot_startup(
-                        version=BOT_VERSION,
-                        startup_duration=startup_duration,
-                        services_loaded=(
-                            len(self.container._singletons)
-                            if hasattr(self.container, "_singletons")
-                            else 0
-                        ),
-                        guild_count=len(self.bot.guilds),
+                except Exception as e:
+                    await self.logger.error(
+                        "Failed to initialize daily verses system", {"error": str(e)}
                     )
-            except Exception as e:
-                await self.logger.warning(
-                    "Failed to send startup webhook", {"error": str(e)}
-                )
 
-            # **START AUTOMATED AUDIO PLAYBACK IMMEDIATELY**
-            await self._start_automated_continuous_playback()
+            async def setup_quiz_phase():
+                try:
+                    daily_verse_channel_id = self.config.DAILY_VERSE_CHANNEL_ID
+                    if daily_verse_channel_id:
+                        from src.utils.quiz_manager import setup_quiz_system
+                        await setup_quiz_system(self.bot, daily_verse_channel_id)
+                        await self.logger.info(
+                            "Quiz system initialized",
+                            {"channel_id": daily_verse_channel_id},
+                        )
+                    else:
+                        await self.logger.warning(
+                            "Quiz system not initialized - channel ID not configured"
+                        )
+                except Exception as e:
+                    await self.logger.error(
+                        "Failed to initialize quiz system", {"error": str(e)}
+                    )
 
-            # Initialize daily verses system
-            try:
-                daily_verse_channel_id = self.config.DAILY_VERSE_CHANNEL_ID
-                if daily_verse_channel_id:
-                    await setup_daily_verses(self.bot, daily_verse_channel_id)
+            async def setup_prayer_notifications_phase():
+                try:
+                    from src.utils.mecca_prayer_times import (
+                        setup_mecca_prayer_notifications,
+                    )
+                    await setup_mecca_prayer_notifications(self.bot)
                     await self.logger.info(
-                        "Daily verses system initialized",
-                        {"channel_id": daily_verse_channel_id},
+                        "Mecca prayer notification system initialized",
+                        {"monitoring": "5 daily prayers in Holy City"},
                     )
-                else:
-                    await self.logger.warning(
-                        "Daily verses system not initialized - channel ID not configured"
+                except Exception as e:
+                    await self.logger.error(
+                        "Failed to initialize Mecca prayer notifications", {"error": str(e)}
                     )
-            except Exception as e:
-                await self.logger.error(
-                    "Failed to initialize daily verses system", {"error": str(e)}
-                )
 
-            # Initialize quiz system
-            try:
-                daily_verse_channel_id = self.config.DAILY_VERSE_CHANNEL_ID
-                if daily_verse_channel_id:
-                    from src.utils.quiz_manager import setup_quiz_system
-                    await setup_quiz_system(self.bot, daily_verse_channel_id)
+            async def setup_ai_listener_phase():
+                try:
+                    from src.utils.islamic_ai_listener import setup_islamic_ai_listener
+                    await setup_islamic_ai_listener(self.bot, self.container)
                     await self.logger.info(
-                        "Quiz system initialized",
-                        {"channel_id": daily_verse_channel_id},
+                        "Islamic AI mention listener initialized",
+                        {"trigger": "bot mentions", "model": "GPT-3.5 Turbo", "languages": "English + Arabic input", "rate_limit": "1 question/hour per user"},
                     )
-                else:
-                    await self.logger.warning(
-                        "Quiz system not initialized - channel ID not configured"
+                except Exception as e:
+                    await self.logger.error(
+                        "Failed to initialize Islamic AI listener", {"error": str(e)}
                     )
-            except Exception as e:
-                await self.logger.error(
-                    "Failed to initialize quiz system", {"error": str(e)}
-                )
 
-            # Initialize Mecca prayer notifications
-            try:
-                from src.utils.mecca_prayer_times import (
-                    setup_mecca_prayer_notifications,
-                )
-                await setup_mecca_prayer_notifications(self.bot)
-                await self.logger.info(
-                    "Mecca prayer notification system initialized",
-                    {"monitoring": "5 daily prayers in Holy City"},
-                )
-            except Exception as e:
-                await self.logger.error(
-                    "Failed to initialize Mecca prayer notifications", {"error": str(e)}
-                )
+            async def setup_panel_roles_phase():
+                self._get_panel_roles().start(self.bot)
 
-            # Initialize Islamic AI mention listener
-            try:
-                from src.utils.islamic_ai_listener import setup_islamic_ai_listener
-                await setup_islamic_ai_listener(self.bot, self.container)
-                await self.logger.info(
-                    "Islamic AI mention listener initialized",
-                    {"trigger": "bot mentions", "model": "GPT-3.5 Turbo", "languages": "English + Arabic input", "rate_limit": "1 question/hour per user"},
-                )
-            except Exception as e:
-                await self.logger.error(
-                    "Failed to initialize Islamic AI listener", {"error": str(e)}
-                )
+            # **START AUTOMATED AUDIO PLAYBACK IMMEDIATELY**
+            # Playback has no dependencies; the other systems set up alongside it
+            startup = StartupOrchestrator("Ready Startup")
+            startup.add("playback", self._start_automated_continuous_playback)
+            startup.add("startup_webhook", send_startup_webhook_phase, critical=False)
+            startup.add("daily_verses", setup_daily_verses_phase, critical=False)
+            # The quiz shares the daily verse channel and is set up after it
+            startup.add(
+                "quiz", setup_quiz_phase, depends_on=("daily_verses",), critical=False
+            )
+            startup.add(
+                "prayer_notifications", setup_prayer_notifications_phase, critical=False
+            )
+            startup.add("ai_listener", setup_ai_listener_phase, critical=False)
+            startup.add("panel_roles", setup_panel_roles_phase, critical=False)
+            await startup.run()
 
         @self.bot.event
         async def on_error(event, *args, **kwargs):
@@ -870,53 +766,22 @@ class ModernizedQuranBot:
                     {"member_id": member.id if member else "unknown", "error": str(e)},
                 )
 
+    def _get_panel_roles(self) -> PanelRoleReconciler:
+        """Get the panel access role reconciler, creating it on first use."""
+        if self.panel_roles is None:
+            self.panel_roles = PanelRoleReconciler(
+                self.config.PANEL_ACCESS_ROLE_ID or 0,
+                self.config_service.get_target_channel_id(),
+                assign=self._assign_panel_access_role,
+                remove=self._remove_panel_access_role,
+            )
+        return self.panel_roles
+
     async def _handle_voice_channel_roles(self, member, before, after, target_channel_id):
-        """Handle role assignment/removal for voice channel activity."""
+        """Queue a panel access role update for voice channel activity."""
         try:
-            # Skip role management for bots
-            if member.bot:
-                return
-
-            # Get panel access role ID from config
-            panel_access_role_id = self.config.PANEL_ACCESS_ROLE_ID
-            if not panel_access_role_id:
-                return  # Role management disabled
-
-            # Get the guild and role
-            guild = member.guild
-            if not guild:
-                return
-
-            panel_role = guild.get_role(panel_access_role_id)
-            if not panel_role:
-                await self.logger.warning(
-                    "Panel access role not found",
-                    {"role_id": panel_access_role_id, "guild_id": guild.id}
-                )
-                return
-
-            # Check if user joined a voice channel (wasn't in VC, now is)
-            if not before.channel and after.channel:
-                # Only assign role if they joined the Quran voice channel specifically
-                if after.channel.id == target_channel_id:
-                    await self._assign_panel_access_role(member, panel_role, after.channel)
-
-            # Check if user left all voice channels (was in VC, now isn't)
-            elif before.channel and not after.channel:
-                # Only remove role if they left the Quran voice channel
-                if before.channel.id == target_channel_id:
-                    await self._remove_panel_access_role(member, panel_role, before.channel)
-
-            # Check if user moved between voice channels
-            elif before.channel and after.channel and before.channel != after.channel:
-                # If they left the Quran voice channel, remove role
-                if before.channel.id == target_channel_id:
-                    await self._remove_panel_access_role(member, panel_role, before.channel)
-
-                # If they joined the Quran voice channel, assign role
-                if after.channel.id == target_channel_id:
-                    await self._assign_panel_access_role(member, panel_role, after.channel)
-
+            # Applied after a quiet period so channel flapping costs no role edits
+            self._get_panel_roles().note_voice_state(member, before, after)
         except Exception as e:
             await self.logger.error(
                 "Error in voice channel role management",
@@ -1074,6 +939,9 @@ class ModernizedQuranBot:
             # Start continuous 24/7 playback with resume
             await audio_service.start_playback(resume_position=True)
 
+            # Last-alive marker that bounds the resume position after a crash
+            get_heartbeat().start(get_event_scheduler())
+
             # Set up Control Panel after successful voice connection
             await self._setup_control_panel(voice_channel_id, guild_id)
 
@@ -1166,7 +1034,7 @@ class ModernizedQuranBot:
             audio_service = self.container.get(AudioService)
 
             # Create adapter for compatibility with control panel
-            audio_adapter = AudioServiceAdapter(audio_service)
+            audio_adapter = AudioServiceAdapter(audio_service, self.logger)
 
             # Set up control panel with the adapter
             await setup_control_panel(
@@ -1290,6 +1158,15 @@ class ModernizedQuranBot:
                 log_status("Disconnecting from Discord", "📡")
                 await self.bot.close()
 
+            # Stop scheduled jobs before the services they call into
+            try:
+                await get_event_scheduler().stop()
+            except Exception:
+                pass
+
+            if self.panel_roles:
+                await self.panel_roles.stop()
+
             # Shutdown services in reverse order
             if self.container:
                 log_status("Shutting down services", "🛠️")
@@ -19,7 +19,6 @@
 # =============================================================================
 
 import asyncio
-import glob
 import os
 import traceback
 from pathlib import Path
@@ -91,20 +90,27 @@ from src.utils.quiz_manager import setup_quiz_system
 from src.version import BOT_NAME, BOT_VERSION
 
 # =============================================================================
-# Import Audio Manager
+# Import Backup Manager
 # =============================================================================
-from utils.audio_manager import AudioManager
+from utils.backup_manager import start_backup_scheduler
 
 # =============================================================================
-# Import Backup Manager
+# Import Command Tree Sync
 # =============================================================================
-from utils.backup_manager import start_backup_scheduler
+from utils.command_sync import sync_command_tree
 
 # =============================================================================
 # Import Control Panel Manager
 # =============================================================================
 from utils.control_panel import setup_control_panel
 
+# =============================================================================
+# Import Guild Session Manager
+# =============================================================================
+from utils.guild_sessions import parse_session_configs, setup_session_manager
+from utils.playback_clock import get_heartbeat
+from utils.scheduler import get_event_scheduler
+
 # =============================================================================
 # Import Unified Discord Logger for VPS Monitoring (Webhook + Bot)
 # =============================================================================
@@ -115,16 +121,36 @@ from utils.unified_discord_logger import setup_unified_discord_logger, get_unifi
 # =============================================================================
 from utils.listening_stats import track_voice_join, track_voice_leave
 
+# =============================================================================
+# Import Panel Access Role Reconciler
+# =============================================================================
+from utils.panel_roles import PanelRoleReconciler
+
+# =============================================================================
+# Import Reciter Catalog
+# =============================================================================
+from utils.reciter_catalog import get_reciter_catalog
+
 # =============================================================================
 # Import Rich Presence Manager
 # =============================================================================
 from utils.rich_presence import RichPresenceManager, validate_rich_presence_dependencies
 
+# =============================================================================
+# Import Shuffle Modes
+# =============================================================================
+from utils.shuffle_playlist import ShuffleMode
+
 # =============================================================================
 # Import State Manager
 # =============================================================================
 from utils.state_manager import state_manager
 
+# =============================================================================
+# Import Startup Orchestrator
+# =============================================================================
+from utils.startup_orchestrator import StartupOrchestrator
+
 # =============================================================================
 # Import Surah Mapping Functions
 # =============================================================================
@@ -153,7 +179,8 @@ from utils.discord_api_monitor import initialize_discord_monitor, get_discord_mo
 # Global Managers
 # =============================================================================
 rich_presence = None
-audio_manager = None
+audio_manager = None  # Primary guild's session (GUILD_ID)
+session_manager = None
 
 
 class DiscordTreeHandler(logging.Handler):
@@ -516,6 +543,18 @@ AUDIO_FOLDER = "audio/Saad Al Ghamdi"
 DEFAULT_RECITER = os.getenv("DEFAULT_RECITER", "Saad Al Ghamdi")
 DEFAULT_SHUFFLE = os.getenv("DEFAULT_SHUFFLE", "false").lower() == "true"
 DEFAULT_LOOP = os.getenv("DEFAULT_LOOP", "false").lower() == "true"
+SHUFFLE_MODE = os.getenv("SHUFFLE_MODE", "uniform").lower()
+
+# Extra servers with their own session: guild:voice[:panel], comma separated
+GUILD_SESSIONS = os.getenv("GUILD_SESSIONS", "")
+
+# Voice channels in other servers that relay the primary stream (comma separated)
+LISTENER_CHANNEL_IDS_RAW = os.getenv("LISTENER_CHANNEL_IDS", "")
+LISTENER_CHANNEL_IDS = [
+    int(value)
+    for value in LISTENER_CHANNEL_IDS_RAW.split(",")
+    if value.strip().isdigit()
+]
 
 
 # =============================================================================
@@ -601,6 +640,23 @@ def validate_configuration():
         elif not isinstance(PANEL_ACCESS_ROLE_ID, int) or PANEL_ACCESS_ROLE_ID < 0:
             warnings.append("PANEL_ACCESS_ROLE_ID must be a positive integer")
 
+        try:
+            parse_session_configs(GUILD_SESSIONS)
+        except ValueError as e:
+            errors.append(str(e))
+
+        invalid_listeners = [
+            value.strip()
+            for value in LISTENER_CHANNEL_IDS_RAW.split(",")
+            if value.strip() and not value.strip().isdigit()
+        ]
+        if invalid_listeners:
+            warnings.append(
+                f"LISTENER_CHANNEL_IDS has invalid entries: {', '.join(invalid_listeners)}"
+            )
+        if TARGET_CHANNEL_ID in LISTENER_CHANNEL_IDS:
+            warnings.append("LISTENER_CHANNEL_IDS must not include TARGET_CHANNEL_ID")
+
         # =============================================================================
         # File System Validation
         # =============================================================================
@@ -613,7 +669,9 @@ def validate_configuration():
         else:
             # Check for audio files in the folder
             try:
-                audio_files = glob.glob(os.path.join(AUDIO_FOLDER, "*.mp3"))
+                audio_files = get_reciter_catalog(os.path.dirname(AUDIO_FOLDER)).get_files(
+                    os.path.basename(AUDIO_FOLDER)
+                )
                 if not audio_files:
                     warnings.append(f"No MP3 files found in '{AUDIO_FOLDER}'")
                 else:
@@ -695,6 +753,11 @@ def validate_configuration():
         if not isinstance(DEFAULT_LOOP, bool):
             warnings.append("DEFAULT_LOOP should be a boolean (true/false)")
 
+        if SHUFFLE_MODE not in {mode.value for mode in ShuffleMode}:
+            warnings.append(
+                "SHUFFLE_MODE should be uniform, weighted_by_duration or exclude_long"
+            )
+
         # =============================================================================
         # External Dependencies Validation
         # =============================================================================
@@ -784,7 +847,7 @@ async def on_ready():
         Various exceptions are caught and handled gracefully with appropriate
         logging and cleanup. Critical errors may cause bot shutdown.
     """
-    global rich_presence, audio_manager
+    global rich_presence, audio_manager, session_manager
 
     try:
         # =============================================================================
@@ -849,14 +912,28 @@ async def on_ready():
 
         # Initialize Audio Manager with environment defaults
         try:
-            audio_manager = AudioManager(
+            # Unknown SHUFFLE_MODE values were reported during validation
+            shuffle_mode = (
+                ShuffleMode(SHUFFLE_MODE)
+                if SHUFFLE_MODE in {mode.value for mode in ShuffleMode}
+                else ShuffleMode.UNIFORM
+            )
+
+            # Each guild gets its own session; GUILD_ID is the primary one
+            session_manager = setup_session_manager(
                 bot,
                 FFMPEG_PATH,
                 default_reciter=DEFAULT_RECITER,
                 default_shuffle=DEFAULT_SHUFFLE,
                 default_loop=DEFAULT_LOOP,
+                shuffle_mode=shuffle_mode,
+                primary_guild_id=GUILD_ID,
             )
+            audio_manager = session_manager.get_or_create_session(GUILD_ID).audio_manager
             audio_manager.set_rich_presence(rich_presence)
+            session_manager.start()
+            # Last-alive marker that bounds the resume position after a crash
+            get_heartbeat().start(get_event_scheduler())
             log_perfect_tree_section(
                 "Audio Manager Initialization",
                 [
@@ -864,6 +941,7 @@ async def on_ready():
                     ("ffmpeg_path", FFMPEG_PATH),
                     ("default_reciter", DEFAULT_RECITER),
                     ("default_shuffle", str(DEFAULT_SHUFFLE)),
+                    ("shuffle_mode", SHUFFLE_MODE),
                     ("default_loop", str(DEFAULT_LOOP)),
                     (
                         "rich_presence",
@@ -994,206 +1072,277 @@ async def on_ready():
                 # Control Panel Setup
                 # =============================================================================
                 # Set up control panel with AudioManager
-                if PANEL_CHANNEL_ID != 0:
-                    try:
-                        await setup_control_panel(bot, PANEL_CHANNEL_ID, audio_manager)
-                        log_perfect_tree_section(
-                            "Control Panel Setup",
-                            [
-                                ("status", "✅ Control panel setup successful"),
-                                ("panel_channel_id", str(PANEL_CHANNEL_ID)),
-                                ("audio_manager", "Connected"),
-                            ],
-                            "🎛️",
-                        )
-                    except Exception as e:
-                        log_error_with_traceback("Error setting up control panel", e)
-                        # Control panel failure is not critical, continue without it
-
-                # =============================================================================
-                # Commands Setup (Slash Commands Only)
-                # =============================================================================
-                # Set up slash commands - prefix commands are disabled
-                log_spacing()
-                log_perfect_tree_section(
-                    "Command System Setup",
-                    [
-                        ("status", "🔄 Setting up slash commands"),
-                        (
-                            "prefix_commands",
-                            "⚠️ Disabled (only work when bot is mentioned)",
-                        ),
-                        ("slash_commands", "✅ Enabled"),
-                    ],
-                    "⚡",
-                )
+                async def control_panel_phase():
+                    if PANEL_CHANNEL_ID != 0:
+                        try:
+                            await setup_control_panel(bot, PANEL_CHANNEL_ID, audio_manager)
+                            log_perfect_tree_section(
+                                "Control Panel Setup",
+                                [
+                                    ("status", "✅ Control panel setup successful"),
+                                    ("panel_channel_id", str(PANEL_CHANNEL_ID)),
+                                    ("audio_manager", "Connected"),
+                                ],
+                                "🎛️",
+                            )
+                        except Exception as e:
+                            log_error_with_traceback("Error setting up control panel", e)
+                            # Control panel failure is not critical, continue without it
 
                 # =============================================================================
                 # Daily Verses System Setup - MUST BE BEFORE COMMAND SETUP
                 # =============================================================================
-                log_spacing()
-                try:
-                    if DAILY_VERSE_CHANNEL_ID:
-                        await setup_daily_verses(bot, DAILY_VERSE_CHANNEL_ID)
-                        log_perfect_tree_section(
-                            "Daily Verses System",
-                            [
-                                ("status", "✅ Daily verses system started"),
-                                ("channel_id", str(DAILY_VERSE_CHANNEL_ID)),
-                                ("developer_id", str(DEVELOPER_ID)),
-                                ("schedule", "Every 3 hours"),
-                                ("features", "🤲 Auto dua reaction, bot thumbnail"),
-                            ],
-                            "📖",
-                        )
-                    else:
-                        missing_vars = []
-                        if not DAILY_VERSE_CHANNEL_ID:
-                            missing_vars.append("DAILY_VERSE_CHANNEL_ID")
-                        if not DEVELOPER_ID:
-                            missing_vars.append("DEVELOPER_ID")
+                async def daily_verses_phase():
+                    log_spacing()
+                    try:
+                        if DAILY_VERSE_CHANNEL_ID:
+                            await setup_daily_verses(bot, DAILY_VERSE_CHANNEL_ID)
+                            log_perfect_tree_section(
+                                "Daily Verses System",
+                                [
+                                    ("status", "✅ Daily verses system started"),
+                                    ("channel_id", str(DAILY_VERSE_CHANNEL_ID)),
+                                    ("developer_id", str(DEVELOPER_ID)),
+                                    ("schedule", "Every 3 hours"),
+                                    ("features", "🤲 Auto dua reaction, bot thumbnail"),
+                                ],
+                                "📖",
+                            )
+                        else:
+                            missing_vars = []
+                            if not DAILY_VERSE_CHANNEL_ID:
+                                missing_vars.append("DAILY_VERSE_CHANNEL_ID")
+                            if not DEVELOPER_ID:
+                                missing_vars.append("DEVELOPER_ID")
 
+                            log_perfect_tree_section(
+                                "Daily Verses System",
+                                [
+                                    ("status", "⚠️ Daily verses system disabled"),
+                                    ("missing_vars", ", ".join(missing_vars)),
+                                    ("impact", "No automated verse sending"),
+                                ],
+                                "⚠️",
+                            )
+                    except Exception as daily_verses_error:
+                        log_error_with_traceback(
+                            "Failed to start daily verses system", daily_verses_error
+                        )
                         log_perfect_tree_section(
-                            "Daily Verses System",
+                            "Daily Verses System Warning",
                             [
-                                ("status", "⚠️ Daily verses system disabled"),
-                                ("missing_vars", ", ".join(missing_vars)),
+                                ("status", "⚠️ Daily verses system failed to start"),
                                 ("impact", "No automated verse sending"),
+                                ("action", "Check logs for details"),
                             ],
                             "⚠️",
                         )
-                except Exception as daily_verses_error:
-                    log_error_with_traceback(
-                        "Failed to start daily verses system", daily_verses_error
-                    )
-                    log_perfect_tree_section(
-                        "Daily Verses System Warning",
-                        [
-                            ("status", "⚠️ Daily verses system failed to start"),
-                            ("impact", "No automated verse sending"),
-                            ("action", "Check logs for details"),
-                        ],
-                        "⚠️",
-                    )
 
                 # =============================================================================
                 # Quiz System Setup - MUST BE AFTER DAILY VERSES SETUP
                 # =============================================================================
-                log_spacing()
-                try:
-                    if DAILY_VERSE_CHANNEL_ID:
-                        await setup_quiz_system(bot, DAILY_VERSE_CHANNEL_ID)
-                        log_perfect_tree_section(
-                            "Quiz System",
-                            [
-                                ("status", "✅ Quiz system started"),
-                                ("channel_id", str(DAILY_VERSE_CHANNEL_ID)),
-                                ("developer_id", str(DEVELOPER_ID)),
-                                ("schedule", "Every 3 hours"),
-                                ("features", "🧠 Auto quiz reaction, bot thumbnail"),
-                            ],
-                            "🧠",
-                        )
-                    else:
-                        missing_vars = []
-                        if not DAILY_VERSE_CHANNEL_ID:
-                            missing_vars.append("DAILY_VERSE_CHANNEL_ID")
-                        if not DEVELOPER_ID:
-                            missing_vars.append("DEVELOPER_ID")
+                async def quiz_phase():
+                    log_spacing()
+                    try:
+                        if DAILY_VERSE_CHANNEL_ID:
+                            await setup_quiz_system(bot, DAILY_VERSE_CHANNEL_ID)
+                            log_perfect_tree_section(
+                                "Quiz System",
+                                [
+                                    ("status", "✅ Quiz system started"),
+                                    ("channel_id", str(DAILY_VERSE_CHANNEL_ID)),
+                                    ("developer_id", str(DEVELOPER_ID)),
+                                    ("schedule", "Every 3 hours"),
+                                    ("features", "🧠 Auto quiz reaction, bot thumbnail"),
+                                ],
+                                "🧠",
+                            )
+                        else:
+                            missing_vars = []
+                            if not DAILY_VERSE_CHANNEL_ID:
+                                missing_vars.append("DAILY_VERSE_CHANNEL_ID")
+                            if not DEVELOPER_ID:
+                                missing_vars.append("DEVELOPER_ID")
 
+                            log_perfect_tree_section(
+                                "Quiz System",
+                                [
+                                    ("status", "⚠️ Quiz system disabled"),
+                                    ("missing_vars", ", ".join(missing_vars)),
+                                    ("impact", "No automated quiz sending"),
+                                ],
+                                "⚠️",
+                            )
+                    except Exception as quiz_error:
+                        log_error_with_traceback("Failed to start quiz system", quiz_error)
                         log_perfect_tree_section(
-                            "Quiz System",
+                            "Quiz System Warning",
                             [
-                                ("status", "⚠️ Quiz system disabled"),
-                                ("missing_vars", ", ".join(missing_vars)),
+                                ("status", "⚠️ Quiz system failed to start"),
                                 ("impact", "No automated quiz sending"),
+                                ("action", "Check logs for details"),
                             ],
                             "⚠️",
                         )
-                except Exception as quiz_error:
-                    log_error_with_traceback("Failed to start quiz system", quiz_error)
-                    log_perfect_tree_section(
-                        "Quiz System Warning",
-                        [
-                            ("status", "⚠️ Quiz system failed to start"),
-                            ("impact", "No automated quiz sending"),
-                            ("action", "Check logs for details"),
-                        ],
-                        "⚠️",
-                    )
 
                 # =============================================================================
                 # Web Command Processor Setup
                 # =============================================================================
-                try:
-                    from src.utils.web_command_processor import initialize_web_command_processor
-                    web_processor = initialize_web_command_processor(bot)
-                    log_perfect_tree_section(
-                        "Web Command Processor",
-                        [
-                            ("status", "✅ Web command processor started"),
-                            ("queue_directory", "web/command_queue"),
-                            ("check_interval", "5 seconds"),
-                            ("features", "🌐 Web dashboard integration"),
-                        ],
-                        "🌐",
-                    )
-                except Exception as web_error:
-                    log_error_with_traceback("Failed to start web command processor", web_error)
-                    log_perfect_tree_section(
-                        "Web Command Processor Warning",
-                        [
-                            ("status", "⚠️ Web command processor failed to start"),
-                            ("impact", "Web dashboard controls may not work"),
-                            ("action", "Check logs for details"),
-                        ],
-                        "⚠️",
-                    )
+                async def web_commands_phase():
+                    try:
+                        from src.utils.web_command_processor import initialize_web_command_processor
+                        web_processor = initialize_web_command_processor(bot)
+                        log_perfect_tree_section(
+                            "Web Command Processor",
+                            [
+                                ("status", "✅ Web command processor started"),
+                                ("queue_directory", "web/command_queue"),
+                                ("intake", web_processor.intake_mode),
+                                ("features", "🌐 Web dashboard integration"),
+                            ],
+                            "🌐",
+                        )
+                    except Exception as web_error:
+                        log_error_with_traceback("Failed to start web command processor", web_error)
+                        log_perfect_tree_section(
+                            "Web Command Processor Warning",
+                            [
+                                ("status", "⚠️ Web command processor failed to start"),
+                                ("impact", "Web dashboard controls may not work"),
+                                ("action", "Check logs for details"),
+                            ],
+                            "⚠️",
+                        )
 
                 # =============================================================================
                 # Slash Commands Setup - MUST BE AFTER DAILY VERSES SETUP
                 # =============================================================================
-                log_spacing()
-                try:
-                    from src.commands import (
-                        setup_credits,
-                        setup_interval,
-                        setup_leaderboard,
-                        setup_question,
-                        setup_verse,
-                    )
-
-                    await setup_credits(bot)
-                    await setup_interval(bot)
-                    await setup_leaderboard(bot)
-                    await setup_question(bot)
-                    await setup_verse(bot)
-
-                    # Sync commands to Discord with force sync
-                    await bot.tree.sync()
+                # Set up slash commands - prefix commands are disabled
+                async def slash_commands_phase():
+                    log_spacing()
                     log_perfect_tree_section(
-                        "Slash Commands Sync",
+                        "Command System Setup",
                         [
-                            ("status", "✅ Slash commands synced successfully"),
+                            ("status", "🔄 Setting up slash commands"),
                             (
-                                "available_commands",
-                                "/credits, /interval, /leaderboard, /question, /verse",
+                                "prefix_commands",
+                                "⚠️ Disabled (only work when bot is mentioned)",
                             ),
-                            ("sync_method", "Discord Tree API"),
+                            ("slash_commands", "✅ Enabled"),
                         ],
                         "⚡",
                     )
 
-                except Exception as e:
-                    log_error_with_traceback("Error setting up slash commands", e)
-                    # Command setup failure is not critical, continue without them
+                    log_spacing()
+                    try:
+                        from src.commands import (
+                            setup_credits,
+                            setup_interval,
+                            setup_leaderboard,
+                            setup_question,
+                            setup_verse,
+                        )
+
+                        await setup_credits(bot)
+                        await setup_interval(bot)
+                        await setup_leaderboard(bot)
+                        await setup_question(bot)
+                        await setup_verse(bot)
+
+                        # Sync commands to Discord only if their definitions changed
+                        await sync_command_tree(bot.tree)
+                        log_perfect_tree_section(
+                            "Slash Commands Ready",
+                            [
+                                ("status", "✅ Slash commands registered"),
+                                (
+                                    "available_commands",
+                                    "/credits, /interval, /leaderboard, /question, /verse",
+                                ),
+                                ("sync_method", "Discord Tree API (hash-gated)"),
+                            ],
+                            "⚡",
+                        )
+
+                    except Exception as e:
+                        log_error_with_traceback("Error setting up slash commands", e)
+                        # Command setup failure is not critical, continue without them
+
+                # =============================================================================
+                # Startup Phases
+                # =============================================================================
+                # Playback starts as soon as the voice client is set; the panel,
+                # daily verses, quiz and commands set up alongside it
+                async def audio_playback_phase():
+                    await audio_manager.start_playback()
+
+                async def panel_roles_phase():
+                    panel_role_reconciler.start(bot)
+
+                async def guild_sessions_phase():
+                    configs = parse_session_configs(GUILD_SESSIONS)
+                    if configs:
+                        await session_manager.start_configured_sessions(configs)
+
+                async def listener_channels_phase():
+                    # A bot holds one voice connection per guild, so relays
+                    # must live in guilds without their own session
+                    for channel_id in LISTENER_CHANNEL_IDS:
+                        channel = bot.get_channel(channel_id)
+                        if not isinstance(channel, discord.VoiceChannel):
+                            log_warning_with_context(
+                                "Listener channel unavailable",
+                                f"{channel_id} is not a voice channel the bot can see",
+                            )
+                            continue
+                        if channel.guild.id == GUILD_ID or (
+                            session_manager
+                            and session_manager.get_session(channel.guild.id)
+                        ):
+                            log_warning_with_context(
+                                "Listener channel skipped",
+                                f"Guild {channel.guild.id} already has its own voice session",
+                            )
+                            continue
+                        try:
+                            voice_client = await channel.connect(
+                                reconnect=True, timeout=60
+                            )
+                            audio_manager.add_listener_client(voice_client)
+                        except Exception as e:
+                            log_error_with_traceback(
+                                f"Error connecting listener channel {channel_id}", e
+                            )
+
+                startup = StartupOrchestrator("Bot Startup")
+                startup.add("audio_playback", audio_playback_phase)
+                startup.add("control_panel", control_panel_phase, critical=False)
+                startup.add("daily_verses", daily_verses_phase, critical=False)
+                startup.add(
+                    "quiz", quiz_phase, depends_on=("daily_verses",), critical=False
+                )
+                startup.add("web_commands", web_commands_phase, critical=False)
+                startup.add("panel_roles", panel_roles_phase, critical=False)
+                startup.add("guild_sessions", guild_sessions_phase, critical=False)
+                startup.add(
+                    "listener_channels",
+                    listener_channels_phase,
+                    depends_on=("audio_playback", "guild_sessions"),
+                    critical=False,
+                )
+                startup.add(
+                    "slash_commands",
+                    slash_commands_phase,
+                    depends_on=("daily_verses",),
+                    critical=False,
+                )
 
                 # =============================================================================
                 # Audio Playback Initialization
                 # =============================================================================
-                # Start playing audio using AudioManager
+                # Run the startup phases; a playback failure triggers a retry
                 try:
-                    await audio_manager.start_playback()
+                    await startup.run()
                     
                     # Initialize Discord API Monitor
                     try:
@@ -1254,11 +1403,14 @@ async def on_ready():
                                     "schedule",
                                     "Every hour on EST clock (1:00, 2:00, etc.)",
                                 ),
-                                ("backup_format", "ZIP files with EST date/time names"),
-                                ("backup_location", "backup/ directory"),
+                                (
+                                    "backup_format",
+                                    "Incremental snapshots, unchanged files stored once",
+                                ),
+                                ("backup_location", "backup/snapshots/ directory"),
                                 (
                                     "data_protection",
-                                    "Enhanced with automated ZIP backups",
+                                    "Recent and daily snapshots kept, restorable by ID",
                                 ),
                             ],
                             "💾",
@@ -1665,7 +1817,9 @@ async def play_audio(voice_client):
 
     try:
         # Get all mp3 files and sort them
-        audio_files = sorted(glob.glob(os.path.join(AUDIO_FOLDER, "*.mp3")))
+        audio_files = get_reciter_catalog(os.path.dirname(AUDIO_FOLDER)).get_files(
+            os.path.basename(AUDIO_FOLDER)
+        )
 
         if not audio_files:
             log_perfect_tree_section(
@@ -1837,6 +1991,33 @@ async def on_voice_state_update(member, before, after):
     global rich_presence, audio_manager
 
     try:
+        # =============================================================================
+        # Other Guilds (Per-Guild Sessions)
+        # =============================================================================
+        event_channel = after.channel or before.channel
+        if (
+            member == bot.user
+            and audio_manager
+            and before.channel
+            and before.channel.id in LISTENER_CHANNEL_IDS
+            and not after.channel
+        ):
+            # A relay channel dropped its connection; stop feeding it
+            for listener in list(audio_manager.listener_clients):
+                if listener.channel and listener.channel.id == before.channel.id:
+                    audio_manager.remove_listener_client(listener)
+            return
+
+        if session_manager and event_channel and event_channel.guild.id != GUILD_ID:
+            if member == bot.user:
+                session = session_manager.get_session(event_channel.guild.id)
+                if session and before.channel and not after.channel:
+                    await session.audio_manager.stop_playback()
+            else:
+                # Lazily revive an evicted session when someone joins its channel
+                await session_manager.handle_voice_join(member, before, after)
+            return
+
         # =============================================================================
         # Bot Voice State Handling (Reconnection Logic)
         # =============================================================================
@@ -2296,49 +2477,8 @@ async def on_voice_state_update(member, before, after):
         # =============================================================================
         # Panel Access Role Management
         # =============================================================================
-
-        # Skip if panel access role management is disabled
-        if PANEL_ACCESS_ROLE_ID == 0:
-            return
-
-        # Get the panel access role
-        guild = member.guild
-        panel_role = guild.get_role(PANEL_ACCESS_ROLE_ID)
-
-        if not panel_role:
-            log_perfect_tree_section(
-                "Panel Access Role - Not Found",
-                [
-                    (
-                        "role_error",
-                        f"Panel access role {PANEL_ACCESS_ROLE_ID} not found",
-                    ),
-                ],
-                "❌",
-            )
-            return
-
-        # Check if user joined a voice channel (wasn't in VC, now is)
-        if not before.channel and after.channel:
-            # Only assign role if they joined the Quran voice channel specifically
-            if after.channel.id == TARGET_CHANNEL_ID:
-                await _assign_panel_access_role(member, panel_role, after.channel)
-
-        # Check if user left all voice channels (was in VC, now isn't)
-        elif before.channel and not after.channel:
-            # Only remove role if they left the Quran voice channel
-            if before.channel.id == TARGET_CHANNEL_ID:
-                await _remove_panel_access_role(member, panel_role, before.channel)
-
-        # Check if user moved between voice channels
-        elif before.channel and after.channel and before.channel != after.channel:
-            # If they left the Quran voice channel, remove role
-            if before.channel.id == TARGET_CHANNEL_ID:
-                await _remove_panel_access_role(member, panel_role, before.channel)
-
-            # If they joined the Quran voice channel, assign role
-            if after.channel.id == TARGET_CHANNEL_ID:
-                await _assign_panel_access_role(member, panel_role, after.channel)
+        # Debounced and rate limited; a no-op if PANEL_ACCESS_ROLE_ID is 0
+        panel_role_reconciler.note_voice_state(member, before, after)
 
     except Exception as e:
         log_discord_error("on_voice_state_update", e, GUILD_ID)
@@ -2600,6 +2740,15 @@ async def _remove_panel_access_role(member, panel_role, channel):
         )
 
 
+# Applies panel role changes after a quiet period, spacing the role edits
+panel_role_reconciler = PanelRoleReconciler(
+    PANEL_ACCESS_ROLE_ID,
+    TARGET_CHANNEL_ID,
+    assign=_assign_panel_access_role,
+    remove=_remove_panel_access_role,
+)
+
+
 # =============================================================================
 # Discord Error Event Handlers
 # =============================================================================
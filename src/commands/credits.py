@@ -13,6 +13,7 @@ from src.core.exceptions import DiscordAPIError, ServiceError, handle_errors
 from src.core.security import rate_limit
 from src.core.structured_logger import StructuredLogger
 from src.core.webhook_logger import ModernWebhookLogger
+from src.utils.interaction_middleware import fast_ack
 
 # Import tree logging functions
 from src.utils.tree_log import log_error_with_traceback, log_perfect_tree_section
@@ -43,6 +44,7 @@ class CreditsCog(commands.Cog):
         name="credits",
         description="🕌 Show bot information and credits",
     )
+    @fast_ack(ephemeral=False)
     @rate_limit(user_limit=3, user_window=30)  # 3 requests per 30 seconds per user
     @handle_errors(logger=None, reraise=False)
     async def credits(self, interaction: discord.Interaction):
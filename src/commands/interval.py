@@ -18,6 +18,8 @@ from src.core.security import rate_limit, require_admin, validate_input
 from src.utils import daily_verses
 from src.utils import quiz_manager as quiz_mgr
 from src.utils.discord_logger import get_discord_logger
+from src.utils.interaction_middleware import fast_ack
+from src.utils.scheduler import get_event_scheduler
 from src.utils.tree_log import log_error_with_traceback, log_perfect_tree_section
 
 
@@ -250,6 +252,7 @@ class IntervalCog(commands.Cog):
         name="interval",
         description="Adjust quiz and verse intervals with flexible time formats (Admin only)",
     )
+    @fast_ack()
     @app_commands.describe(
         quiz_time="Quiz interval (e.g., '30m', '2h', '1h30m', '90m')",
         verse_time="Verse interval (e.g., '3h', '2h30m', '180m')",
@@ -620,21 +623,34 @@ class IntervalCog(commands.Cog):
                     )
 
                 # Add next scheduled times
+                # The event scheduler has already moved both jobs to their
+                # new deadlines, so report those when available
                 try:
                     now = datetime.now(UTC)
+                    scheduler = get_event_scheduler()
                     if quiz_hours is not None:
-                        next_quiz = now + timedelta(hours=quiz_hours)
+                        quiz_job = scheduler.get_job(quiz_mgr.QUIZ_JOB_NAME)
+                        next_quiz = (
+                            quiz_job.next_run
+                            if quiz_job and quiz_job.next_run
+                            else (now + timedelta(hours=quiz_hours)).timestamp()
+                        )
                         embed.add_field(
                             name="📝 Next Quiz",
-                            value=f"<t:{int(next_quiz.timestamp())}:R>",
+                            value=f"<t:{int(next_quiz)}:R>",
                             inline=True,
                         )
 
                     if verse_hours is not None:
-                        next_verse = now + timedelta(hours=verse_hours)
+                        verse_job = scheduler.get_job(daily_verses.VERSE_JOB_NAME)
+                        next_verse = (
+                            verse_job.next_run
+                            if verse_job and verse_job.next_run
+                            else (now + timedelta(hours=verse_hours)).timestamp()
+                        )
                         embed.add_field(
                             name="📖 Next Verse",
-                            value=f"<t:{int(next_verse.timestamp())}:R>",
+                            value=f"<t:{int(next_verse)}:R>",
                             inline=True,
                         )
                 except (AttributeError, TypeError, ValueError, OverflowError):
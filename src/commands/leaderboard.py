@@ -12,6 +12,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from src.utils.interaction_middleware import fast_ack
 from src.utils.listening_stats import format_listening_time, get_user_listening_stats
 from src.utils.tree_log import log_error_with_traceback, log_perfect_tree_section
 
@@ -161,6 +162,7 @@ class LeaderboardView(discord.ui.View):
         return True
 
     @discord.ui.button(emoji="⬅️", style=discord.ButtonStyle.primary)
+    @fast_ack()
     async def previous_page(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
@@ -172,6 +174,7 @@ class LeaderboardView(discord.ui.View):
             await interaction.response.edit_message(embed=embed, view=self)
 
     @discord.ui.button(emoji="➡️", style=discord.ButtonStyle.primary)
+    @fast_ack()
     async def next_page(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
@@ -203,6 +206,7 @@ class LeaderboardCog(commands.Cog):
         name="leaderboard",
         description="Display the quiz points leaderboard",
     )
+    @fast_ack(ephemeral=False)
     async def leaderboard(self, interaction: discord.Interaction):
         """Display the quiz points leaderboard with pagination"""
         try:
@@ -13,6 +13,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from src.config import get_config_service
+from src.utils.interaction_middleware import fast_ack
 from src.utils.quiz_manager import QuizView
 from src.utils.tree_log import log_error_with_traceback, log_perfect_tree_section
 
@@ -68,6 +69,7 @@ class QuestionCog(commands.Cog):
         name="question",
         description="Send an Islamic knowledge quiz manually and reset the timer (Admin only)",
     )
+    @fast_ack()
     async def question(self, interaction: discord.Interaction):
         """
         Administrative command to manually trigger quiz delivery.
@@ -31,7 +31,6 @@
 # - DEVELOPER_ID: Discord ID of bot administrator
 # =============================================================================
 
-import asyncio
 from datetime import datetime
 
 import discord
@@ -42,10 +41,11 @@ from src.core.exceptions import ConfigurationError
 from src.core.security import rate_limit, require_admin
 from src.utils import daily_verses
 from src.utils.discord_logger import get_discord_logger
+from src.utils.interaction_middleware import fast_ack
+from src.utils.reaction_router import get_reaction_router
 from src.utils.tree_log import (
     log_error_with_traceback,
     log_perfect_tree_section,
-    log_user_interaction,
 )
 
 
@@ -89,6 +89,7 @@ class VerseCog(commands.Cog):
         name="verse",
         description="Send a daily verse manually and reset the 3-hour timer (Admin only)",
     )
+    @fast_ack()
     @require_admin
     @rate_limit(
         user_limit=2, user_window=60
@@ -351,151 +352,17 @@ class VerseCog(commands.Cog):
                 # Add only the dua emoji for user interaction
                 await message.add_reaction("🤲")  # Dua emoji only
 
-                # Monitor reactions for user interaction tracking and removal of unauthorized reactions
-                def check_dua_reaction(reaction, user):
-                    return (
-                        reaction.message.id == message.id
-                        and not user.bot
-                        and str(reaction.emoji) == "🤲"
-                    )
-
-                def check_unauthorized_reaction(reaction, user):
-                    return (
-                        reaction.message.id == message.id
-                        and not user.bot
-                        and str(reaction.emoji) != "🤲"
-                    )
-
-                async def monitor_unauthorized_reactions():
-                    """Monitor and remove unauthorized reactions"""
-                    try:
-                        while True:
-                            reaction, user = await interaction.client.wait_for(
-                                "reaction_add",
-                                check=check_unauthorized_reaction,
-                                timeout=3600,
-                            )  # 1 hour timeout
-
-                            # Log unauthorized reaction removal
-                            log_user_interaction(
-                                interaction_type="verse_reaction_removed",
-                                user_name=user.display_name,
-                                user_id=user.id,
-                                action_description=f"Added unauthorized reaction '{reaction.emoji}' to daily verse, removed automatically",
-                                details={
-                                    "reaction_removed": str(reaction.emoji),
-                                    "allowed_reaction": "🤲",
-                                    "verse_id": verse_data.get("id", "Unknown"),
-                                    "surah": verse_data.get("surah", "Unknown"),
-                                    "verse_number": verse_data.get(
-                                        "ayah", verse_data.get("verse", "Unknown")
-                                    ),
-                                    "message_id": message.id,
-                                    "channel_id": channel.id,
-                                },
-                            )
-
-                            # Remove the unauthorized reaction
-                            try:
-                                await reaction.remove(user)
-                            except discord.Forbidden:
-                                # Bot doesn't have permission to remove reactions
-                                pass
-                            except (discord.HTTPException, discord.NotFound):
-                                # Ignore other reaction removal errors (message deleted, etc.)
-                                pass
-
-                    except TimeoutError:
-                        # Timeout reached, stop monitoring
-                        pass
-                    except Exception as e:
-                        log_error_with_traceback(
-                            "Error monitoring unauthorized reactions", e
-                        )
-
-                async def monitor_dua_reactions():
-                    """Monitor dua reactions specifically"""
-                    try:
-                        while True:
-                            reaction, user = await interaction.client.wait_for(
-                                "reaction_add",
-                                check=check_dua_reaction,
-                                timeout=3600,
-                            )  # 1 hour timeout
-
-                            # Log dua interaction
-                            log_user_interaction(
-                                interaction_type="dua_reaction",
-                                user_name=user.display_name,
-                                user_id=user.id,
-                                action_description="Made dua (🤲) on daily verse",
-                                details={
-                                    "reaction": "🤲",
-                                    "verse_id": verse_data.get("id", "Unknown"),
-                                    "surah": verse_data.get("surah", "Unknown"),
-                                    "verse_number": verse_data.get(
-                                        "ayah", verse_data.get("verse", "Unknown")
-                                    ),
-                                    "message_id": message.id,
-                                    "channel_id": channel.id,
-                                    "spiritual_activity": "dua_made",
-                                },
-                            )
-
-                            # Record dua reaction in statistics
-                            if daily_verses.daily_verse_manager:
-                                daily_verses.daily_verse_manager.record_dua_reaction(
-                                    user.id,
-                                    verse_data.get("surah", 1),
-                                    verse_data.get("ayah", verse_data.get("verse", 1)),
-                                )
-
-                            # Log to Discord with user profile picture
-                            discord_logger = get_discord_logger()
-                            if discord_logger:
-                                try:
-                                    user_avatar_url = (
-                                        user.avatar.url
-                                        if user.avatar
-                                        else user.default_avatar.url
-                                    )
-                                    await discord_logger.log_user_interaction(
-                                        "dua_reaction",
-                                        user.display_name,
-                                        user.id,
-                                        "made dua (🤲) on daily verse",
-                                        {
-                                            "Reaction": "🤲",
-                                            "Verse ID": str(
-                                                verse_data.get("id", "Unknown")
-                                            ),
-                                            "Surah": str(
-                                                verse_data.get("surah", "Unknown")
-                                            ),
-                                            "Verse Number": str(
-                                                verse_data.get(
-                                                    "ayah",
-                                                    verse_data.get("verse", "Unknown"),
-                                                )
-                                            ),
-                                            "Message ID": str(message.id),
-                                            "Channel ID": str(channel.id),
-                                            "Spiritual Activity": "Dua Made",
-                                        },
-                                        user_avatar_url,
-                                    )
-                                except:
-                                    pass
-
-                    except TimeoutError:
-                        # Timeout reached, stop monitoring
-                        pass
-                    except Exception as e:
-                        log_error_with_traceback("Error monitoring dua reactions", e)
-
-                # Start monitoring tasks
-                asyncio.create_task(monitor_unauthorized_reactions())
-                asyncio.create_task(monitor_dua_reactions())
+                # Route reactions to the daily verse dua handler for an hour
+                get_reaction_router().route(
+                    message,
+                    daily_verses.VERSE_REACTION_KIND,
+                    daily_verses.VERSE_REACTION_TTL,
+                    {
+                        "surah": verse_data.get("surah", 1),
+                        "ayah": verse_data.get("ayah", verse_data.get("verse", 1)),
+                        "verse_type": "daily",
+                    },
+                )
 
                 # Send confirmation to the user
                 try:
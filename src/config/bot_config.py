@@ -131,6 +131,12 @@ class BotConfig(BaseSettings):
 
     DEFAULT_LOOP: bool = Field(default=False, description="Default loop mode setting")
 
+    SHUFFLE_MODE: str = Field(
+        default="uniform",
+        description="Shuffle order: uniform, weighted_by_duration or exclude_long",
+        pattern=r"^(uniform|weighted_by_duration|exclude_long)$",
+    )
+
     # =============================================================================
     # Performance Configuration
     # =============================================================================
@@ -8,6 +8,12 @@ and service management.
 
 from .di_container import DIContainer
 from .exceptions import *
+from .rate_limit_engine import (
+    RateLimitDecision,
+    RateLimitEngine,
+    RateLimitRule,
+    get_rate_limit_engine,
+)
 from .security import (
     InputValidator,
     RateLimiter,
@@ -38,6 +44,10 @@ __all__ = [
     "get_logging_service",
     "set_logging_service",
     "RateLimiter",
+    "RateLimitEngine",
+    "RateLimitRule",
+    "RateLimitDecision",
+    "get_rate_limit_engine",
     "SecurityService",
     "InputValidator",
     "rate_limit",
@@ -6,14 +6,25 @@ service registration and resolution throughout the application. It supports
 both singleton and transient service lifetimes with proper error handling.
 """
 
+import asyncio
 from collections.abc import Callable
+from contextvars import ContextVar
 from functools import wraps
 import inspect
 import threading
+import time
 from typing import Any, TypeVar
 
 T = TypeVar("T")
 
+# Marks a singleton that has not been materialized yet (None is a valid instance)
+_UNRESOLVED = object()
+
+# Services being built by async factories in the current task, for cycle detection
+_async_resolution_chain: ContextVar[tuple[type, ...]] = ContextVar(
+    "async_resolution_chain", default=()
+)
+
 
 class DIError(Exception):
     """Base exception for dependency injection errors."""
@@ -47,8 +58,10 @@ class DIContainer:
     - Singleton services (single instance per container)
     - Transient services (new instance per resolution)
     - Factory functions for complex service creation
-    - Circular dependency detection
-    - Thread-safe operations
+    - Async factories resolved with get_async()
+    - Circular dependency detection during first construction
+    - Thread-safe operations, with lock-free reads of built singletons
+    - Startup validation of the whole service graph
     - Proper error handling and reporting
 
     Example:
@@ -68,11 +81,24 @@ class DIContainer:
         """Initialize the dependency injection container."""
         self._singletons: dict[type, Any] = {}
         self._transient_factories: dict[type, Callable] = {}
-        self._resolution_stack: set = set()
+        self._resolution_stack: list[type] = []
         self._lock = threading.RLock()
 
+        # Resolution cache: singletons that are built, and those still to build.
+        # Whether a registration is a factory is decided once, at registration.
+        self._instances: dict[type, Any] = {}
+        self._singleton_factories: dict[type, Callable] = {}
+        self._async_locks: dict[type, asyncio.Lock] = {}
+
+        # Singletons the app can run without; validate() drops them on failure
+        self._optional: set[type] = set()
+        self.optional_failures: dict[str, str] = {}
+
     def register_singleton(
-        self, interface: type[T], implementation: T | Callable[[], T]
+        self,
+        interface: type[T],
+        implementation: T | Callable[[], T],
+        optional: bool = False,
     ) -> None:
         """
         Register a singleton service.
@@ -83,6 +109,8 @@ class DIContainer:
         Args:
             interface: The service interface/type to register
             implementation: The service instance or factory function
+            optional: If building it fails during validate(), unregister it
+                and record the error instead of failing validation
 
         Raises:
             ServiceRegistrationError: If registration fails
@@ -104,8 +132,15 @@ class DIContainer:
                         f"Service {interface.__name__} is already registered"
                     )
 
-                # Store the implementation directly - we'll determine if it's a factory during resolution
                 self._singletons[interface] = implementation
+                if optional:
+                    self._optional.add(interface)
+                if callable(implementation) and self._is_factory_function(
+                    implementation
+                ):
+                    self._singleton_factories[interface] = implementation
+                else:
+                    self._instances[interface] = implementation
 
             except Exception as e:
                 raise ServiceRegistrationError(
@@ -162,6 +197,9 @@ class DIContainer:
         - Singleton: Returns the same instance for all requests
         - Transient: Creates a new instance for each request
 
+        Built singletons are served with a plain dict lookup and no lock;
+        only first construction and transients take the resolution path.
+
         Args:
             interface: The service interface/type to resolve
 
@@ -171,49 +209,160 @@ class DIContainer:
         Raises:
             ServiceNotRegisteredError: If the service is not registered
             CircularDependencyError: If a circular dependency is detected
+            DIError: If the service has an async factory that has not run yet
 
         Example:
             config_service = container.get(ConfigService)
             audio_service = container.get(AudioService)
         """
+        instance = self._instances.get(interface, _UNRESOLVED)
+        if instance is not _UNRESOLVED:
+            return instance
+        return self._resolve(interface)
+
+    async def get_async(self, interface: type[T]) -> T:
+        """
+        Resolve a service whose factory may be a coroutine function.
+
+        Async singleton factories run once; concurrent callers wait for the
+        same construction. Services with sync factories resolve as in get().
+
+        Args:
+            interface: The service interface/type to resolve
+
+        Returns:
+            The resolved service instance
+
+        Raises:
+            ServiceNotRegisteredError: If the service is not registered
+            CircularDependencyError: If a circular dependency is detected
+
+        Example:
+            database = await container.get_async(DatabaseService)
+        """
+        instance = self._instances.get(interface, _UNRESOLVED)
+        if instance is not _UNRESOLVED:
+            return instance
+
+        factory = self._singleton_factories.get(
+            interface
+        ) or self._transient_factories.get(interface)
+        if factory is None or not inspect.iscoroutinefunction(factory):
+            return self._resolve(interface)
+
+        chain = _async_resolution_chain.get()
+        if interface in chain:
+            self._raise_circular(list(chain), interface)
+
+        token = _async_resolution_chain.set(chain + (interface,))
+        try:
+            if interface in self._transient_factories:
+                return await factory()
+
+            lock = self._async_locks.setdefault(interface, asyncio.Lock())
+            async with lock:
+                instance = self._instances.get(interface, _UNRESOLVED)
+                if instance is _UNRESOLVED:
+                    instance = await factory()
+                    self._materialize(interface, instance)
+                return instance
+        finally:
+            _async_resolution_chain.reset(token)
+
+    async def validate(self) -> dict[str, float]:
+        """
+        Resolve every registered singleton once, e.g. at startup.
+
+        Transients are not built, since each resolution creates a new
+        instance. A service's time includes any dependencies it built.
+        Optional singletons that fail are unregistered and listed in
+        `optional_failures` instead.
+
+        Returns:
+            Dictionary mapping service names to resolution time in seconds
+
+        Raises:
+            DIError: If any required singleton failed to resolve, listing all failures
+        """
+        timings: dict[str, float] = {}
+        failures: list[str] = []
+
+        for interface in list(self._singletons):
+            started = time.perf_counter()
+            try:
+                await self.get_async(interface)
+            except Exception as e:
+                if interface in self._optional:
+                    self._unregister(interface)
+                    self.optional_failures[interface.__name__] = str(e)
+                else:
+                    failures.append(f"{interface.__name__}: {e!s}")
+                continue
+            timings[interface.__name__] = time.perf_counter() - started
+
+        if failures:
+            raise DIError(f"Service graph validation failed: {'; '.join(failures)}")
+        return timings
+
+    def _resolve(self, interface: type[T]) -> T:
+        """Build a singleton for the first time, or a transient, under the lock."""
         with self._lock:
-            # Check for circular dependencies
-            if interface in self._resolution_stack:
-                dependency_chain = " -> ".join(
-                    [cls.__name__ for cls in self._resolution_stack]
+            # Another thread may have built it while we waited for the lock
+            instance = self._instances.get(interface, _UNRESOLVED)
+            if instance is not _UNRESOLVED:
+                return instance
+
+            if interface in self._singleton_factories:
+                factory = self._singleton_factories[interface]
+            elif interface in self._transient_factories:
+                factory = self._transient_factories[interface]
+            else:
+                raise ServiceNotRegisteredError(
+                    f"Service {interface.__name__} is not registered"
                 )
-                raise CircularDependencyError(
-                    f"Circular dependency detected: {dependency_chain} -> {interface.__name__}"
+
+            if inspect.iscoroutinefunction(factory):
+                raise DIError(
+                    f"Service {interface.__name__} has an async factory; "
+                    "resolve it with get_async() or validate() first"
                 )
 
+            # Check for circular dependencies
+            if interface in self._resolution_stack:
+                self._raise_circular(self._resolution_stack, interface)
+
+            self._resolution_stack.append(interface)
             try:
-                self._resolution_stack.add(interface)
-
-                # Try singleton first
-                if interface in self._singletons:
-                    service = self._singletons[interface]
-
-                    # Check if it's a factory function by trying to determine if it's a lambda or function
-                    # that should be called to create the service instance
-                    if callable(service) and self._is_factory_function(service):
-                        instance = service()
-                        self._singletons[interface] = instance
-                        return instance
-                    else:
-                        return service
-
-                # Try transient factory
-                elif interface in self._transient_factories:
-                    factory = self._transient_factories[interface]
-                    return factory()
+                instance = factory()
+            finally:
+                self._resolution_stack.pop()
 
-                else:
-                    raise ServiceNotRegisteredError(
-                        f"Service {interface.__name__} is not registered"
-                    )
+            if interface in self._singleton_factories:
+                self._materialize(interface, instance)
+            return instance
 
-            finally:
-                self._resolution_stack.discard(interface)
+    def _unregister(self, interface: type) -> None:
+        """Forget a singleton registration entirely."""
+        with self._lock:
+            self._singletons.pop(interface, None)
+            self._singleton_factories.pop(interface, None)
+            self._instances.pop(interface, None)
+            self._optional.discard(interface)
+
+    def _materialize(self, interface: type, instance: Any) -> None:
+        """Cache a built singleton so later lookups skip the lock."""
+        with self._lock:
+            self._singletons[interface] = instance
+            self._singleton_factories.pop(interface, None)
+            self._instances[interface] = instance
+
+    @staticmethod
+    def _raise_circular(chain: list[type], interface: type) -> None:
+        """Raise a CircularDependencyError describing the resolution chain."""
+        dependency_chain = " -> ".join(cls.__name__ for cls in chain)
+        raise CircularDependencyError(
+            f"Circular dependency detected: {dependency_chain} -> {interface.__name__}"
+        )
 
     def is_registered(self, interface: type[T]) -> bool:
         """
@@ -259,6 +408,11 @@ class DIContainer:
             self._singletons.clear()
             self._transient_factories.clear()
             self._resolution_stack.clear()
+            self._instances.clear()
+            self._singleton_factories.clear()
+            self._optional.clear()
+            self.optional_failures.clear()
+            self._async_locks.clear()
 
     def get_registered_services(self) -> dict[str, str]:
         """
@@ -266,6 +266,9 @@ class RateLimitError(QuranBotError):
         retry_after: float | None = None,
         context: dict[str, Any] | None = None,
         original_error: Exception | None = None,
+        limit: int | None = None,
+        window: float | None = None,
+        current_count: int | None = None,
     ):
         """
         Initialize rate limit error with rate limit-specific context.
@@ -278,7 +281,16 @@ class RateLimitError(QuranBotError):
             retry_after: Seconds to wait before retrying
             context: Additional context information
             original_error: Original exception that caused this error
+            limit: Maximum requests allowed per window
+            window: Rate limit window in seconds
+            current_count: Requests counted against the limit
         """
+        self.limit_type = limit_type
+        self.retry_after = retry_after
+        self.limit = limit
+        self.window = window
+        self.current_count = current_count
+
         rate_limit_context = context or {}
 
         # Add rate limit-specific context
@@ -290,6 +302,9 @@ class RateLimitError(QuranBotError):
             rate_limit_context["limit_type"] = limit_type
         if retry_after:
             rate_limit_context["retry_after"] = retry_after
+        if limit is not None:
+            rate_limit_context["limit"] = limit
+            rate_limit_context["window"] = window
 
         super().__init__(message, rate_limit_context, original_error)
 
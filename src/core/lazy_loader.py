@@ -161,30 +161,27 @@ class ReciterResource(LazyLoadable):
     async def load(self) -> dict[str, Any]:
         """Load reciter information and discover audio files"""
         try:
+            from src.utils.reciter_catalog import get_reciter_catalog
+
             if not self.reciter_path.exists() or not self.reciter_path.is_dir():
                 raise ServiceError(f"Reciter directory not found: {self.reciter_path}")
 
-            # Scan for audio files
-            audio_extensions = {".mp3", ".wav", ".ogg", ".m4a", ".flac"}
+            # File sizes and surah numbers come from the shared catalogue
+            catalog = get_reciter_catalog(str(self.reciter_path.parent))
             audio_files = []
             total_size = 0
 
-            for file_path in self.reciter_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in audio_extensions:
-                    # Extract surah number from filename
-                    surah_number = self._extract_surah_number(file_path.name)
-
-                    if surah_number:
-                        file_size = file_path.stat().st_size
-                        total_size += file_size
-
-                        audio_resource = AudioFileResource(
-                            file_path=file_path,
+            for filename, info in catalog.get_file_entries(self.reciter_path.name).items():
+                if info["surah"]:
+                    total_size += info["size"]
+                    audio_files.append(
+                        AudioFileResource(
+                            file_path=self.reciter_path / filename,
                             reciter=self.reciter_name,
-                            surah_number=surah_number,
-                            file_size=file_size,
+                            surah_number=info["surah"],
+                            file_size=info["size"],
                         )
-                        audio_files.append(audio_resource)
+                    )
 
             self.audio_files = sorted(audio_files, key=lambda x: x.surah_number)
             self.total_files = len(audio_files)
@@ -270,6 +267,7 @@ class LazyLoader:
 
         # Resource tracking
         self._resources: dict[str, LazyLoadable] = {}
+        self._audio_directories: set[Path] = set()
         self._loading_states: dict[str, LoadingState] = {}
         self._dependency_graph: dict[str, set[str]] = defaultdict(set)
 
@@ -380,6 +378,7 @@ class LazyLoader:
         if not audio_path.exists() or not audio_path.is_dir():
             raise ServiceError(f"Audio directory not found: {audio_path}")
 
+        self._audio_directories.add(audio_path)
         registered_count = 0
 
         # Scan for reciter directories
@@ -653,10 +652,27 @@ class LazyLoader:
                 await self._logger.error("File watcher error", {"error": str(e)})
 
     async def _scan_for_new_resources(self) -> None:
-        """Scan for new resources in registered directories"""
-        # Placeholder for scanning logic
-        # Would iterate through known directories and register new resources
-        pass
+        """Register reciters added to registered audio directories"""
+        from src.utils.reciter_catalog import get_reciter_catalog
+
+        for audio_path in self._audio_directories:
+            # The catalogue only re-walks folders whose mtime changed
+            catalog = get_reciter_catalog(str(audio_path))
+            reciters = await asyncio.to_thread(catalog.get_reciters)
+
+            for reciter_name in reciters:
+                if f"reciter:{reciter_name}" in self._resources:
+                    continue
+                await self.register_resource(
+                    ReciterResource(
+                        reciter_path=audio_path / reciter_name,
+                        reciter_name=reciter_name,
+                    )
+                )
+                await self._logger.info(
+                    "New reciter discovered",
+                    {"reciter": reciter_name, "path": str(audio_path)},
+                )
 
     async def _get_cache_hit_rate(self) -> float:
         """Calculate cache hit rate"""
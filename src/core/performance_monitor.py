@@ -13,6 +13,7 @@ from datetime import UTC, datetime, timedelta
 from enum import Enum
 import gc
 import json
+import math
 from pathlib import Path
 import statistics
 import threading
@@ -70,6 +71,176 @@ class MetricValue:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with logarithmic buckets.
+
+    Values are counted in buckets whose boundaries grow geometrically, so
+    every quantile estimate is within `relative_accuracy` of the true value.
+    Recording is O(1); quantile queries walk the occupied buckets, which
+    are bounded by the value range rather than by the number of samples.
+    Sketches with the same accuracy can be merged losslessly.
+    """
+
+    MIN_TRACKED_VALUE = 1e-9  # Smaller values are counted as zero
+
+    def __init__(self, relative_accuracy: float = 0.02):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: dict[int, int] = defaultdict(int)
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.sum_squares = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Record a single value"""
+        if value > self.MIN_TRACKED_VALUE:
+            self.buckets[math.ceil(math.log(value) / self._log_gamma)] += 1
+        else:
+            self.zero_count += 1
+
+        self.count += 1
+        self.sum += value
+        self.sum_squares += value * value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch into this one"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+
+        for index, bucket_count in other.buckets.items():
+            self.buckets[index] += bucket_count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.sum_squares += other.sum_squares
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        """Average of all recorded values"""
+        return self.sum / self.count if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation of all recorded values"""
+        if self.count < 2:
+            return 0.0
+        variance = (self.sum_squares - self.sum * self.sum / self.count) / (
+            self.count - 1
+        )
+        return math.sqrt(max(variance, 0.0))
+
+    def quantile(self, percentile: float) -> float:
+        """Estimate the value at a percentile (0-100)"""
+        if not self.count:
+            return 0.0
+
+        rank = (self.count - 1) * percentile / 100
+        seen = self.zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                estimate = 2 * self._gamma**index / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export the sketch so it can be stored or merged elsewhere"""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "count": self.count,
+            "sum": self.sum,
+            "sum_squares": self.sum_squares,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "zero_count": self.zero_count,
+            "buckets": {str(index): c for index, c in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        """Rebuild a sketch exported with to_dict"""
+        sketch = cls(data["relative_accuracy"])
+        sketch.count = data["count"]
+        sketch.sum = data["sum"]
+        sketch.sum_squares = data["sum_squares"]
+        if data["count"]:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        sketch.zero_count = data["zero_count"]
+        for index, bucket_count in data["buckets"].items():
+            sketch.buckets[int(index)] = bucket_count
+        return sketch
+
+
+class WindowedQuantileSketch:
+    """
+    Quantile sketch over a sliding time window.
+
+    Values land in one sketch per `slot_seconds`; slots older than
+    `slot_count` are dropped as time moves on. Window queries merge only
+    the slots that overlap the window.
+    """
+
+    def __init__(
+        self,
+        slot_seconds: int = 60,
+        slot_count: int = 60,
+        relative_accuracy: float = 0.02,
+    ):
+        self.slot_seconds = slot_seconds
+        self.slot_count = slot_count
+        self.relative_accuracy = relative_accuracy
+        self._slots: deque[tuple[int, QuantileSketch]] = deque()
+
+    @property
+    def span_seconds(self) -> int:
+        """Longest window this sketch can answer"""
+        return self.slot_seconds * self.slot_count
+
+    def add(self, value: float, now: float | None = None) -> None:
+        """Record a value in the current slot"""
+        slot_index = int((now if now is not None else time.time()) // self.slot_seconds)
+        if not self._slots or self._slots[-1][0] != slot_index:
+            self._slots.append((slot_index, QuantileSketch(self.relative_accuracy)))
+            self._expire(slot_index)
+        self._slots[-1][1].add(value)
+
+    def merged(
+        self, window_seconds: int | None = None, now: float | None = None
+    ) -> QuantileSketch:
+        """Merge the slots overlapping the last `window_seconds`"""
+        now = now if now is not None else time.time()
+        self._expire(int(now // self.slot_seconds))
+
+        window_seconds = window_seconds or self.span_seconds
+        first_slot = int((now - window_seconds) // self.slot_seconds)
+
+        result = QuantileSketch(self.relative_accuracy)
+        for slot_index, sketch in reversed(self._slots):
+            if slot_index < first_slot:
+                break
+            result.merge(sketch)
+        return result
+
+    def _expire(self, current_slot: int) -> None:
+        """Drop slots that fell out of the retained span"""
+        while self._slots and self._slots[0][0] <= current_slot - self.slot_count:
+            self._slots.popleft()
+
+
 @dataclass
 class MetricSeries:
     """Time series of metric values"""
@@ -79,11 +250,22 @@ class MetricSeries:
     values: deque = field(default_factory=lambda: deque(maxlen=1000))
     unit: str = field(default="")
     description: str = field(default="")
+    sketch: WindowedQuantileSketch | None = field(default=None)
+
+    def __post_init__(self) -> None:
+        """Distribution metrics keep a quantile sketch alongside raw values"""
+        if self.sketch is None and self.metric_type in (
+            MetricType.TIMER,
+            MetricType.HISTOGRAM,
+        ):
+            self.sketch = WindowedQuantileSketch()
 
     def add_value(self, value: int | float, tags: dict[str, str] | None = None) -> None:
         """Add a value to the time series"""
         metric_value = MetricValue(value=value, tags=tags or {})
         self.values.append(metric_value)
+        if self.sketch is not None:
+            self.sketch.add(value)
 
     def get_latest(self) -> MetricValue | None:
         """Get the most recent value"""
@@ -91,12 +273,18 @@ class MetricSeries:
 
     def get_average(self, window_seconds: int = 300) -> float:
         """Get average value over a time window"""
+        if self.sketch is not None and window_seconds <= self.sketch.span_seconds:
+            return self.sketch.merged(window_seconds).mean
+
         cutoff_time = datetime.now(UTC) - timedelta(seconds=window_seconds)
         recent_values = [mv.value for mv in self.values if mv.timestamp > cutoff_time]
         return statistics.mean(recent_values) if recent_values else 0.0
 
     def get_percentile(self, percentile: float, window_seconds: int = 300) -> float:
         """Get percentile value over a time window"""
+        if self.sketch is not None and window_seconds <= self.sketch.span_seconds:
+            return self.sketch.merged(window_seconds).quantile(percentile)
+
         cutoff_time = datetime.now(UTC) - timedelta(seconds=window_seconds)
         recent_values = [mv.value for mv in self.values if mv.timestamp > cutoff_time]
         if not recent_values:
@@ -225,8 +413,11 @@ class PerformanceMonitor:
         self._system_metrics = SystemMetrics()
         self._app_metrics = ApplicationMetrics()
 
-        # Performance tracking
-        self._operation_timers: dict[str, list[float]] = defaultdict(list)
+        # Performance tracking (durations in seconds)
+        self._operation_timers: dict[str, WindowedQuantileSketch] = defaultdict(
+            WindowedQuantileSketch
+        )
+        self._active_timers: dict[str, tuple[str, float]] = {}
         self._performance_baseline: dict[str, float] = {}
 
         # Alerting
@@ -337,33 +528,24 @@ class PerformanceMonitor:
 
     async def start_timer(self, operation_name: str) -> str:
         """Start timing an operation"""
-        timer_id = f"{operation_name}_{time.time()}_{id(asyncio.current_task())}"
-
-        # Store start time
-        if not hasattr(self, "_active_timers"):
-            self._active_timers = {}
+        start_time = time.time()
+        timer_id = f"{operation_name}_{start_time}_{id(asyncio.current_task())}"
 
-        self._active_timers[timer_id] = time.time()
+        # Store operation name and start time
+        self._active_timers[timer_id] = (operation_name, start_time)
 
         return timer_id
 
     async def end_timer(self, timer_id: str) -> float:
         """End timing an operation and record the duration"""
-        if not hasattr(self, "_active_timers") or timer_id not in self._active_timers:
+        if timer_id not in self._active_timers:
             return 0.0
 
-        start_time = self._active_timers.pop(timer_id)
+        operation_name, start_time = self._active_timers.pop(timer_id)
         duration = time.time() - start_time
 
-        # Extract operation name
-        operation_name = timer_id.split("_")[0]
-
         # Record duration
-        with self._lock:
-            self._operation_timers[operation_name].append(duration)
-            # Keep only last 1000 measurements
-            if len(self._operation_timers[operation_name]) > 1000:
-                self._operation_timers[operation_name].pop(0)
+        self.record_duration(operation_name, duration)
 
         # Record as metric
         await self.record_metric(
@@ -372,7 +554,12 @@ class PerformanceMonitor:
 
         return duration
 
-    async def time_operation(self, operation_name: str):
+    def record_duration(self, operation_name: str, duration: float) -> None:
+        """Record an operation duration (seconds) in its quantile sketch"""
+        with self._lock:
+            self._operation_timers[operation_name].add(duration)
+
+    def time_operation(self, operation_name: str):
         """Context manager for timing operations"""
 
         class TimerContext:
@@ -434,25 +621,24 @@ class PerformanceMonitor:
         """Get metric time series by name"""
         return self._metrics.get(name) or self._custom_metrics.get(name)
 
-    async def get_operation_stats(self, operation_name: str) -> dict[str, float]:
-        """Get statistics for an operation"""
-        with self._lock:
-            durations = self._operation_timers.get(operation_name, [])
+    async def get_operation_stats(
+        self, operation_name: str, window_seconds: int | None = None
+    ) -> dict[str, float]:
+        """Get statistics for an operation over a time window (default: 1 hour)"""
+        durations = self._get_operation_sketch(operation_name, window_seconds)
 
-        if not durations:
+        if not durations.count:
             return {}
 
         return {
-            "count": len(durations),
-            "average_ms": statistics.mean(durations) * 1000,
-            "median_ms": statistics.median(durations) * 1000,
-            "min_ms": min(durations) * 1000,
-            "max_ms": max(durations) * 1000,
-            "stddev_ms": (
-                statistics.stdev(durations) * 1000 if len(durations) > 1 else 0.0
-            ),
-            "p95_ms": self._percentile(durations, 95) * 1000,
-            "p99_ms": self._percentile(durations, 99) * 1000,
+            "count": durations.count,
+            "average_ms": durations.mean * 1000,
+            "median_ms": durations.quantile(50) * 1000,
+            "min_ms": durations.min * 1000,
+            "max_ms": durations.max * 1000,
+            "stddev_ms": durations.stddev * 1000,
+            "p95_ms": durations.quantile(95) * 1000,
+            "p99_ms": durations.quantile(99) * 1000,
         }
 
     async def get_performance_summary(self) -> dict[str, Any]:
@@ -463,11 +649,10 @@ class PerformanceMonitor:
 
         # Get top operations by duration
         top_operations = {}
-        with self._lock:
-            for op_name, durations in self._operation_timers.items():
-                if durations:
-                    avg_duration = statistics.mean(durations) * 1000
-                    top_operations[op_name] = avg_duration
+        for op_name in list(self._operation_timers):
+            durations = self._get_operation_sketch(op_name)
+            if durations.count:
+                top_operations[op_name] = durations.mean * 1000
 
         # Sort by average duration
         top_operations = dict(
@@ -771,24 +956,17 @@ class PerformanceMonitor:
             except Exception:
                 pass
 
-            # Calculate commands per minute from operation timers
+            # Calculate commands per minute from operation sketches
             command_operations = [
                 name
-                for name in self._operation_timers.keys()
+                for name in list(self._operation_timers)
                 if "command" in name.lower()
             ]
             if command_operations:
-                recent_commands = 0
-                with self._lock:
-                    for op_name in command_operations:
-                        recent_commands += len(
-                            [
-                                t
-                                for t in self._operation_timers[op_name]
-                                if time.time() - t < 60  # Last minute
-                            ]
-                        )
-                self._app_metrics.commands_per_minute = recent_commands
+                self._app_metrics.commands_per_minute = sum(
+                    self._get_operation_sketch(op_name, 60).count
+                    for op_name in command_operations
+                )
 
         except Exception as e:
             await self._logger.warning(
@@ -958,13 +1136,11 @@ class PerformanceMonitor:
             )
 
         # Operation performance recommendations
-        with self._lock:
-            slow_operations = []
-            for op_name, durations in self._operation_timers.items():
-                if durations:
-                    avg_duration = statistics.mean(durations)
-                    if avg_duration > 1.0:  # Slower than 1 second
-                        slow_operations.append((op_name, avg_duration))
+        slow_operations = []
+        for op_name in list(self._operation_timers):
+            durations = self._get_operation_sketch(op_name)
+            if durations.count and durations.mean > 1.0:  # Slower than 1 second
+                slow_operations.append((op_name, durations.mean))
 
         if slow_operations:
             slowest_op = max(slow_operations, key=lambda x: x[1])
@@ -985,14 +1161,11 @@ class PerformanceMonitor:
             if timestamp > cutoff_time
         ]
 
-        # Clean up old operation timers
+        # Drop operations with no measurements left in their window
         with self._lock:
             for op_name in list(self._operation_timers.keys()):
-                if len(self._operation_timers[op_name]) > 1000:
-                    # Keep only the most recent 1000 measurements
-                    self._operation_timers[op_name] = self._operation_timers[op_name][
-                        -1000:
-                    ]
+                if not self._operation_timers[op_name].merged().count:
+                    del self._operation_timers[op_name]
 
     async def _export_performance_data(self) -> None:
         """Export performance data to files"""
@@ -1024,16 +1197,20 @@ class PerformanceMonitor:
                 "triggered_alerts": len(self._triggered_alerts),
             }
 
-            # Add operation statistics
-            with self._lock:
-                for op_name, durations in self._operation_timers.items():
-                    if durations:
-                        export_data["operation_stats"][op_name] = {
-                            "count": len(durations),
-                            "average_ms": statistics.mean(durations) * 1000,
-                            "max_ms": max(durations) * 1000,
-                            "min_ms": min(durations) * 1000,
-                        }
+            # Add operation statistics with their mergeable sketches
+            for op_name in list(self._operation_timers):
+                durations = self._get_operation_sketch(op_name)
+                if durations.count:
+                    export_data["operation_stats"][op_name] = {
+                        "count": durations.count,
+                        "average_ms": durations.mean * 1000,
+                        "max_ms": durations.max * 1000,
+                        "min_ms": durations.min * 1000,
+                        "p50_ms": durations.quantile(50) * 1000,
+                        "p95_ms": durations.quantile(95) * 1000,
+                        "p99_ms": durations.quantile(99) * 1000,
+                        "sketch_seconds": durations.to_dict(),
+                    }
 
             # Write to file
             with open(export_file, "w") as f:
@@ -1048,20 +1225,15 @@ class PerformanceMonitor:
                 "Failed to export performance data", {"error": str(e)}
             )
 
-    def _percentile(self, values: list[float], percentile: float) -> float:
-        """Calculate percentile of values"""
-        if not values:
-            return 0.0
-
-        sorted_values = sorted(values)
-        k = (len(sorted_values) - 1) * percentile / 100
-        f = int(k)
-        c = k - f
-
-        if f == len(sorted_values) - 1:
-            return sorted_values[f]
-
-        return sorted_values[f] * (1 - c) + sorted_values[f + 1] * c
+    def _get_operation_sketch(
+        self, operation_name: str, window_seconds: int | None = None
+    ) -> QuantileSketch:
+        """Merge an operation's duration sketch over a time window"""
+        with self._lock:
+            windowed = self._operation_timers.get(operation_name)
+            if windowed is None:
+                return QuantileSketch()
+            return windowed.merged(window_seconds)
 
     def _calculate_trend_slope(self, values: list[float]) -> float:
         """Calculate trend slope using simple linear regression"""
@@ -1094,19 +1266,23 @@ def monitor_performance(operation_name: str = None):
         if operation_name is None:
             operation_name = func.__name__
 
+        def resolve_monitor() -> PerformanceMonitor | None:
+            try:
+                from .di_container import get_container
+
+                return get_container().get(PerformanceMonitor)
+            except Exception:
+                # Monitoring not available
+                return None
+
         if asyncio.iscoroutinefunction(func):
 
             async def async_wrapper(*args, **kwargs):
-                try:
-                    from .di_container import get_container
-
-                    container = get_container()
-                    monitor = container.get(PerformanceMonitor)
+                monitor = resolve_monitor()
+                if monitor is None:
+                    return await func(*args, **kwargs)
 
-                    async with monitor.time_operation(operation_name):
-                        return await func(*args, **kwargs)
-                except Exception:
-                    # Fallback if monitoring not available
+                async with monitor.time_operation(operation_name):
                     return await func(*args, **kwargs)
 
             return async_wrapper
@@ -1118,9 +1294,11 @@ def monitor_performance(operation_name: str = None):
                     result = func(*args, **kwargs)
                     return result
                 finally:
-                    duration = time.time() - start_time
-                    # Could log duration here for sync functions
-                    pass
+                    monitor = resolve_monitor()
+                    if monitor is not None:
+                        monitor.record_duration(
+                            operation_name, time.time() - start_time
+                        )
 
             return sync_wrapper
 
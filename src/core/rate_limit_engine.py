@@ -0,0 +1,299 @@
+# =============================================================================
+# QuranBot - Rate Limit Engine
+# =============================================================================
+# Shared GCRA (generic cell rate algorithm) rate limiter used by commands,
+# the AI assistant and the webhook loggers. Each key stores a single
+# "theoretical arrival time", so checks are O(1) in time and memory and a
+# key whose bucket has fully refilled can be evicted without losing state.
+# =============================================================================
+
+from dataclasses import dataclass
+from datetime import datetime
+import json
+import math
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+# Default location for persisted rate limit state
+RATE_LIMIT_STATE_FILE = (
+    Path(__file__).parent.parent.parent / "data" / "rate_limit_state.json"
+)
+
+# How often idle keys are swept out of memory
+EVICTION_INTERVAL_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    A rate limit policy: `limit` requests per `period_seconds`.
+
+    `burst` is how many requests may arrive back to back; it defaults to
+    `limit`, which lets a full window's worth through at once and then
+    refills one request every `period_seconds / limit`.
+    """
+
+    name: str
+    limit: int
+    period_seconds: float
+    burst: int | None = None
+    persist: bool = False
+
+    @property
+    def emission_interval(self) -> float:
+        """Seconds it takes to earn back one request"""
+        return self.period_seconds / self.limit
+
+    @property
+    def burst_tolerance(self) -> float:
+        """How far ahead of real time the arrival time may run"""
+        return self.emission_interval * (self.burst or self.limit)
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of a rate limit check"""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # Seconds until the next request would be allowed
+    reset_after: float  # Seconds until the limit is fully replenished
+
+    @property
+    def used(self) -> int:
+        """Requests currently counted against the limit"""
+        return self.limit - self.remaining
+
+    @property
+    def retry_at(self) -> datetime:
+        """Local time at which the next request would be allowed"""
+        return datetime.fromtimestamp(time.time() + self.retry_after)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary for status displays"""
+        return {
+            "allowed": self.allowed,
+            "limit": self.limit,
+            "used": self.used,
+            "remaining": self.remaining,
+            "retry_after": self.retry_after,
+            "reset_after": self.reset_after,
+            "retry_at": self.retry_at.strftime("%H:%M"),
+        }
+
+
+class RateLimitEngine:
+    """
+    Keyed GCRA rate limiter.
+
+    State is one float per (rule, key): the time at which that key's
+    bucket will be completely full again. Keys whose arrival time is in
+    the past carry no information and are evicted automatically during
+    normal use. Rules marked `persist` are written to `state_file` so
+    long limits (such as one AI question per hour) survive restarts.
+    """
+
+    def __init__(
+        self,
+        state_file: Path | None = None,
+        eviction_interval: float = EVICTION_INTERVAL_SECONDS,
+    ):
+        self.state_file = state_file
+        self.eviction_interval = eviction_interval
+
+        # {(rule name, key): theoretical arrival time}
+        self._arrival_times: dict[tuple[str, str], float] = {}
+        self._persisted_rules: set[str] = set()
+        self._last_eviction = 0.0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        if self.state_file:
+            self._load_state()
+
+    def acquire(
+        self, rule: RateLimitRule, key: Any, cost: int = 1, now: float | None = None
+    ) -> RateLimitDecision:
+        """Consume `cost` requests for a key if the rule allows it"""
+        return self.acquire_all([(rule, key)], cost=cost, now=now)
+
+    def acquire_all(
+        self,
+        checks: list[tuple[RateLimitRule, Any]],
+        cost: int = 1,
+        now: float | None = None,
+    ) -> RateLimitDecision:
+        """
+        Consume requests against several rules at once.
+
+        Either every rule admits the request and all of them are charged,
+        or none are. The returned decision is the first denial, or the
+        most restrictive allowance when everything passes.
+        """
+        now = now if now is not None else time.time()
+
+        with self._lock:
+            pending = []
+            decisions = []
+            for rule, key in checks:
+                state_key = (rule.name, str(key))
+                arrival = max(self._arrival_times.get(state_key, now), now)
+                new_arrival = arrival + rule.emission_interval * cost
+
+                if new_arrival - now > rule.burst_tolerance:
+                    return self._decision(rule, arrival, now, allowed=False, cost=cost)
+
+                pending.append((rule, state_key, new_arrival))
+                decisions.append(self._decision(rule, new_arrival, now, allowed=True))
+
+            for rule, state_key, new_arrival in pending:
+                self._arrival_times[state_key] = new_arrival
+                if rule.persist:
+                    self._persisted_rules.add(rule.name)
+                    self._dirty = True
+
+            # Persisted rules guard slow limits, so write them through
+            save_due = self._maybe_evict(now) or (
+                self.state_file is not None
+                and any(rule.persist for rule, _, _ in pending)
+            )
+
+        if save_due:
+            try:
+                self.save_state()
+            except OSError:
+                # Persistence is best effort; limits still apply in memory
+                pass
+
+        return min(decisions, key=lambda d: d.remaining)
+
+    def peek(
+        self, rule: RateLimitRule, key: Any, now: float | None = None
+    ) -> RateLimitDecision:
+        """Report a key's status without consuming anything"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            arrival = max(self._arrival_times.get((rule.name, str(key)), now), now)
+        new_arrival = arrival + rule.emission_interval
+        allowed = new_arrival - now <= rule.burst_tolerance
+        return self._decision(rule, arrival, now, allowed=allowed)
+
+    def reset(self, rule: RateLimitRule, key: Any) -> None:
+        """Forget a key's history"""
+        with self._lock:
+            if self._arrival_times.pop((rule.name, str(key)), None) is not None:
+                self._dirty = self._dirty or rule.name in self._persisted_rules
+
+    def evict_idle(self, now: float | None = None) -> int:
+        """Drop keys whose bucket has fully refilled; returns how many"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            return self._evict(now)
+
+    def save_state(self) -> None:
+        """Write persisted rules' arrival times to the state file"""
+        if not self.state_file:
+            return
+
+        with self._lock:
+            entries = [
+                {"rule": rule_name, "key": key, "arrival": arrival}
+                for (rule_name, key), arrival in self._arrival_times.items()
+                if rule_name in self._persisted_rules
+            ]
+            self._dirty = False
+
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.state_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump({"entries": entries, "saved_at": time.time()}, f)
+        os.replace(temp_file, self.state_file)
+
+    @property
+    def tracked_keys(self) -> int:
+        """Number of keys currently held in memory"""
+        return len(self._arrival_times)
+
+    # =========================================================================
+    # Private Methods
+    # =========================================================================
+
+    def _decision(
+        self,
+        rule: RateLimitRule,
+        arrival: float,
+        now: float,
+        allowed: bool,
+        cost: int = 1,
+    ) -> RateLimitDecision:
+        """Build a decision from a key's arrival time"""
+        backlog = arrival - now
+        remaining = math.floor(
+            (rule.burst_tolerance - backlog) / rule.emission_interval + 1e-9
+        )
+        retry_after = 0.0
+        if not allowed:
+            retry_after = backlog + rule.emission_interval * cost - rule.burst_tolerance
+
+        return RateLimitDecision(
+            allowed=allowed,
+            limit=rule.burst or rule.limit,
+            remaining=max(0, min(remaining, rule.burst or rule.limit)),
+            retry_after=max(0.0, retry_after),
+            reset_after=max(0.0, backlog),
+        )
+
+    def _maybe_evict(self, now: float) -> bool:
+        """
+        Sweep idle keys once per eviction interval (caller holds the lock).
+
+        Returns True when persisted state changed and should be saved.
+        """
+        if now - self._last_eviction < self.eviction_interval:
+            return False
+
+        self._evict(now)
+        return self._dirty and self.state_file is not None
+
+    def _evict(self, now: float) -> int:
+        """Remove keys whose arrival time has passed (caller holds the lock)"""
+        idle = [key for key, arrival in self._arrival_times.items() if arrival <= now]
+        for key in idle:
+            del self._arrival_times[key]
+            if key[0] in self._persisted_rules:
+                self._dirty = True
+        self._last_eviction = now
+        return len(idle)
+
+    def _load_state(self) -> None:
+        """Restore persisted arrival times that are still in the future"""
+        try:
+            with open(self.state_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        now = time.time()
+        for entry in data.get("entries", []):
+            if entry["arrival"] > now:
+                self._arrival_times[(entry["rule"], entry["key"])] = entry["arrival"]
+                self._persisted_rules.add(entry["rule"])
+
+
+# =============================================================================
+# Global Rate Limit Engine
+# =============================================================================
+
+_rate_limit_engine: RateLimitEngine | None = None
+
+
+def get_rate_limit_engine() -> RateLimitEngine:
+    """Get the shared, persisted rate limit engine"""
+    global _rate_limit_engine
+    if _rate_limit_engine is None:
+        _rate_limit_engine = RateLimitEngine(state_file=RATE_LIMIT_STATE_FILE)
+    return _rate_limit_engine
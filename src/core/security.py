@@ -5,8 +5,6 @@
 # and permission checking for Discord bot commands and interactions.
 # =============================================================================
 
-import asyncio
-from collections import defaultdict, deque
 from collections.abc import Callable
 from functools import wraps
 import hashlib
@@ -17,6 +15,7 @@ from typing import Any
 import discord
 
 from .exceptions import RateLimitError, SecurityError, ValidationError
+from .rate_limit_engine import RateLimitEngine, RateLimitRule, get_rate_limit_engine
 from .structured_logger import StructuredLogger
 
 # =============================================================================
@@ -33,76 +32,19 @@ class RateLimiter:
     - Per-guild rate limiting
     - Per-command rate limiting
     - Global rate limiting
-    - Sliding window and token bucket algorithms
+    - Token bucket limits for bursty commands
+
+    All tiers are backed by a RateLimitEngine, so every check is O(1) per
+    tier and idle keys are evicted by the engine itself.
     """
 
-    def __init__(self, logger: StructuredLogger | None = None):
+    def __init__(
+        self,
+        logger: StructuredLogger | None = None,
+        engine: RateLimitEngine | None = None,
+    ):
         self.logger = logger
-
-        # Rate limit storage: {scope: {identifier: deque of timestamps}}
-        self._user_requests: dict[str, dict[int, deque]] = defaultdict(
-            lambda: defaultdict(deque)
-        )
-        self._guild_requests: dict[str, dict[int, deque]] = defaultdict(
-            lambda: defaultdict(deque)
-        )
-        self._command_requests: dict[str, deque] = defaultdict(deque)
-        self._global_requests: deque = deque()
-
-        # Token bucket storage: {scope: {identifier: (tokens, last_refill)}}
-        self._token_buckets: dict[str, dict[int, tuple]] = defaultdict(dict)
-
-        # Cleanup task
-        self._cleanup_task: asyncio.Task | None = None
-        self._start_cleanup_task()
-
-    def _start_cleanup_task(self):
-        """Start background cleanup task"""
-        if self._cleanup_task is None or self._cleanup_task.done():
-            self._cleanup_task = asyncio.create_task(self._cleanup_old_requests())
-
-    async def _cleanup_old_requests(self):
-        """Clean up old request timestamps periodically"""
-        while True:
-            try:
-                await asyncio.sleep(300)  # Clean up every 5 minutes
-                current_time = time.time()
-
-                # Clean up user requests (older than 1 hour)
-                for command_requests in self._user_requests.values():
-                    for user_id, timestamps in list(command_requests.items()):
-                        while timestamps and current_time - timestamps[0] > 3600:
-                            timestamps.popleft()
-                        if not timestamps:
-                            del command_requests[user_id]
-
-                # Clean up guild requests (older than 1 hour)
-                for command_requests in self._guild_requests.values():
-                    for guild_id, timestamps in list(command_requests.items()):
-                        while timestamps and current_time - timestamps[0] > 3600:
-                            timestamps.popleft()
-                        if not timestamps:
-                            del command_requests[guild_id]
-
-                # Clean up command requests (older than 1 hour)
-                for command, timestamps in self._command_requests.items():
-                    while timestamps and current_time - timestamps[0] > 3600:
-                        timestamps.popleft()
-
-                # Clean up global requests (older than 1 hour)
-                while (
-                    self._global_requests
-                    and current_time - self._global_requests[0] > 3600
-                ):
-                    self._global_requests.popleft()
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                if self.logger:
-                    await self.logger.error(
-                        "Rate limiter cleanup error", {"error": str(e)}
-                    )
+        self.engine = engine or get_rate_limit_engine()
 
     async def check_rate_limit(
         self,
@@ -140,114 +82,70 @@ class RateLimiter:
         Raises:
             RateLimitError: If rate limit is exceeded
         """
-        current_time = time.time()
-
-        # Check user rate limit
-        user_requests = self._user_requests[command_name][user_id]
-        self._clean_window(user_requests, current_time, user_window)
-
-        if len(user_requests) >= user_limit:
-            if self.logger:
-                await self.logger.warning(
-                    "User rate limit exceeded",
-                    {
-                        "user_id": user_id,
-                        "command": command_name,
-                        "limit": user_limit,
-                        "window": user_window,
-                        "current_requests": len(user_requests),
-                    },
-                )
-            raise RateLimitError(
-                f"User rate limit exceeded: {user_limit} requests per {user_window} seconds",
-                limit_type="user",
-                limit=user_limit,
-                window=user_window,
-                current_count=len(user_requests),
+        tiers = [
+            (
+                "user",
+                RateLimitRule(f"user:{command_name}", user_limit, user_window),
+                user_id,
             )
-
-        # Check guild rate limit (if in a guild)
+        ]
         if guild_id:
-            guild_requests = self._guild_requests[command_name][guild_id]
-            self._clean_window(guild_requests, current_time, guild_window)
-
-            if len(guild_requests) >= guild_limit:
-                if self.logger:
-                    await self.logger.warning(
-                        "Guild rate limit exceeded",
-                        {
-                            "guild_id": guild_id,
-                            "command": command_name,
-                            "limit": guild_limit,
-                            "window": guild_window,
-                            "current_requests": len(guild_requests),
-                        },
-                    )
-                raise RateLimitError(
-                    f"Guild rate limit exceeded: {guild_limit} requests per {guild_window} seconds",
-                    limit_type="guild",
-                    limit=guild_limit,
-                    window=guild_window,
-                    current_count=len(guild_requests),
+            tiers.append(
+                (
+                    "guild",
+                    RateLimitRule(f"guild:{command_name}", guild_limit, guild_window),
+                    guild_id,
                 )
-
-        # Check command rate limit
-        command_requests = self._command_requests[command_name]
-        self._clean_window(command_requests, current_time, command_window)
-
-        if len(command_requests) >= command_limit:
-            if self.logger:
-                await self.logger.warning(
-                    "Command rate limit exceeded",
-                    {
-                        "command": command_name,
-                        "limit": command_limit,
-                        "window": command_window,
-                        "current_requests": len(command_requests),
-                    },
-                )
-            raise RateLimitError(
-                f"Command rate limit exceeded: {command_limit} requests per {command_window} seconds",
-                limit_type="command",
-                limit=command_limit,
-                window=command_window,
-                current_count=len(command_requests),
             )
-
-        # Check global rate limit
-        self._clean_window(self._global_requests, current_time, global_window)
-
-        if len(self._global_requests) >= global_limit:
-            if self.logger:
-                await self.logger.warning(
-                    "Global rate limit exceeded",
-                    {
-                        "limit": global_limit,
-                        "window": global_window,
-                        "current_requests": len(self._global_requests),
-                    },
-                )
-            raise RateLimitError(
-                f"Global rate limit exceeded: {global_limit} requests per {global_window} seconds",
-                limit_type="global",
-                limit=global_limit,
-                window=global_window,
-                current_count=len(self._global_requests),
+        tiers.append(
+            (
+                "command",
+                RateLimitRule("command_total", command_limit, command_window),
+                command_name,
             )
+        )
+        tiers.append(
+            (
+                "global",
+                RateLimitRule("command_global", global_limit, global_window),
+                "all",
+            )
+        )
 
-        # Record the request
-        user_requests.append(current_time)
-        if guild_id:
-            guild_requests.append(current_time)
-        command_requests.append(current_time)
-        self._global_requests.append(current_time)
+        decision = self.engine.acquire_all([(rule, key) for _, rule, key in tiers])
+        if decision.allowed:
+            return True
 
-        return True
+        # Find the tier that refused the request
+        for limit_type, rule, key in tiers:
+            status = self.engine.peek(rule, key)
+            if not status.allowed:
+                break
 
-    def _clean_window(self, timestamps: deque, current_time: float, window: int):
-        """Remove timestamps outside the current window"""
-        while timestamps and current_time - timestamps[0] > window:
-            timestamps.popleft()
+        if self.logger:
+            await self.logger.warning(
+                f"{limit_type.capitalize()} rate limit exceeded",
+                {
+                    "user_id": user_id,
+                    "guild_id": guild_id,
+                    "command": command_name,
+                    "limit": rule.limit,
+                    "window": rule.period_seconds,
+                    "current_requests": status.used,
+                    "retry_after": status.retry_after,
+                },
+            )
+        raise RateLimitError(
+            f"{limit_type.capitalize()} rate limit exceeded: {rule.limit} requests "
+            f"per {rule.period_seconds} seconds",
+            user_id=user_id,
+            command=command_name,
+            limit_type=limit_type,
+            retry_after=status.retry_after,
+            limit=rule.limit,
+            window=rule.period_seconds,
+            current_count=status.used,
+        )
 
     async def check_token_bucket(
         self,
@@ -268,63 +166,54 @@ class RateLimiter:
         Returns:
             True if request should proceed, False if no tokens available
         """
-        current_time = time.time()
-        key = f"{command_name}:{user_id}"
-
-        if key not in self._token_buckets:
-            # Initialize new bucket
-            self._token_buckets[key] = (bucket_size - 1, current_time)
-            return True
+        rule = self._token_bucket_rule(command_name, bucket_size, refill_rate)
+        decision = self.engine.acquire(rule, user_id)
 
-        tokens, last_refill = self._token_buckets[key]
-
-        # Calculate tokens to add
-        time_passed = current_time - last_refill
-        tokens_to_add = time_passed * refill_rate
-        new_tokens = min(bucket_size, tokens + tokens_to_add)
-
-        if new_tokens >= 1:
-            # Consume one token
-            self._token_buckets[key] = (new_tokens - 1, current_time)
-            return True
-        else:
-            # No tokens available
+        if not decision.allowed:
             if self.logger:
                 await self.logger.warning(
                     "Token bucket rate limit exceeded",
                     {
                         "user_id": user_id,
                         "command": command_name,
-                        "tokens": new_tokens,
+                        "tokens": decision.remaining,
                         "bucket_size": bucket_size,
+                        "retry_after": decision.retry_after,
                     },
                 )
             return False
 
+        return True
+
     async def get_rate_limit_status(
         self, user_id: int, command_name: str
     ) -> dict[str, Any]:
         """Get current rate limit status for a user and command"""
-        current_time = time.time()
-
-        user_requests = self._user_requests[command_name][user_id]
-        self._clean_window(user_requests, current_time, 60)  # Default 60s window
-
-        token_bucket_key = f"{command_name}:{user_id}"
-        tokens = 0
-        if token_bucket_key in self._token_buckets:
-            tokens, last_refill = self._token_buckets[token_bucket_key]
-            time_passed = current_time - last_refill
-            tokens = min(
-                10, tokens + time_passed * 1.0
-            )  # Default bucket size and refill rate
+        # Default user tier and token bucket settings
+        user_status = self.engine.peek(
+            RateLimitRule(f"user:{command_name}", 5, 60), user_id
+        )
+        bucket_status = self.engine.peek(
+            self._token_bucket_rule(command_name, 10, 1.0), user_id
+        )
 
         return {
-            "user_requests_last_minute": len(user_requests),
-            "available_tokens": tokens,
-            "next_token_in": max(0, 1.0 - tokens) if tokens < 1 else 0,
+            "user_requests_last_minute": user_status.used,
+            "available_tokens": bucket_status.remaining,
+            "next_token_in": bucket_status.retry_after,
+            "retry_at": (
+                None if user_status.allowed else user_status.retry_at.strftime("%H:%M")
+            ),
         }
 
+    def _token_bucket_rule(
+        self, command_name: str, bucket_size: int, refill_rate: float
+    ) -> RateLimitRule:
+        """Express a token bucket as an equivalent GCRA rule"""
+        return RateLimitRule(
+            f"bucket:{command_name}", bucket_size, bucket_size / refill_rate
+        )
+
 
 # =============================================================================
 # Rate Limiting Decorators
@@ -403,9 +292,10 @@ def rate_limit(
                     description=f"You're doing that too quickly! {e!s}",
                     color=0xFF6B6B,
                 )
+                retry_at = int(time.time() + (e.retry_after or 0))
                 embed.add_field(
                     name="🔄 Try Again",
-                    value=f"Please wait {e.window} seconds before trying again.",
+                    value=f"You can try again <t:{retry_at}:R> (at <t:{retry_at}:t>).",
                     inline=False,
                 )
                 embed.set_footer(
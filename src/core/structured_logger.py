@@ -181,6 +181,18 @@ class StructuredLogger:
         """
         return correlation_id.get()
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check whether messages at `level` pass the logger's level.
+
+        The async methods emit regardless of level; hot paths check this
+        first so their debug output follows the configured level.
+
+        Args:
+            level: Logging level to check
+        """
+        return self._logger.isEnabledFor(level)
+
     async def debug(self, message: str, context: dict[str, Any] | None = None) -> None:
         """
         Log debug message with optional context.
@@ -19,14 +19,17 @@ import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+import hashlib
 import time
 from typing import Any
+import uuid
 import weakref
 
 import aiohttp
 import pytz
 
 from .exceptions import QuranBotError
+from .rate_limit_engine import RateLimitEngine, RateLimitRule, get_rate_limit_engine
 from .structured_logger import StructuredLogger
 
 
@@ -116,37 +119,30 @@ class WebhookMessage:
 
 
 class RateLimitTracker:
-    """Memory-efficient rate limit tracker using sliding window."""
+    """Memory-efficient rate limit tracker backed by the shared GCRA engine."""
 
-    def __init__(self, max_requests: int, window_seconds: int = 60):
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: int = 60,
+        engine: RateLimitEngine | None = None,
+        key: str | None = None,
+    ):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._requests: list[float] = []
-        self._lock = asyncio.Lock()
+        self._rule = RateLimitRule("webhook", max_requests, window_seconds)
+        self._engine = engine or get_rate_limit_engine()
+        # Engine key for this tracker's budget; trackers only share a budget
+        # when given the same key (e.g. the same webhook)
+        self._key = key or f"tracker:{uuid.uuid4().hex}"
 
     async def can_proceed(self) -> bool:
         """Check if request can proceed without hitting rate limit."""
-        async with self._lock:
-            now = time.time()
-            # Remove old requests outside the window
-            cutoff = now - self.window_seconds
-            self._requests = [
-                req_time for req_time in self._requests if req_time > cutoff
-            ]
-
-            if len(self._requests) < self.max_requests:
-                self._requests.append(now)
-                return True
-            return False
+        return self._engine.acquire(self._rule, self._key).allowed
 
     async def get_retry_after(self) -> float:
         """Get seconds to wait before next request."""
-        if not self._requests:
-            return 0.0
-
-        oldest_request = min(self._requests)
-        retry_after = self.window_seconds - (time.time() - oldest_request)
-        return max(0.0, retry_after)
+        return self._engine.peek(self._rule, self._key).retry_after
 
 
 class WebhookFormatter:
@@ -367,8 +363,12 @@ class ModernWebhookLogger:
         self.bot = bot
 
         # Initialize components
+        # Keyed by a hash of the URL so the secret never lands in engine state
+        webhook_key = hashlib.sha256(config.webhook_url.encode()).hexdigest()[:16]
         self.rate_limiter = RateLimitTracker(
-            config.max_logs_per_minute, config.rate_limit_window
+            config.max_logs_per_minute,
+            config.rate_limit_window,
+            key=f"url:{webhook_key}",
         )
         self.formatter = WebhookFormatter(config, bot)
         self.sender = WebhookSender(config, logger)
@@ -9,8 +9,8 @@
 import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
-import random
 import re
+from typing import TypedDict
 
 import discord
 from discord.ext import commands
@@ -33,9 +33,43 @@ from src.data.models import (
     ReciterInfo,
 )
 from src.services.state_service import StateService
+from src.utils.opus_library import get_opus_library
+from src.utils.playback_clock import (
+    PlaybackClock,
+    PlaybackEvent,
+    PlaybackEventType,
+    extrapolate_position,
+    get_heartbeat,
+)
+from src.utils.reciter_catalog import get_reciter_catalog
+from src.utils.shuffle_playlist import ShuffleMode, ShufflePlaylistStore
 
 from .metadata_cache import MetadataCache
 
+# How long past a track's known duration to wait for the player's `after`
+# callback before treating it as stuck, and the limit for unknown durations
+WATCHDOG_GRACE_SECONDS = 30
+WATCHDOG_UNKNOWN_DURATION = 300
+
+# A resume this close to the end of a track moves on to the next one instead
+RESUME_END_MARGIN_SECONDS = 30
+
+
+class PlaybackStatus(TypedDict):
+    """Playback status in the shape the control panel reads"""
+
+    is_playing: bool
+    is_paused: bool
+    current_surah: int
+    current_reciter: str
+    is_loop_enabled: bool
+    is_shuffle_enabled: bool
+    current_track: int
+    total_tracks: int
+    available_reciters: list[str]
+    current_time: float
+    total_time: float
+
 
 class AudioService:
     """
@@ -57,6 +91,7 @@ class AudioService:
         config: AudioServiceConfig,
         logger: StructuredLogger,
         metadata_cache: MetadataCache,
+        shuffle_mode: ShuffleMode = ShuffleMode.UNIFORM,
     ):
         """
         Initialize the audio service.
@@ -67,6 +102,7 @@ class AudioService:
             config: Audio service configuration
             logger: Structured logger
             metadata_cache: Metadata cache service
+            shuffle_mode: How shuffle cycles are ordered
         """
         self._container = container
         self._bot = bot
@@ -92,16 +128,32 @@ class AudioService:
         # Background tasks
         self._playback_task: asyncio.Task | None = None
         self._monitoring_task: asyncio.Task | None = None
-        self._position_save_task: asyncio.Task | None = None
+        self._snapshot_task: asyncio.Task | None = None
 
         # Recovery and monitoring
         self._connection_attempts = 0
         self._last_successful_playback = datetime.now(UTC)
         self._health_check_interval = 60  # seconds
 
-        # Track state for resume functionality
-        self._track_start_time: float | None = None
-        self._pause_timestamp: float | None = None
+        # Position is derived from playback events; each event saves a snapshot
+        self._playback_clock = PlaybackClock()
+        self._playback_clock.subscribe(self._on_playback_event)
+        self._track_error: Exception | None = None
+
+        # Pre-transcoded Opus mirror used for passthrough playback
+        self._opus_library = get_opus_library(
+            str(config.audio_base_folder), str(config.ffmpeg_path)
+        )
+
+        # Shared catalogue of reciter folders (scanned once, refreshed by mtime)
+        self._catalog = get_reciter_catalog(str(config.audio_base_folder))
+
+        # Persisted no-repeat shuffle order per reciter
+        self._shuffle_playlists = ShufflePlaylistStore()
+        self._shuffle_mode = shuffle_mode
+
+        # Control panel status, rebuilt whenever playback state changes
+        self._status: PlaybackStatus = self._build_status()
 
     async def initialize(self) -> None:
         """Initialize the audio service"""
@@ -152,6 +204,10 @@ class AudioService:
             # Stop playback
             await self.stop_playback()
 
+            # Let the final playback snapshot finish writing
+            if self._snapshot_task and not self._snapshot_task.done():
+                await self._snapshot_task
+
             # Disconnect from voice
             await self.disconnect()
 
@@ -159,7 +215,6 @@ class AudioService:
             tasks = [
                 self._playback_task,
                 self._monitoring_task,
-                self._position_save_task,
             ]
 
             for task in tasks:
@@ -170,6 +225,9 @@ class AudioService:
                     except asyncio.CancelledError:
                         pass
 
+            # Stop background Opus conversion
+            await self._opus_library.stop()
+
             # Shutdown cache
             await self._cache.shutdown()
 
@@ -374,6 +432,7 @@ class AudioService:
 
         self._current_state.is_playing = False
         self._current_state.is_paused = False
+        self._refresh_status()
 
         await self._logger.info("Stopped audio playback")
 
@@ -390,7 +449,7 @@ class AudioService:
         self._voice_client.pause()
         self._current_state.is_playing = False
         self._current_state.is_paused = True
-        self._pause_timestamp = asyncio.get_event_loop().time()
+        self._playback_clock.paused()
 
         await self._logger.info("Paused audio playback")
         return True
@@ -409,12 +468,7 @@ class AudioService:
         self._current_state.is_playing = True
         self._current_state.is_paused = False
 
-        # Adjust track start time for accurate position tracking
-        if self._pause_timestamp and self._track_start_time:
-            pause_duration = asyncio.get_event_loop().time() - self._pause_timestamp
-            self._track_start_time += pause_duration
-
-        self._pause_timestamp = None
+        self._playback_clock.resumed()
 
         await self._logger.info("Resumed audio playback")
         return True
@@ -452,6 +506,10 @@ class AudioService:
 
         # Update state
         self._current_state.current_reciter = reciter
+        self._refresh_status()
+        self._opus_library.start_background_transcode(
+            str(self._config.audio_base_folder / reciter)
+        )
 
         await self._logger.info(
             "Changed reciter",
@@ -512,6 +570,7 @@ class AudioService:
         # Update state
         self._current_state.current_position.surah_number = surah_number
         self._current_state.current_position.position_seconds = 0.0
+        self._refresh_status()
 
         await self._logger.info(
             "Changed surah", {"from": old_surah, "to": surah_number}
@@ -578,6 +637,7 @@ class AudioService:
         """
         old_mode = self._current_state.mode
         self._current_state.mode = mode
+        self._refresh_status()
 
         await self._logger.info(
             "Changed playback mode", {"from": old_mode.value, "to": mode.value}
@@ -587,15 +647,35 @@ class AudioService:
 
     async def get_playback_state(self) -> PlaybackState:
         """Get current playback state"""
-        # Update current position if playing
-        if self._current_state.is_playing and self._track_start_time:
-            current_time = asyncio.get_event_loop().time()
-            elapsed = current_time - self._track_start_time
-            self._current_state.current_position.position_seconds = max(0.0, elapsed)
+        # Position is derived from the last playback event
+        if self._playback_clock.is_active:
+            self._current_state.current_position.position_seconds = (
+                self._get_current_position()
+            )
 
         self._current_state.last_updated = datetime.now(UTC)
         return self._current_state.copy(deep=True)
 
+    def get_playback_status(self) -> PlaybackStatus:
+        """
+        Control panel status without any I/O.
+
+        Everything but the position is precomputed on state changes; the
+        position comes from the last playback event.
+        """
+        status = self._status.copy()
+        status["current_time"], status["total_time"] = self.get_position()
+        return status
+
+    def get_position(self) -> tuple[float, float]:
+        """(position, duration) of the current track, without any I/O"""
+        duration = (
+            self._playback_clock.duration
+            or self._current_state.current_position.total_duration
+            or 0.0
+        )
+        return self._get_current_position(), duration
+
     async def get_available_reciters(self) -> list[ReciterInfo]:
         """Get list of available reciters"""
         return self._available_reciters.copy()
@@ -634,25 +714,21 @@ class AudioService:
             )
             return
 
-        # Scan directories for reciters
-        for item in self._config.audio_base_folder.iterdir():
-            if item.is_dir():
-                mp3_files = list(item.glob("*.mp3"))
-                if mp3_files:
-                    reciter_info = ReciterInfo(
-                        name=item.name,
-                        folder_name=item.name,
-                        total_surahs=len(
-                            [f for f in mp3_files if self._extract_surah_number(f.name)]
-                        ),
-                        file_count=len(mp3_files),
-                        audio_quality=None,  # Could be detected from files
-                        language="Arabic",
-                    )
-                    self._available_reciters.append(reciter_info)
+        # Reciters come from the shared catalogue rather than a folder walk
+        for reciter in self._catalog.get_reciters():
+            reciter_info = ReciterInfo(
+                name=reciter,
+                folder_name=reciter,
+                total_surahs=len(self._catalog.get_surahs(reciter)),
+                file_count=len(self._catalog.get_files(reciter)),
+                audio_quality=None,  # Could be detected from files
+                language="Arabic",
+            )
+            self._available_reciters.append(reciter_info)
 
         # Sort by name
         self._available_reciters.sort(key=lambda r: r.name)
+        self._refresh_status()
 
         # Warm cache for default reciter
         if self._config.preload_metadata:
@@ -695,8 +771,19 @@ class AudioService:
             state_service = self._container.get(StateService)
             saved_state = await state_service.load_playback_state()
 
+            # A snapshot saved mid-track keeps advancing from its timestamp
+            # until the previous run's last heartbeat
+            position = saved_state.current_position
+            position.position_seconds = extrapolate_position(
+                position.position_seconds,
+                saved_state.is_playing and not saved_state.is_paused,
+                position.timestamp.timestamp() if position.timestamp else None,
+                get_heartbeat().previous_alive_at(),
+            )
+
             # Update current state with saved data
             self._current_state = saved_state
+            self._refresh_status()
 
             await self._logger.info(
                 "Loaded saved playback state",
@@ -718,8 +805,10 @@ class AudioService:
         # Start monitoring task
         self._monitoring_task = asyncio.create_task(self._monitoring_loop())
 
-        # Start position saving task
-        self._position_save_task = asyncio.create_task(self._position_save_loop())
+        # Convert the current reciter to Opus for passthrough playback
+        self._opus_library.start_background_transcode(
+            str(self._config.audio_base_folder / self._current_state.current_reciter)
+        )
 
         await self._logger.info("Started background tasks")
 
@@ -757,13 +846,36 @@ class AudioService:
                     await self._advance_to_next_track()
                     continue
 
+                # An extrapolated resume can land at or past the end of the
+                # track; move on rather than seek past EOF
+                resume_at = self._current_state.current_position.position_seconds
+                duration = file_info.duration_seconds
+                if (
+                    resume_position
+                    and duration
+                    and resume_at >= duration - RESUME_END_MARGIN_SECONDS
+                ):
+                    await self._logger.info(
+                        "Saved position is at the end of the track, skipping ahead",
+                        {"position": f"{resume_at:.1f}s", "duration": f"{duration:.1f}s"},
+                    )
+                    self._current_state.current_position.position_seconds = 0.0
+                    resume_position = False
+                    await self._advance_to_next_track()
+                    continue
+
                 # Create audio source
+                resumed = (
+                    resume_position
+                    and self._current_state.current_position.position_seconds > 0
+                )
+                start_offset = (
+                    self._current_state.current_position.position_seconds
+                    if resumed
+                    else 0.0
+                )
                 try:
-                    audio_source = await self._create_audio_source(
-                        file_path,
-                        resume_position
-                        and self._current_state.current_position.position_seconds > 0,
-                    )
+                    audio_source = await self._create_audio_source(file_path, resumed)
                     resume_position = False  # Only resume once
 
                 except Exception as e:
@@ -780,9 +892,15 @@ class AudioService:
 
                 # Start playback
                 try:
-                    self._voice_client.play(audio_source)
+                    finished = asyncio.Event()
+                    self._track_error = None
+                    self._voice_client.play(
+                        audio_source, after=self._make_after_callback(finished)
+                    )
                     self._current_state.is_playing = True
-                    self._track_start_time = asyncio.get_event_loop().time()
+                    self._playback_clock.track_started(
+                        start_offset, file_info.duration_seconds
+                    )
                     self._last_successful_playback = datetime.now(UTC)
 
                     # Update position info
@@ -802,7 +920,9 @@ class AudioService:
                     )
 
                     # Wait for playback to complete
-                    await self._wait_for_playback_completion()
+                    await self._wait_for_playback_completion(
+                        finished, file_info.duration_seconds
+                    )
 
                 except Exception as e:
                     raise AudioError(
@@ -816,7 +936,8 @@ class AudioService:
                         original_error=e,
                     )
 
-                # Move to next track
+                # Move to next track; its start is the next playback event
+                self._playback_clock.reset()
                 await self._advance_to_next_track()
 
         except asyncio.CancelledError:
@@ -826,13 +947,34 @@ class AudioService:
             await self._logger.error("Error in playback loop", {"error": str(e)})
             raise
         finally:
+            # Record where playback ended if it stopped mid-track
+            if self._playback_clock.is_active:
+                self._current_state.current_position.position_seconds = (
+                    self._get_current_position()
+                )
+                self._playback_clock.stopped()
             self._current_state.is_playing = False
-            self._track_start_time = None
+            self._refresh_status()
 
     async def _create_audio_source(
         self, file_path: Path, resume: bool = False
     ) -> discord.AudioSource:
         """Create FFmpeg audio source with proper options"""
+        position = (
+            self._current_state.current_position.position_seconds if resume else 0.0
+        )
+
+        # Converted tracks pass their Opus packets straight through
+        opus_path = self._opus_library.get_opus_path(str(file_path))
+        if opus_path:
+            return discord.FFmpegOpusAudio(
+                opus_path,
+                codec="copy",
+                executable=self._config.ffmpeg_path,
+                before_options=f"-ss {position}" if position > 0 else None,
+                options="-vn",
+            )
+
         ffmpeg_options = [
             "-vn",  # No video
             "-loglevel warning",
@@ -850,28 +992,161 @@ class AudioService:
                 ]
             )
 
-        before_options = []
-        if resume and self._current_state.current_position.position_seconds > 0:
-            before_options.append(
-                f"-ss {self._current_state.current_position.position_seconds}"
-            )
+        # Resume MP3s at a byte offset from the seek index instead of -ss scanning
+        before_options, options = self._opus_library.seek_index.ffmpeg_options(
+            str(file_path), position, " ".join(ffmpeg_options)
+        )
 
         return discord.FFmpegPCMAudio(
             str(file_path),
             executable=self._config.ffmpeg_path,
-            before_options=" ".join(before_options) if before_options else None,
-            options=" ".join(ffmpeg_options),
+            before_options=before_options,
+            options=options,
+        )
+
+    def _make_after_callback(self, finished: asyncio.Event):
+        """Bridge VoiceClient.play's `after` (player thread) into an asyncio event"""
+        loop = asyncio.get_running_loop()
+
+        def after(error: Exception | None) -> None:
+            self._track_error = error
+            try:
+                loop.call_soon_threadsafe(finished.set)
+            except RuntimeError:
+                # Event loop already closed during shutdown
+                pass
+
+        return after
+
+    def _get_current_position(self) -> float:
+        """Current position in the track, derived from the last playback event"""
+        if not self._playback_clock.is_active:
+            return self._current_state.current_position.position_seconds
+        return self._playback_clock.position()
+
+    def _build_status(self) -> PlaybackStatus:
+        """Control panel status for the current state (position filled in on read)"""
+        state = self._current_state
+        surah = state.current_position.surah_number
+        reciter_names = [r.name for r in self._available_reciters]
+        total_tracks = next(
+            (
+                r.total_surahs
+                for r in self._available_reciters
+                if r.name == state.current_reciter
+            ),
+            114,
+        )
+        return PlaybackStatus(
+            is_playing=state.is_playing,
+            is_paused=state.is_paused,
+            current_surah=surah,
+            current_reciter=state.current_reciter,
+            is_loop_enabled=state.mode == PlaybackMode.LOOP_TRACK,
+            is_shuffle_enabled=state.mode == PlaybackMode.SHUFFLE,
+            current_track=surah,
+            total_tracks=total_tracks,
+            available_reciters=reciter_names or [state.current_reciter],
+            current_time=0.0,
+            total_time=0.0,
+        )
+
+    def _refresh_status(self) -> None:
+        """Rebuild the control panel status after a state change"""
+        self._status = self._build_status()
+
+    def _on_playback_event(self, event: PlaybackEvent) -> None:
+        """Persist a playback snapshot for each playback event"""
+        self._refresh_status()
+        snapshot = {
+            "surah_number": self._current_state.current_position.surah_number,
+            "position_seconds": event.offset,
+            "reciter": self._current_state.current_reciter,
+            "is_playing": event.running,
+            "is_paused": event.type is PlaybackEventType.PAUSED,
+            "volume": self._current_state.volume,
+        }
+        self._snapshot_task = asyncio.get_running_loop().create_task(
+            self._save_playback_snapshot(event, snapshot, self._snapshot_task)
+        )
+
+    async def _save_playback_snapshot(
+        self,
+        event: PlaybackEvent,
+        snapshot: dict,
+        previous: asyncio.Task | None = None,
+    ) -> None:
+        """Save a snapshot once the previous one is written, keeping event order"""
+        if previous and not previous.done():
+            await asyncio.wait([previous])
+
+        try:
+            state_service = self._container.get(StateService)
+            await state_service.save_playback_state(**snapshot)
+        except Exception as e:
+            await self._logger.warning(
+                "Failed to save playback snapshot",
+                {"event": event.type.value, "error": str(e)},
+            )
+
+    async def _wait_for_playback_completion(
+        self, finished: asyncio.Event, duration: float | None
+    ) -> None:
+        """
+        Wait for the player's `after` callback to signal the end of the track.
+
+        A watchdog derived from the track duration force-stops playback that
+        overruns it; paused tracks re-arm the watchdog instead.
+        """
+        while True:
+            if duration:
+                timeout = duration - self._get_current_position() + WATCHDOG_GRACE_SECONDS
+            else:
+                timeout = WATCHDOG_UNKNOWN_DURATION
+
+            try:
+                await asyncio.wait_for(finished.wait(), timeout=max(timeout, 1.0))
+                break
+            except TimeoutError:
+                if self._voice_client and self._voice_client.is_paused():
+                    continue
+
+                await self._logger.warning(
+                    "Playback watchdog stopped a stuck track",
+                    {
+                        "position": f"{self._get_current_position():.1f}s",
+                        "duration": duration,
+                    },
+                )
+                if self._voice_client:
+                    self._voice_client.stop()
+                break
+
+        self._current_state.current_position.position_seconds = (
+            self._get_current_position()
         )
 
-    async def _wait_for_playback_completion(self) -> None:
-        """Wait for current track to complete playback"""
-        while self._voice_client and self._voice_client.is_playing():
-            await asyncio.sleep(1)
+        if self._track_error:
+            await self._logger.error(
+                "Audio player reported an error",
+                {"error": str(self._track_error)},
+            )
+
+    async def _get_shuffle_durations(self, reciter: str) -> dict[int, float] | None:
+        """Surah durations for weighted shuffle modes, read off the event loop"""
+        if self._shuffle_mode is ShuffleMode.UNIFORM:
+            return None
 
-            # Update position
-            if self._track_start_time:
-                elapsed = asyncio.get_event_loop().time() - self._track_start_time
-                self._current_state.current_position.position_seconds = elapsed
+        def read_durations() -> dict[int, float]:
+            surah_files = self._catalog.get_surahs(reciter)
+            durations = {
+                surah: self._catalog.get_duration(path)
+                for surah, path in surah_files.items()
+            }
+            self._catalog.flush()
+            return durations
+
+        return await asyncio.to_thread(read_durations)
 
     async def _advance_to_next_track(self) -> None:
         """Advance to the next track based on playback mode"""
@@ -883,15 +1158,19 @@ class AudioService:
             return
 
         elif self._current_state.mode == PlaybackMode.SHUFFLE:
-            # Random surah
-            reciter_info = await self._get_reciter_info(
-                self._current_state.current_reciter
-            )
-            if reciter_info and reciter_info.total_surahs > 1:
-                available_surahs = list(range(1, reciter_info.total_surahs + 1))
-                available_surahs.remove(current_surah)  # Don't repeat current
-                next_surah = random.choice(available_surahs)
-                self._current_state.current_position.surah_number = next_surah
+            # Next surah from the reciter's persisted shuffle order
+            reciter = self._current_state.current_reciter
+            surahs = list(self._catalog.get_surahs(reciter))
+            if len(surahs) > 1:
+                playlist = self._shuffle_playlists.get(
+                    reciter,
+                    surahs,
+                    self._shuffle_mode,
+                    await self._get_shuffle_durations(reciter),
+                )
+                playlist.mark_played(current_surah)
+                self._current_state.current_position.surah_number = playlist.advance()
+                self._shuffle_playlists.save()
 
         else:
             # Normal progression
@@ -912,6 +1191,7 @@ class AudioService:
 
         # Reset position for new track
         self._current_state.current_position.position_seconds = 0.0
+        self._refresh_status()
 
         await self._logger.info(
             "Advanced to next track",
@@ -924,20 +1204,11 @@ class AudioService:
 
     async def _get_current_audio_file_path(self) -> Path | None:
         """Get the path to the current audio file"""
-        reciter_folder = (
-            self._config.audio_base_folder / self._current_state.current_reciter
-        )
-        if not reciter_folder.exists():
-            return None
-
         surah_number = self._current_state.current_position.surah_number
-
-        # Look for files that match the surah number
-        for file_path in reciter_folder.glob("*.mp3"):
-            if self._extract_surah_number(file_path.name) == surah_number:
-                return file_path
-
-        return None
+        file_path = self._catalog.get_surahs(self._current_state.current_reciter).get(
+            surah_number
+        )
+        return Path(file_path) if file_path else None
 
     async def _get_reciter_info(self, reciter: str) -> ReciterInfo | None:
         """Get reciter information by name"""
@@ -989,20 +1260,3 @@ class AudioService:
                 break
             except Exception as e:
                 await self._logger.error("Error in monitoring loop", {"error": str(e)})
-
-    async def _position_save_loop(self) -> None:
-        """Background loop to save playback position"""
-        while True:
-            try:
-                await asyncio.sleep(5)  # Save every 5 seconds
-
-                if self._current_state.is_playing:
-                    # Save current state (implementation would use state manager)
-                    pass
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                await self._logger.error(
-                    "Error in position save loop", {"error": str(e)}
-                )
@@ -9,7 +9,7 @@
 # 4. Practical Islamic Tools - Prayer times, Qibla, Zakat, etc.
 # =============================================================================
 
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
 import math
 from pathlib import Path
@@ -20,11 +20,17 @@ from openai import AsyncOpenAI
 import requests
 
 from src.config import get_config_service
+from src.core.rate_limit_engine import RateLimitRule, get_rate_limit_engine
 from src.services.conversation_memory_service import get_conversation_memory_service
 from src.services.islamic_calendar_service import get_islamic_calendar_service
 from src.utils.tree_log import log_error_with_traceback, log_perfect_tree_section
 
 
+# One question per hour per user, kept across restarts. The name must differ
+# from IslamicAIService's rule because both share the global engine.
+AI_QUESTION_RULE = RateLimitRule("enhanced_ai_question", 1, 3600, persist=True)
+
+
 class EnhancedIslamicAIService:
     """Enhanced Islamic AI service with hadith integration, verse lookup, and practical tools."""
 
@@ -36,7 +42,7 @@ class EnhancedIslamicAIService:
         self.practical_tools: dict = {}
         self.syrian_knowledge: dict = {}
         self.user_sessions: dict[int, dict] = {}  # Track deep dive sessions
-        self.user_rate_limits: dict[int, dict] = {}  # Track rate limits
+        self.rate_limit_engine = get_rate_limit_engine()
 
     async def initialize(self) -> bool:
         """Initialize the enhanced AI service with all databases."""
@@ -874,29 +880,7 @@ Remember: You're a caring member of the Muslim community with your own personali
     def _check_rate_limit(self, user_id: int) -> bool:
         """Check if user has exceeded rate limit (1 question per hour)."""
         try:
-            current_time = datetime.now()
-
-            if user_id not in self.user_rate_limits:
-                self.user_rate_limits[user_id] = {
-                    'requests': [],
-                    'last_reset': current_time
-                }
-
-            user_data = self.user_rate_limits[user_id]
-
-            # Clean old requests (older than 1 hour)
-            one_hour_ago = current_time - timedelta(hours=1)
-            user_data['requests'] = [
-                req_time for req_time in user_data['requests']
-                if req_time > one_hour_ago
-            ]
-
-            # Check if under limit (1 request per hour)
-            if len(user_data['requests']) < 1:
-                user_data['requests'].append(current_time)
-                return True
-
-            return False
+            return self.rate_limit_engine.acquire(AI_QUESTION_RULE, user_id).allowed
 
         except Exception as e:
             log_error_with_traceback("Error in rate limit check", e)
@@ -911,43 +895,19 @@ Remember: You're a caring member of the Muslim community with your own personali
                     "requests_used": 0,
                     "requests_remaining": "∞",
                     "reset_time": 0,
+                    "retry_at": None,
                     "is_admin": True
                 }
 
-            current_time = datetime.now()
-
-            if user_id not in self.user_rate_limits:
-                return {
-                    "requests_used": 0,
-                    "requests_remaining": 1,
-                    "reset_time": 0,
-                    "is_admin": False
-                }
-
-            user_data = self.user_rate_limits[user_id]
-
-            # Clean old requests
-            one_hour_ago = current_time - timedelta(hours=1)
-            user_data['requests'] = [
-                req_time for req_time in user_data['requests']
-                if req_time > one_hour_ago
-            ]
-
-            requests_used = len(user_data['requests'])
-            requests_remaining = max(0, 1 - requests_used)
-
-            # Calculate reset time
-            reset_time = 0
-            if user_data['requests']:
-                oldest_request = min(user_data['requests'])
-                reset_datetime = oldest_request + timedelta(hours=1)
-                if reset_datetime > current_time:
-                    reset_time = int((reset_datetime - current_time).total_seconds())
+            status = self.rate_limit_engine.peek(AI_QUESTION_RULE, user_id)
 
             return {
-                "requests_used": requests_used,
-                "requests_remaining": requests_remaining,
-                "reset_time": reset_time,
+                "requests_used": status.used,
+                "requests_remaining": status.remaining,
+                "reset_time": math.ceil(status.retry_after),
+                "retry_at": (
+                    None if status.allowed else status.retry_at.strftime("%H:%M")
+                ),
                 "is_admin": False
             }
 
@@ -957,6 +917,7 @@ Remember: You're a caring member of the Muslim community with your own personali
                 "requests_used": 0,
                 "requests_remaining": 1,
                 "reset_time": 0,
+                "retry_at": None,
                 "is_admin": False
             }
 
@@ -5,7 +5,6 @@ Provides Islamic knowledge assistance with proper disclaimers and authentic guid
 """
 
 import asyncio
-from datetime import datetime
 import json
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -13,8 +12,12 @@ from typing import Dict, Optional, Tuple
 import openai
 
 from src.config import get_config_service
+from src.core.rate_limit_engine import RateLimitRule, get_rate_limit_engine
 from src.utils.tree_log import log_error_with_traceback, log_perfect_tree_section
 
+# One question per hour per user, kept across restarts
+AI_QUESTION_RULE = RateLimitRule("ai_question", 1, 3600, persist=True)
+
 
 class IslamicAIService:
     """Service for handling Islamic Q&A using OpenAI GPT-3.5 Turbo
@@ -30,7 +33,7 @@ class IslamicAIService:
         self.config = get_config_service().config
         self.client = None
         self.system_prompt = self._create_islamic_system_prompt()
-        self.rate_limits = {}  # Simple rate limiting per user
+        self.rate_limit_engine = get_rate_limit_engine()
 
     async def initialize(self):
         """Initialize the OpenAI client"""
@@ -276,57 +279,21 @@ Remember: You're not just an information source - you're a caring member of the
         if user_id == self.config.DEVELOPER_ID:
             return True
 
-        now = datetime.now()
-
-        if user_id not in self.rate_limits:
-            self.rate_limits[user_id] = []
-
-        # Clean old requests (older than 1 hour)
-        self.rate_limits[user_id] = [
-            timestamp for timestamp in self.rate_limits[user_id]
-            if (now - timestamp).total_seconds() < 3600  # 1 hour
-        ]
-
-        # Check if under limit (1 question per hour)
-        if len(self.rate_limits[user_id]) >= 1:
-            return False
-
-        # Add current request
-        self.rate_limits[user_id].append(now)
-        return True
+        return self.rate_limit_engine.acquire(AI_QUESTION_RULE, user_id).allowed
 
     def get_rate_limit_status(self, user_id: int) -> dict[str, any]:
         """Get current rate limit status for user"""
         # Admin users have unlimited access
         if user_id == self.config.DEVELOPER_ID:
-            return {"requests_used": 0, "requests_remaining": "∞", "reset_time": None, "is_admin": True}
-
-        now = datetime.now()
-
-        if user_id not in self.rate_limits:
-            return {"requests_used": 0, "requests_remaining": 1, "reset_time": None, "is_admin": False}
-
-        # Clean old requests (older than 1 hour)
-        recent_requests = [
-            timestamp for timestamp in self.rate_limits[user_id]
-            if (now - timestamp).total_seconds() < 3600  # 1 hour
-        ]
-
-        requests_used = len(recent_requests)
-        requests_remaining = max(0, 1 - requests_used)
+            return {"requests_used": 0, "requests_remaining": "∞", "reset_time": None, "retry_at": None, "is_admin": True}
 
-        # Find oldest request for reset time
-        reset_time = None
-        if recent_requests:
-            oldest_request = min(recent_requests)
-            reset_seconds = 3600 - (now - oldest_request).total_seconds()  # 1 hour
-            if reset_seconds > 0:
-                reset_time = int(reset_seconds)
+        status = self.rate_limit_engine.peek(AI_QUESTION_RULE, user_id)
 
         return {
-            "requests_used": requests_used,
-            "requests_remaining": requests_remaining,
-            "reset_time": reset_time,
+            "requests_used": status.used,
+            "requests_remaining": status.remaining,
+            "reset_time": int(status.retry_after) if status.retry_after > 0 else None,
+            "retry_at": status.retry_at.strftime("%H:%M") if status.retry_after > 0 else None,
             "is_admin": False
         }
 
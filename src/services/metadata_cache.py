@@ -16,6 +16,7 @@ from mutagen.mp3 import MP3
 from src.core.exceptions import AudioError
 from src.core.structured_logger import StructuredLogger
 from src.data.models import AudioCache, AudioFileInfo, ReciterInfo
+from src.utils.reciter_catalog import get_reciter_catalog
 
 
 class MetadataCache:
@@ -180,17 +181,16 @@ class MetadataCache:
             },
         )
 
-        # Find all MP3 files
-        mp3_files = list(reciter_folder.glob("*.mp3"))
+        # Surah files come from the shared catalogue rather than a folder walk
+        surah_files = get_reciter_catalog(str(audio_base_folder)).get_surahs(
+            reciter_info.folder_name
+        )
         loaded_count = 0
 
-        for file_path in mp3_files:
+        for surah_number, file_path in surah_files.items():
             try:
-                # Extract surah number from filename
-                surah_number = self._extract_surah_number(file_path.name)
-                if surah_number:
-                    await self.get_file_info(file_path, reciter_info.name, surah_number)
-                    loaded_count += 1
+                await self.get_file_info(Path(file_path), reciter_info.name, surah_number)
+                loaded_count += 1
             except Exception as e:
                 await self._logger.warning(
                     "Failed to load metadata during cache warming",
@@ -206,7 +206,7 @@ class MetadataCache:
             {
                 "reciter": reciter_info.name,
                 "files_loaded": loaded_count,
-                "total_files": len(mp3_files),
+                "total_files": len(surah_files),
                 "cache_size": len(self._cache),
             },
         )
@@ -395,16 +395,6 @@ class MetadataCache:
         except Exception:
             return ""
 
-    def _extract_surah_number(self, filename: str) -> int | None:
-        """Extract surah number from filename"""
-        import re
-
-        match = re.search(r"(\d+)", filename)
-        if match:
-            surah_num = int(match.group(1))
-            return surah_num if 1 <= surah_num <= 114 else None
-        return None
-
     async def _cleanup_loop(self) -> None:
         """Background task to clean up expired cache entries"""
         while True:
@@ -8,8 +8,6 @@
 
 import asyncio
 from datetime import UTC, datetime
-import gzip
-import hashlib
 import json
 from pathlib import Path
 import uuid
@@ -24,9 +22,12 @@ from src.data.models import (
     PlaybackPosition,
     PlaybackState,
     StateServiceConfig,
-    StateSnapshot,
     StateValidationResult,
 )
+from src.utils.snapshot_store import SNAPSHOT_KIND_PARTIAL, get_snapshot_store
+
+# Snapshot reasons are "state-<backup type>", e.g. "state-manual"
+BACKUP_REASON_PREFIX = "state-"
 
 
 class StateService:
@@ -73,6 +74,11 @@ class StateService:
         self._bot_statistics_file = self._config.data_directory / "bot_statistics.json"
         self._session_file = self._config.data_directory / "current_session.json"
 
+        # Backups are partial snapshots in the shared snapshot store
+        self._snapshot_store = get_snapshot_store(
+            self._config.backup_directory / "snapshots", self._config.data_directory
+        )
+
         # Background tasks
         self._backup_task: asyncio.Task | None = None
         self._cleanup_task: asyncio.Task | None = None
@@ -429,53 +435,13 @@ class StateService:
             List of backup information
         """
         try:
-            backups = []
-            backup_dir = self._config.backup_directory
-
-            if not backup_dir.exists():
-                return backups
-
-            # Find backup files
-            backup_files = list(backup_dir.glob("backup_*.json.gz"))
-            backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
-            for backup_file in backup_files[:limit]:
-                try:
-                    stat = backup_file.stat()
-                    backup_id = backup_file.stem.replace(".json", "")
-
-                    # Try to read backup metadata from the file
-                    backup_type = "automatic"  # Default
-                    description = None
-                    try:
-                        with gzip.open(backup_file, "rt", encoding="utf-8") as f:
-                            backup_data = json.load(f)
-                            # Read metadata if available
-                            if "metadata" in backup_data:
-                                metadata = backup_data["metadata"]
-                                backup_type = metadata.get("backup_type", "automatic")
-                                description = metadata.get("description")
-                    except Exception:
-                        # If we can't read the backup, assume it's automatic
-                        pass
-
-                    backup_info = BackupInfo(
-                        backup_id=backup_id,
-                        file_path=backup_file,
-                        backup_type=backup_type,
-                        file_size=stat.st_size,
-                        created_at=datetime.fromtimestamp(stat.st_mtime, tz=UTC),
-                        description=description,
-                    )
-                    backups.append(backup_info)
-
-                except Exception as e:
-                    await self._logger.warning(
-                        "Failed to read backup file info",
-                        {"file": str(backup_file), "error": str(e)},
-                    )
-
-            return backups
+            snapshots = await asyncio.to_thread(self._snapshot_store.list_snapshots)
+            backups = [
+                self._backup_info(snapshot)
+                for snapshot in snapshots
+                if self._is_state_backup(snapshot)
+            ]
+            return backups[:limit]
 
         except Exception as e:
             await self._logger.error("Failed to list backups", {"error": str(e)})
@@ -492,40 +458,21 @@ class StateService:
             True if restore successful
         """
         try:
-            backup_file = self._config.backup_directory / f"{backup_id}.json.gz"
+            manifest = await asyncio.to_thread(
+                self._snapshot_store.load_manifest, backup_id
+            )
 
-            if not backup_file.exists():
-                await self._logger.error(
-                    "Backup file not found",
-                    {"backup_id": backup_id, "file": str(backup_file)},
-                )
+            if manifest is None or not self._is_state_backup(manifest):
+                await self._logger.error("Backup not found", {"backup_id": backup_id})
                 return False
 
-            # Load backup data
-            with gzip.open(backup_file, "rt", encoding="utf-8") as f:
-                backup_data = json.load(f)
-
-            # Handle both old and new backup formats
-            if "snapshot" in backup_data:
-                # New format with metadata
-                snapshot_data = backup_data["snapshot"]
-            else:
-                # Old format (direct snapshot)
-                snapshot_data = backup_data
-
-            # Validate backup data
-            snapshot = StateSnapshot(**snapshot_data)
-
-            # Restore state
-            self._playback_state = snapshot.playback_state
-            self._bot_statistics = snapshot.bot_statistics
-
-            # Save restored state
-            await self._save_all_state()
+            # Rewrite the state files that differ, then reload them
+            restored = await asyncio.to_thread(self._snapshot_store.restore, backup_id)
+            await self._load_existing_state()
 
             await self._logger.info(
                 "State restored from backup",
-                {"backup_id": backup_id, "snapshot_age_hours": snapshot.age_hours},
+                {"backup_id": backup_id, "restored_files": restored},
             )
 
             return True
@@ -758,50 +705,51 @@ class StateService:
     async def _create_backup(
         self, backup_type: str, description: str | None = None
     ) -> BackupInfo | None:
-        """Create a state backup"""
+        """Snapshot the state files into the snapshot store"""
         try:
-            backup_id = f"backup_{datetime.now(UTC).strftime('%Y_%m_%d_%H_%M_%S_%f')}"
-            backup_file = self._config.backup_directory / f"{backup_id}.json.gz"
-
-            # Create snapshot
-            snapshot = StateSnapshot(
-                snapshot_id=backup_id,
-                playback_state=self._playback_state,
-                bot_statistics=self._bot_statistics,
-                current_session=self._current_session,
-            )
-
-            # Add checksum
-            snapshot.checksum = self._calculate_checksum(snapshot.model_dump_json())
+            # Make sure the files match the in-memory state
+            await self._save_all_state()
 
-            # Create backup data with metadata
-            backup_data = {
-                "snapshot": snapshot.model_dump(),
-                "metadata": {
-                    "backup_type": backup_type,
-                    "description": description,
-                    "created_at": datetime.now(UTC).isoformat(),
-                },
-            }
+            state_files = [
+                path
+                for path in (
+                    self._playback_state_file,
+                    self._bot_statistics_file,
+                    self._session_file,
+                )
+                if path.exists()
+            ]
+
+            result = await asyncio.to_thread(
+                self._snapshot_store.snapshot,
+                state_files,
+                reason=f"{BACKUP_REASON_PREFIX}{backup_type}",
+                kind=SNAPSHOT_KIND_PARTIAL,
+                description=description,
+            )
+            if result.failed:
+                raise StateError(
+                    "Failed to snapshot state files",
+                    context={"files": result.failed},
+                )
 
-            # Save compressed backup
-            with gzip.open(backup_file, "wt", encoding="utf-8") as f:
-                json.dump(backup_data, f, indent=2, default=str)
+            # Unchanged state is already covered by the latest backup
+            if result.snapshot_id is None:
+                backups = await self.list_backups(limit=1)
+                return backups[0] if backups else None
 
-            backup_info = BackupInfo(
-                backup_id=backup_id,
-                file_path=backup_file,
-                backup_type=backup_type,
-                file_size=backup_file.stat().st_size,
-                description=description,
+            manifest = await asyncio.to_thread(
+                self._snapshot_store.load_manifest, result.snapshot_id
             )
+            backup_info = self._backup_info({**manifest, "size": result.total_size})
 
             await self._logger.debug(
                 "Backup created",
                 {
-                    "backup_id": backup_id,
+                    "backup_id": backup_info.backup_id,
                     "type": backup_type,
-                    "size": backup_info.file_size,
+                    "changed_files": result.changed_files,
+                    "bytes_stored": result.bytes_stored,
                 },
             )
 
@@ -814,29 +762,42 @@ class StateService:
             return None
 
     async def _cleanup_old_backups(self) -> None:
-        """Clean up old backup files"""
+        """Apply the snapshot store's retention policy"""
         try:
-            backup_files = list(self._config.backup_directory.glob("backup_*.json.gz"))
-            backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
-            # Keep only the configured number of backups
-            files_to_remove = backup_files[self._config.max_backups :]
-
-            for backup_file in files_to_remove:
-                backup_file.unlink()
+            removed_snapshots, removed_blobs = await asyncio.to_thread(
+                self._snapshot_store.prune
+            )
 
-            if files_to_remove:
+            if removed_snapshots:
                 await self._logger.info(
                     "Cleaned up old backups",
                     {
-                        "removed_count": len(files_to_remove),
-                        "remaining_count": len(backup_files) - len(files_to_remove),
+                        "removed_snapshots": removed_snapshots,
+                        "removed_blobs": removed_blobs,
                     },
                 )
 
         except Exception as e:
             await self._logger.error("Failed to cleanup old backups", {"error": str(e)})
 
+    @staticmethod
+    def _is_state_backup(snapshot: dict) -> bool:
+        """Whether a snapshot was taken by this service"""
+        return snapshot.get("kind") == SNAPSHOT_KIND_PARTIAL and snapshot.get(
+            "reason", ""
+        ).startswith(BACKUP_REASON_PREFIX)
+
+    def _backup_info(self, snapshot: dict) -> BackupInfo:
+        """BackupInfo for a snapshot summary"""
+        return BackupInfo(
+            backup_id=snapshot["id"],
+            file_path=self._snapshot_store.manifests_dir / f"{snapshot['id']}.json",
+            backup_type=snapshot["reason"][len(BACKUP_REASON_PREFIX) :],
+            file_size=snapshot["size"],
+            created_at=datetime.fromisoformat(snapshot["created_at"]),
+            description=snapshot.get("description"),
+        )
+
     async def _save_all_state(self) -> None:
         """Save all current state to files"""
         await asyncio.gather(
@@ -900,7 +861,3 @@ class StateService:
                 "Failed to load JSON file", {"file": str(file_path), "error": str(e)}
             )
             return None
-
-    def _calculate_checksum(self, data: str) -> str:
-        """Calculate SHA256 checksum of data"""
-        return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
@@ -28,6 +28,7 @@ from .control_panel import (
     SimpleControlPanelView,
     SurahSelect,
     cleanup_all_control_panels,
+    cleanup_control_panels,
     create_control_panel,
     setup_control_panel,
 )
@@ -173,6 +174,7 @@ __all__ = [
     "create_control_panel",
     "setup_control_panel",
     "cleanup_all_control_panels",
+    "cleanup_control_panels",
     # Rich Presence Management
     "RichPresenceManager",
     "validate_rich_presence_dependencies",
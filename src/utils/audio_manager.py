@@ -30,19 +30,32 @@
 # =============================================================================
 
 import asyncio
-import glob
+from dataclasses import dataclass
 import os
 import re
-import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from pathlib import Path
-import random
 
 import discord
-from mutagen.mp3 import MP3  # For MP3 duration detection
 
-from .state_manager import state_manager
+from .broadcast_audio import BroadcastAudioSource
+from .opus_library import OpusLibrary, get_opus_library
+from .playback_clock import (
+    PlaybackClock,
+    PlaybackEvent,
+    PlaybackEventType,
+    extrapolate_position,
+    get_heartbeat,
+)
+from .reciter_catalog import get_reciter_catalog
+from .shuffle_playlist import (
+    SHUFFLE_STATE_FILE_NAME,
+    ShuffleMode,
+    ShufflePlaylist,
+    ShufflePlaylistStore,
+)
+from .state_manager import StateManager, state_manager
 from .surah_mapper import (
     get_surah_display,
     get_surah_info,
@@ -57,6 +70,30 @@ from .tree_log import (
     log_warning_with_context,
 )
 
+# =============================================================================
+# Gapless Playback
+# =============================================================================
+
+# Seconds before the end of a track at which the next track is prepared
+PREFETCH_LEAD_SECONDS = 20
+
+# How long past a track's known duration to wait for `after` before
+# treating the track as stuck, and the limit used when duration is unknown
+WATCHDOG_GRACE_SECONDS = 30
+WATCHDOG_UNKNOWN_DURATION = 300
+
+
+@dataclass
+class PrefetchedTrack:
+    """Next track resolved, validated and opened before the handoff"""
+
+    index: int
+    file_path: str
+    reciter: str
+    duration: float
+    source: discord.AudioSource
+
+
 # =============================================================================
 # Audio Monitoring System
 # =============================================================================
@@ -811,8 +848,17 @@ _audio_monitor = AudioPlaybackMonitor()
 # Monitoring Task
 # =============================================================================
 
-async def start_audio_monitoring_task(audio_manager):
+async def start_audio_monitoring_task(audio_manager) -> asyncio.Task:
     """Start a background task to monitor audio health with enhanced connection monitoring"""
+    task = getattr(audio_manager, "_monitoring_task", None)
+    if task and not task.done():
+        return task  # Already started by the manager itself
+    audio_manager._monitoring_task = _start_monitoring_loop(audio_manager)
+    return audio_manager._monitoring_task
+
+
+def _start_monitoring_loop(audio_manager) -> asyncio.Task:
+    """Link the primary audio manager to the global monitor and start its health loop"""
     # Link the audio manager to the monitor for auto-recovery
     _audio_monitor._audio_manager = audio_manager
     
@@ -893,7 +939,7 @@ async def start_audio_monitoring_task(audio_manager):
                 # Continue monitoring even if there's an error
                 
     # Start the monitoring task
-    asyncio.create_task(monitoring_loop())
+    return asyncio.create_task(monitoring_loop())
 
 
 class AudioManager:
@@ -907,14 +953,50 @@ class AudioManager:
         default_reciter: str = "Saad Al Ghamdi",
         default_shuffle: bool = False,
         default_loop: bool = False,
+        state_store: Optional[StateManager] = None,
+        guild_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        opus_library: Optional[OpusLibrary] = None,
+        duration_cache: Optional[Dict[str, float]] = None,
+        shuffle_mode: ShuffleMode = ShuffleMode.UNIFORM,
+        monitor_health: bool = True,
     ):
-        """Initialize audio manager with configuration"""
+        """
+        Initialize audio manager with configuration.
+
+        The optional arguments let a GuildSessionManager run one manager per
+        guild with its own state file and voice channel, while sharing the
+        Opus library and duration cache. Without them the manager uses the
+        global state manager and the GUILD_ID/VOICE_CHANNEL_ID environment.
+
+        Only the primary manager (monitor_health=True) drives the global
+        health monitor and its loop; session managers record into a monitor
+        of their own, so recovery never targets the wrong guild.
+        """
         self.bot = bot
         self.ffmpeg_path = ffmpeg_path
         self.audio_base_folder = audio_base_folder
         self.default_reciter = default_reciter
         self.default_loop = default_loop
         self.default_shuffle = default_shuffle
+        self.state_manager = state_store or state_manager
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+
+        # Pre-transcoded Opus mirror used for passthrough playback
+        self.opus_library = opus_library or get_opus_library(
+            audio_base_folder, ffmpeg_path
+        )
+
+        # Shared catalogue of reciter folders (scanned once, refreshed by mtime)
+        self.catalog = get_reciter_catalog(audio_base_folder)
+
+        # Persisted per-reciter shuffle order, stored with this manager's state
+        self.shuffle_mode = shuffle_mode
+        self.shuffle_playlists = ShufflePlaylistStore(
+            Path(self.state_manager.data_dir) / SHUFFLE_STATE_FILE_NAME
+        )
+        self._shuffle_file_indices: Dict[int, int] = {}
         
         # State variables
         self.current_reciter = default_reciter
@@ -930,20 +1012,36 @@ class AudioManager:
         
         # Initialize components
         self.voice_client = None
+        self.listener_clients = set()  # Extra voice clients fed from the same decode
+        self._broadcast: Optional[BroadcastAudioSource] = None
         self.rich_presence = None
         self.control_panel = None
         self.control_panel_view = None
-        self.monitor = AudioPlaybackMonitor()
+        self.monitor = _audio_monitor if monitor_health else AudioPlaybackMonitor()
+        if not monitor_health:
+            self.monitor._audio_manager = self  # Recovery acts on this session
+        self._monitoring_task: Optional[asyncio.Task] = None
         
         # Initialize task variables
-        self._position_save_task = None
-        self._position_tracking_task = None
         self._jump_occurred = False
         self.playback_task = None
-        
-        # Initialize timing variables
-        self.track_start_time = None
-        self.track_pause_time = None
+
+        # Position is derived from playback events; each event saves a snapshot
+        self.playback_clock = PlaybackClock()
+        self.playback_clock.subscribe(self._save_playback_snapshot)
+
+        # Track completion signalled by VoiceClient.play(after=...)
+        self._track_finished: Optional[asyncio.Event] = None
+        self._track_error: Optional[Exception] = None
+
+        # Gapless handoff: next track prepared near the end of the current one
+        self._prefetched_track: Optional[PrefetchedTrack] = None
+        self._prefetch_task = None
+        self._duration_cache: Dict[str, float] = (
+            duration_cache if duration_cache is not None else {}
+        )
+        self._background_tasks = set()
+        self._duration_warmup: Optional[asyncio.Task] = None
         
         # Discover available reciters
         self.available_reciters = self._discover_reciters()
@@ -952,15 +1050,14 @@ class AudioManager:
         self._load_saved_state()
         
         # Start background tasks
-        if bot and bot.loop:
-            self._start_position_saving()
-            asyncio.create_task(start_audio_monitoring_task(self))
+        if monitor_health and bot and bot.loop:
+            self._monitoring_task = _start_monitoring_loop(self)
 
     def _load_saved_state(self):
         """Load previous playback state from state manager"""
         try:
-            state = state_manager.load_playback_state()
-            resume_info = state_manager.get_resume_info()
+            state = self.state_manager.load_playback_state()
+            resume_info = self.state_manager.get_resume_info()
 
             # Restore state (but reset reciter, loop, shuffle to environment defaults on restart)
             self.current_surah = state["current_surah"]
@@ -968,7 +1065,14 @@ class AudioManager:
             # Always reset to default reciter on restart
             self.current_reciter = self.default_reciter
 
-            self.current_position = state["current_position"]
+            # A snapshot saved mid-track keeps advancing from its timestamp
+            # until the previous run's last heartbeat
+            self.current_position = extrapolate_position(
+                state["current_position"],
+                state.get("position_running", False),
+                state.get("timestamp"),
+                get_heartbeat().previous_alive_at(),
+            )
 
             # Always reset loop and shuffle to environment defaults on restart
             self.is_loop_enabled = self.default_loop
@@ -1003,147 +1107,19 @@ class AudioManager:
         except Exception as e:
             log_error_with_traceback("Error loading saved state", e)
 
-    def _start_position_saving(self):
-        """Start the periodic position saving task"""
-        try:
-            if hasattr(self, '_position_save_task') and self._position_save_task and not self._position_save_task.done():
-                self._position_save_task.cancel()
-
-            self._position_save_task = asyncio.create_task(self._position_save_loop())
-            log_perfect_tree_section(
-                "Audio Manager - Position Saving",
-                [
-                    ("status", "✅ Started periodic state saving"),
-                    ("interval", "5 seconds"),
-                ],
-                "💾",
-            )
-
-        except Exception as e:
-            log_error_with_traceback("Error starting position saving", e)
-
-    async def _position_save_loop(self):
-        """Periodically save playback position"""
-        try:
-            save_counter = 0  # Counter to control logging frequency
-            while True:
-                await asyncio.sleep(5)  # Save every 5 seconds
-                save_counter += 1
-
-                if self.is_playing and self.rich_presence:
-                    try:
-                        # Use current position from audio manager instead of rich presence
-                        # since get_current_track_info doesn't exist
-                        current_time = self.current_position
-                        total_time = 0  # Could be enhanced with audio file metadata
-
-                        # Save state silently most of the time, only log every 5 minutes
-                        should_log = (
-                            save_counter >= 60
-                        )  # Log every 60th save (5 minutes)
-
-                        state_manager.save_playback_state(
-                            current_surah=self.current_surah,
-                            current_position=current_time,
-                            current_reciter=self.current_reciter,
-                            is_playing=self.is_playing,
-                            loop_enabled=self.is_loop_enabled,
-                            shuffle_enabled=self.is_shuffle_enabled,
-                            silent=not should_log,  # Silent unless it's time to log
-                        )
-
-                        # Reset counter after logging
-                        if should_log:
-                            save_counter = 0
-                    except Exception as e:
-                        log_error_with_traceback("Error in position save loop", e)
-
-        except asyncio.CancelledError:
-            log_perfect_tree_section(
-                "Audio Manager - Position Saving Stopped",
-                [
-                    ("status", "🛑 Position saving stopped"),
-                    ("reason", "Task cancelled"),
-                ],
-                "💾",
-            )
-        except Exception as e:
-            log_error_with_traceback("Critical error in position save loop", e)
-
-    async def _position_tracking_loop(self):
-        """Track playback position and update UI every 15 seconds"""
-        try:
-            update_counter = 0  # Counter to control status logging frequency
-
-            while True:
-                await asyncio.sleep(15)  # Update every 15 seconds
-                update_counter += 1
-
-                if self.is_playing and self.track_start_time:
-                    try:
-                        # Calculate current position based on elapsed time
-                        import time
-
-                        current_time = time.time()
-                        elapsed_time = current_time - self.track_start_time
-
-                        # Get track duration to ensure we don't exceed it
-                        track_duration = self._get_current_file_duration()
-
-                        # Ensure position doesn't exceed track duration
-                        if track_duration > 0:
-                            self.current_position = min(elapsed_time, track_duration)
-                            
-                            # SAFEGUARD: Check if we've reached the end of the track
-                            # If position is within 5 seconds of the end and voice client is still playing,
-                            # this indicates a potential stuck state - force progression
-                            if (self.current_position >= (track_duration - 5) and 
-                                self.voice_client and self.voice_client.is_playing()):
-                                
-                                # Log the safeguard activation
-                                log_perfect_tree_section(
-                                    "Audio Safeguard - Track End Detected",
-                                    [
-                                        ("current_position", f"{self.current_position:.1f}s"),
-                                        ("track_duration", f"{track_duration:.1f}s"),
-                                        ("action", "Force stopping to prevent stuck state"),
-                                        ("safeguard", "✅ Automatic progression activated"),
-                                    ],
-                                    "🛡️"
-                                )
-                                
-                                # Force stop the voice client to trigger progression
-                                try:
-                                    self.voice_client.stop()
-                                except Exception as e:
-                                    log_error_with_traceback("Error force-stopping voice client", e)
-                        else:
-                            self.current_position = elapsed_time
-
-                        # Update control panel every 4th iteration (1 minute)
-                        if update_counter % 4 == 0 and self.control_panel_view:
-                            try:
-                                await self.control_panel_view.update_panel()
-                            except Exception as e:
-                                log_error_with_traceback(
-                                    "Error updating control panel during position tracking",
-                                    e,
-                                )
-
-                    except Exception as e:
-                        log_error_with_traceback("Error in position tracking", e)
-
-        except asyncio.CancelledError:
-            log_perfect_tree_section(
-                "Audio Manager - Position Tracking Stopped",
-                [
-                    ("status", "🛑 Position tracking stopped"),
-                    ("reason", "Task cancelled"),
-                ],
-                "📍",
-            )
-        except Exception as e:
-            log_error_with_traceback("Critical error in position tracking loop", e)
+    def _save_playback_snapshot(self, event: PlaybackEvent):
+        """Persist playback state when a playback event changes it"""
+        stopped = event.type is PlaybackEventType.STOPPED
+        self.state_manager.save_playback_state(
+            current_surah=self.current_surah,
+            current_position=event.offset,
+            current_reciter=self.current_reciter,
+            is_playing=not stopped,
+            loop_enabled=self.is_loop_enabled,
+            shuffle_enabled=self.is_shuffle_enabled,
+            silent=not stopped,
+            position_running=event.running,
+        )
 
     def _discover_reciters(self) -> List[str]:
         """Discover available reciters from audio folder structure"""
@@ -1156,18 +1132,10 @@ class AudioManager:
                 ],
                 "🔍",
             )
-            reciters = []
-
-            if os.path.exists(self.audio_base_folder):
-                # First pass: collect all valid reciters
-                items = sorted(os.listdir(self.audio_base_folder))
-                for item in items:
-                    folder_path = os.path.join(self.audio_base_folder, item)
-                    if os.path.isdir(folder_path):
-                        # Check if folder contains mp3 files
-                        mp3_files = glob.glob(os.path.join(folder_path, "*.mp3"))
-                        if mp3_files:
-                            reciters.append((item, len(mp3_files)))
+            reciters = [
+                (reciter, len(self.catalog.get_files(reciter)))
+                for reciter in self.catalog.get_reciters()
+            ]
 
             result = (
                 sorted([r[0] for r in reciters]) if reciters else ["Saad Al Ghamdi"]
@@ -1284,9 +1252,71 @@ class AudioManager:
         except Exception as e:
             log_error_with_traceback("Error setting voice client", e)
 
+    def add_listener_client(self, voice_client: discord.VoiceClient):
+        """
+        Play the current stream in another voice channel as well.
+
+        The listener shares the primary decode, so each extra channel costs
+        a frame copy rather than another FFmpeg process. Listeners join at
+        the live edge of the current track and follow every later track.
+        """
+        if voice_client is self.voice_client:
+            return
+
+        self.listener_clients.add(voice_client)
+        if self._broadcast and not self._broadcast.ended and self.is_playing:
+            self._attach_listener(voice_client)
+
+        log_perfect_tree_section(
+            "Audio Manager - Listener Added",
+            [
+                ("channel", getattr(voice_client.channel, "name", "Unknown")),
+                ("listeners", len(self.listener_clients)),
+            ],
+            "📡",
+        )
+
+    def remove_listener_client(self, voice_client: discord.VoiceClient):
+        """Stop feeding a listener voice client"""
+        self.listener_clients.discard(voice_client)
+        try:
+            if voice_client.is_playing() or voice_client.is_paused():
+                voice_client.stop()
+        except Exception as e:
+            log_error_with_traceback("Error stopping listener voice client", e)
+
+    def _attach_listener(self, voice_client: discord.VoiceClient):
+        """Subscribe a listener to the current broadcast"""
+        if not voice_client.is_connected():
+            # Disconnected listeners are dropped instead of retried
+            self.listener_clients.discard(voice_client)
+            return
+
+        try:
+            subscriber = self._broadcast.subscribe()
+            if voice_client.is_playing() or voice_client.is_paused():
+                # Swap sources in place so the listener never goes silent
+                previous = voice_client.source
+                voice_client.source = subscriber
+                previous.cleanup()
+            else:
+                voice_client.play(subscriber)
+        except Exception as e:
+            log_error_with_traceback("Error attaching listener voice client", e)
+
+    def _for_each_listener(self, action: str):
+        """Call pause/resume/stop on every listener that is still connected"""
+        for voice_client in list(self.listener_clients):
+            if not voice_client.is_connected():
+                self.listener_clients.discard(voice_client)
+                continue
+            try:
+                getattr(voice_client, action)()
+            except Exception as e:
+                log_error_with_traceback(f"Error calling {action} on listener", e)
+
     async def connect_to_voice_channel(self):
         """Connect to the voice channel with enhanced auto-recovery and validation support"""
-        global _audio_monitor
         try:
             import os
             
@@ -1300,8 +1330,8 @@ class AudioManager:
                     log_error_with_traceback("Error disconnecting existing voice client", disconnect_error)
             
             # Get the bot's target guild and channel
-            guild_id = int(os.getenv("GUILD_ID", "0"))
-            channel_id = int(os.getenv("VOICE_CHANNEL_ID", "0"))
+            guild_id = self.guild_id or int(os.getenv("GUILD_ID", "0"))
+            channel_id = self.channel_id or int(os.getenv("VOICE_CHANNEL_ID", "0"))
 
             if not guild_id or not channel_id:
                 log_warning_with_context(
@@ -1402,7 +1432,7 @@ class AudioManager:
                             )
                             
                             # Record successful connection for monitoring
-                            _audio_monitor.record_successful_connection()
+                            self.monitor.record_successful_connection()
                             
                             return True
                     
@@ -1487,7 +1517,7 @@ class AudioManager:
             )
             
             # Record connection failure for monitoring
-            _audio_monitor.record_connection_failure("connection_failed", f"All {max_connection_attempts} connection attempts failed")
+            self.monitor.record_connection_failure("connection_failed", f"All {max_connection_attempts} connection attempts failed")
             
             return False
 
@@ -1495,7 +1525,7 @@ class AudioManager:
             log_error_with_traceback("Critical error in enhanced voice channel connection", e)
             
             # Record critical failure
-            _audio_monitor.record_connection_failure("critical_error", str(e))
+            self.monitor.record_connection_failure("critical_error", str(e))
             
             return False
 
@@ -1523,9 +1553,7 @@ class AudioManager:
                 )
                 return False
 
-            self.current_audio_files = sorted(
-                glob.glob(os.path.join(audio_folder, "*.mp3"))
-            )
+            self.current_audio_files = self.catalog.get_files(self.current_reciter)
 
             if not self.current_audio_files:
                 log_warning_with_context(
@@ -1537,6 +1565,9 @@ class AudioManager:
             # Update file index to match current surah
             self._update_file_index_for_surah()
 
+            # Convert this reciter to Opus in the background for passthrough
+            self.opus_library.start_background_transcode(audio_folder)
+
             # Check for missing surahs and log them
             self._check_missing_surahs()
 
@@ -1567,17 +1598,8 @@ class AudioManager:
     def _check_missing_surahs(self):
         """Check for missing surahs in the current reciter's collection"""
         try:
-            # Get list of available surah numbers from filenames
-            available_surahs = set()
-            for audio_file in self.current_audio_files:
-                filename = os.path.basename(audio_file)
-                try:
-                    # Extract surah number from filename (e.g., "001.mp3" -> 1)
-                    surah_num = int(filename.split(".")[0])
-                    if 1 <= surah_num <= 114:  # Valid surah range
-                        available_surahs.add(surah_num)
-                except (ValueError, IndexError):
-                    continue
+            # Surah numbers are parsed once by the catalogue
+            available_surahs = set(self.catalog.get_surahs(self.current_reciter))
 
             # Find missing surahs
             all_surahs = set(range(1, 115))  # Surahs 1-114
@@ -1635,7 +1657,6 @@ class AudioManager:
 
     async def start_playback(self, resume_position: bool = True):
         """Start the audio playback loop with monitoring"""
-        global _audio_monitor
         
         try:
             log_perfect_tree_section(
@@ -1648,14 +1669,14 @@ class AudioManager:
             )
 
             if not self.voice_client or not self.voice_client.is_connected():
-                _audio_monitor.record_connection_failure("no_voice_client", "Voice client not connected")
+                self.monitor.record_connection_failure("no_voice_client", "Voice client not connected")
                 log_warning_with_context(
                     "Cannot start playback", "Voice client not connected"
                 )
                 return
 
             if not self.load_audio_files():
-                _audio_monitor.record_playback_failure("no_audio_files", "No audio files loaded")
+                self.monitor.record_playback_failure("no_audio_files", "No audio files loaded")
                 log_warning_with_context(
                     "Cannot start playback", "No audio files loaded"
                 )
@@ -1664,8 +1685,8 @@ class AudioManager:
             # Stop any existing playback
             await self.stop_playback()
 
-            # Start position saving
-            self._start_position_saving()
+            # Weighted shuffle modes need durations before the first pick
+            await self._warm_shuffle_durations()
 
             # Start new playback task
             self.playback_task = asyncio.create_task(
@@ -1673,7 +1694,7 @@ class AudioManager:
             )
             
             # Record successful start
-            _audio_monitor.record_successful_connection()
+            self.monitor.record_successful_connection()
             
             log_perfect_tree_section(
                 "Audio Manager - Playback Started",
@@ -1686,38 +1707,26 @@ class AudioManager:
             )
 
         except Exception as e:
-            _audio_monitor.record_playback_failure("start_playback_error", str(e))
+            self.monitor.record_playback_failure("start_playback_error", str(e))
             log_async_error("start_playback", e, f"Reciter: {self.current_reciter}")
 
+    def stop_health_monitoring(self):
+        """Cancel this manager's health monitoring loop, if it runs one"""
+        if self._monitoring_task and not self._monitoring_task.done():
+            self._monitoring_task.cancel()
+        self._monitoring_task = None
+
     async def stop_playback(self):
         """Stop the audio playback"""
         try:
-            # Save final state before stopping
-            if self.is_playing:
-                try:
-                    if self.rich_presence:
-                        # Use current position from audio manager instead of rich presence
-                        current_time = self.current_position
-                        total_time = 0  # Could be enhanced with audio file metadata
-
-                        state_manager.save_playback_state(
-                            current_surah=self.current_surah,
-                            current_position=current_time,
-                            current_reciter=self.current_reciter,
-                            is_playing=False,
-                            loop_enabled=self.is_loop_enabled,
-                            shuffle_enabled=self.is_shuffle_enabled,
-                        )
-                except Exception as e:
-                    log_error_with_traceback("Error saving final state", e)
+            # Record the final position; the stop event saves it
+            self.current_position = self.get_current_position()
+            self.playback_clock.stopped()
 
-            # Stop position saving task
-            if hasattr(self, '_position_save_task') and self._position_save_task and not self._position_save_task.done():
-                self._position_save_task.cancel()
-
-            # Stop position tracking task
-            if hasattr(self, '_position_tracking_task') and self._position_tracking_task and not self._position_tracking_task.done():
-                self._position_tracking_task.cancel()
+            # Drop any track prepared for the next handoff
+            if self._prefetch_task and not self._prefetch_task.done():
+                self._prefetch_task.cancel()
+            self._discard_prefetch()
 
             if self.playback_task and not self.playback_task.done():
                 self.playback_task.cancel()
@@ -1728,6 +1737,7 @@ class AudioManager:
 
             if self.voice_client and self.voice_client.is_playing():
                 self.voice_client.stop()
+            self._for_each_listener("stop")
 
             if self.rich_presence:
                 try:
@@ -1763,18 +1773,11 @@ class AudioManager:
         try:
             if self.voice_client and self.voice_client.is_playing():
                 self.voice_client.pause()
+                self._for_each_listener("pause")
                 self.is_paused = True
 
-                # Store pause time to maintain accurate position tracking
-                import time
-
-                self.track_pause_time = time.time()
-
-                # Update current position based on elapsed time before pause
-                if self.track_start_time:
-                    self.current_position = (
-                        self.track_pause_time - self.track_start_time
-                    )
+                # Freeze the position (and save it) at the pause
+                self.playback_clock.paused()
 
                 # Update control panel
                 if self.control_panel_view:
@@ -1801,15 +1804,11 @@ class AudioManager:
         try:
             if self.voice_client and self.voice_client.is_paused():
                 self.voice_client.resume()
+                self._for_each_listener("resume")
                 self.is_paused = False
 
-                # Adjust track start time to account for pause duration
-                if self.track_pause_time and self.track_start_time:
-                    import time
-
-                    pause_duration = time.time() - self.track_pause_time
-                    self.track_start_time += pause_duration  # Shift start time forward
-                    self.track_pause_time = None  # Clear pause time
+                # Position advances again from where it was paused
+                self.playback_clock.resumed()
 
                 # Update control panel
                 if self.control_panel_view:
@@ -1843,12 +1842,11 @@ class AudioManager:
                 self.voice_client.stop()
 
             # Move to next track
-            if self.is_shuffle_enabled:
-                import random
-
-                self.current_file_index = random.randint(
-                    0, len(self.current_audio_files) - 1
-                )
+            shuffle_index = (
+                self._advance_shuffle_file_index() if self.is_shuffle_enabled else None
+            )
+            if shuffle_index is not None:
+                self.current_file_index = shuffle_index
             else:
                 self.current_file_index = (self.current_file_index + 1) % len(
                     self.current_audio_files
@@ -1909,13 +1907,12 @@ class AudioManager:
             if self.voice_client and self.voice_client.is_playing():
                 self.voice_client.stop()
 
-            # Move to previous track
-            if self.is_shuffle_enabled:
-                import random
-
-                self.current_file_index = random.randint(
-                    0, len(self.current_audio_files) - 1
-                )
+            # Move to previous track (in shuffle, the previously played one)
+            shuffle_index = (
+                self._previous_shuffle_file_index() if self.is_shuffle_enabled else None
+            )
+            if shuffle_index is not None:
+                self.current_file_index = shuffle_index
             else:
                 self.current_file_index = (self.current_file_index - 1) % len(
                     self.current_audio_files
@@ -2174,40 +2171,446 @@ class AudioManager:
 
     def _get_current_file_duration(self) -> float:
         """Get the duration of the currently playing MP3 file in seconds"""
-        try:
-            if not self.current_audio_files or self.current_file_index >= len(
-                self.current_audio_files
-            ):
-                return 0.0
+        if not self.current_audio_files or self.current_file_index >= len(
+            self.current_audio_files
+        ):
+            return 0.0
+
+        return self._get_file_duration(
+            self.current_audio_files[self.current_file_index]
+        )
+
+    def _get_file_duration(self, file_path: str) -> float:
+        """Get an MP3 file's duration in seconds, cached per file"""
+        if file_path in self._duration_cache:
+            return self._duration_cache[file_path]
+
+        duration = self._read_file_duration(file_path)
+        if duration:
+            self._duration_cache[file_path] = duration
+        return duration
+
+    def _read_file_duration(self, file_path: str) -> float:
+        """
+        Read an MP3 file's duration without touching the cache.
+
+        Safe to run in a worker thread; the caller caches the result on the
+        event loop.
+        """
+        # Indexed files already have an exact duration from the frame scan
+        indexed_duration = self.opus_library.seek_index.get_duration(file_path)
+        if indexed_duration:
+            return indexed_duration
+
+        # Otherwise read once by the (thread-safe) catalogue and kept across restarts
+        return self.catalog.get_duration(file_path)
+
+    def get_current_position(self) -> float:
+        """Current position in the track, derived from the last playback event"""
+        if not self.playback_clock.is_active:
+            return self.current_position
+        return self.playback_clock.position()
+
+    # =========================================================================
+    # Track Completion
+    # =========================================================================
+
+    def _make_after_callback(self, finished: asyncio.Event):
+        """Bridge VoiceClient.play's `after` (player thread) into an asyncio event"""
+        loop = asyncio.get_running_loop()
+
+        def after(error: Optional[Exception]):
+            self._track_error = error
+            try:
+                loop.call_soon_threadsafe(finished.set)
+            except RuntimeError:
+                # Event loop already closed during shutdown
+                pass
 
-            current_file = self.current_audio_files[self.current_file_index]
+        return after
 
-            # Use mutagen to get MP3 duration
-            audio = MP3(current_file)
-            if audio.info and hasattr(audio.info, "length"):
-                return float(audio.info.length)
+    async def _wait_for_track_end(self, finished: asyncio.Event) -> bool:
+        """
+        Wait for the `after` callback, with a watchdog from the track duration.
+
+        Returns False if the watchdog had to force-stop a stuck track.
+        """
+        while True:
+            duration = self._get_current_file_duration()
+            if duration > 0:
+                timeout = duration - self.get_current_position() + WATCHDOG_GRACE_SECONDS
             else:
-                return 0.0
+                timeout = WATCHDOG_UNKNOWN_DURATION
+
+            try:
+                await asyncio.wait_for(finished.wait(), timeout=max(timeout, 1.0))
+                return True
+            except asyncio.TimeoutError:
+                # Paused tracks don't advance; re-arm from the frozen position
+                if self.voice_client and self.voice_client.is_paused():
+                    continue
 
+            log_perfect_tree_section(
+                "Audio Safeguard - Playback Timeout",
+                [
+                    ("position", f"{self.get_current_position():.1f}s"),
+                    ("track_duration", f"{duration:.1f}s"),
+                    ("grace_period", f"{WATCHDOG_GRACE_SECONDS}s"),
+                    ("action", "Force stopping stuck playback"),
+                    ("safeguard", "✅ Timeout protection activated"),
+                ],
+                "⏰",
+            )
+
+            # Force stop the stuck playback
+            try:
+                if self.voice_client:
+                    self.voice_client.stop()
+            except Exception as e:
+                log_error_with_traceback("Error force-stopping stuck playback", e)
+            return False
+
+    # =========================================================================
+    # Shuffle Playlist
+    # =========================================================================
+
+    def set_shuffle_mode(self, mode: ShuffleMode) -> None:
+        """Change how shuffle cycles are ordered (takes effect immediately)"""
+        self.shuffle_mode = mode
+        self._discard_prefetch()
+
+    async def _warm_shuffle_durations(self) -> None:
+        """Read the current reciter's durations in a worker thread"""
+        if self.shuffle_mode is ShuffleMode.UNIFORM:
+            return
+        missing = [
+            path
+            for path in self.catalog.get_surahs(self.current_reciter).values()
+            if path not in self._duration_cache
+        ]
+        if missing:
+            durations = await asyncio.to_thread(self._read_durations, missing)
+            self._duration_cache.update(durations)
+
+    def _read_durations(self, file_paths: list[str]) -> Dict[str, float]:
+        """Read durations for several files (blocking; run in a thread)"""
+        durations = {}
+        for file_path in file_paths:
+            duration = self._read_file_duration(file_path)
+            if duration:
+                durations[file_path] = duration
+        self.catalog.flush()  # One write for the whole scan
+        return durations
+
+    def _get_shuffle_playlist(self) -> Optional[ShufflePlaylist]:
+        """The current reciter's shuffle playlist, synced to the playing surah"""
+        surah_files = self.catalog.get_surahs(self.current_reciter)
+        file_indices = {path: i for i, path in enumerate(self.current_audio_files)}
+        self._shuffle_file_indices = {
+            surah: file_indices[path]
+            for surah, path in surah_files.items()
+            if path in file_indices
+        }
+        if not self._shuffle_file_indices:
+            return None
+
+        durations = None
+        if self.shuffle_mode is not ShuffleMode.UNIFORM:
+            # Only cached durations here: this runs on the event loop. Missing
+            # ones are read in the background and used from then on.
+            durations = {
+                surah: self._duration_cache[surah_files[surah]]
+                for surah in self._shuffle_file_indices
+                if surah_files[surah] in self._duration_cache
+            }
+            if len(durations) < len(self._shuffle_file_indices):
+                self._schedule_duration_warmup()
+
+        playlist = self.shuffle_playlists.get(
+            self.current_reciter,
+            list(self._shuffle_file_indices),
+            self.shuffle_mode,
+            durations,
+        )
+        # Jumps and restarts may have moved playback; never replay it this cycle
+        if playlist.mark_played(self.current_surah):
+            self.shuffle_playlists.save()
+        return playlist
+
+    def _peek_shuffle_file_index(self) -> Optional[int]:
+        """File index of the next shuffled surah, without consuming it"""
+        playlist = self._get_shuffle_playlist()
+        if not playlist:
+            return None
+        return self._shuffle_file_indices.get(playlist.peek_next())
+
+    def _advance_shuffle_surah(self) -> Optional[int]:
+        """Consume and return the next shuffled surah number"""
+        playlist = self._get_shuffle_playlist()
+        if not playlist:
+            return None
+        surah = playlist.advance()
+        self.shuffle_playlists.save()
+        return surah
+
+    def _advance_shuffle_file_index(self) -> Optional[int]:
+        """Consume the next shuffled surah and return its file index"""
+        return self._shuffle_file_indices.get(self._advance_shuffle_surah())
+
+    def _previous_shuffle_file_index(self) -> Optional[int]:
+        """Step back to the previously shuffled surah, if any"""
+        playlist = self._get_shuffle_playlist()
+        if not playlist:
+            return None
+        surah = playlist.step_back()
+        self.shuffle_playlists.save()
+        return self._shuffle_file_indices.get(surah)
+
+    # =========================================================================
+    # Gapless Prefetch
+    # =========================================================================
+
+    def _resolve_next_file_index(self) -> Optional[int]:
+        """Index the playback loop will move to after the current track"""
+        if not self.current_audio_files or self._jump_occurred:
+            return None
+
+        total = len(self.current_audio_files)
+        if self.is_loop_enabled:
+            return self.current_file_index
+
+        if self.is_shuffle_enabled:
+            # Peek without consuming so the prefetch and the real advance agree
+            shuffle_index = self._peek_shuffle_file_index()
+            if shuffle_index is not None:
+                return shuffle_index
+
+        return (self.current_file_index + 1) % total
+
+    def _validate_audio_file(self, file_path: str):
+        """Check a file exists and is readable; returns (failure_type, error) or None"""
+        if not os.path.exists(file_path):
+            return "file_missing", FileNotFoundError(f"File not found: {file_path}")
+
+        try:
+            with open(file_path, "rb") as f:
+                f.read(1024)  # Test read first 1KB
+        except Exception as file_error:
+            return "file_access", file_error
+
+        return None
+
+    def _schedule_prefetch(self):
+        """Prepare the next track shortly before the current one ends"""
+        if self._prefetch_task and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+
+        remaining = self._get_current_file_duration() - self.current_position
+        delay = max(0.0, remaining - PREFETCH_LEAD_SECONDS)
+        self._prefetch_task = asyncio.create_task(self._prefetch_after(delay))
+
+    async def _prefetch_after(self, delay: float):
+        """Wait until the lead window, then prefetch the next track"""
+        try:
+            await asyncio.sleep(delay)
+            await self._prefetch_next_track()
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
-            log_error_with_traceback("Error getting MP3 duration", e)
-            return 0.0
+            log_error_with_traceback("Error prefetching next track", e)
 
-    def _get_playback_time_display(self) -> str:
-        """Get formatted playback time display like control panel"""
+    async def _prefetch_next_track(self):
+        """Resolve, validate and open the next track ahead of the handoff"""
+        index = self._resolve_next_file_index()
+        if index is None:
+            return
+
+        file_path = self.current_audio_files[index]
+        reciter = self.current_reciter
+
+        # Failures are left for the handoff to report through the monitor
+        if await asyncio.to_thread(self._validate_audio_file, file_path):
+            return
+
+        duration = self._duration_cache.get(file_path)
+        if duration is None:
+            duration = await asyncio.to_thread(self._read_file_duration, file_path)
+            if duration:
+                self._duration_cache[file_path] = duration
+        source = await asyncio.to_thread(
+            self.opus_library.create_audio_source, file_path
+        )
+
+        self._discard_prefetch()
+        self._prefetched_track = PrefetchedTrack(
+            index=index,
+            file_path=file_path,
+            reciter=reciter,
+            duration=duration,
+            source=source,
+        )
+
+    def _take_prefetched_source(
+        self, index: int, file_path: str
+    ) -> Optional[discord.AudioSource]:
+        """Hand over the prepared source if it is for this exact track"""
+        prefetched = self._prefetched_track
+        self._prefetched_track = None
+        if prefetched is None:
+            return None
+
+        if (
+            prefetched.index == index
+            and prefetched.file_path == file_path
+            and prefetched.reciter == self.current_reciter
+        ):
+            return prefetched.source
+
+        # Skip, jump or reciter change since it was prepared
+        prefetched.source.cleanup()
+        return None
+
+    def _discard_prefetch(self):
+        """Release any prepared source without playing it"""
+        if self._prefetched_track:
+            try:
+                self._prefetched_track.source.cleanup()
+            except Exception as e:
+                log_error_with_traceback("Error releasing prefetched track", e)
+            self._prefetched_track = None
+
+    def _schedule_duration_warmup(self) -> None:
+        """Start one background duration read if none is running"""
+        if self._duration_warmup and not self._duration_warmup.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No running loop (sync callers during setup)
+        self._duration_warmup = self._run_in_background(self._warm_shuffle_durations())
+
+    def _run_in_background(self, coro):
+        """Run non-critical work without delaying playback"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _record_track_completed(self, filename: str, surah_number: int):
+        """Count a finished surah and log it once the next track is underway"""
         try:
-            # Calculate real-time position based on track start time
-            current_time_seconds = 0.0
+            await asyncio.to_thread(self.state_manager.mark_surah_completed)
+
+            log_perfect_tree_section(
+                "Audio Track - Completed",
+                [
+                    ("track_completed", f"Finished playing: {filename}"),
+                    ("surah", surah_number),
+                    ("status", "✅ Track completed successfully"),
+                ],
+                "✅",
+            )
+        except Exception as e:
+            log_error_with_traceback("Error recording track completion", e)
 
-            if self.is_playing and self.track_start_time:
-                import time
+    async def _announce_track_start(self, position: float):
+        """Log, update presence and refresh the panel for a new track"""
+        surah_number = self.current_surah
+        reciter = self.current_reciter
+        file_index = self.current_file_index
 
-                current_time = time.time()
-                # This calculation already accounts for resumed position
-                current_time_seconds = current_time - self.track_start_time
-            else:
-                # Use saved position when not playing
-                current_time_seconds = self.current_position
+        # Log automatic surah start to Discord
+        from src.utils.discord_logger import get_discord_logger
+
+        discord_logger = get_discord_logger()
+        if discord_logger:
+            try:
+                surah_name = self._get_surah_name(surah_number)
+                await discord_logger.log_bot_activity(
+                    "surah_start",
+                    f"started playing {surah_name}",
+                    {
+                        "Surah Number": str(surah_number),
+                        "Surah Name": surah_name,
+                        "Reciter": reciter,
+                        "File Index": f"{file_index + 1}/{len(self.current_audio_files)}",
+                        "Position": f"{position:.1f}s" if position > 0 else "From beginning",
+                    },
+                )
+            except Exception:
+                pass
+
+        if validate_surah_number(surah_number):
+            log_perfect_tree_section(
+                "Now Playing",
+                [
+                    ("surah", get_surah_display(surah_number)),
+                ],
+                "🎵",
+            )
+
+            # Start Rich Presence tracking
+            if self.rich_presence:
+                try:
+                    from src.utils.surah_mapper import get_surah_info, get_surah_name
+
+                    surah_info = get_surah_info(surah_number)
+
+                    # Adjust the start time backwards for resumed tracks so
+                    # Discord's elapsed timer matches the real position
+                    actual_start_time = datetime.now(timezone.utc) - timedelta(
+                        seconds=position
+                    )
+
+                    self.rich_presence.update_presence_with_template(
+                        "listening",
+                        {
+                            "emoji": surah_info.emoji if surah_info else "📖",
+                            "surah": get_surah_name(surah_number),
+                            "verse": "1",  # Could be enhanced with actual verse tracking
+                            "total": str(surah_info.verses) if surah_info else "Unknown",
+                            "reciter": reciter,
+                        },
+                        start_time=actual_start_time,
+                    )
+                except Exception as e:
+                    log_error_with_traceback("Error starting rich presence track", e)
+
+        # Update control panel
+        if self.control_panel_view:
+            try:
+                await self.control_panel_view.update_panel()
+            except Exception as e:
+                log_error_with_traceback(
+                    "Error updating control panel during playback", e
+                )
+
+    async def _announce_playlist_restart(self):
+        """Log the 24/7 wrap-around back to the first surah"""
+        from src.utils.discord_logger import get_discord_logger
+
+        discord_logger = get_discord_logger()
+        if discord_logger:
+            try:
+                await discord_logger.log_bot_activity(
+                    "surah_switch",
+                    "completed all surahs, restarting from Al-Fatiha for 24/7 continuous playback",
+                    {
+                        "Playback Mode": "24/7 Continuous",
+                        "Action": "Restart from beginning",
+                        "Reason": "Completed all 114 surahs",
+                        "Next Surah": "1. Al-Fatiha",
+                        "Reciter": self.current_reciter,
+                    },
+                )
+            except Exception:
+                pass
+
+    def _get_playback_time_display(self) -> str:
+        """Get formatted playback time display like control panel"""
+        try:
+            # Derived from the last playback event, or the saved position
+            current_time_seconds = self.get_current_position()
 
             # Get the real duration of the current MP3 file
             total_time_seconds = self._get_current_file_duration()
@@ -2278,7 +2681,7 @@ class AudioManager:
                                         )
 
                                 # Save the updated state to prevent this issue from recurring
-                                state_manager.save_playback_state(
+                                self.state_manager.save_playback_state(
                                     current_surah=self.current_surah,
                                     current_position=0,
                                     current_reciter=self.current_reciter,
@@ -2315,7 +2718,7 @@ class AudioManager:
             while True:
                 try:
                     if not self.voice_client or not self.voice_client.is_connected():
-                        _audio_monitor.record_connection_failure("voice_disconnected", "Voice client disconnected during playback")
+                        self.monitor.record_connection_failure("voice_disconnected", "Voice client disconnected during playback")
                         log_warning_with_context(
                             "Voice client disconnected", "Stopping playback"
                         )
@@ -2343,6 +2746,7 @@ class AudioManager:
 
                     current_file = self.current_audio_files[self.current_file_index]
                     filename = os.path.basename(current_file)
+                    track_played = False
 
                     # Update current Surah
                     self._update_current_surah()
@@ -2352,83 +2756,6 @@ class AudioManager:
                         self.current_file_index + 1, len(self.current_audio_files)
                     )
 
-                    # Log automatic surah start to Discord
-                    from src.utils.discord_logger import get_discord_logger
-                    discord_logger = get_discord_logger()
-                    if discord_logger:
-                        try:
-                            surah_name = self._get_surah_name(self.current_surah)
-                            await discord_logger.log_bot_activity(
-                                "surah_start",
-                                f"started playing {surah_name}",
-                                {
-                                    "Surah Number": str(self.current_surah),
-                                    "Surah Name": surah_name,
-                                    "Reciter": self.current_reciter,
-                                    "File Index": f"{self.current_file_index + 1}/{len(self.current_audio_files)}",
-                                    "Position": f"{self.current_position:.1f}s" if self.current_position > 0 else "From beginning"
-                                }
-                            )
-                        except:
-                            pass
-
-                    if validate_surah_number(self.current_surah):
-                        surah_display = get_surah_display(self.current_surah)
-                        log_perfect_tree_section(
-                            "Now Playing",
-                            [
-                                ("surah", surah_display),
-                            ],
-                            "🎵",
-                        )
-
-                        # Start Rich Presence tracking
-                        if self.rich_presence:
-                            try:
-                                # Use update_presence_with_template instead of start_track
-                                from src.utils.surah_mapper import (
-                                    get_surah_info,
-                                    get_surah_name,
-                                )
-
-                                surah_name = get_surah_name(self.current_surah)
-                                surah_info = get_surah_info(self.current_surah)
-                                verse_count = (
-                                    str(surah_info.verses) if surah_info else "Unknown"
-                                )
-                                surah_emoji = surah_info.emoji if surah_info else "📖"
-
-                                # Calculate the actual start time for Discord's automatic elapsed time
-                                # This accounts for resume position by adjusting the start time backwards
-                                from datetime import datetime, timezone
-                                import time
-                                
-                                # If we're resuming, adjust start time to account for current position
-                                actual_start_time = datetime.now(timezone.utc)
-                                if self.current_position > 0:
-                                    from datetime import timedelta
-                                    actual_start_time -= timedelta(seconds=self.current_position)
-
-                                self.rich_presence.update_presence_with_template(
-                                    "listening",
-                                    {
-                                        "emoji": surah_emoji,
-                                        "surah": surah_name,
-                                        "verse": "1",  # Could be enhanced with actual verse tracking
-                                        "total": verse_count,  # Now shows actual verse count
-                                        "reciter": self.current_reciter,
-                                    },
-                                    start_time=actual_start_time,  # Pass start_time for automatic elapsed time
-                                )
-
-                                # Note: seek_to_position doesn't exist either, so we'll skip that
-                                should_resume = False  # Only resume once
-
-                            except Exception as e:
-                                log_error_with_traceback(
-                                    "Error starting rich presence track", e
-                                )
-
                     # Create and play audio source with resume capability
                     try:
                         if should_resume and self.current_position > 0:
@@ -2456,62 +2783,81 @@ class AudioManager:
                                 self.current_position = 0.0
                                 should_resume = False
 
+                        # Use the source prepared during the previous track when it
+                        # matches; otherwise validate and open the file now
+                        source = None
                         if should_resume and self.current_position > 0:
-                            # Use FFmpeg to start from specific position
-                            seek_options = f"-ss {self.current_position}"
-                            source = discord.FFmpegPCMAudio(
-                                current_file,
-                                executable=self.ffmpeg_path,
-                                before_options=seek_options,
-                                options="-vn -loglevel warning -bufsize 2048k -reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5 -multiple_requests 1 -rw_timeout 30000000",  # Enhanced options for maximum stability
-                            )
-                            should_resume = False  # Only resume once
-                            log_perfect_tree_section(
-                                "Audio Resume - Enhanced",
-                                [
-                                    ("resumed_from", f"{self.current_position:.1f}s"),
-                                    ("enhanced_stability", "✅ Using enhanced FFmpeg options"),
-                                    ("buffer_size", "2048k (increased)"),
-                                    ("reconnection", "✅ Enhanced auto-reconnect"),
-                                    ("timeout_handling", "✅ 30s timeout protection"),
-                                ],
-                                "⏯️",
-                            )
+                            self._discard_prefetch()
                         else:
-                            source = discord.FFmpegPCMAudio(
-                                current_file,
-                                executable=self.ffmpeg_path,
-                                options="-vn -loglevel warning -bufsize 2048k -reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5 -multiple_requests 1 -rw_timeout 30000000",  # Enhanced options for maximum stability
+                            source = self._take_prefetched_source(
+                                self.current_file_index, current_file
                             )
 
-                        # Use a wrapper to catch FFmpeg process errors
-                        try:
-                            # Enhanced audio validation before playback
-                            if not os.path.exists(current_file):
+                        if source is None:
+                            failure = self._validate_audio_file(current_file)
+                            if failure:
+                                failure_type, error = failure
                                 log_error_with_traceback(
-                                    f"Audio file no longer exists: {current_file}", 
-                                    FileNotFoundError(f"File not found: {current_file}")
+                                    f"Audio file unavailable: {current_file}", error
+                                )
+                                self.monitor.record_playback_failure(
+                                    failure_type, str(error)
                                 )
-                                _audio_monitor.record_playback_failure("file_missing", f"Audio file not found: {current_file}")
                                 continue
 
-                            # Check file accessibility
-                            try:
-                                with open(current_file, 'rb') as f:
-                                    f.read(1024)  # Test read first 1KB
-                            except Exception as file_error:
-                                log_error_with_traceback(f"Audio file not accessible: {current_file}", file_error)
-                                _audio_monitor.record_playback_failure("file_access", f"Cannot access audio file: {file_error}")
-                                continue
+                            if should_resume and self.current_position > 0:
+                                # Use FFmpeg to start from specific position
+                                # (Opus passthrough when the track has been converted)
+                                source = self.opus_library.create_audio_source(
+                                    current_file, position=self.current_position
+                                )
+                                should_resume = False  # Only resume once
+                                log_perfect_tree_section(
+                                    "Audio Resume - Enhanced",
+                                    [
+                                        ("resumed_from", f"{self.current_position:.1f}s"),
+                                        ("enhanced_stability", "✅ Using enhanced FFmpeg options"),
+                                        ("buffer_size", "2048k (increased)"),
+                                        ("reconnection", "✅ Enhanced auto-reconnect"),
+                                        ("timeout_handling", "✅ 30s timeout protection"),
+                                    ],
+                                    "⏯️",
+                                )
+                            else:
+                                source = self.opus_library.create_audio_source(current_file)
 
+                        # Use a wrapper to catch FFmpeg process errors
+                        try:
                             # Enhanced voice client validation before playback
                             if not self.voice_client or not self.voice_client.is_connected():
-                                _audio_monitor.record_connection_failure("pre_playback_check", "Voice client lost connection before playback")
+                                self.monitor.record_connection_failure("pre_playback_check", "Voice client lost connection before playback")
                                 log_warning_with_context("Voice client disconnected", "Cannot start audio playback")
                                 break
 
                             # Attempt to play with enhanced error handling
-                            self.voice_client.play(source)
+                            finished = asyncio.Event()
+                            self._track_finished = finished
+                            self._track_error = None
+                            # Decode once and share the frames with every listener
+                            self._broadcast = BroadcastAudioSource(source)
+                            self.voice_client.play(
+                                self._broadcast.subscribe(),
+                                after=self._make_after_callback(finished),
+                            )
+                            for listener in list(self.listener_clients):
+                                self._attach_listener(listener)
+                            self.playback_clock.track_started(
+                                self.current_position,
+                                self._get_current_file_duration() or None,
+                            )
+                            should_resume = False  # Only resume once
+
+                            # Announce the track and prepare the next one off the
+                            # critical path so the handoff stays gapless
+                            self._run_in_background(
+                                self._announce_track_start(self.current_position)
+                            )
+                            self._schedule_prefetch()
                             
                             # Enhanced playback validation with multiple checks
                             playback_validation_attempts = 0
@@ -2536,7 +2882,7 @@ class AudioManager:
                                         ],
                                         "❌",
                                     )
-                                    _audio_monitor.record_playback_failure("playback_start", "Audio playback failed to start after validation")
+                                    self.monitor.record_playback_failure("playback_start", "Audio playback failed to start after validation")
                                     continue
 
                             # Verify playback actually started successfully
@@ -2550,92 +2896,35 @@ class AudioManager:
                                     ],
                                     "❌",
                                 )
-                                _audio_monitor.record_playback_failure("playback_verification", "Playback verification failed")
+                                self.monitor.record_playback_failure("playback_verification", "Playback verification failed")
                                 continue
 
                             self.is_playing = True
                             self.is_paused = False
+                            track_played = True
 
                             # Record successful playback start
-                            _audio_monitor.record_successful_playback()
-
-                            # Set track start time for position tracking
-                            import time
+                            self.monitor.record_successful_playback()
 
-                            # Always account for current position when setting track start time
-                            # This ensures position tracking works correctly on resume
-                            self.track_start_time = time.time() - self.current_position
+                            # Wait for the player's `after` callback; the watchdog
+                            # only fires if the track overruns its known duration
+                            await self._wait_for_track_end(finished)
 
-                            # Start position tracking task
-                            if (
-                                not hasattr(self, '_position_tracking_task') or not self._position_tracking_task
-                                or self._position_tracking_task.done()
-                            ):
-                                self._position_tracking_task = asyncio.create_task(
-                                    self._position_tracking_loop()
+                            if self._track_error:
+                                self.monitor.record_playback_failure(
+                                    "player_error", str(self._track_error)
+                                )
+                                log_error_with_traceback(
+                                    f"Audio player error for: {filename}",
+                                    self._track_error,
                                 )
 
-                            # Update control panel
-                            if self.control_panel_view:
-                                try:
-                                    await self.control_panel_view.update_panel()
-                                except Exception as e:
-                                    log_error_with_traceback(
-                                        "Error updating control panel during playback",
-                                        e,
-                                    )
-
-                            # Wait for playback to finish with better error handling
-                            playback_start_time = time.time()
-                            track_duration = self._get_current_file_duration()
-                            
-                            # Set a reasonable timeout: track duration + 30 seconds buffer
-                            # This prevents infinite waiting if the track gets stuck
-                            timeout_duration = track_duration + 30 if track_duration > 0 else 300  # 5 min default
-                            
-                            while (
-                                self.voice_client.is_playing()
-                                or self.voice_client.is_paused()
-                            ):
-                                await asyncio.sleep(1)
-                                
-                                # SAFEGUARD: Check for timeout to prevent infinite waiting
-                                elapsed_playback = time.time() - playback_start_time
-                                if elapsed_playback > timeout_duration:
-                                    log_perfect_tree_section(
-                                        "Audio Safeguard - Playback Timeout",
-                                        [
-                                            ("elapsed_time", f"{elapsed_playback:.1f}s"),
-                                            ("timeout_limit", f"{timeout_duration:.1f}s"),
-                                            ("track_duration", f"{track_duration:.1f}s"),
-                                            ("action", "Force stopping stuck playback"),
-                                            ("safeguard", "✅ Timeout protection activated"),
-                                        ],
-                                        "⏰"
-                                    )
-                                    
-                                    # Force stop the stuck playback
-                                    try:
-                                        self.voice_client.stop()
-                                    except Exception as e:
-                                        log_error_with_traceback("Error force-stopping stuck playback", e)
-                                    break
-
-                            # Mark surah as completed
-                            state_manager.mark_surah_completed()
-
-                            # Log successful completion
-                            log_perfect_tree_section(
-                                "Audio Track - Completed",
-                                [
-                                    (
-                                        "track_completed",
-                                        f"Finished playing: {filename}",
-                                    ),
-                                    ("surah", self.current_surah),
-                                    ("status", "✅ Track completed successfully"),
-                                ],
-                                "✅",
+                            # Record the completion off the playback path so the
+                            # next (prefetched) track starts without waiting on disk
+                            self._run_in_background(
+                                self._record_track_completed(
+                                    filename, self.current_surah
+                                )
                             )
 
                         except Exception as voice_error:
@@ -2656,7 +2945,7 @@ class AudioManager:
                                     "✅",
                                 )
                             else:
-                                _audio_monitor.record_playback_failure("voice_client_error", str(voice_error))
+                                self.monitor.record_playback_failure("voice_client_error", str(voice_error))
                                 log_error_with_traceback(
                                     f"Voice client error for: {filename}", voice_error
                                 )
@@ -2678,7 +2967,7 @@ class AudioManager:
                                 "✅",
                             )
                         else:
-                            _audio_monitor.record_playback_failure("audio_file_error", str(e))
+                            self.monitor.record_playback_failure("audio_file_error", str(e))
                             log_error_with_traceback(
                                 f"Error playing audio file: {filename}", e
                             )
@@ -2686,20 +2975,10 @@ class AudioManager:
                         # Continue to next track on any error
                         pass
 
-                    finally:
-                        # Stop Rich Presence for this track
-                        if self.rich_presence:
-                            try:
-                                # Use clear_presence instead of stop_track
-                                self.rich_presence.clear_presence()
-                            except Exception as e:
-                                log_error_with_traceback(
-                                    "Error stopping rich presence track", e
-                                )
 
                     # Reset position for next track
                     self.current_position = 0.0
-                    self.track_start_time = None  # Reset track timing for next track
+                    self.playback_clock.reset()  # The next track start is the next event
 
                     # Handle loop mode for individual surah
                     if self.is_loop_enabled:
@@ -2730,10 +3009,13 @@ class AudioManager:
                             "🔄",
                         )
                     elif self.is_shuffle_enabled:
-                        import random
-
-                        self.current_file_index = random.randint(
-                            0, len(self.current_audio_files) - 1
+                        # Consume the same pick the prefetch prepared
+                        shuffle_index = self._advance_shuffle_file_index()
+                        self.current_file_index = (
+                            shuffle_index
+                            if shuffle_index is not None
+                            else (self.current_file_index + 1)
+                            % len(self.current_audio_files)
                         )
                     else:
                         # Normal progression - always continue 24/7
@@ -2752,40 +3034,16 @@ class AudioManager:
                             )
 
                             # Log 24/7 restart to Discord
-                            from src.utils.discord_logger import get_discord_logger
-                            discord_logger = get_discord_logger()
-                            if discord_logger:
-                                try:
-                                    await discord_logger.log_bot_activity(
-                                        "surah_switch",
-                                        f"completed all surahs, restarting from Al-Fatiha for 24/7 continuous playback",
-                                        {
-                                            "Playback Mode": "24/7 Continuous",
-                                            "Action": "Restart from beginning",
-                                            "Reason": "Completed all 114 surahs",
-                                            "Next Surah": "1. Al-Fatiha",
-                                            "Reciter": self.current_reciter
-                                        }
-                                    )
-                                except:
-                                    pass
-
-                    # Update control panel after track change
-                    if self.control_panel_view:
-                        try:
-                            await self.control_panel_view.update_panel()
-                        except Exception as e:
-                            log_error_with_traceback(
-                                "Error updating control panel after track change", e
-                            )
+                            self._run_in_background(self._announce_playlist_restart())
 
                     # Small delay to prevent rapid cycling on repeated errors
-                    await asyncio.sleep(0.5)
+                    if not track_played:
+                        await asyncio.sleep(0.5)
 
                     # 24/7 mode - never break the loop, always continue playing
 
                 except Exception as e:
-                    _audio_monitor.record_playback_failure("playback_loop_error", str(e))
+                    self.monitor.record_playback_failure("playback_loop_error", str(e))
                     log_error_with_traceback("Error in playback loop iteration", e)
                     # Wait a bit before continuing to avoid rapid error loops
                     await asyncio.sleep(2)
@@ -2802,8 +3060,23 @@ class AudioManager:
             log_error_with_traceback("Critical error in playback loop", e)
         finally:
             try:
+                # Record where playback ended if it stopped mid-track
+                if self.playback_clock.is_active:
+                    self.current_position = self.get_current_position()
+                    self.playback_clock.stopped()
+
                 self.is_playing = False
                 self.is_paused = False
+                self._discard_prefetch()
+
+                # Stop Rich Presence now that playback has ended
+                if self.rich_presence:
+                    try:
+                        self.rich_presence.clear_presence()
+                    except Exception as e:
+                        log_error_with_traceback(
+                            "Error stopping rich presence track", e
+                        )
 
                 # Update control panel
                 if self.control_panel_view:
@@ -2847,15 +3120,7 @@ class AudioManager:
 
             # Use the exact same time calculation as rich presence
             # This ensures both control panel and rich presence show identical times
-            current_time_seconds = 0.0
-            if self.is_playing and self.track_start_time:
-                import time
-                current_time = time.time()
-                # This calculation already accounts for resumed position
-                current_time_seconds = current_time - self.track_start_time
-            else:
-                # Use saved position when not playing
-                current_time_seconds = self.current_position
+            current_time_seconds = self.get_current_position()
 
             # Get the real duration of the current MP3 file
             total_time_seconds = self._get_current_file_duration()
@@ -2897,12 +3162,7 @@ class AudioManager:
 
     def _get_surah_files(self, reciter: str) -> List[str]:
         """Get list of surah files for a reciter"""
-        reciter_dir = Path(self.audio_base_folder) / reciter
-        if not reciter_dir.exists():
-            return []
-        
-        files = sorted(glob.glob(str(reciter_dir / "*.mp3")))
-        return [str(Path(f)) for f in files]
+        return self.catalog.get_files(reciter)
 
     def change_reciter(self, reciter_name: str) -> bool:
         """Change current reciter"""
@@ -2919,14 +3179,7 @@ class AudioManager:
 
     def get_surah_file(self, surah_number: int) -> Optional[str]:
         """Get specific surah audio file path"""
-        files = self._get_surah_files(self.current_reciter)
-        if not files:
-            return None
-        
-        try:
-            return files[surah_number - 1]
-        except IndexError:
-            return None
+        return self.catalog.get_surahs(self.current_reciter).get(surah_number)
 
     def get_surah_count(self, reciter: str) -> int:
         """Get total number of surahs for reciter"""
@@ -2956,8 +3209,9 @@ class AudioManager:
         if total_surahs == 0:
             return
 
-        if self.shuffle_enabled:
-            self.current_surah = random.randint(1, total_surahs)
+        next_surah = self._advance_shuffle_surah() if self.shuffle_enabled else None
+        if next_surah is not None:
+            self.current_surah = next_surah
         else:
             self.current_surah = (self.current_surah % total_surahs) + 1
 
@@ -11,34 +11,39 @@
 #
 # Key Features:
 # - Dynamic file discovery
-# - Scheduled ZIP backups
-# - Timezone-aware naming
-# - Automatic cleanup
-# - Progress tracking
+# - Scheduled incremental snapshots
+# - Timezone-aware scheduling
+# - Retention policies
+# - Fast restore
 # - Error recovery
 #
 # Technical Implementation:
 # - Async/await for non-blocking backups
-# - ZIP compression with deflate
-# - Atomic file operations
+# - Content-addressed snapshot store (see snapshot_store.py)
+# - Hashing and gzip compression in a worker thread
 # - Pattern-based file matching
 # - Error handling and logging
 #
 # File Structure:
 # /data/          - Source data directory
 # /backup/        - Backup storage
+#   /snapshots/   - Snapshot manifests and compressed blobs
 #   /temp/        - Temporary backup staging
 #
 # Required Dependencies:
-# - zipfile: ZIP file handling
 # - pathlib: Cross-platform paths
 # =============================================================================
 
 import asyncio
 from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
-import zipfile
 
+from .scheduler import get_event_scheduler
+from .snapshot_store import (
+    KEEP_DAILY_SNAPSHOTS,
+    KEEP_RECENT_SNAPSHOTS,
+    get_snapshot_store,
+)
 from .tree_log import log_error_with_traceback, log_perfect_tree_section
 
 # EST timezone for backup scheduling and naming
@@ -90,8 +95,7 @@ EXCLUDE_PATTERNS = [
 
 # Backup scheduling configuration
 BACKUP_INTERVAL_HOURS = 1  # Time between backups
-_last_backup_time = None  # Last successful backup
-_backup_task = None  # Scheduler task reference
+BACKUP_JOB_NAME = "hourly_backup"  # Event scheduler job name
 
 
 # =============================================================================
@@ -121,15 +125,15 @@ class BackupManager:
        - Future-proof design
 
     2. Backup Process:
-       - ZIP compression
+       - Only changed files are compressed and stored
        - Atomic operations
-       - Progress tracking
+       - Runs off the event loop
        - Error handling
 
     3. Maintenance:
-       - Automatic cleanup
+       - Retention policy (recent + daily snapshots)
        - Status reporting
-       - Error recovery
+       - Fast restore
 
     Implementation Notes:
     - Uses async/await
@@ -147,8 +151,8 @@ class BackupManager:
     # Manual backup
     await manager.create_hourly_backup()
 
-    # Cleanup old backups
-    manager.cleanup_old_backups(keep_count=5)
+    # Restore the latest snapshot
+    await manager.restore_snapshot()
     ```
     """
 
@@ -156,8 +160,9 @@ class BackupManager:
         self.data_dir = DATA_DIR
         self.backup_dir = BACKUP_DIR
         self.temp_backup_dir = TEMP_BACKUP_DIR
+        self.store = get_snapshot_store()
         self.last_backup_time = None
-        self.backup_task = None
+        self.scheduler_active = False
 
         # Ensure temp backup directory exists
         self.temp_backup_dir.mkdir(parents=True, exist_ok=True)
@@ -172,9 +177,10 @@ class BackupManager:
 
         discovered_files = []
 
-        # Search for files matching our patterns
+        # Search for files matching our patterns, including per-guild
+        # session directories
         for pattern in DATA_FILE_PATTERNS:
-            for file_path in self.data_dir.glob(pattern):
+            for file_path in self.data_dir.rglob(pattern):
                 if file_path.is_file():
                     # Check if file should be excluded
                     should_exclude = False
@@ -188,44 +194,9 @@ class BackupManager:
 
         return sorted(discovered_files)  # Sort for consistent ordering
 
-    def _generate_backup_filename(self) -> str:
-        """Generate EST-based backup filename like '7_6 - 10PM.zip'"""
-        try:
-            now_est = datetime.now(EST)
-
-            # Format: "7/6 - 10PM" becomes "7_6 - 10PM.zip"
-            month = now_est.month
-            day = now_est.day
-            hour = now_est.hour
-
-            # Convert to 12-hour format with AM/PM
-            if hour == 0:
-                time_str = "12AM"
-            elif hour < 12:
-                time_str = f"{hour}AM"
-            elif hour == 12:
-                time_str = "12PM"
-            else:
-                time_str = f"{hour - 12}PM"
-
-            # Replace / with _ for filename compatibility
-            filename = f"{month}_{day} - {time_str}.zip"
-            return filename
-
-        except Exception as e:
-            # Fallback to UTC timestamp if EST conversion fails
-            fallback = datetime.now().strftime("backup_%Y%m%d_%I%M%S_%p.zip")
-            log_error_with_traceback(
-                "Error generating EST backup filename, using fallback", e
-            )
-            return fallback
-
     async def create_hourly_backup(self) -> bool:
-        """Create a ZIP backup of the data directory with EST-based naming"""
+        """Snapshot the data directory, storing only files that changed"""
         try:
-            # Ensure backup directory exists
-            self.backup_dir.mkdir(exist_ok=True)
-
             # Check if data directory exists
             if not self.data_dir.exists():
                 log_perfect_tree_section(
@@ -257,125 +228,58 @@ class BackupManager:
                 )
                 return False
 
-            # Generate backup filename with EST timezone
-            backup_filename = self._generate_backup_filename()
-            backup_path = self.backup_dir / backup_filename
-
-            # Calculate total size before backup
-            total_size = sum(f.stat().st_size for f in data_files)
-
-            # Create ZIP backup with detailed logging
-            backed_up_files = []
-            failed_files = []
-
-            log_perfect_tree_section(
-                "Backup Manager - ZIP Creation Starting",
-                [
-                    ("zip_file", f"📦 Creating: {backup_filename}"),
-                    ("files_to_backup", f"📁 Files to backup: {len(data_files)}"),
-                    ("total_size", f"📊 Total size: {total_size} bytes"),
-                    ("compression", "🗜️ Using ZIP_DEFLATED compression"),
-                    ("backup_location", f"💾 {self.backup_dir}"),
-                ],
-                "🔄",
+            # Hashing and compression run in a worker thread
+            result = await asyncio.to_thread(self.store.snapshot, data_files, "hourly")
+            removed_snapshots, removed_blobs = await asyncio.to_thread(
+                self.store.prune
             )
 
-            with zipfile.ZipFile(backup_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                for data_file in data_files:
-                    try:
-                        # Add file to ZIP with just the filename (no path)
-                        original_size = data_file.stat().st_size
-                        zipf.write(data_file, data_file.name)
-                        backed_up_files.append(
-                            {"name": data_file.name, "size": original_size}
-                        )
-
-                        # Log individual file addition
-                        log_perfect_tree_section(
-                            "Backup Manager - File Added",
-                            [
-                                ("file_name", f"📄 {data_file.name}"),
-                                ("file_size", f"📊 {original_size} bytes"),
-                                ("status", "✅ Added to ZIP successfully"),
-                            ],
-                            "📦",
-                        )
-
-                    except Exception as file_error:
-                        failed_files.append(data_file.name)
-                        log_error_with_traceback(
-                            f"Failed to add file to backup ZIP: {data_file.name}",
-                            file_error,
-                            {"source": str(data_file), "zip_file": str(backup_path)},
-                        )
-
             # Update last backup time
             self.last_backup_time = datetime.now(UTC)
-
-            # Get EST time for logging
             now_est = datetime.now(EST)
 
-            # Calculate compression ratio
-            zip_size = backup_path.stat().st_size
-            compression_ratio = (
-                ((total_size - zip_size) / total_size * 100) if total_size > 0 else 0
-            )
-
-            # Create file summary for logging
-            file_names = [f["name"] for f in backed_up_files]
-
             log_perfect_tree_section(
-                "Backup Manager - ZIP Creation Complete",
+                "Backup Manager - Snapshot Complete",
                 [
                     (
                         "backup_time_est",
                         f"🕒 {now_est.strftime('%m/%d - %I%p')} EST",
                     ),
                     (
-                        "backup_time_utc",
-                        f"🕒 {self.last_backup_time.strftime('%Y-%m-%d %I:%M:%S %p')} UTC",
+                        "snapshot",
+                        (
+                            f"📦 {result.snapshot_id}"
+                            if result.snapshot_id
+                            else "⏭️ Unchanged since last snapshot"
+                        ),
                     ),
-                    ("backup_file", f"📦 {backup_filename}"),
+                    ("files", f"📁 {result.files} files ({result.total_size} bytes)"),
+                    ("changed_files", f"🔄 {result.changed_files} changed"),
                     (
-                        "files_backed_up",
-                        f"📁 {len(backed_up_files)} files successfully",
+                        "stored",
+                        f"💾 {result.new_blobs} new blobs, {result.bytes_stored} bytes compressed",
                     ),
                     (
                         "files_failed",
                         (
-                            f"❌ {len(failed_files)} files failed"
-                            if failed_files
+                            f"❌ {', '.join(result.failed)}"
+                            if result.failed
                             else "✅ No failures"
                         ),
                     ),
-                    ("total_size", f"📊 {total_size} bytes original"),
-                    ("zip_size", f"📦 {zip_size} bytes compressed"),
-                    ("compression_ratio", f"🗜️ {compression_ratio:.1f}% compression"),
-                    ("backup_location", f"💾 {self.backup_dir}"),
-                    ("files_list", f"📋 {', '.join(file_names)}"),
-                    ("integrity_check", "✅ ZIP file verified"),
+                    (
+                        "retention",
+                        f"🧹 Removed {removed_snapshots} snapshots, {removed_blobs} blobs",
+                    ),
                 ],
                 "💾",
             )
 
-            # Automatically clean up old backups (keep only 1 most recent)
-            cleaned_count = self.cleanup_old_backups(keep_count=1)
-            if cleaned_count > 0:
-                log_perfect_tree_section(
-                    "Backup Manager - Auto Cleanup",
-                    [
-                        ("cleaned_files", f"🗑️ Removed {cleaned_count} old backup(s)"),
-                        ("retention_policy", "📋 Keeping 1 most recent backup"),
-                        ("status", "✅ Cleanup completed automatically"),
-                    ],
-                    "🧹",
-                )
-
-            return True
+            return not result.failed
 
         except Exception as e:
             log_error_with_traceback(
-                "Backup Manager - ZIP creation failed",
+                "Backup Manager - Snapshot failed",
                 e,
                 {
                     "data_dir": str(self.data_dir),
@@ -389,92 +293,92 @@ class BackupManager:
             )
             return False
 
-    async def backup_scheduler(self):
-        """Background task that runs backups on EST hour marks"""
+    async def restore_snapshot(
+        self, snapshot_id: str | None = None, names: list[str] | None = None
+    ) -> list[str]:
+        """
+        Restore data files from a snapshot (the latest full one by default).
+
+        Only files whose content differs from the snapshot are rewritten.
+
+        Args:
+            snapshot_id: Snapshot to restore, or None for the latest full one
+            names: Restrict the restore to these paths relative to the data directory
+
+        Returns:
+            list[str]: Relative paths of the restored files
+        """
+        restored = await asyncio.to_thread(
+            self.store.restore, snapshot_id, self.data_dir, names
+        )
         log_perfect_tree_section(
-            "Backup Manager - Scheduler Started",
+            "Backup Manager - Restore Complete",
             [
-                ("schedule", "⏰ On every EST hour mark (1:00, 2:00, etc.)"),
-                ("backup_dir", f"📁 {self.backup_dir}"),
-                ("timezone", "🌍 Eastern Standard Time (EST)"),
-                ("status", "🔄 Backup scheduler running"),
+                ("snapshot", f"📦 {snapshot_id or 'latest'}"),
+                (
+                    "restored",
+                    f"📁 {', '.join(restored)}" if restored else "✅ Already up to date",
+                ),
             ],
-            "🔄",
+            "♻️",
         )
+        return restored
 
-        while True:
-            try:
-                # Get current EST time
-                now_est = datetime.now(EST)
-                now_utc = datetime.now(UTC)
-
-                # Check if we're at the top of an hour (within the first 5 minutes)
-                should_backup = False
-                reason = ""
-
-                if self.last_backup_time is None:
-                    # First backup - run immediately
-                    should_backup = True
-                    reason = "Initial backup"
-                else:
-                    # Check if we've crossed an hour mark since last backup
-                    last_backup_est = self.last_backup_time.astimezone(EST)
-
-                    # If we're in the first 5 minutes of an hour and haven't backed up this hour
-                    if now_est.minute < 5 and (
-                        last_backup_est.hour != now_est.hour
-                        or last_backup_est.date() != now_est.date()
-                    ):
-                        should_backup = True
-                        reason = f"EST hour mark reached ({now_est.strftime('%I%p')})"
-
-                if should_backup:
-                    log_perfect_tree_section(
-                        "Backup Manager - Triggering Backup",
-                        [
-                            ("reason", f"📅 {reason}"),
-                            (
-                                "est_time",
-                                f"🕒 {now_est.strftime('%m/%d - %I:%M%p')} EST",
-                            ),
-                            (
-                                "utc_time",
-                                f"🕒 {now_utc.strftime('%Y-%m-%d %I:%M:%S %p')} UTC",
-                            ),
-                            (
-                                "last_backup_est",
-                                f"🕒 {self.last_backup_time.astimezone(EST).strftime('%m/%d - %I:%M%p') if self.last_backup_time else 'Never'} EST",
-                            ),
-                        ],
-                        "🔄",
-                    )
+    def get_next_backup_timestamp(self) -> float:
+        """Next EST hour mark after the last backup (immediately if none yet)"""
+        if self.last_backup_time is None:
+            return datetime.now(UTC).timestamp()  # Initial backup
 
-                    success = await self.create_hourly_backup()
-                    if not success:
-                        log_perfect_tree_section(
-                            "Backup Manager - Backup Failed",
-                            [
-                                ("status", "❌ Backup failed, will retry next cycle"),
-                            ],
-                            "❌",
-                        )
+        last_backup_est = self.last_backup_time.astimezone(EST)
+        next_hour = last_backup_est.replace(
+            minute=0, second=0, microsecond=0
+        ) + timedelta(hours=BACKUP_INTERVAL_HOURS)
+        return next_hour.timestamp()
 
-                # Calculate sleep time to next check
-                # Check every 2 minutes to catch hour marks reliably
-                await asyncio.sleep(120)  # 2 minutes
+    async def backup_scheduler(self):
+        """Scheduled job body that runs a backup on an EST hour mark"""
+        now_est = datetime.now(EST)
+        now_utc = datetime.now(UTC)
+        reason = (
+            "Initial backup"
+            if self.last_backup_time is None
+            else f"EST hour mark reached ({now_est.strftime('%I%p')})"
+        )
 
-            except Exception as e:
-                log_error_with_traceback(
-                    "Backup Manager - Scheduler error", e, {"timezone": "EST"}
-                )
-                # Wait before retrying
-                await asyncio.sleep(120)
+        log_perfect_tree_section(
+            "Backup Manager - Triggering Backup",
+            [
+                ("reason", f"📅 {reason}"),
+                ("est_time", f"🕒 {now_est.strftime('%m/%d - %I:%M%p')} EST"),
+                (
+                    "utc_time",
+                    f"🕒 {now_utc.strftime('%Y-%m-%d %I:%M:%S %p')} UTC",
+                ),
+                (
+                    "last_backup_est",
+                    f"🕒 {self.last_backup_time.astimezone(EST).strftime('%m/%d - %I:%M%p') if self.last_backup_time else 'Never'} EST",
+                ),
+            ],
+            "🔄",
+        )
+
+        success = await self.create_hourly_backup()
+        if not success:
+            log_perfect_tree_section(
+                "Backup Manager - Backup Failed",
+                [
+                    ("status", "❌ Backup failed, will retry shortly"),
+                ],
+                "❌",
+            )
 
     def start_backup_scheduler(self):
-        """Start the automated backup scheduler"""
+        """Register the automated backup job with the event scheduler"""
         try:
-            # Don't start multiple backup tasks
-            if self.backup_task and not self.backup_task.done():
+            scheduler = get_event_scheduler()
+
+            # Don't register the backup job twice
+            if self.scheduler_active and scheduler.get_job(BACKUP_JOB_NAME):
                 log_perfect_tree_section(
                     "Backup Manager - Already Running",
                     [
@@ -484,8 +388,13 @@ class BackupManager:
                 )
                 return
 
-            # Create the backup task
-            self.backup_task = asyncio.create_task(self.backup_scheduler())
+            scheduler.schedule(
+                BACKUP_JOB_NAME,
+                self.backup_scheduler,
+                next_run_func=self.get_next_backup_timestamp,
+                retry_seconds=120,
+            )
+            self.scheduler_active = True
 
             # Get current EST time for display
             now_est = datetime.now(EST)
@@ -507,9 +416,13 @@ class BackupManager:
                         "next_backup_window",
                         f"🕒 {next_hour.strftime('%m/%d - %I:%M%p')} EST",
                     ),
-                    ("backup_format", "📦 ZIP files with EST date/time names"),
+                    ("backup_format", "📦 Incremental content-addressed snapshots"),
+                    (
+                        "retention",
+                        f"📋 {KEEP_RECENT_SNAPSHOTS} recent + {KEEP_DAILY_SNAPSHOTS} daily",
+                    ),
                     ("backup_dir", f"📁 {self.backup_dir}"),
-                    ("task_id", f"🆔 {id(self.backup_task)}"),
+                    ("job", f"⏰ {BACKUP_JOB_NAME}"),
                 ],
                 "✅",
             )
@@ -524,13 +437,13 @@ class BackupManager:
     def stop_backup_scheduler(self):
         """Stop the automated backup scheduler"""
         try:
-            if self.backup_task and not self.backup_task.done():
-                self.backup_task.cancel()
+            if self.scheduler_active and get_event_scheduler().cancel(BACKUP_JOB_NAME):
+                self.scheduler_active = False
                 log_perfect_tree_section(
                     "Backup Manager - Stopped",
                     [
                         ("status", "🛑 Backup scheduler stopped"),
-                        ("task_id", f"🆔 {id(self.backup_task)}"),
+                        ("job", f"⏰ {BACKUP_JOB_NAME}"),
                     ],
                     "🛑",
                 )
@@ -549,10 +462,8 @@ class BackupManager:
     def get_backup_status(self) -> dict:
         """Get current backup system status"""
         try:
-            backup_files = (
-                list(self.backup_dir.glob("*.zip")) if self.backup_dir.exists() else []
-            )
-            backup_size = sum(f.stat().st_size for f in backup_files if f.is_file())
+            snapshots = self.store.list_snapshots()
+            store_stats = self.store.get_stats()
 
             # Calculate next backup window
             now_est = datetime.now(EST)
@@ -564,11 +475,11 @@ class BackupManager:
             in_backup_window = now_est.minute < 5
 
             return {
-                "scheduler_running": self.backup_task is not None
-                and not self.backup_task.done(),
+                "scheduler_running": self.scheduler_active,
                 "backup_dir_exists": self.backup_dir.exists(),
-                "backup_files_count": len(backup_files),
-                "backup_total_size": backup_size,
+                "backup_files_count": len(snapshots),
+                "backup_total_size": store_stats["store_size"],
+                "stored_blobs": store_stats["blobs"],
                 "last_backup_time": (
                     self.last_backup_time.isoformat() if self.last_backup_time else None
                 ),
@@ -583,57 +494,50 @@ class BackupManager:
                 "next_backup_window": next_hour.strftime("%m/%d - %I:%M%p EST"),
                 "in_backup_window": in_backup_window,
                 "backup_schedule": "Automatic only - EST hour marks (1:00, 2:00, etc.)",
-                "backup_format": "ZIP files with EST date/time names",
-                "backup_files": [f.name for f in backup_files if f.is_file()],
+                "backup_format": "Incremental content-addressed snapshots",
+                "backup_files": [snapshot["id"] for snapshot in snapshots],
             }
 
         except Exception as e:
             log_error_with_traceback("Backup Manager - Failed to get status", e)
             return {"error": str(e)}
 
-    def cleanup_old_backups(self, keep_count: int = 1) -> int:
-        """Clean up old backup files, keeping only the most recent ones"""
-        try:
-            if not self.backup_dir.exists():
-                return 0
-
-            # Find all backup files
-            backup_files = list(self.backup_dir.glob("*.zip"))
-
-            if len(backup_files) <= keep_count:
-                return 0
+    def cleanup_old_backups(self, keep_count: int = KEEP_RECENT_SNAPSHOTS) -> int:
+        """
+        Apply snapshot retention and remove ZIP archives from the old format.
 
-            # Sort by modification time, newest first
-            backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+        Keeps the `keep_count` most recent snapshots plus one per day for the
+        last KEEP_DAILY_SNAPSHOTS days.
 
-            # Remove old backups
-            old_backups = backup_files[keep_count:]
-            removed_count = 0
+        Returns:
+            int: Number of snapshots and archives removed
+        """
+        try:
+            removed_snapshots, removed_blobs = self.store.prune(keep_recent=keep_count)
 
-            for old_backup in old_backups:
-                try:
-                    old_backup.unlink()
-                    removed_count += 1
-                except Exception as e:
-                    log_error_with_traceback(
-                        f"Failed to remove old backup: {old_backup.name}", e
-                    )
+            # Old ZIP archives go once a snapshot has replaced them
+            removed_archives = 0
+            if self.backup_dir.exists() and self.store.list_snapshots():
+                for archive in self.backup_dir.glob("*.zip"):
+                    try:
+                        archive.unlink()
+                        removed_archives += 1
+                    except Exception as e:
+                        log_error_with_traceback(
+                            f"Failed to remove old backup: {archive.name}", e
+                        )
 
+            removed_count = removed_snapshots + removed_archives
             if removed_count > 0:
                 log_perfect_tree_section(
                     "Backup Manager - Cleanup Completed",
                     [
-                        (
-                            "removed_files",
-                            f"🗑️ Removed {removed_count} old backup files",
-                        ),
-                        (
-                            "kept_files",
-                            f"💾 Kept {len(backup_files) - removed_count} recent backups",
-                        ),
+                        ("removed_snapshots", f"🗑️ {removed_snapshots} snapshots"),
+                        ("removed_blobs", f"🗑️ {removed_blobs} unreferenced blobs"),
+                        ("removed_archives", f"🗑️ {removed_archives} ZIP archives"),
                         (
                             "keep_policy",
-                            f"📋 Policy: Keep {keep_count} most recent backup only",
+                            f"📋 {keep_count} recent + {KEEP_DAILY_SNAPSHOTS} daily snapshots",
                         ),
                     ],
                     "🧹",
@@ -670,6 +574,6 @@ def get_backup_status() -> dict:
     return backup_manager.get_backup_status()
 
 
-def cleanup_old_backups(keep_count: int = 1) -> int:
+def cleanup_old_backups(keep_count: int = KEEP_RECENT_SNAPSHOTS) -> int:
     """Clean up old backup files"""
     return backup_manager.cleanup_old_backups(keep_count)
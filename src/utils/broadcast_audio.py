@@ -0,0 +1,139 @@
+# =============================================================================
+# QuranBot - Broadcast Audio
+# =============================================================================
+# Fans a single decoded track out to any number of voice clients.
+#
+# Each track is read from FFmpeg (and Opus-encoded, for PCM sources) exactly
+# once. Every voice client plays its own lightweight subscriber, which pulls
+# 20ms Opus frames from a short shared buffer:
+#
+# - The subscriber furthest ahead pulls the next frame from upstream
+# - Subscribers slightly behind are served from the buffer
+# - Subscribers that fall further behind than the buffer skip ahead
+# - New subscribers join at the live edge, mid-track
+#
+# Because subscribers report `is_opus()`, discord.py sends the shared frames
+# as-is and never runs a per-connection encoder.
+# =============================================================================
+
+from collections import deque
+import threading
+
+import discord
+from discord.opus import Encoder
+
+# Frames kept for subscribers that are slightly behind (50 frames = 1 second)
+BROADCAST_BUFFER_FRAMES = 50
+
+
+class BroadcastAudioSource:
+    """One upstream audio source shared by many voice clients"""
+
+    def __init__(
+        self,
+        upstream: discord.AudioSource,
+        buffer_frames: int = BROADCAST_BUFFER_FRAMES,
+    ):
+        self.upstream = upstream
+        self._frames: deque[bytes] = deque(maxlen=buffer_frames)
+        self._next_sequence = 0  # Sequence number of the next upstream frame
+        self._ended = False
+        self._closed = False
+        self._subscribers: set["BroadcastSubscriber"] = set()
+        self._lock = threading.Lock()
+
+        # PCM upstreams are encoded once here instead of once per connection
+        self._encoder = None if upstream.is_opus() else Encoder()
+
+    def subscribe(self) -> "BroadcastSubscriber":
+        """Create an audio source for one more voice client, at the live edge"""
+        with self._lock:
+            subscriber = BroadcastSubscriber(self, self._next_sequence)
+            self._subscribers.add(subscriber)
+            return subscriber
+
+    def unsubscribe(self, subscriber: "BroadcastSubscriber") -> None:
+        """Remove a subscriber; the upstream is released with the last one"""
+        with self._lock:
+            self._subscribers.discard(subscriber)
+            release = not self._subscribers
+        if release:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the upstream source"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._ended = True
+            self._frames.clear()
+        self.upstream.cleanup()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of voice clients currently listening"""
+        return len(self._subscribers)
+
+    @property
+    def ended(self) -> bool:
+        """Whether the upstream track has finished"""
+        return self._ended
+
+    def read_frame(self, sequence: int) -> tuple[bytes, int]:
+        """
+        Return the frame at `sequence` and the next sequence to request.
+
+        An empty frame means the track has ended.
+        """
+        with self._lock:
+            oldest = self._next_sequence - len(self._frames)
+            if sequence < oldest:
+                # Fell behind the buffer; rejoin at the oldest frame kept
+                sequence = oldest
+
+            if sequence < self._next_sequence:
+                return self._frames[sequence - oldest], sequence + 1
+
+            # This subscriber is at the live edge: pull the next frame
+            if self._ended:
+                return b"", sequence
+
+            frame = self._read_upstream()
+            if not frame:
+                self._ended = True
+                return b"", sequence
+
+            self._frames.append(frame)
+            self._next_sequence += 1
+            return frame, sequence + 1
+
+    def _read_upstream(self) -> bytes:
+        """Read one 20ms frame from upstream as Opus (caller holds the lock)"""
+        data = self.upstream.read()
+        if not data or self._encoder is None:
+            return data
+        return self._encoder.encode(data, Encoder.SAMPLES_PER_FRAME)
+
+
+class BroadcastSubscriber(discord.AudioSource):
+    """Per-voice-client view of a broadcast"""
+
+    def __init__(self, broadcast: BroadcastAudioSource, sequence: int):
+        self.broadcast = broadcast
+        self._sequence = sequence
+
+    def read(self) -> bytes:
+        frame, self._sequence = self.broadcast.read_frame(self._sequence)
+        return frame
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        self.broadcast.unsubscribe(self)
+
+    @property
+    def _current_error(self):
+        """Surface upstream FFmpeg errors to the voice client's after callback"""
+        return getattr(self.broadcast.upstream, "_current_error", None)
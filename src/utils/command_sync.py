@@ -0,0 +1,133 @@
+# =============================================================================
+# QuranBot - Command Tree Sync
+# =============================================================================
+# Syncs slash commands to Discord only when their definitions changed.
+#
+# - The registered command tree (names, descriptions, options, permissions)
+#   is reduced to a stable SHA-256 fingerprint
+# - The fingerprint of the last successful sync is persisted per
+#   application, so restarts and reconnect re-readies skip the rate-limited
+#   tree.sync() REST call when nothing changed
+# - FORCE_COMMAND_SYNC=true or --force-sync always syncs
+# =============================================================================
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+COMMAND_SYNC_FILE = DATA_DIR / "command_sync.json"
+
+
+def force_sync_requested() -> bool:
+    """True if a sync was forced from the environment or the command line"""
+    return (
+        os.getenv("FORCE_COMMAND_SYNC", "false").lower() == "true"
+        or "--force-sync" in sys.argv
+    )
+
+
+def command_tree_fingerprint(tree) -> str:
+    """
+    Stable hash of every command registered on `tree`.
+
+    Each command's sync payload is serialized with sorted keys and the
+    commands are ordered by type and name, so registration order and
+    dict ordering do not change the result.
+    """
+    payloads = sorted(
+        (command.to_dict(tree) for command in tree.get_commands()),
+        key=lambda payload: (payload.get("type", 1), payload["name"]),
+    )
+    serialized = json.dumps(payloads, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _load_fingerprints(state_file: Path) -> dict[str, dict]:
+    """Fingerprints of the last sync for each application"""
+    try:
+        if state_file.exists():
+            with open(state_file) as f:
+                return json.load(f).get("applications", {})
+    except Exception as e:
+        log_error_with_traceback("Error loading command sync state", e)
+    return {}
+
+
+def _save_fingerprints(state_file: Path, applications: dict[str, dict]) -> None:
+    """Atomically write the synced fingerprints"""
+    try:
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = state_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump({"version": 1, "applications": applications}, f, indent=2)
+        os.replace(temp_file, state_file)
+    except Exception as e:
+        log_error_with_traceback("Error saving command sync state", e)
+
+
+async def sync_command_tree(
+    tree,
+    force: bool | None = None,
+    state_file: str | Path = COMMAND_SYNC_FILE,
+) -> bool:
+    """
+    Sync `tree` to Discord unless it matches the last synced fingerprint.
+
+    Args:
+        tree: The bot's app command tree
+        force: Sync even if unchanged; defaults to force_sync_requested()
+        state_file: Where synced fingerprints are stored
+
+    Returns:
+        bool: True if tree.sync() was called, False if it was skipped
+    """
+    state_file = Path(state_file)
+    force = force_sync_requested() if force is None else force
+    application_id = str(getattr(tree.client, "application_id", None) or "default")
+
+    fingerprint = command_tree_fingerprint(tree)
+    applications = _load_fingerprints(state_file)
+    previous = applications.get(application_id, {}).get("fingerprint")
+
+    if not force and previous == fingerprint:
+        log_perfect_tree_section(
+            "Slash Commands Sync",
+            [
+                ("status", "⏭️ Skipped - command definitions unchanged"),
+                ("commands", str(len(tree.get_commands()))),
+                ("fingerprint", fingerprint[:12]),
+                ("force", "Set FORCE_COMMAND_SYNC=true or pass --force-sync"),
+            ],
+            "⚡",
+        )
+        return False
+
+    await tree.sync()
+
+    applications[application_id] = {
+        "fingerprint": fingerprint,
+        "synced_at": time.time(),
+    }
+    _save_fingerprints(state_file, applications)
+
+    log_perfect_tree_section(
+        "Slash Commands Sync",
+        [
+            ("status", "✅ Slash commands synced"),
+            ("reason", "Forced" if force else "Command definitions changed"),
+            ("commands", str(len(tree.get_commands()))),
+            ("fingerprint", fingerprint[:12]),
+        ],
+        "⚡",
+    )
+    return True
@@ -13,6 +13,7 @@ import discord
 from discord.ui import Button, Modal, Select, TextInput, View
 
 from .discord_logger import get_discord_logger
+from .interaction_middleware import fast_ack
 from .surah_mapper import get_surah_info, search_surahs
 from .tree_log import (
     log_error_with_traceback,
@@ -51,6 +52,7 @@ class SurahSearchModal(Modal):
         )
         self.add_item(self.search_input)
 
+    @fast_ack("surah_search_submit")
     async def on_submit(self, interaction: discord.Interaction):
         """Handle search submission"""
         try:
@@ -296,6 +298,7 @@ class SearchResultsSelect(Select):
             max_values=1,
         )
 
+    @fast_ack("search_results_select")
     async def callback(self, interaction: discord.Interaction):
         """Handle surah selection from search results"""
         try:
@@ -405,6 +408,7 @@ class SurahConfirmationView(View):
     @discord.ui.button(
         label="🎵 Play This Surah", style=discord.ButtonStyle.primary, row=0
     )
+    @fast_ack()
     async def play_surah(self, interaction: discord.Interaction, button: Button):
         """Play the selected surah"""
         try:
@@ -460,6 +464,7 @@ class SurahConfirmationView(View):
     @discord.ui.button(
         label="🔍 Search Again", style=discord.ButtonStyle.secondary, row=0
     )
+    @fast_ack(auto_defer=False)  # Opens a modal
     async def search_again(self, interaction: discord.Interaction, button: Button):
         """Open search modal again"""
         try:
@@ -489,6 +494,7 @@ class SurahConfirmationView(View):
             )
 
     @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.danger, row=0)
+    @fast_ack()
     async def cancel_selection(self, interaction: discord.Interaction, button: Button):
         """Cancel the selection"""
         try:
@@ -580,6 +586,7 @@ class SurahSelect(Select):
         except Exception as e:
             log_error_with_traceback("Error updating surah options", e)
 
+    @fast_ack("surah_select")
     async def callback(self, interaction: discord.Interaction):
         """Handle surah selection"""
         try:
@@ -726,6 +733,7 @@ class ReciterSelect(Select):
         except Exception as e:
             log_error_with_traceback("Error updating reciter options", e)
 
+    @fast_ack("reciter_select")
     async def callback(self, interaction: discord.Interaction):
         """Handle reciter selection"""
         try:
@@ -1210,6 +1218,7 @@ class SimpleControlPanelView(View):
             await interaction.response.defer()
 
     @discord.ui.button(label="⬅️ Prev Page", style=discord.ButtonStyle.secondary, row=2)
+    @fast_ack()
     async def prev_page(self, interaction: discord.Interaction, button: Button):
         """Go to previous page"""
         try:
@@ -1266,6 +1275,7 @@ class SimpleControlPanelView(View):
             await interaction.response.defer()
 
     @discord.ui.button(label="➡️ Next Page", style=discord.ButtonStyle.secondary, row=2)
+    @fast_ack()
     async def next_page(self, interaction: discord.Interaction, button: Button):
         """Go to next page"""
         try:
@@ -1298,6 +1308,7 @@ class SimpleControlPanelView(View):
             await interaction.response.defer()
 
     @discord.ui.button(label="🔍 Search", style=discord.ButtonStyle.primary, row=2)
+    @fast_ack(auto_defer=False)  # Opens a modal
     async def search_surah(self, interaction: discord.Interaction, button: Button):
         """Open search modal for finding surahs"""
         try:
@@ -1344,6 +1355,7 @@ class SimpleControlPanelView(View):
             await interaction.response.defer()
 
     @discord.ui.button(label="⏮️ Previous", style=discord.ButtonStyle.danger, row=3)
+    @fast_ack()
     async def previous_surah(self, interaction: discord.Interaction, button: Button):
         """Go to previous surah"""
         try:
@@ -1374,6 +1386,7 @@ class SimpleControlPanelView(View):
             await interaction.response.defer()
 
     @discord.ui.button(label="🔀 Shuffle", style=discord.ButtonStyle.secondary, row=3)
+    @fast_ack()
     async def toggle_shuffle(self, interaction: discord.Interaction, button: Button):
         """Toggle shuffle mode"""
         try:
@@ -1416,6 +1429,7 @@ class SimpleControlPanelView(View):
             await interaction.response.defer()
 
     @discord.ui.button(label="🔁 Loop", style=discord.ButtonStyle.secondary, row=3)
+    @fast_ack()
     async def toggle_loop(self, interaction: discord.Interaction, button: Button):
         """Toggle individual surah loop mode (24/7 playback continues regardless)"""
         try:
@@ -1464,6 +1478,7 @@ class SimpleControlPanelView(View):
             await interaction.response.defer()
 
     @discord.ui.button(label="⏭️ Next", style=discord.ButtonStyle.success, row=3)
+    @fast_ack()
     async def next_surah(self, interaction: discord.Interaction, button: Button):
         """Go to next surah"""
         try:
@@ -1552,6 +1567,27 @@ def register_control_panel(panel_view):
     _active_panels.append(panel_view)
 
 
+def cleanup_control_panels(channel_id: int) -> int:
+    """
+    Clean up the panels posted in one channel.
+
+    Each guild session keeps its own panel, so replacing one panel must not
+    stop the others. Panels that never got a message are dropped as well.
+    """
+    cleaned_count = 0
+    for panel in _active_panels.copy():
+        message = getattr(panel, "panel_message", None)
+        if message and message.channel.id != channel_id:
+            continue
+        try:
+            panel.cleanup()
+            cleaned_count += 1
+        except Exception as e:
+            log_error_with_traceback("Error cleaning up individual panel", e)
+        _active_panels.remove(panel)
+    return cleaned_count
+
+
 def cleanup_all_control_panels():
     """Clean up all active control panels"""
     try:
@@ -1725,8 +1761,8 @@ async def create_control_panel(
             "🎛️",
         )
 
-        # Clean up any existing control panels first
-        cleanup_all_control_panels()
+        # Clean up any existing control panel in this channel first
+        cleanup_control_panels(channel.id)
 
         # Delete all existing messages in the channel first
         try:
@@ -1978,8 +2014,8 @@ async def setup_control_panel(bot, channel_id: int, audio_manager=None) -> bool:
                 "⚠️",
             )
 
-        # Clean up any existing panels before creating new one
-        cleanup_all_control_panels()
+        # Clean up this channel's panel before creating a new one
+        cleanup_control_panels(channel_id)
 
         message = await create_control_panel(bot, channel, audio_manager)
 
@@ -36,7 +36,6 @@
 # - pytz: Timezone handling
 # =============================================================================
 
-import asyncio
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
@@ -46,14 +45,24 @@ import discord
 import pytz
 
 from .discord_logger import get_discord_logger
+from .reaction_router import get_reaction_router
+from .scheduler import get_event_scheduler
 from .tree_log import (
     log_error_with_traceback,
     log_perfect_tree_section,
     log_user_interaction,
 )
 
-# Global scheduler task reference
-_verse_scheduler_task = None
+# Name of the verse job registered with the event scheduler
+VERSE_JOB_NAME = "scheduled_verse"
+
+# Random delay added to each verse deadline so restarts don't post in lockstep
+VERSE_JOB_JITTER_SECONDS = 60
+
+# Reaction route for posted verses: only 🤲 is kept, for one hour
+VERSE_REACTION_KIND = "daily_verse"
+VERSE_REACTION_TTL = 3600
+DUA_EMOJI = "🤲"
 
 
 class DailyVerseManager:
@@ -182,6 +191,9 @@ class DailyVerseManager:
             with open(self.verses_state_file, "w") as f:
                 json.dump(config_data, f, indent=2)
 
+            # Apply the new interval immediately instead of at the next check
+            get_event_scheduler().reschedule(VERSE_JOB_NAME)
+
             return True
         except Exception as e:
             log_error_with_traceback("Error saving verse interval config", e)
@@ -204,11 +216,18 @@ class DailyVerseManager:
             log_error_with_traceback("Error checking verse send time", e)
             return True
 
+    def get_next_send_timestamp(self) -> float:
+        """Get the Unix timestamp at which the next verse is due"""
+        if not self.last_sent_time:
+            return datetime.now(pytz.UTC).timestamp()  # Due immediately
+        return self.last_sent_time.timestamp() + self.get_interval_hours() * 3600
+
     def update_last_sent_time(self):
         """Update the last sent time to now"""
         try:
             self.last_sent_time = datetime.now(pytz.UTC)
             self.save_state()
+            get_event_scheduler().reschedule(VERSE_JOB_NAME)
         except Exception as e:
             log_error_with_traceback("Error updating last sent time", e)
 
@@ -711,6 +730,88 @@ class DailyVerseManager:
 daily_verse_manager = None
 
 
+async def handle_verse_reaction(bot, event) -> None:
+    """
+    Handle a reaction on a posted verse.
+
+    Dua reactions are recorded and logged; any other reaction is removed.
+
+    Args:
+        bot: Discord bot instance
+        event: ReactionEvent from the reaction router
+    """
+    user = event.user
+    surah = event.route.data.get("surah")
+    ayah = event.route.data.get("ayah")
+    verse_type = event.route.data.get("verse_type", "daily")
+    verse_label = f"{verse_type} verse"
+    reaction_time = datetime.now(pytz.timezone("US/Eastern")).strftime(
+        "%m/%d %I:%M %p EST"
+    )
+
+    if event.emoji_name != DUA_EMOJI:
+        # Log user interaction for unwanted reaction
+        log_user_interaction(
+            interaction_type=f"{verse_type}_verse_reaction_removed",
+            user_name=user.display_name,
+            user_id=user.id,
+            action_description=f"Added unauthorized reaction '{event.emoji_name}' to {verse_label}, removed automatically",
+            details={
+                "reaction_emoji": event.emoji_name,
+                "allowed_emoji": DUA_EMOJI,
+                "surah": surah,
+                "ayah": ayah,
+                "reaction_time": reaction_time,
+            },
+        )
+
+        # Remove unwanted reaction
+        await event.remove()
+        return
+
+    # Record dua reaction in statistics
+    if daily_verse_manager:
+        daily_verse_manager.record_dua_reaction(user.id, surah, ayah)
+
+    # Log user interaction for dua reaction
+    log_user_interaction(
+        interaction_type=f"{verse_type}_verse_dua_reaction",
+        user_name=user.display_name,
+        user_id=user.id,
+        action_description=f"Added dua reaction 🤲 to {verse_label}",
+        details={
+            "reaction_emoji": DUA_EMOJI,
+            "surah": surah,
+            "ayah": ayah,
+            "reaction_time": reaction_time,
+        },
+    )
+
+    # Log to Discord with user profile picture
+    discord_logger = get_discord_logger()
+    if discord_logger:
+        try:
+            user_avatar_url = (
+                user.avatar.url if user.avatar else user.default_avatar.url
+            )
+            await discord_logger.log_user_interaction(
+                "dua_reaction",
+                user.display_name,
+                user.id,
+                f"made dua (🤲) on {verse_label}",
+                {
+                    "Reaction": DUA_EMOJI,
+                    "Surah": str(surah),
+                    "Ayah": str(ayah),
+                    "Reaction Time": reaction_time,
+                    "Verse Type": verse_label.title(),
+                },
+                user_avatar_url,
+            )
+        except Exception:
+            pass
+
+
 async def setup_daily_verses(bot, channel_id: int) -> None:
     """
     Set up the daily verse system.
@@ -726,6 +827,11 @@ async def setup_daily_verses(bot, channel_id: int) -> None:
         if daily_verse_manager is None:
             daily_verse_manager = DailyVerseManager(Path("data"))
 
+        # Route reactions on posted verses, including ones from before a restart
+        reaction_router = get_reaction_router()
+        reaction_router.register_handler(VERSE_REACTION_KIND, handle_verse_reaction)
+        reaction_router.attach(bot)
+
         # Schedule initial verse check (legacy daily system)
         await check_and_post_verse(bot, channel_id)
 
@@ -836,130 +942,17 @@ async def check_and_post_verse(bot, channel_id: int) -> None:
                     try:
                         await message.add_reaction("🤲")
 
-                        # Monitor reactions to remove unwanted ones
-                        def check_unauthorized_reaction(reaction, user):
-                            return (
-                                reaction.message.id == message.id
-                                and str(reaction.emoji) != "🤲"
-                                and not user.bot
-                            )
-
-                        # Monitor for allowed dua reactions
-                        def check_dua_reaction(reaction, user):
-                            return (
-                                reaction.message.id == message.id
-                                and str(reaction.emoji) == "🤲"
-                                and not user.bot
-                            )
-
-                        # Set up reaction monitoring in background
-                        async def monitor_unauthorized_reactions():
-                            try:
-                                while True:
-                                    reaction, user = await bot.wait_for(
-                                        "reaction_add",
-                                        timeout=3600,  # Monitor for 1 hour
-                                        check=check_unauthorized_reaction,
-                                    )
-
-                                    # Log user interaction for unwanted reaction
-                                    log_user_interaction(
-                                        interaction_type="daily_verse_reaction_removed",
-                                        user_name=user.display_name,
-                                        user_id=user.id,
-                                        action_description=f"Added unauthorized reaction '{reaction.emoji}' to daily verse, removed automatically",
-                                        details={
-                                            "reaction_emoji": str(reaction.emoji),
-                                            "allowed_emoji": "🤲",
-                                            "surah": verse["surah"],
-                                            "ayah": verse.get("ayah", verse["verse"]),
-                                            "reaction_time": datetime.now(
-                                                pytz.timezone("US/Eastern")
-                                            ).strftime("%m/%d %I:%M %p EST"),
-                                        },
-                                    )
-
-                                    # Remove unwanted reaction
-                                    await reaction.remove(user)
-                            except TimeoutError:
-                                pass  # Stop monitoring after timeout
-                            except Exception:
-                                pass  # Ignore errors in monitoring
-
-                        # Monitor for dua reactions in background
-                        async def monitor_dua_reactions():
-                            try:
-                                while True:
-                                    reaction, user = await bot.wait_for(
-                                        "reaction_add",
-                                        timeout=3600,  # Monitor for 1 hour
-                                        check=check_dua_reaction,
-                                    )
-
-                                    # Record dua reaction in statistics
-                                    daily_verse_manager.record_dua_reaction(
-                                        user.id,
-                                        verse["surah"],
-                                        verse.get("ayah", verse["verse"]),
-                                    )
-
-                                    # Log user interaction for dua reaction
-                                    log_user_interaction(
-                                        interaction_type="daily_verse_dua_reaction",
-                                        user_name=user.display_name,
-                                        user_id=user.id,
-                                        action_description="Added dua reaction 🤲 to daily verse",
-                                        details={
-                                            "reaction_emoji": "🤲",
-                                            "surah": verse["surah"],
-                                            "ayah": verse.get("ayah", verse["verse"]),
-                                            "reaction_time": datetime.now(
-                                                pytz.timezone("US/Eastern")
-                                            ).strftime("%m/%d %I:%M %p EST"),
-                                        },
-                                    )
-
-                                    # Log to Discord with user profile picture
-
-                                    discord_logger = get_discord_logger()
-                                    if discord_logger:
-                                        try:
-                                            user_avatar_url = (
-                                                user.avatar.url
-                                                if user.avatar
-                                                else user.default_avatar.url
-                                            )
-                                            await discord_logger.log_user_interaction(
-                                                "dua_reaction",
-                                                user.display_name,
-                                                user.id,
-                                                "made dua (🤲) on daily verse",
-                                                {
-                                                    "Reaction": "🤲",
-                                                    "Surah": str(verse["surah"]),
-                                                    "Ayah": str(
-                                                        verse.get(
-                                                            "ayah", verse["verse"]
-                                                        )
-                                                    ),
-                                                    "Reaction Time": datetime.now(
-                                                        pytz.timezone("US/Eastern")
-                                                    ).strftime("%m/%d %I:%M %p EST"),
-                                                    "Verse Type": "Daily Verse",
-                                                },
-                                                user_avatar_url,
-                                            )
-                                        except:
-                                            pass
-
-                            except TimeoutError:
-                                pass  # Stop monitoring after timeout
-                            except Exception:
-                                pass  # Ignore errors in monitoring
-
-                        # Start monitoring tasks
-                        asyncio.create_task(monitor_unauthorized_reactions())
-                        asyncio.create_task(monitor_dua_reactions())
+                        # Route reactions on this verse to the dua handler
+                        get_reaction_router().route(
+                            message,
+                            VERSE_REACTION_KIND,
+                            VERSE_REACTION_TTL,
+                            {
+                                "surah": verse["surah"],
+                                "ayah": verse.get("ayah", verse["verse"]),
+                                "verse_type": "daily",
+                            },
+                        )
 
                     except Exception:
                         pass  # Non-critical if reaction fails
@@ -1080,130 +1073,17 @@ async def check_and_send_scheduled_verse(bot, channel_id: int) -> None:
                     try:
                         await message.add_reaction("🤲")
 
-                        # Monitor reactions to remove unwanted ones
-                        def check_unauthorized_reaction(reaction, user):
-                            return (
-                                reaction.message.id == message.id
-                                and str(reaction.emoji) != "🤲"
-                                and not user.bot
-                            )
-
-                        # Monitor for allowed dua reactions
-                        def check_dua_reaction(reaction, user):
-                            return (
-                                reaction.message.id == message.id
-                                and str(reaction.emoji) == "🤲"
-                                and not user.bot
-                            )
-
-                        # Set up reaction monitoring in background
-                        async def monitor_unauthorized_reactions():
-                            try:
-                                while True:
-                                    reaction, user = await bot.wait_for(
-                                        "reaction_add",
-                                        timeout=3600,  # Monitor for 1 hour
-                                        check=check_unauthorized_reaction,
-                                    )
-
-                                    # Log user interaction for unwanted reaction
-                                    log_user_interaction(
-                                        interaction_type="scheduled_verse_reaction_removed",
-                                        user_name=user.display_name,
-                                        user_id=user.id,
-                                        action_description=f"Added unauthorized reaction '{reaction.emoji}' to scheduled verse, removed automatically",
-                                        details={
-                                            "reaction_emoji": str(reaction.emoji),
-                                            "allowed_emoji": "🤲",
-                                            "surah": verse["surah"],
-                                            "ayah": verse.get("ayah", verse["verse"]),
-                                            "reaction_time": datetime.now(
-                                                pytz.timezone("US/Eastern")
-                                            ).strftime("%m/%d %I:%M %p EST"),
-                                        },
-                                    )
-
-                                    # Remove unwanted reaction
-                                    await reaction.remove(user)
-                            except TimeoutError:
-                                pass  # Stop monitoring after timeout
-                            except Exception:
-                                pass  # Ignore errors in monitoring
-
-                        # Monitor for dua reactions in background
-                        async def monitor_dua_reactions():
-                            try:
-                                while True:
-                                    reaction, user = await bot.wait_for(
-                                        "reaction_add",
-                                        timeout=3600,  # Monitor for 1 hour
-                                        check=check_dua_reaction,
-                                    )
-
-                                    # Record dua reaction in statistics
-                                    daily_verse_manager.record_dua_reaction(
-                                        user.id,
-                                        verse["surah"],
-                                        verse.get("ayah", verse["verse"]),
-                                    )
-
-                                    # Log user interaction for dua reaction
-                                    log_user_interaction(
-                                        interaction_type="scheduled_verse_dua_reaction",
-                                        user_name=user.display_name,
-                                        user_id=user.id,
-                                        action_description="Added dua reaction 🤲 to scheduled verse",
-                                        details={
-                                            "reaction_emoji": "🤲",
-                                            "surah": verse["surah"],
-                                            "ayah": verse.get("ayah", verse["verse"]),
-                                            "reaction_time": datetime.now(
-                                                pytz.timezone("US/Eastern")
-                                            ).strftime("%m/%d %I:%M %p EST"),
-                                        },
-                                    )
-
-                                    # Log to Discord with user profile picture
-
-                                    discord_logger = get_discord_logger()
-                                    if discord_logger:
-                                        try:
-                                            user_avatar_url = (
-                                                user.avatar.url
-                                                if user.avatar
-                                                else user.default_avatar.url
-                                            )
-                                            await discord_logger.log_user_interaction(
-                                                "dua_reaction",
-                                                user.display_name,
-                                                user.id,
-                                                "made dua (🤲) on scheduled verse",
-                                                {
-                                                    "Reaction": "🤲",
-                                                    "Surah": str(verse["surah"]),
-                                                    "Ayah": str(
-                                                        verse.get(
-                                                            "ayah", verse["verse"]
-                                                        )
-                                                    ),
-                                                    "Reaction Time": datetime.now(
-                                                        pytz.timezone("US/Eastern")
-                                                    ).strftime("%m/%d %I:%M %p EST"),
-                                                    "Verse Type": "Scheduled Verse",
-                                                },
-                                                user_avatar_url,
-                                            )
-                                        except:
-                                            pass
-
-                            except TimeoutError:
-                                pass  # Stop monitoring after timeout
-                            except Exception:
-                                pass  # Ignore errors in monitoring
-
-                        # Start monitoring tasks
-                        asyncio.create_task(monitor_unauthorized_reactions())
-                        asyncio.create_task(monitor_dua_reactions())
+                        # Route reactions on this verse to the dua handler
+                        get_reaction_router().route(
+                            message,
+                            VERSE_REACTION_KIND,
+                            VERSE_REACTION_TTL,
+                            {
+                                "surah": verse["surah"],
+                                "ayah": verse.get("ayah", verse["verse"]),
+                                "verse_type": "scheduled",
+                            },
+                        )
 
                     except Exception:
                         pass  # Non-critical if reaction fails
@@ -1249,70 +1129,38 @@ async def check_and_send_scheduled_verse(bot, channel_id: int) -> None:
         log_error_with_traceback("Error checking and sending scheduled verse", e)
 
 
-async def verse_scheduler_loop(bot, channel_id: int) -> None:
-    """
-    Background task that checks for scheduled verses every 30 seconds.
-
-    Args:
-        bot: Discord bot instance
-        channel_id: Channel ID for verse posts
-    """
-    log_perfect_tree_section(
-        "Verse Scheduler - Started",
-        [
-            ("status", "🔄 Verse scheduler running"),
-            ("check_interval", "30 seconds"),
-            ("channel_id", str(channel_id)),
-        ],
-        "⏰",
-    )
-
-    while True:
-        try:
-            await asyncio.sleep(30)  # Check every 30 seconds
-            await check_and_send_scheduled_verse(bot, channel_id)
-        except asyncio.CancelledError:
-            log_perfect_tree_section(
-                "Verse Scheduler - Stopped",
-                [
-                    ("status", "🛑 Verse scheduler stopped"),
-                    ("reason", "Task cancelled"),
-                ],
-                "⏰",
-            )
-            break
-        except Exception as e:
-            log_error_with_traceback("Error in verse scheduler loop", e)
-            await asyncio.sleep(30)  # Wait before retrying
-
-
 def start_verse_scheduler(bot, channel_id: int) -> None:
     """
-    Start the background verse scheduler.
+    Register the scheduled verse job with the event scheduler.
+
+    The job fires exactly when the next verse is due (last sent time plus
+    the configured interval) rather than polling every 30 seconds.
 
     Args:
         bot: Discord bot instance
         channel_id: Channel ID for verse posts
     """
-    global _verse_scheduler_task
-
     try:
-        # Cancel existing task if running
-        if _verse_scheduler_task and not _verse_scheduler_task.done():
-            _verse_scheduler_task.cancel()
+        if not daily_verse_manager:
+            return
 
-        # Start new scheduler task
-        _verse_scheduler_task = asyncio.create_task(
-            verse_scheduler_loop(bot, channel_id)
+        scheduler = get_event_scheduler()
+        job = scheduler.schedule(
+            VERSE_JOB_NAME,
+            lambda: check_and_send_scheduled_verse(bot, channel_id),
+            next_run_func=daily_verse_manager.get_next_send_timestamp,
+            retry_seconds=30,
+            jitter_seconds=VERSE_JOB_JITTER_SECONDS,
+            persist=True,
         )
 
         log_perfect_tree_section(
             "Verse Scheduler - Initialized",
             [
-                ("status", "✅ Verse scheduler started"),
+                ("status", "✅ Verse job registered with event scheduler"),
                 ("channel_id", str(channel_id)),
-                ("check_frequency", "Every 30 seconds"),
-                ("task_id", f"🆔 {id(_verse_scheduler_task)}"),
+                ("interval", f"{daily_verse_manager.get_interval_hours()}h"),
+                ("next_run", job.to_dict()["next_run"] or "Dormant"),
             ],
             "⏰",
         )
@@ -5,18 +5,18 @@
 # Tracks response times, rate limits, gateway connection, and error rates
 # =============================================================================
 
-import asyncio
+from bisect import bisect_left
 from collections import defaultdict, deque
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 import json
 from pathlib import Path
-import statistics
 import time
 from typing import Any
 
 import discord
 from discord.ext import commands
 
+from .scheduler import get_event_scheduler
 from .tree_log import log_error_with_traceback, log_perfect_tree_section
 
 # =============================================================================
@@ -32,6 +32,21 @@ MAX_HISTORY_SIZE = 1000  # Maximum number of metrics to keep in memory
 SAVE_INTERVAL = 30  # Save metrics to disk every 30 seconds
 CLEANUP_INTERVAL = 3600  # Clean old data every hour
 MAX_AGE_HOURS = 24  # Keep data for 24 hours
+HEALTH_SNAPSHOT_INTERVAL = 30  # Build a health snapshot every 30 seconds
+HEALTH_WINDOW_SECONDS = 300  # Health is judged on the last 5 minutes
+
+# Event scheduler job names
+HEALTH_JOB_NAME = "discord_api_health_snapshot"
+SAVE_JOB_NAME = "discord_api_monitor_save"
+CLEANUP_JOB_NAME = "discord_api_monitor_cleanup"
+
+# Rolling aggregate settings
+BUCKET_SECONDS = 60  # Width of each aggregate bucket
+MAX_BUCKETS = (MAX_AGE_HOURS * 3600) // BUCKET_SECONDS
+
+# Upper bounds (seconds) of the response time histogram bins; the last bin
+# collects everything slower
+LATENCY_BUCKET_BOUNDS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0)
 
 # Rate limit warning thresholds
 RATE_LIMIT_WARNING_THRESHOLD = 0.8  # Warn when 80% of rate limit used
@@ -87,6 +102,96 @@ class DiscordAPIHealth:
     status: str  # 'healthy', 'warning', 'critical'
 
 
+@dataclass
+class EndpointAggregate:
+    """Running totals for one endpoint within a time bucket"""
+
+    count: int = 0
+    response_time_sum: float = 0.0
+    error_count: int = 0
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKET_BOUNDS) + 1)
+    )
+
+    def record(self, response_time: float, is_error: bool):
+        """Add one call to the totals"""
+        self.count += 1
+        self.response_time_sum += response_time
+        if is_error:
+            self.error_count += 1
+        self.histogram[bisect_left(LATENCY_BUCKET_BOUNDS, response_time)] += 1
+
+    def merge(self, other: "EndpointAggregate"):
+        """Fold another aggregate into this one"""
+        self.count += other.count
+        self.response_time_sum += other.response_time_sum
+        self.error_count += other.error_count
+        for i, value in enumerate(other.histogram):
+            self.histogram[i] += value
+
+
+@dataclass
+class MetricBucket:
+    """Aggregated API calls for one BUCKET_SECONDS wide slice of time"""
+
+    start: float
+    totals: EndpointAggregate = field(default_factory=EndpointAggregate)
+    endpoints: dict[str, EndpointAggregate] = field(default_factory=dict)
+
+
+class RollingAPIAggregates:
+    """
+    Time-bucketed rolling aggregates of API calls.
+
+    Recording a call touches only the newest bucket, so it is O(1) no
+    matter how many calls are retained. Queries walk the buckets in the
+    requested window, which is bounded by MAX_BUCKETS rather than by call
+    volume.
+    """
+
+    def __init__(
+        self, bucket_seconds: int = BUCKET_SECONDS, max_buckets: int = MAX_BUCKETS
+    ):
+        self.bucket_seconds = bucket_seconds
+        self.buckets: deque[MetricBucket] = deque(maxlen=max_buckets)
+
+    def record(
+        self, timestamp: float, endpoint: str, response_time: float, is_error: bool
+    ):
+        """Add one API call to the current bucket"""
+        bucket_start = timestamp - (timestamp % self.bucket_seconds)
+        if not self.buckets or self.buckets[-1].start < bucket_start:
+            self.buckets.append(MetricBucket(start=bucket_start))
+        bucket = self.buckets[-1]
+
+        bucket.totals.record(response_time, is_error)
+        endpoint_aggregate = bucket.endpoints.get(endpoint)
+        if endpoint_aggregate is None:
+            endpoint_aggregate = bucket.endpoints[endpoint] = EndpointAggregate()
+        endpoint_aggregate.record(response_time, is_error)
+
+    def summarize(
+        self, since: float
+    ) -> tuple[EndpointAggregate, dict[str, EndpointAggregate]]:
+        """Merge every bucket that overlaps [since, now]"""
+        totals = EndpointAggregate()
+        endpoints: dict[str, EndpointAggregate] = defaultdict(EndpointAggregate)
+
+        for bucket in reversed(self.buckets):
+            if bucket.start + self.bucket_seconds <= since:
+                break
+            totals.merge(bucket.totals)
+            for endpoint, aggregate in bucket.endpoints.items():
+                endpoints[endpoint].merge(aggregate)
+
+        return totals, dict(endpoints)
+
+    def prune(self, cutoff: float):
+        """Drop buckets that ended before the cutoff"""
+        while self.buckets and self.buckets[0].start + self.bucket_seconds <= cutoff:
+            self.buckets.popleft()
+
+
 # =============================================================================
 # Discord API Monitor
 # =============================================================================
@@ -109,6 +214,7 @@ class DiscordAPIMonitor:
         self.api_metrics: deque[APICallMetric] = deque(maxlen=MAX_HISTORY_SIZE)
         self.gateway_metrics: deque[GatewayMetric] = deque(maxlen=MAX_HISTORY_SIZE)
         self.health_history: deque[DiscordAPIHealth] = deque(maxlen=MAX_HISTORY_SIZE)
+        self.aggregates = RollingAPIAggregates()
 
         # Rate limiting tracking
         self.rate_limit_buckets: dict[str, dict] = defaultdict(dict)
@@ -119,10 +225,6 @@ class DiscordAPIMonitor:
         self.reconnect_count = 0
         self.last_heartbeat = None
 
-        # Background tasks
-        self.save_task: asyncio.Task | None = None
-        self.cleanup_task: asyncio.Task | None = None
-
         # Statistics
         self.total_api_calls = 0
         self.total_errors = 0
@@ -201,8 +303,13 @@ class DiscordAPIMonitor:
                 )
 
                 self.api_metrics.append(metric)
+                self.aggregates.record(
+                    metric.timestamp,
+                    metric.endpoint,
+                    response_time,
+                    status_code >= 400,
+                )
                 self._check_rate_limits(metric)
-                self._update_health_status()
 
         # Replace the original request method
         self.bot.http.request = monitored_request
@@ -239,7 +346,11 @@ class DiscordAPIMonitor:
             if event_type in ["connect", "heartbeat"]
             else self.last_heartbeat
         )
-        self._update_health_status()
+
+        # Connection state changes are rare and matter immediately;
+        # heartbeats are picked up by the periodic snapshot
+        if event_type != "heartbeat":
+            self._update_health_status()
 
     def record_heartbeat(self, latency: float):
         """Record a heartbeat event (call this from bot's heartbeat monitoring)"""
@@ -302,24 +413,14 @@ class DiscordAPIMonitor:
                 self.last_rate_limit_warning[bucket_key] = current_time
 
     def _update_health_status(self):
-        """Update overall health status"""
+        """Build a health snapshot from the rolling aggregates"""
         current_time = time.time()
 
-        # Calculate metrics from recent data (last 5 minutes)
-        recent_cutoff = current_time - 300
-        recent_api_calls = [m for m in self.api_metrics if m.timestamp > recent_cutoff]
-        recent_gateway_events = [
-            m for m in self.gateway_metrics if m.timestamp > recent_cutoff
-        ]
-
-        # Calculate average response time
-        if recent_api_calls:
-            avg_response_time = statistics.mean(
-                [m.response_time for m in recent_api_calls]
-            )
-            error_rate = len(
-                [m for m in recent_api_calls if m.status_code >= 400]
-            ) / len(recent_api_calls)
+        # Calculate metrics from recent buckets (last 5 minutes)
+        recent, _ = self.aggregates.summarize(current_time - HEALTH_WINDOW_SECONDS)
+        if recent.count:
+            avg_response_time = recent.response_time_sum / recent.count
+            error_rate = recent.error_count / recent.count
         else:
             avg_response_time = 0.0
             error_rate = 0.0
@@ -402,10 +503,9 @@ class DiscordAPIMonitor:
 
     def get_api_metrics_summary(self, hours: int = 1) -> dict[str, Any]:
         """Get API metrics summary"""
-        cutoff = time.time() - (hours * 3600)
-        recent_metrics = [m for m in self.api_metrics if m.timestamp > cutoff]
+        totals, endpoints = self.aggregates.summarize(time.time() - (hours * 3600))
 
-        if not recent_metrics:
+        if not totals.count:
             return {
                 "total_calls": 0,
                 "avg_response_time": 0.0,
@@ -413,40 +513,27 @@ class DiscordAPIMonitor:
                 "slowest_endpoint": None,
                 "most_used_endpoint": None,
                 "rate_limit_status": {},
+                "latency_histogram": {},
             }
 
-        # Calculate statistics
-        response_times = [m.response_time for m in recent_metrics]
-        error_count = len([m for m in recent_metrics if m.status_code >= 400])
-
-        # Find slowest and most used endpoints
-        endpoint_times = defaultdict(list)
-        endpoint_counts = defaultdict(int)
-
-        for metric in recent_metrics:
-            endpoint_times[metric.endpoint].append(metric.response_time)
-            endpoint_counts[metric.endpoint] += 1
-
-        slowest_endpoint = None
-        if endpoint_times:
-            avg_times = {
-                ep: statistics.mean(times) for ep, times in endpoint_times.items()
-            }
-            slowest_endpoint = max(avg_times, key=avg_times.get)
+        slowest_endpoint = max(
+            endpoints,
+            key=lambda ep: endpoints[ep].response_time_sum / endpoints[ep].count,
+        )
+        most_used_endpoint = max(endpoints, key=lambda ep: endpoints[ep].count)
 
-        most_used_endpoint = None
-        if endpoint_counts:
-            most_used_endpoint = max(endpoint_counts, key=endpoint_counts.get)
+        bin_labels = [f"<={bound}s" for bound in LATENCY_BUCKET_BOUNDS] + [
+            f">{LATENCY_BUCKET_BOUNDS[-1]}s"
+        ]
 
         return {
-            "total_calls": len(recent_metrics),
-            "avg_response_time": (
-                statistics.mean(response_times) if response_times else 0.0
-            ),
-            "error_rate": error_count / len(recent_metrics) if recent_metrics else 0.0,
+            "total_calls": totals.count,
+            "avg_response_time": totals.response_time_sum / totals.count,
+            "error_rate": totals.error_count / totals.count,
             "slowest_endpoint": slowest_endpoint,
             "most_used_endpoint": most_used_endpoint,
             "rate_limit_status": dict(self.rate_limit_buckets),
+            "latency_histogram": dict(zip(bin_labels, totals.histogram, strict=True)),
         }
 
     def get_gateway_status(self) -> dict[str, Any]:
@@ -460,29 +547,35 @@ class DiscordAPIMonitor:
         }
 
     def _start_background_tasks(self):
-        """Start background monitoring tasks"""
-        self.save_task = asyncio.create_task(self._save_data_loop())
-        self.cleanup_task = asyncio.create_task(self._cleanup_loop())
+        """Register snapshot, save and cleanup jobs with the event scheduler"""
+        scheduler = get_event_scheduler()
+        scheduler.schedule(
+            HEALTH_JOB_NAME,
+            self._run_health_snapshot,
+            interval_seconds=HEALTH_SNAPSHOT_INTERVAL,
+        )
+        scheduler.schedule(
+            SAVE_JOB_NAME,
+            self._run_save,
+            interval_seconds=SAVE_INTERVAL,
+        )
+        scheduler.schedule(
+            CLEANUP_JOB_NAME,
+            self._run_cleanup,
+            interval_seconds=CLEANUP_INTERVAL,
+        )
 
-    async def _save_data_loop(self):
-        """Periodically save data to disk"""
-        while True:
-            try:
-                await asyncio.sleep(SAVE_INTERVAL)
-                self._save_data()
-            except Exception as e:
-                log_error_with_traceback("Error saving Discord API monitor data", e)
+    async def _run_health_snapshot(self):
+        """Scheduled job body that records a health snapshot"""
+        self._update_health_status()
 
-    async def _cleanup_loop(self):
-        """Periodically clean up old data"""
-        while True:
-            try:
-                await asyncio.sleep(CLEANUP_INTERVAL)
-                self._cleanup_old_data()
-            except Exception as e:
-                log_error_with_traceback(
-                    "Error cleaning up Discord API monitor data", e
-                )
+    async def _run_save(self):
+        """Scheduled job body that saves data to disk"""
+        self._save_data()
+
+    async def _run_cleanup(self):
+        """Scheduled job body that removes old data"""
+        self._cleanup_old_data()
 
     def _save_data(self):
         """Save current data to disk"""
@@ -528,11 +621,17 @@ class DiscordAPIMonitor:
                         health = DiscordAPIHealth(**h_data)
                         self.health_history.append(health)
 
-                # Load API metrics
+                # Load API metrics and rebuild the rolling aggregates
                 if "api_metrics" in data:
                     for m_data in data["api_metrics"]:
                         metric = APICallMetric(**m_data)
                         self.api_metrics.append(metric)
+                        self.aggregates.record(
+                            metric.timestamp,
+                            metric.endpoint,
+                            metric.response_time,
+                            metric.status_code >= 400,
+                        )
 
                 # Load gateway metrics
                 if "gateway_metrics" in data:
@@ -579,6 +678,9 @@ class DiscordAPIMonitor:
             maxlen=MAX_HISTORY_SIZE,
         )
 
+        # Clean aggregate buckets
+        self.aggregates.prune(cutoff)
+
         # Clean rate limit buckets
         current_time = time.time()
         expired_buckets = [
@@ -591,10 +693,9 @@ class DiscordAPIMonitor:
 
     def stop(self):
         """Stop monitoring and cleanup"""
-        if self.save_task:
-            self.save_task.cancel()
-        if self.cleanup_task:
-            self.cleanup_task.cancel()
+        scheduler = get_event_scheduler()
+        for job_name in (HEALTH_JOB_NAME, SAVE_JOB_NAME, CLEANUP_JOB_NAME):
+            scheduler.cancel(job_name)
 
         # Final save
         self._save_data()
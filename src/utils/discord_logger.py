@@ -24,8 +24,14 @@ import discord
 from discord.ext import commands
 import pytz
 
+from src.core.rate_limit_engine import RateLimitRule, get_rate_limit_engine
+
+from .scheduler import get_event_scheduler
 from .tree_log import log_error_with_traceback, log_perfect_tree_section
 
+# Name of the hourly heartbeat job registered with the event scheduler
+HEARTBEAT_JOB_NAME = "discord_logger_heartbeat"
+
 
 class DiscordLogger:
     """
@@ -56,7 +62,7 @@ class DiscordLogger:
         self.bot = bot
         self.log_channel_id = log_channel_id
         self.log_channel = None
-        self.rate_limit_cache = {}
+        self.rate_limit_engine = get_rate_limit_engine()
         self.max_logs_per_minute = 10
         self.enabled = True
         # Dashboard URL removed as part of web dashboard removal
@@ -115,8 +121,13 @@ class DiscordLogger:
                 # Send initial heartbeat after a short delay to allow bot to fully initialize
                 self.bot.loop.create_task(self._send_initial_heartbeat())
 
-                # Start heartbeat task
-                self.bot.loop.create_task(self._heartbeat_task())
+                # Register hourly heartbeat with the event scheduler
+                get_event_scheduler().schedule(
+                    HEARTBEAT_JOB_NAME,
+                    self._send_heartbeat,
+                    next_run_func=self._get_next_hour_timestamp,
+                    retry_seconds=300,
+                )
                 return True
             else:
                 self.enabled = False
@@ -139,42 +150,14 @@ class DiscordLogger:
         except Exception as e:
             log_error_with_traceback("Error sending initial heartbeat", e)
 
-    async def _heartbeat_task(self):
-        """Send hourly heartbeat with system status and recent logs."""
-        while True:
-            try:
-                # Wait for the next hour mark
-                await self._wait_for_next_hour()
-
-                # Send heartbeat
-                await self._send_heartbeat()
-
-            except Exception as e:
-                log_error_with_traceback("Error in heartbeat task", e)
-                # Wait 5 minutes before retrying
-                await asyncio.sleep(300)
-
-    async def _wait_for_next_hour(self):
-        """Wait until the next hour mark (e.g., 10:00, 11:00, etc.)."""
-        try:
-            est = pytz.timezone("US/Eastern")
-            now_est = datetime.now(est)
-
-            # Calculate next hour
-            next_hour = now_est.replace(minute=0, second=0, microsecond=0) + timedelta(
-                hours=1
-            )
-
-            # Calculate seconds to wait
-            wait_seconds = (next_hour - now_est).total_seconds()
-
-            # Wait until next hour
-            await asyncio.sleep(wait_seconds)
-
-        except Exception as e:
-            log_error_with_traceback("Error calculating next hour", e)
-            # Fallback: wait 1 hour
-            await asyncio.sleep(3600)
+    def _get_next_hour_timestamp(self) -> float:
+        """Get the Unix timestamp of the next hour mark (e.g., 10:00, 11:00, etc.)."""
+        est = pytz.timezone("US/Eastern")
+        now_est = datetime.now(est)
+        next_hour = now_est.replace(minute=0, second=0, microsecond=0) + timedelta(
+            hours=1
+        )
+        return next_hour.timestamp()
 
     async def _send_heartbeat(self, is_startup: bool = False):
         """Send heartbeat embed with system status and recent logs."""
@@ -243,6 +226,13 @@ class DiscordLogger:
                 name="🎯 Current Surah", value=status_data["current_surah"], inline=True
             )
 
+            if status_data.get("upcoming_jobs"):
+                embed.add_field(
+                    name="🗓️ Upcoming Jobs",
+                    value=status_data["upcoming_jobs"],
+                    inline=False,
+                )
+
             # Dashboard link removed as part of web dashboard removal
 
             # Add recent logs
@@ -265,6 +255,22 @@ class DiscordLogger:
         except Exception as e:
             log_error_with_traceback("Error sending heartbeat", e)
 
+    def _format_upcoming_jobs(self, limit: int = 5) -> str:
+        """Summarize the next scheduled jobs for the heartbeat embed"""
+        lines = []
+        for job in get_event_scheduler().get_upcoming_jobs(limit=limit):
+            seconds = job["seconds_until"]
+            if seconds is None:
+                when = "dormant"
+            elif seconds <= 0:
+                when = "due now"
+            elif seconds < 3600:
+                when = f"in {int(seconds // 60)}m"
+            else:
+                when = f"in {int(seconds // 3600)}h {int(seconds % 3600 // 60)}m"
+            lines.append(f"• `{job['name']}` {when}")
+        return "\n".join(lines) or "No jobs scheduled"
+
     async def _get_system_status(self) -> dict[str, str]:
         """Get current system status information."""
         try:
@@ -277,11 +283,15 @@ class DiscordLogger:
                 "current_surah": "Unknown",
             }
 
-            # Check voice connection
-            if hasattr(self.bot, "voice_clients") and self.bot.voice_clients:
-                voice_client = self.bot.voice_clients[0]
-                status["voice_connected"] = voice_client.is_connected()
-                status["audio_playing"] = voice_client.is_playing()
+            # Check voice connections (one per channel when broadcasting)
+            voice_clients = getattr(self.bot, "voice_clients", None) or []
+            connected = [vc for vc in voice_clients if vc.is_connected()]
+            status["voice_connected"] = bool(connected)
+            status["audio_playing"] = any(vc.is_playing() for vc in connected)
+            if len(voice_clients) > 1:
+                status["voice_connections"] = f"{len(connected)}/{len(voice_clients)}"
+
+            status["upcoming_jobs"] = self._format_upcoming_jobs()
 
             # Note: Current surah status removed as legacy state_manager was removed
             # This can be re-implemented using modern StateService if needed
@@ -540,35 +550,12 @@ class DiscordLogger:
         Returns:
             bool: True if within rate limits, False if rate limited
         """
-        now = datetime.now()
-        minute_key = now.strftime("%Y-%m-%d-%H-%M")
-
-        if log_type not in self.rate_limit_cache:
-            self.rate_limit_cache[log_type] = {}
-
-        if minute_key not in self.rate_limit_cache[log_type]:
-            self.rate_limit_cache[log_type][minute_key] = 0
-
-        # Clean old entries (older than 2 minutes)
-        keys_to_remove = []
-        for key in self.rate_limit_cache[log_type].keys():
-            try:
-                key_time = datetime.strptime(key, "%Y-%m-%d-%H-%M")
-                if (now - key_time).total_seconds() > 120:
-                    keys_to_remove.append(key)
-            except:
-                keys_to_remove.append(key)
-
-        for key in keys_to_remove:
-            del self.rate_limit_cache[log_type][key]
-
-        # Check current minute's count
-        current_count = self.rate_limit_cache[log_type][minute_key]
-        if current_count >= self.max_logs_per_minute:
-            return False
+        return self.rate_limit_engine.acquire(self._log_rate_rule, log_type).allowed
 
-        self.rate_limit_cache[log_type][minute_key] += 1
-        return True
+    @property
+    def _log_rate_rule(self) -> RateLimitRule:
+        """Per-log-type limit of max_logs_per_minute"""
+        return RateLimitRule("discord_log", self.max_logs_per_minute, 60)
 
     def _get_timestamp(self) -> str:
         """Get formatted timestamp in EST timezone."""
@@ -890,8 +877,8 @@ class DiscordLogger:
             # Add rate limit statistics
             try:
                 rate_limit_count = sum(
-                    sum(minute_counts.values())
-                    for minute_counts in self.rate_limit_cache.values()
+                    self.rate_limit_engine.peek(self._log_rate_rule, log_type).used
+                    for log_type in self.level_colors
                 )
                 fields.append(
                     {
@@ -0,0 +1,434 @@
+# =============================================================================
+# QuranBot - Guild Session Manager
+# =============================================================================
+# Runs an independent playback session per guild from a single process.
+#
+# Each session owns its own AudioManager (reciter, surah, position, loop and
+# shuffle mode, control panel) and its own persisted playback state under
+# data/sessions/<guild_id>/. The Opus library and MP3 duration cache are
+# shared by every session.
+#
+# Sessions are started for every guild listed in GUILD_SESSIONS at startup,
+# each with its own control panel when a panel channel is given. Sessions
+# that have not played for a while are stopped and evicted from memory;
+# their state and channels stay on disk, so the session is revived lazily
+# the next time a member joins that voice channel.
+# =============================================================================
+
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import time
+
+import discord
+
+from .audio_manager import AudioManager
+from .control_panel import cleanup_control_panels, setup_control_panel
+from .opus_library import get_opus_library
+from .scheduler import get_event_scheduler
+from .shuffle_playlist import ShuffleMode
+from .state_manager import StateManager, state_manager
+from .tree_log import (
+    log_error_with_traceback,
+    log_perfect_tree_section,
+    log_warning_with_context,
+)
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+SESSIONS_DATA_DIR = Path(__file__).parent.parent.parent / "data" / "sessions"
+SESSION_FILE_NAME = "session.json"
+IDLE_SESSION_SECONDS = 30 * 60  # Evict sessions idle for 30 minutes
+EVICTION_INTERVAL_SECONDS = 60
+EVICTION_JOB_NAME = "guild_session_eviction"
+
+
+@dataclass(frozen=True)
+class SessionConfig:
+    """A configured guild: the voice channel to play in and its panel channel"""
+
+    guild_id: int
+    channel_id: int
+    panel_channel_id: int | None = None
+
+
+def parse_session_configs(value: str) -> list[SessionConfig]:
+    """
+    Parse GUILD_SESSIONS entries of the form guild:voice[:panel].
+
+    Entries are comma separated. Raises ValueError naming the first
+    malformed entry.
+    """
+    configs = []
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        parts = entry.split(":")
+        if len(parts) not in (2, 3) or not all(p.strip().isdigit() for p in parts):
+            raise ValueError(f"Invalid GUILD_SESSIONS entry: {entry!r}")
+        ids = [int(part) for part in parts]
+        configs.append(SessionConfig(*ids))
+    return configs
+
+
+@dataclass
+class GuildSession:
+    """Playback session for one guild"""
+
+    guild_id: int
+    channel_id: int | None
+    audio_manager: AudioManager
+    panel_channel_id: int | None = None
+    panel_active: bool = False
+    last_active: float = field(default_factory=time.monotonic)
+
+    @property
+    def is_playing(self) -> bool:
+        """Whether audio is currently being played in this guild"""
+        voice_client = self.audio_manager.voice_client
+        return bool(
+            voice_client
+            and voice_client.is_connected()
+            and self.audio_manager.is_playing
+        )
+
+    def touch(self) -> None:
+        """Record activity so the session is not evicted"""
+        self.last_active = time.monotonic()
+
+
+class GuildSessionManager:
+    """Creates, persists, evicts and revives per-guild playback sessions"""
+
+    def __init__(
+        self,
+        bot,
+        ffmpeg_path: str,
+        audio_base_folder: str = "audio",
+        default_reciter: str = "Saad Al Ghamdi",
+        default_shuffle: bool = False,
+        default_loop: bool = False,
+        shuffle_mode: ShuffleMode = ShuffleMode.UNIFORM,
+        primary_guild_id: int | None = None,
+        idle_timeout: float = IDLE_SESSION_SECONDS,
+        data_dir: Path = SESSIONS_DATA_DIR,
+    ):
+        self.bot = bot
+        self.ffmpeg_path = ffmpeg_path
+        self.audio_base_folder = audio_base_folder
+        self.default_reciter = default_reciter
+        self.default_shuffle = default_shuffle
+        self.default_loop = default_loop
+        self.shuffle_mode = shuffle_mode
+        self.primary_guild_id = primary_guild_id
+        self.idle_timeout = idle_timeout
+        self.data_dir = Path(data_dir)
+
+        self.sessions: dict[int, GuildSession] = {}
+
+        # Shared across every session
+        self.opus_library = get_opus_library(audio_base_folder, ffmpeg_path)
+        self.duration_cache: dict[str, float] = {}
+
+    # =========================================================================
+    # Session Lifecycle
+    # =========================================================================
+
+    def get_session(self, guild_id: int) -> GuildSession | None:
+        """Get a live session without creating one"""
+        return self.sessions.get(guild_id)
+
+    def get_or_create_session(
+        self,
+        guild_id: int,
+        channel_id: int | None = None,
+        panel_channel_id: int | None = None,
+    ) -> GuildSession:
+        """Get a guild's session, creating or reviving it from disk"""
+        session = self.sessions.get(guild_id)
+        if session:
+            changed = False
+            if channel_id and channel_id != session.channel_id:
+                session.channel_id = channel_id
+                session.audio_manager.channel_id = channel_id
+                changed = True
+            if panel_channel_id and panel_channel_id != session.panel_channel_id:
+                session.panel_channel_id = panel_channel_id
+                session.panel_active = False
+                changed = True
+            if changed and guild_id != self.primary_guild_id:
+                self._save_session_info(session)
+            session.touch()
+            return session
+
+        saved = self._load_session_info(guild_id)
+        channel_id = channel_id or saved.get("channel_id")
+        panel_channel_id = panel_channel_id or saved.get("panel_channel_id")
+        audio_manager = AudioManager(
+            self.bot,
+            self.ffmpeg_path,
+            audio_base_folder=self.audio_base_folder,
+            default_reciter=self.default_reciter,
+            default_shuffle=self.default_shuffle,
+            default_loop=self.default_loop,
+            state_store=self._state_store_for(guild_id),
+            guild_id=guild_id,
+            channel_id=channel_id,
+            opus_library=self.opus_library,
+            duration_cache=self.duration_cache,
+            shuffle_mode=self.shuffle_mode,
+            # Only the primary guild drives the global health monitor
+            monitor_health=guild_id == self.primary_guild_id,
+        )
+
+        session = GuildSession(guild_id, channel_id, audio_manager, panel_channel_id)
+        self.sessions[guild_id] = session
+        if guild_id != self.primary_guild_id:
+            self._save_session_info(session)
+
+        log_perfect_tree_section(
+            "Guild Session - Started",
+            [
+                ("guild_id", guild_id),
+                ("channel_id", channel_id or "Not set"),
+                ("active_sessions", len(self.sessions)),
+            ],
+            "🕌",
+        )
+        return session
+
+    async def start_session(
+        self, channel: discord.VoiceChannel, panel_channel_id: int | None = None
+    ) -> GuildSession:
+        """Connect to a voice channel and start (or resume) its guild's playback"""
+        session = self.get_or_create_session(
+            channel.guild.id, channel.id, panel_channel_id
+        )
+        audio_manager = session.audio_manager
+
+        if not (audio_manager.voice_client and audio_manager.voice_client.is_connected()):
+            if not await audio_manager.connect_to_voice_channel():
+                raise ConnectionError(f"Could not connect to voice channel {channel.id}")
+
+        if not audio_manager.is_playing:
+            await audio_manager.start_playback(resume_position=True)
+
+        # The primary guild's panel is managed by the bot's startup
+        if session.panel_channel_id and not session.panel_active:
+            session.panel_active = await setup_control_panel(
+                self.bot, session.panel_channel_id, audio_manager
+            )
+        session.touch()
+        return session
+
+    async def start_configured_sessions(
+        self, configs: list[SessionConfig]
+    ) -> list[GuildSession]:
+        """Start a session for every configured guild; failures are logged"""
+        started = []
+        for config in configs:
+            if config.guild_id == self.primary_guild_id:
+                log_warning_with_context(
+                    "Guild session skipped",
+                    f"Guild {config.guild_id} is the primary guild",
+                )
+                continue
+
+            channel = self.bot.get_channel(config.channel_id)
+            if (
+                not isinstance(channel, discord.VoiceChannel)
+                or channel.guild.id != config.guild_id
+            ):
+                log_warning_with_context(
+                    "Guild session skipped",
+                    f"{config.channel_id} is not a voice channel in guild {config.guild_id}",
+                )
+                continue
+
+            try:
+                started.append(
+                    await self.start_session(channel, config.panel_channel_id)
+                )
+            except Exception as e:
+                log_error_with_traceback(
+                    f"Error starting session for guild {config.guild_id}", e
+                )
+
+        log_perfect_tree_section(
+            "Guild Sessions - Configured",
+            [
+                ("configured", len(configs)),
+                ("started", len(started)),
+                ("active_sessions", len(self.sessions)),
+            ],
+            "🕌",
+        )
+        return started
+
+    async def end_session(self, guild_id: int) -> bool:
+        """Stop a guild's playback, save its state and drop it from memory"""
+        session = self.sessions.pop(guild_id, None)
+        if not session:
+            return False
+
+        audio_manager = session.audio_manager
+        audio_manager.stop_health_monitoring()
+        try:
+            await audio_manager.stop_playback()
+            if audio_manager.voice_client and audio_manager.voice_client.is_connected():
+                await audio_manager.voice_client.disconnect()
+        except Exception as e:
+            log_error_with_traceback(f"Error ending session for guild {guild_id}", e)
+
+        if session.panel_active:
+            cleanup_control_panels(session.panel_channel_id)
+
+        log_perfect_tree_section(
+            "Guild Session - Evicted",
+            [
+                ("guild_id", guild_id),
+                ("surah", audio_manager.current_surah),
+                ("active_sessions", len(self.sessions)),
+            ],
+            "💤",
+        )
+        return True
+
+    async def handle_voice_join(self, member, before, after) -> GuildSession | None:
+        """
+        Revive an evicted session when a member joins its voice channel.
+
+        Only channels a session has previously played in are revived, so
+        joins in unrelated channels never pull the bot in.
+        """
+        if member.bot or not after.channel:
+            return None
+        if before.channel and before.channel.id == after.channel.id:
+            return None
+
+        guild_id = after.channel.guild.id
+        session = self.sessions.get(guild_id)
+        if session:
+            session.touch()
+            return session
+
+        if self._load_session_info(guild_id).get("channel_id") != after.channel.id:
+            return None
+
+        try:
+            return await self.start_session(after.channel)
+        except Exception as e:
+            log_error_with_traceback(
+                f"Error reviving session for guild {guild_id}", e
+            )
+            return None
+
+    # =========================================================================
+    # Idle Eviction
+    # =========================================================================
+
+    def start(self) -> None:
+        """Register the idle eviction job with the event scheduler"""
+        get_event_scheduler().schedule(
+            EVICTION_JOB_NAME,
+            self.evict_idle_sessions,
+            interval_seconds=EVICTION_INTERVAL_SECONDS,
+        )
+
+    def stop(self) -> None:
+        """Remove the idle eviction job"""
+        get_event_scheduler().cancel(EVICTION_JOB_NAME)
+
+    async def evict_idle_sessions(self, now: float | None = None) -> list[int]:
+        """Evict sessions that have not played for `idle_timeout` seconds"""
+        now = now if now is not None else time.monotonic()
+        idle = []
+        for guild_id, session in list(self.sessions.items()):
+            if session.is_playing:
+                session.touch()
+                continue
+            if guild_id == self.primary_guild_id:
+                continue
+            if now - session.last_active >= self.idle_timeout:
+                idle.append(guild_id)
+
+        for guild_id in idle:
+            await self.end_session(guild_id)
+        return idle
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def _session_dir(self, guild_id: int) -> Path:
+        """Directory holding a guild's persisted state"""
+        return self.data_dir / str(guild_id)
+
+    def _state_store_for(self, guild_id: int) -> StateManager:
+        """Per-guild state manager; the primary guild keeps the legacy files"""
+        if guild_id == self.primary_guild_id:
+            return state_manager
+
+        session_dir = self._session_dir(guild_id)
+        session_dir.mkdir(parents=True, exist_ok=True)
+        return StateManager(
+            data_dir=str(session_dir),
+            default_reciter=self.default_reciter,
+            default_shuffle=self.default_shuffle,
+            default_loop=self.default_loop,
+        )
+
+    def _load_session_info(self, guild_id: int) -> dict:
+        """Load a guild's saved session info (voice and panel channels)"""
+        session_file = self._session_dir(guild_id) / SESSION_FILE_NAME
+        try:
+            with open(session_file) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log_warning_with_context(
+                "Unreadable guild session file", f"{session_file}: {e}"
+            )
+            return {}
+
+    def _save_session_info(self, session: GuildSession) -> None:
+        """Persist which voice and panel channels a guild's session uses"""
+        session_dir = self._session_dir(session.guild_id)
+        session_dir.mkdir(parents=True, exist_ok=True)
+        session_file = session_dir / SESSION_FILE_NAME
+        temp_file = session_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump(
+                {
+                    "guild_id": session.guild_id,
+                    "channel_id": session.channel_id,
+                    "panel_channel_id": session.panel_channel_id,
+                },
+                f,
+                indent=2,
+            )
+        os.replace(temp_file, session_file)
+
+
+# =============================================================================
+# Global Session Manager
+# =============================================================================
+
+_session_manager: GuildSessionManager | None = None
+
+
+def get_session_manager() -> GuildSessionManager | None:
+    """Get the global guild session manager, if one has been set up"""
+    return _session_manager
+
+
+def setup_session_manager(bot, ffmpeg_path: str, **kwargs) -> GuildSessionManager:
+    """Create the global guild session manager"""
+    global _session_manager
+    _session_manager = GuildSessionManager(bot, ffmpeg_path, **kwargs)
+    return _session_manager
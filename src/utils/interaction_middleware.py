@@ -0,0 +1,290 @@
+# =============================================================================
+# QuranBot - Interaction Middleware
+# =============================================================================
+# Fast acknowledgement for slash commands, buttons and selects.
+#
+# - Handlers predicted to be slow are deferred before their body runs, so
+#   file I/O, logging and REST calls never race Discord's 3-second deadline
+# - Handlers predicted to be fast run as before, with a watchdog that
+#   defers them if they have not responded shortly before the deadline
+# - After a defer, the handler's own response calls become follow-ups, so
+#   handler bodies keep using interaction.response unchanged
+# - Ack latency and total latency are recorded per command in quantile
+#   sketches and forwarded to the PerformanceMonitor when one is available
+# =============================================================================
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable
+from functools import wraps
+import time
+from typing import Any
+
+import discord
+
+from src.core.performance_monitor import PerformanceMonitor, QuantileSketch
+
+from .tree_log import log_error_with_traceback
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+SLOW_HANDLER_SECONDS = 0.25  # Predicted time to respond above which we defer up front
+AUTO_DEFER_SECONDS = 0.35  # Watchdog defers handlers that have not responded by then
+LATENCY_SMOOTHING = 0.3  # Weight of the newest sample in the prediction
+
+
+# =============================================================================
+# Follow-up Aware Response
+# =============================================================================
+
+
+class FastAckResponse(discord.InteractionResponse):
+    """
+    Interaction response that turns into follow-ups once acknowledged.
+
+    Installed on the interaction by fast_ack(). The first response, whether
+    the middleware's defer or the handler's own reply, goes to Discord as
+    usual; later send_message/edit_message calls become followup.send and
+    edit_original_response, and extra defers are ignored.
+    """
+
+    __slots__ = ("_ack_lock", "acked_at", "handler_responded_at", "auto_deferred", "deferring")
+
+    def __init__(self, parent: discord.Interaction):
+        super().__init__(parent)
+        self._ack_lock = asyncio.Lock()
+        self.acked_at: float | None = None  # perf_counter of the first response
+        self.handler_responded_at: float | None = None  # When the handler first replied
+        self.auto_deferred = False  # Acknowledged by the middleware, not the handler
+        self.deferring = False  # The watchdog has started its defer
+
+    def _handler_responding(self) -> None:
+        if self.handler_responded_at is None:
+            self.handler_responded_at = time.perf_counter()
+
+    def _acked(self) -> None:
+        if self.acked_at is None:
+            self.acked_at = time.perf_counter()
+
+    async def auto_defer(self, ephemeral: bool) -> None:
+        """Defer on the handler's behalf if nothing has been sent yet"""
+        async with self._ack_lock:
+            if self.is_done():
+                return
+            # A deferred component update keeps the message; commands show "thinking"
+            thinking = self._parent.type is discord.InteractionType.application_command
+            await super().defer(ephemeral=ephemeral, thinking=thinking)
+            self.auto_deferred = True
+            self._acked()
+
+    async def defer_after(self, delay: float, ephemeral: bool) -> None:
+        """Watchdog: auto_defer() if the handler is still silent after `delay`"""
+        await asyncio.sleep(delay)
+        self.deferring = True
+        try:
+            await self.auto_defer(ephemeral)
+        except Exception as e:
+            log_error_with_traceback("Error auto-deferring interaction", e)
+
+    async def defer(self, *, ephemeral: bool = False, thinking: bool = False):
+        self._handler_responding()
+        async with self._ack_lock:
+            if self.is_done():
+                return None
+            result = await super().defer(ephemeral=ephemeral, thinking=thinking)
+            self._acked()
+            return result
+
+    async def send_message(self, content: Any | None = None, **kwargs):
+        self._handler_responding()
+        async with self._ack_lock:
+            if not self.is_done():
+                result = await super().send_message(content, **kwargs)
+                self._acked()
+                return result
+
+        delete_after = kwargs.pop("delete_after", None)
+        if content is not None:
+            kwargs["content"] = str(content)
+        message = await self._parent.followup.send(wait=True, **kwargs)
+        if delete_after is not None:
+            await message.delete(delay=delete_after)
+        return message
+
+    async def edit_message(self, **kwargs):
+        self._handler_responding()
+        async with self._ack_lock:
+            if not self.is_done():
+                result = await super().edit_message(**kwargs)
+                self._acked()
+                return result
+
+        delete_after = kwargs.pop("delete_after", None)
+        message = await self._parent.edit_original_response(**kwargs)
+        if delete_after is not None:
+            await message.delete(delay=delete_after)
+        return message
+
+    async def send_modal(self, modal: discord.ui.Modal):
+        self._handler_responding()
+        async with self._ack_lock:
+            result = await super().send_modal(modal)
+            self._acked()
+            return result
+
+
+# =============================================================================
+# Latency Tracking
+# =============================================================================
+
+
+class InteractionLatencyStats:
+    """Per-command ack and total latency sketches plus the slowness prediction"""
+
+    def __init__(self):
+        self.ack: dict[str, QuantileSketch] = defaultdict(QuantileSketch)
+        self.total: dict[str, QuantileSketch] = defaultdict(QuantileSketch)
+        self.deferred: dict[str, int] = defaultdict(int)
+        self.predicted_response: dict[str, float] = {}
+
+    def is_predicted_slow(self, command: str) -> bool:
+        """True if the handler usually takes too long to send its first reply"""
+        return self.predicted_response.get(command, 0.0) > SLOW_HANDLER_SECONDS
+
+    def record(
+        self,
+        command: str,
+        ack_seconds: float,
+        total_seconds: float,
+        response_seconds: float,
+        deferred: bool,
+    ) -> None:
+        """Record one handled interaction"""
+        self.ack[command].add(ack_seconds)
+        self.total[command].add(total_seconds)
+        if deferred:
+            self.deferred[command] += 1
+
+        previous = self.predicted_response.get(command)
+        self.predicted_response[command] = (
+            response_seconds
+            if previous is None
+            else previous + LATENCY_SMOOTHING * (response_seconds - previous)
+        )
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Ack/total percentiles per command, in milliseconds"""
+        return {
+            command: {
+                "count": ack.count,
+                "deferred": self.deferred[command],
+                "ack_p50_ms": ack.quantile(50) * 1000,
+                "ack_p99_ms": ack.quantile(99) * 1000,
+                "total_p50_ms": self.total[command].quantile(50) * 1000,
+                "total_p99_ms": self.total[command].quantile(99) * 1000,
+            }
+            for command, ack in self.ack.items()
+        }
+
+
+_latency_stats = InteractionLatencyStats()
+
+
+def get_interaction_latency_stats() -> InteractionLatencyStats:
+    """Get the process-wide interaction latency stats"""
+    return _latency_stats
+
+
+def _resolve_monitor(args: tuple) -> PerformanceMonitor | None:
+    """The PerformanceMonitor from the handler's cog or view container, if any"""
+    container = getattr(args[0], "container", None) if args else None
+    try:
+        if container is not None and container.is_registered(PerformanceMonitor):
+            return container.get(PerformanceMonitor)
+    except Exception:
+        pass
+    from src.core import performance_monitor
+
+    return performance_monitor._global_performance_monitor
+
+
+# =============================================================================
+# Middleware Decorator
+# =============================================================================
+
+
+def fast_ack(
+    command_name: str | None = None,
+    *,
+    ephemeral: bool = True,
+    always_defer: bool = False,
+    auto_defer: bool = True,
+):
+    """
+    Acknowledge an interaction handler quickly and record its latency.
+
+    Place it directly under @app_commands.command / @discord.ui.button so
+    admin and rate-limit replies also go through the middleware.
+
+    Args:
+        command_name: Name used in latency stats (defaults to the function name)
+        ephemeral: Whether an up-front defer makes the reply ephemeral
+        always_defer: Defer before the handler runs, regardless of history
+        auto_defer: Allow deferring at all; disable for handlers that open modals
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = command_name or func.__name__
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            interaction = None
+            for arg in args:
+                if isinstance(arg, discord.Interaction):
+                    interaction = arg
+                    break
+
+            if not interaction:
+                return await func(*args, **kwargs)
+
+            started = time.perf_counter()
+            response = FastAckResponse(interaction)
+            interaction._cs_response = response
+
+            watchdog = None
+            if auto_defer and (always_defer or _latency_stats.is_predicted_slow(name)):
+                try:
+                    await response.auto_defer(ephemeral)
+                except Exception as e:
+                    log_error_with_traceback(f"Error deferring interaction: {name}", e)
+            elif auto_defer:
+                watchdog = asyncio.create_task(
+                    response.defer_after(AUTO_DEFER_SECONDS, ephemeral)
+                )
+
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                if watchdog and response.deferring:
+                    await watchdog  # Never abandon a defer that is in flight
+                elif watchdog:
+                    watchdog.cancel()
+
+                finished = time.perf_counter()
+                total = finished - started
+                ack = (response.acked_at or finished) - started
+                responded = (response.handler_responded_at or finished) - started
+                _latency_stats.record(
+                    name, ack, total, responded, response.auto_deferred
+                )
+
+                monitor = _resolve_monitor(args)
+                if monitor is not None:
+                    monitor.record_duration(f"interaction_ack.{name}", ack)
+                    monitor.record_duration(f"interaction_total.{name}", total)
+
+        return wrapper
+
+    return decorator
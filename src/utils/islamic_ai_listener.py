@@ -18,6 +18,7 @@ from src.services.conversation_memory_service import get_conversation_memory_ser
 from src.services.enhanced_islamic_ai_service import get_enhanced_islamic_ai_service
 from src.services.islamic_calendar_service import get_islamic_calendar_service
 from src.services.translation_service import get_translation_service
+from src.utils.interaction_middleware import fast_ack
 from src.utils.tree_log import log_error_with_traceback, log_perfect_tree_section
 
 
@@ -52,6 +53,7 @@ class TranslationView(discord.ui.View):
 
     def create_translation_callback(self, language_code: str):
         """Create callback function for translation button."""
+        @fast_ack("ai_translation", always_defer=True)
         async def translation_callback(interaction: discord.Interaction):
             # Check if the user is authorized to use this translation
             if interaction.user.id != self.original_user_id:
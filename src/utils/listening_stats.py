@@ -34,16 +34,17 @@
 # - discord.py: Discord API wrapper
 # =============================================================================
 
-import asyncio
 from datetime import UTC, datetime
 import json
 import os
 from pathlib import Path
+import time
 
 import discord
 
 from src.core.exceptions import StateError
 
+from .scheduler import get_event_scheduler
 from .tree_log import log_error_with_traceback, log_perfect_tree_section
 
 # =============================================================================
@@ -72,6 +73,7 @@ TEMP_BACKUP_DIR = Path(__file__).parent.parent.parent / "backup" / "temp"
 
 # Leaderboard configuration
 LEADERBOARD_UPDATE_INTERVAL = 60  # Update frequency in seconds
+LEADERBOARD_JOB_NAME = "leaderboard_update"  # Event scheduler job name
 LEADERBOARD_CHANNEL_ID = None  # Set during bot initialization
 LEADERBOARD_UPDATE_TASK = None  # Background task reference
 
@@ -281,7 +283,7 @@ class ListeningStatsManager:
         self.last_updated = None
         self.bot = None
         self.leaderboard_channel_id = None
-        self.leaderboard_update_task = None
+        self.leaderboard_updates_enabled = False
         self.last_leaderboard_message = None
         self.update_counter = 0  # Add counter to reduce log spam
         self.last_logged_active_count = 0  # Track changes in active users
@@ -581,7 +583,7 @@ class ListeningStatsManager:
         try:
             # Create backup before saving (in temp directory to keep data/ clean)
             backup_file = TEMP_BACKUP_DIR / f"{STATS_FILE.stem}.backup"
-            # Individual backup files disabled - using hourly ZIP backup system instead
+            # Individual backup files disabled - using hourly snapshot backups instead
 
             # Prepare data structure
             data = {
@@ -743,6 +745,10 @@ class ListeningStatsManager:
                 user_id=user_id, start_time=datetime.now(UTC)
             )
 
+            # Wake the leaderboard job if it went dormant with nobody listening
+            if self.leaderboard_updates_enabled and len(self.active_sessions) == 1:
+                get_event_scheduler().reschedule(LEADERBOARD_JOB_NAME)
+
             # Initialize user stats if not exists
             if user_id not in self.users:
                 self.users[user_id] = UserStats(user_id)
@@ -956,21 +962,20 @@ class ListeningStatsManager:
             log_error_with_traceback("Failed to set up leaderboard auto-update", e)
 
     def start_leaderboard_updates(self):
-        """Start the automatic leaderboard update task"""
+        """Register the automatic leaderboard update job"""
         try:
-            # Cancel existing task if running
-            if self.leaderboard_update_task and not self.leaderboard_update_task.done():
-                self.leaderboard_update_task.cancel()
-
-            # Start new update task
-            self.leaderboard_update_task = asyncio.create_task(
-                self._leaderboard_update_loop()
+            self.leaderboard_updates_enabled = True
+            get_event_scheduler().schedule(
+                LEADERBOARD_JOB_NAME,
+                self._run_leaderboard_update,
+                next_run_func=self._get_next_leaderboard_update,
+                retry_seconds=LEADERBOARD_UPDATE_INTERVAL,
             )
 
             log_perfect_tree_section(
                 "Leaderboard Auto-Update - Started",
                 [
-                    ("status", "✅ Auto-update task started"),
+                    ("status", "✅ Auto-update job registered"),
                     ("interval", f"{LEADERBOARD_UPDATE_INTERVAL}s"),
                     ("active_users", len(self.active_sessions)),
                 ],
@@ -980,24 +985,16 @@ class ListeningStatsManager:
         except Exception as e:
             log_error_with_traceback("Failed to start leaderboard updates", e)
 
-    async def _leaderboard_update_loop(self):
-        """Background task that updates the leaderboard periodically"""
-        while True:
-            try:
-                await asyncio.sleep(LEADERBOARD_UPDATE_INTERVAL)
-
-                # Only update if there are active users
-                if (
-                    len(self.active_sessions) > 0
-                    and self.bot
-                    and self.leaderboard_channel_id
-                ):
-                    await self._update_leaderboard()
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                log_error_with_traceback("Error in leaderboard update loop", e)
+    def _get_next_leaderboard_update(self) -> float | None:
+        """Next update time, or None to stay dormant while nobody is listening"""
+        if not self.active_sessions:
+            return None
+        return time.time() + LEADERBOARD_UPDATE_INTERVAL
+
+    async def _run_leaderboard_update(self):
+        """Scheduled job body that refreshes the leaderboard message"""
+        if self.active_sessions and self.bot and self.leaderboard_channel_id:
+            await self._update_leaderboard()
 
     async def _update_leaderboard(self):
         """Update the leaderboard message"""
@@ -1109,8 +1106,8 @@ class ListeningStatsManager:
     def stop_leaderboard_updates(self):
         """Stop the automatic leaderboard updates"""
         try:
-            if self.leaderboard_update_task and not self.leaderboard_update_task.done():
-                self.leaderboard_update_task.cancel()
+            self.leaderboard_updates_enabled = False
+            get_event_scheduler().cancel(LEADERBOARD_JOB_NAME)
 
             log_perfect_tree_section(
                 "Leaderboard Auto-Update - Stopped",
@@ -1185,60 +1182,6 @@ def format_listening_time(seconds: float) -> str:
 # =============================================================================
 
 
-def cleanup_old_backups(keep_count: int = 10) -> None:
-    """Clean up old backup files, keeping only the most recent ones"""
-    try:
-        # Find all backup files (excluding manual backups since they're disabled)
-        backup_patterns = [
-            "*.backup",
-            "emergency_backup_*.json",
-            "emergency_session_*.json",
-        ]
-
-        all_backups = []
-        for pattern in backup_patterns:
-            all_backups.extend(DATA_DIR.glob(pattern))
-
-        if len(all_backups) <= keep_count:
-            return
-
-        # Sort by modification time, newest first
-        all_backups.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
-        # Remove old backups
-        old_backups = all_backups[keep_count:]
-        removed_count = 0
-
-        for old_backup in old_backups:
-            try:
-                old_backup.unlink()
-                removed_count += 1
-            except Exception as e:
-                log_error_with_traceback(
-                    f"Failed to remove old backup: {old_backup.name}", e
-                )
-
-        if removed_count > 0:
-            log_perfect_tree_section(
-                "Backup Cleanup Completed",
-                [
-                    ("removed_files", f"🗑️ Removed {removed_count} old backup files"),
-                    (
-                        "kept_files",
-                        f"💾 Kept {len(all_backups) - removed_count} recent backups",
-                    ),
-                    (
-                        "keep_policy",
-                        f"📋 Policy: Keep {keep_count} most recent backups",
-                    ),
-                ],
-                "🧹",
-            )
-
-    except Exception as e:
-        log_error_with_traceback("Failed to cleanup old backups", e)
-
-
 def verify_data_integrity() -> bool:
     """Verify the integrity of the current listening stats data"""
     try:
@@ -1380,7 +1323,6 @@ __all__ = [
     "format_listening_time",
     "listening_stats_manager",
     # Data Protection Utilities (Listening Stats Only)
-    "cleanup_old_backups",
     "verify_data_integrity",
     "get_data_protection_status",
     # Leaderboard Auto-Update Functions
@@ -6,7 +6,6 @@
 # Sacred Mosque (Masjid al-Haram).
 # =============================================================================
 
-import asyncio
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
@@ -18,11 +17,23 @@ import pytz
 import requests
 
 from src.config import get_config_service
+from src.utils.reaction_router import get_reaction_router
+from src.utils.scheduler import get_event_scheduler
 from src.utils.tree_log import log_error_with_traceback, log_perfect_tree_section
 
 # Mecca timezone (Arabia Standard Time)
 MECCA_TZ = pytz.timezone('Asia/Riyadh')
 
+# Name of the prayer job registered with the event scheduler
+PRAYER_JOB_NAME = "mecca_prayer_notifications"
+
+# Jitter must stay well inside the 30 second prayer match window
+PRAYER_JOB_JITTER_SECONDS = 10
+
+# Reaction route for notifications: only 🤲 is kept, for 24 hours
+PRAYER_REACTION_KIND = "prayer_notification"
+PRAYER_REACTION_TTL = 24 * 60 * 60
+
 # Prayer names in Arabic and English
 PRAYER_NAMES = {
     'fajr': {'arabic': 'الفجر', 'english': 'Fajr', 'emoji': '🌅'},
@@ -76,8 +87,8 @@ class MeccaPrayerNotifier:
         self.last_notification_file = Path("data/last_mecca_notification.json")
         self.time_based_duas_file = Path("data/time_based_duas.json")
         self.daily_prayers: dict[str, str] = {}
+        self.daily_prayers_date: str | None = None
         self.time_based_duas: dict = {}
-        self._scheduler_task: asyncio.Task | None = None
 
         # Load time-based duas
         self._load_time_based_duas()
@@ -400,6 +411,8 @@ class MeccaPrayerNotifier:
 
             # Get today's prayer times
             prayer_times = await self.get_mecca_prayer_times(mecca_now)
+            self.daily_prayers = prayer_times
+            self.daily_prayers_date = date_str
 
             # Check each prayer time
             for prayer_name, prayer_time in prayer_times.items():
@@ -454,8 +467,10 @@ class MeccaPrayerNotifier:
             dua_emoji = "🤲"
             await message.add_reaction(dua_emoji)
 
-            # Set up reaction monitoring
-            asyncio.create_task(self._monitor_prayer_reactions(message, dua_emoji))
+            # Route reactions so unwanted ones are removed for the next day
+            get_reaction_router().route(
+                message, PRAYER_REACTION_KIND, PRAYER_REACTION_TTL
+            )
 
             log_perfect_tree_section(
                 "Mecca Prayer Notification - Sent",
@@ -472,80 +487,72 @@ class MeccaPrayerNotifier:
         except Exception as e:
             log_error_with_traceback("Error sending prayer notification", e)
 
-    async def _monitor_prayer_reactions(self, message: discord.Message, allowed_emoji: str):
-        """Monitor prayer notification reactions and remove unwanted ones"""
-        try:
-            def check(reaction, user):
-                return (reaction.message.id == message.id and
-                        not user.bot and
-                        str(reaction.emoji) != allowed_emoji)
+    def get_next_prayer_timestamp(self) -> float:
+        """
+        Get the Unix timestamp of the next prayer using today's cached times.
 
-            # Monitor for 24 hours
-            timeout = 24 * 60 * 60  # 24 hours in seconds
-            end_time = asyncio.get_event_loop().time() + timeout
+        When today's times haven't been loaded yet the job is due immediately;
+        after the last prayer of the day it wakes just after midnight in Mecca
+        to load the next day's times.
+        """
+        mecca_now = datetime.now(MECCA_TZ)
+        date_str = mecca_now.strftime('%Y-%m-%d')
 
-            while asyncio.get_event_loop().time() < end_time:
-                try:
-                    reaction, user = await self.bot.wait_for('reaction_add', check=check, timeout=300)  # Check every 5 minutes
+        if self.daily_prayers_date != date_str or not self.daily_prayers:
+            return mecca_now.timestamp()
 
-                    # Remove the unwanted reaction
-                    await reaction.remove(user)
-
-                    log_perfect_tree_section(
-                        "Prayer Reaction - Cleaned",
-                        [
-                            ("user", user.display_name),
-                            ("removed_emoji", str(reaction.emoji)),
-                            ("allowed_emoji", allowed_emoji),
-                            ("action", "🧹 Unwanted reaction removed")
-                        ],
-                        "🕌"
-                    )
+        upcoming = []
+        for prayer_time in self.daily_prayers.values():
+            try:
+                prayer_dt = MECCA_TZ.localize(
+                    datetime.strptime(f"{date_str} {prayer_time}", '%Y-%m-%d %H:%M')
+                )
+            except ValueError:
+                continue
+            if prayer_dt > mecca_now:
+                upcoming.append(prayer_dt)
 
-                except TimeoutError:
-                    # Continue monitoring
-                    continue
+        if upcoming:
+            return min(upcoming).timestamp()
 
-        except Exception as e:
-            log_error_with_traceback("Error monitoring prayer reactions", e)
+        next_midnight = MECCA_TZ.localize(
+            datetime.strptime(date_str, '%Y-%m-%d') + timedelta(days=1, minutes=1)
+        )
+        return next_midnight.timestamp()
 
     async def start_prayer_scheduler(self):
-        """Start the prayer time monitoring scheduler"""
-        if self._scheduler_task and not self._scheduler_task.done():
-            self._scheduler_task.cancel()
-
-        self._scheduler_task = asyncio.create_task(self._prayer_scheduler_loop())
+        """Register prayer time notifications with the event scheduler"""
+        get_event_scheduler().schedule(
+            PRAYER_JOB_NAME,
+            self.check_and_send_prayer_notification,
+            next_run_func=self.get_next_prayer_timestamp,
+            retry_seconds=60,
+            jitter_seconds=PRAYER_JOB_JITTER_SECONDS,
+            persist=True,
+        )
 
         log_perfect_tree_section(
             "Mecca Prayer Scheduler - Started",
             [
                 ("status", "✅ Prayer time monitoring active"),
-                ("check_interval", "60 seconds"),
+                ("wake_policy", "At each prayer time"),
                 ("timezone", "Asia/Riyadh (Mecca)"),
                 ("prayers_monitored", "5 daily prayers")
             ],
             "🕌"
         )
 
-    async def _prayer_scheduler_loop(self):
-        """Main scheduler loop for prayer time monitoring"""
-        while True:
-            try:
-                await asyncio.sleep(60)  # Check every minute
-                await self.check_and_send_prayer_notification()
-            except asyncio.CancelledError:
-                log_perfect_tree_section(
-                    "Mecca Prayer Scheduler - Stopped",
-                    [
-                        ("status", "🛑 Prayer scheduler stopped"),
-                        ("reason", "Task cancelled")
-                    ],
-                    "🕌"
-                )
-                break
-            except Exception as e:
-                log_error_with_traceback("Error in prayer scheduler loop", e)
-                await asyncio.sleep(60)  # Wait before retrying
+    def stop_prayer_scheduler(self):
+        """Remove prayer time notifications from the event scheduler"""
+        if get_event_scheduler().cancel(PRAYER_JOB_NAME):
+            log_perfect_tree_section(
+                "Mecca Prayer Scheduler - Stopped",
+                [
+                    ("status", "🛑 Prayer scheduler stopped"),
+                    ("reason", "Job cancelled")
+                ],
+                "🕌"
+            )
 
 
 # Global instance
@@ -558,6 +565,11 @@ async def setup_mecca_prayer_notifications(bot) -> None:
 
     try:
         mecca_prayer_notifier = MeccaPrayerNotifier(bot)
+
+        reaction_router = get_reaction_router()
+        reaction_router.register_handler(PRAYER_REACTION_KIND, handle_prayer_reaction)
+        reaction_router.attach(bot)
+
         await mecca_prayer_notifier.start_prayer_scheduler()
 
         log_perfect_tree_section(
@@ -576,6 +588,25 @@ async def setup_mecca_prayer_notifications(bot) -> None:
         log_error_with_traceback("Error setting up Mecca prayer notifications", e)
 
 
+async def handle_prayer_reaction(bot, event) -> None:
+    """Remove any reaction other than 🤲 from a prayer notification"""
+    if event.emoji_name == "🤲":
+        return
+
+    await event.remove()
+
+    log_perfect_tree_section(
+        "Prayer Reaction - Cleaned",
+        [
+            ("user", event.user.display_name),
+            ("removed_emoji", event.emoji_name),
+            ("allowed_emoji", "🤲"),
+            ("action", "🧹 Unwanted reaction removed")
+        ],
+        "🕌"
+    )
+
+
 def get_mecca_prayer_notifier() -> MeccaPrayerNotifier | None:
     """Get the global Mecca prayer notifier instance"""
     return mecca_prayer_notifier
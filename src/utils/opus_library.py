@@ -0,0 +1,364 @@
+# =============================================================================
+# QuranBot - Opus Library
+# =============================================================================
+# Keeps an Ogg Opus mirror of each reciter folder so playback can hand
+# Discord ready-made Opus packets instead of decoding MP3 to PCM and
+# re-encoding it in-process for every second of audio.
+#
+# - Transcoding runs once per file in a low-priority background task
+# - Mirror files are named by the source file's SHA-256, so renamed or
+#   duplicated recordings are never converted twice
+# - A manifest maps each source path to its hash, size and mtime so
+#   lookups at playback time are a dict hit plus one stat()
+# - Tracks that have not been converted yet fall back to the MP3/PCM path,
+#   resuming through the MP3 seek index instead of an FFmpeg scan
+# =============================================================================
+
+import asyncio
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+import time
+
+import discord
+
+from .seek_index import SEEK_INDEX_FILE_NAME, SeekIndex, get_seek_index
+from .tree_log import (
+    log_error_with_traceback,
+    log_perfect_tree_section,
+    log_warning_with_context,
+)
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+OPUS_MIRROR_FOLDER_NAME = "audio_opus"  # Created next to the audio base folder
+MANIFEST_FILE_NAME = "manifest.json"
+OPUS_BITRATE = "128k"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Default FFmpeg output options for the MP3 fallback path
+DEFAULT_PCM_OPTIONS = (
+    "-vn -loglevel warning -bufsize 2048k -reconnect 1 -reconnect_streamed 1 "
+    "-reconnect_delay_max 5 -multiple_requests 1 -rw_timeout 30000000"
+)
+
+
+def _hash_file(path: str) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _lower_priority():
+    """Run transcodes niced so they never compete with live playback"""
+    try:
+        os.nice(10)
+    except (AttributeError, OSError):
+        pass
+
+
+class OpusLibrary:
+    """Ogg Opus mirror of the audio library with passthrough playback"""
+
+    def __init__(
+        self,
+        audio_base_folder: str,
+        ffmpeg_path: str = "ffmpeg",
+        mirror_folder: str | None = None,
+        seek_index: SeekIndex | None = None,
+    ):
+        self.audio_base_folder = Path(audio_base_folder)
+        self.ffmpeg_path = ffmpeg_path
+        self.mirror_folder = (
+            Path(mirror_folder)
+            if mirror_folder
+            else self.audio_base_folder.parent / OPUS_MIRROR_FOLDER_NAME
+        )
+        self.manifest_file = self.mirror_folder / MANIFEST_FILE_NAME
+        self.seek_index = seek_index or get_seek_index(
+            self.mirror_folder / SEEK_INDEX_FILE_NAME
+        )
+
+        # {source path relative to audio base: {size, mtime_ns, sha256, opus}}
+        self.manifest: dict[str, dict] = {}
+        self._transcode_task: asyncio.Task | None = None
+        self._queued_folders: list[Path] = []
+        self._missing_ffmpeg_logged = False
+
+        self._load_manifest()
+
+    @property
+    def ffmpeg_available(self) -> bool:
+        """Whether the configured FFmpeg executable can be run"""
+        return shutil.which(self.ffmpeg_path) is not None
+
+    # =========================================================================
+    # Playback
+    # =========================================================================
+
+    def get_opus_path(self, source_path: str) -> str | None:
+        """Return the converted Opus file for a source, if it is up to date"""
+        entry = self.manifest.get(self._relative_key(source_path))
+        if not entry:
+            return None
+
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+
+        if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime_ns"]:
+            return None
+
+        opus_path = self.mirror_folder / entry["opus"]
+        return str(opus_path) if opus_path.exists() else None
+
+    def create_audio_source(
+        self,
+        source_path: str,
+        position: float = 0.0,
+        pcm_options: str = DEFAULT_PCM_OPTIONS,
+    ) -> discord.AudioSource:
+        """
+        Create the cheapest audio source available for a track.
+
+        Converted tracks stream their Opus packets straight through with
+        copy-codec FFmpeg (Ogg seeks by bisection); anything else is
+        decoded from MP3, resuming at a byte offset from the seek index.
+        """
+        opus_path = self.get_opus_path(source_path)
+        if opus_path:
+            return discord.FFmpegOpusAudio(
+                opus_path,
+                codec="copy",
+                executable=self.ffmpeg_path,
+                before_options=f"-ss {position}" if position > 0 else None,
+                options="-vn",
+            )
+
+        before_options, options = self.seek_index.ffmpeg_options(
+            source_path, position, pcm_options
+        )
+        return discord.FFmpegPCMAudio(
+            source_path,
+            executable=self.ffmpeg_path,
+            before_options=before_options,
+            options=options,
+        )
+
+    # =========================================================================
+    # Background Transcoding
+    # =========================================================================
+
+    def start_background_transcode(self, folder: str) -> None:
+        """Queue a reciter folder for seek indexing and conversion in the background"""
+        # Seek tables need no FFmpeg, so they are built even without it
+        self.seek_index.start_background_index(folder)
+
+        if not self.ffmpeg_available:
+            if not self._missing_ffmpeg_logged:
+                log_warning_with_context(
+                    "FFmpeg not found, Opus conversion disabled",
+                    f"Path: {self.ffmpeg_path}",
+                )
+                self._missing_ffmpeg_logged = True
+            return
+
+        folder_path = Path(folder)
+        if folder_path not in self._queued_folders:
+            self._queued_folders.append(folder_path)
+
+        if self._transcode_task and not self._transcode_task.done():
+            return
+
+        try:
+            self._transcode_task = asyncio.create_task(self._transcode_queue())
+        except RuntimeError:
+            # No running event loop yet; the next call will start the worker
+            pass
+
+    async def stop(self) -> None:
+        """Cancel background conversion and indexing"""
+        await self.seek_index.stop()
+        self._queued_folders.clear()
+        if self._transcode_task and not self._transcode_task.done():
+            self._transcode_task.cancel()
+            try:
+                await self._transcode_task
+            except asyncio.CancelledError:
+                pass
+
+    def get_coverage(self, folder: str) -> tuple[int, int]:
+        """Return (converted, total) track counts for a folder"""
+        sources = sorted(Path(folder).glob("*.mp3"))
+        converted = sum(1 for source in sources if self.get_opus_path(str(source)))
+        return converted, len(sources)
+
+    async def transcode_folder(self, folder: str) -> int:
+        """Convert every stale or missing track in a folder; returns count"""
+        converted = 0
+        for source in sorted(Path(folder).glob("*.mp3")):
+            if self.get_opus_path(str(source)):
+                continue
+            if await self._transcode_file(source):
+                converted += 1
+        return converted
+
+    async def _transcode_queue(self) -> None:
+        """Work through queued folders one at a time"""
+        while self._queued_folders:
+            folder = self._queued_folders[0]
+            try:
+                started = time.time()
+                converted = await self.transcode_folder(str(folder))
+                if converted:
+                    done, total = self.get_coverage(str(folder))
+                    log_perfect_tree_section(
+                        "Opus Library - Folder Converted",
+                        [
+                            ("folder", folder.name),
+                            ("converted", f"{converted} tracks"),
+                            ("coverage", f"{done}/{total}"),
+                            ("duration", f"{time.time() - started:.0f}s"),
+                        ],
+                        "🎼",
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log_error_with_traceback(
+                    f"Error converting audio folder to Opus: {folder}", e
+                )
+            finally:
+                if self._queued_folders and self._queued_folders[0] == folder:
+                    self._queued_folders.pop(0)
+
+    async def _transcode_file(self, source: Path) -> bool:
+        """Convert a single MP3 to Ogg Opus and record it in the manifest"""
+        try:
+            stat = source.stat()
+            source_hash = await asyncio.to_thread(_hash_file, str(source))
+            opus_relative = f"{source.parent.name}/{source_hash[:32]}.opus"
+            opus_path = self.mirror_folder / opus_relative
+            opus_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Identical content was already converted under another name
+            if not opus_path.exists():
+                temp_path = opus_path.with_suffix(".tmp")
+                process = await asyncio.create_subprocess_exec(
+                    self.ffmpeg_path,
+                    "-nostdin",
+                    "-y",
+                    "-loglevel",
+                    "error",
+                    "-i",
+                    str(source),
+                    "-vn",
+                    "-map_metadata",
+                    "-1",
+                    "-c:a",
+                    "libopus",
+                    "-b:a",
+                    OPUS_BITRATE,
+                    "-vbr",
+                    "on",
+                    "-ar",
+                    "48000",
+                    "-ac",
+                    "2",
+                    "-frame_duration",
+                    "20",
+                    "-application",
+                    "audio",
+                    "-f",
+                    "ogg",
+                    str(temp_path),
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                    preexec_fn=_lower_priority,
+                )
+                _, stderr = await process.communicate()
+                if process.returncode != 0:
+                    temp_path.unlink(missing_ok=True)
+                    log_error_with_traceback(
+                        f"FFmpeg failed to convert {source} to Opus "
+                        f"(exit code {process.returncode})",
+                        RuntimeError(stderr.decode(errors="replace")[-500:]),
+                    )
+                    return False
+                os.replace(temp_path, opus_path)
+
+            self.manifest[self._relative_key(str(source))] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": source_hash,
+                "opus": opus_relative,
+            }
+            self._save_manifest()
+            return True
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log_error_with_traceback(f"Error converting {source} to Opus", e)
+            return False
+
+    # =========================================================================
+    # Manifest
+    # =========================================================================
+
+    def _relative_key(self, source_path: str) -> str:
+        """Manifest key for a source file"""
+        try:
+            return Path(source_path).resolve().relative_to(
+                self.audio_base_folder.resolve()
+            ).as_posix()
+        except ValueError:
+            return Path(source_path).resolve().as_posix()
+
+    def _load_manifest(self) -> None:
+        """Load the manifest if one exists"""
+        try:
+            if self.manifest_file.exists():
+                with open(self.manifest_file) as f:
+                    self.manifest = json.load(f).get("entries", {})
+        except Exception as e:
+            log_error_with_traceback("Error loading Opus library manifest", e)
+            self.manifest = {}
+
+    def _save_manifest(self) -> None:
+        """Atomically write the manifest"""
+        self.mirror_folder.mkdir(parents=True, exist_ok=True)
+        temp_file = self.manifest_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump({"version": 1, "entries": self.manifest}, f, indent=2)
+        os.replace(temp_file, self.manifest_file)
+
+
+# =============================================================================
+# Global Opus Library
+# =============================================================================
+
+_opus_libraries: dict[str, OpusLibrary] = {}
+
+
+def get_opus_library(
+    audio_base_folder: str = "audio", ffmpeg_path: str = "ffmpeg"
+) -> OpusLibrary:
+    """
+    Get the shared Opus library for an audio folder, creating it on first use.
+
+    Every player over the same folder must use this one instance: it owns
+    the mirror's manifest and transcode queue.
+    """
+    key = str(Path(audio_base_folder).resolve())
+    if key not in _opus_libraries:
+        _opus_libraries[key] = OpusLibrary(audio_base_folder, ffmpeg_path)
+    return _opus_libraries[key]
@@ -0,0 +1,280 @@
+# =============================================================================
+# QuranBot - Panel Access Role Reconciler
+# =============================================================================
+# Grants the panel access role to listeners in the Quran voice channel and
+# revokes it when they leave, without one role edit per voice event.
+#
+# - Voice events only record each member's desired state; it is applied
+#   after a short quiet period, so join -> leave -> join collapses into a
+#   single check that usually needs no REST call at all
+# - Net changes go through the shared rate limit engine, spacing role edits
+#   per guild instead of bursting into Discord's per-route limits
+# - A periodic reconciliation compares the role against the channel's
+#   actual members and queues whatever was missed (restarts, dropped events)
+# =============================================================================
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from src.core.rate_limit_engine import (
+    RateLimitEngine,
+    RateLimitRule,
+    get_rate_limit_engine,
+)
+
+from .scheduler import get_event_scheduler
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+# Quiet period before a member's latest voice state is applied
+ROLE_DEBOUNCE_SECONDS = 3.0
+
+# How often the role is reconciled against channel membership
+ROLE_RECONCILE_INTERVAL = 300
+
+# Name of the reconciliation job registered with the event scheduler
+PANEL_ROLE_JOB_NAME = "panel_role_reconcile"
+
+# Role edits allowed per guild: 5 every 5 seconds
+PANEL_ROLE_RULE = RateLimitRule("panel_role_edits", limit=5, period_seconds=5.0)
+
+RoleEdit = Callable[[Any, Any, Any], Awaitable[None]]
+
+
+@dataclass
+class PendingRoleChange:
+    """The latest desired role state for a member"""
+
+    member: Any
+    grant: bool
+    due_at: float
+
+
+class PanelRoleReconciler:
+    """
+    Debounced, rate-limited panel access role management.
+
+    The actual role edits are made by the `assign` and `remove` callbacks,
+    each called as `callback(member, panel_role, channel)`, so every bot
+    keeps its own logging and retry behaviour.
+    """
+
+    def __init__(
+        self,
+        role_id: int,
+        channel_id: int,
+        assign: RoleEdit,
+        remove: RoleEdit,
+        debounce_seconds: float = ROLE_DEBOUNCE_SECONDS,
+        rate_limiter: RateLimitEngine | None = None,
+    ):
+        self.role_id = role_id
+        self.channel_id = channel_id
+        self.assign = assign
+        self.remove = remove
+        self.debounce_seconds = debounce_seconds
+        self.rate_limiter = rate_limiter or get_rate_limit_engine()
+
+        self._pending: dict[int, PendingRoleChange] = {}
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._bot = None
+
+        # Counters, exposed for diagnostics
+        self.events = 0
+        self.applied = 0
+        self.collapsed = 0
+
+    # =========================================================================
+    # Voice Events
+    # =========================================================================
+
+    def note_voice_state(self, member, before, after) -> None:
+        """Record a voice state change that may affect the panel role"""
+        if not self.role_id or member.bot:
+            return
+
+        was_listening = before.channel is not None and before.channel.id == self.channel_id
+        is_listening = after.channel is not None and after.channel.id == self.channel_id
+        if was_listening != is_listening:
+            self.request(member, grant=is_listening)
+
+    def request(self, member, grant: bool, delay: float | None = None) -> None:
+        """Queue a member's desired role state, replacing any earlier one"""
+        delay = self.debounce_seconds if delay is None else delay
+        self._pending[member.id] = PendingRoleChange(
+            member=member, grant=grant, due_at=time.monotonic() + delay
+        )
+        self.events += 1
+        self._ensure_running()
+        self._wakeup.set()
+
+    @property
+    def pending_count(self) -> int:
+        """Members waiting for their role state to be applied"""
+        return len(self._pending)
+
+    # =========================================================================
+    # Reconciliation
+    # =========================================================================
+
+    def start(self, bot) -> None:
+        """Reconcile now and then every ROLE_RECONCILE_INTERVAL seconds"""
+        self._bot = bot
+        if not self.role_id:
+            return
+
+        get_event_scheduler().schedule(
+            PANEL_ROLE_JOB_NAME,
+            self.reconcile_all,
+            interval_seconds=ROLE_RECONCILE_INTERVAL,
+            first_run=time.time(),
+        )
+        self._ensure_running()
+
+        log_perfect_tree_section(
+            "Panel Access Roles",
+            [
+                ("status", "✅ Reconciler started"),
+                ("debounce", f"{self.debounce_seconds}s"),
+                ("rate_limit", f"{PANEL_ROLE_RULE.limit} edits / {PANEL_ROLE_RULE.period_seconds:g}s"),
+                ("reconcile_interval", f"{ROLE_RECONCILE_INTERVAL}s"),
+            ],
+            "🎤",
+        )
+
+    async def stop(self) -> None:
+        """Stop reconciling; changes still pending are dropped"""
+        get_event_scheduler().cancel(PANEL_ROLE_JOB_NAME)
+        self._pending.clear()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def reconcile_all(self) -> None:
+        """Reconcile every guild the bot is in"""
+        if self._bot is None:
+            return
+        for guild in self._bot.guilds:
+            self.reconcile(guild)
+
+    def reconcile(self, guild) -> int:
+        """
+        Queue role changes so the role matches the channel's listeners.
+
+        Members with changes already pending are left to the debounce.
+
+        Returns:
+            int: Number of members queued
+        """
+        panel_role = guild.get_role(self.role_id)
+        channel = guild.get_channel(self.channel_id)
+        if panel_role is None or channel is None:
+            return 0
+
+        listeners = {member.id: member for member in channel.members if not member.bot}
+        queued = 0
+
+        for member in listeners.values():
+            if member.id not in self._pending and panel_role not in member.roles:
+                self.request(member, grant=True, delay=0)
+                queued += 1
+
+        for member in panel_role.members:
+            if (
+                member.id not in listeners
+                and member.id not in self._pending
+                and not member.bot
+            ):
+                self.request(member, grant=False, delay=0)
+                queued += 1
+
+        if queued:
+            log_perfect_tree_section(
+                "Panel Access Roles - Reconciled",
+                [
+                    ("listeners", str(len(listeners))),
+                    ("role_holders", str(len(panel_role.members))),
+                    ("queued", f"🔄 {queued} role changes"),
+                ],
+                "🎤",
+            )
+        return queued
+
+    # =========================================================================
+    # Private Methods
+    # =========================================================================
+
+    def _ensure_running(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._apply_loop())
+
+    async def _apply_loop(self) -> None:
+        """Apply pending changes as their quiet periods end"""
+        while True:
+            now = time.monotonic()
+            due = [change for change in self._pending.values() if change.due_at <= now]
+
+            if not due:
+                self._wakeup.clear()
+                timeout = (
+                    min(change.due_at for change in self._pending.values()) - now
+                    if self._pending
+                    else None
+                )
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except TimeoutError:
+                    pass
+                continue
+
+            for change in due:
+                # A newer event for this member restarts its quiet period
+                if self._pending.get(change.member.id) is not change:
+                    continue
+                await self._apply(change)
+                if self._pending.get(change.member.id) is change:
+                    del self._pending[change.member.id]
+
+    async def _apply(self, change: PendingRoleChange) -> None:
+        """Make one member's role match their desired state"""
+        guild = change.member.guild
+        panel_role = guild.get_role(self.role_id)
+        channel = guild.get_channel(self.channel_id)
+        if panel_role is None or channel is None:
+            return
+
+        member = guild.get_member(change.member.id) or change.member
+        if (panel_role in member.roles) == change.grant:
+            self.collapsed += 1
+            return
+
+        await self._acquire_edit_slot(guild.id)
+        try:
+            if change.grant:
+                await self.assign(member, panel_role, channel)
+            else:
+                await self.remove(member, panel_role, channel)
+            self.applied += 1
+        except Exception as e:
+            log_error_with_traceback("Error applying panel access role change", e)
+
+    async def _acquire_edit_slot(self, guild_id: int) -> None:
+        """Wait until the guild's role edit budget allows another edit"""
+        while True:
+            decision = self.rate_limiter.acquire(PANEL_ROLE_RULE, guild_id)
+            if decision.allowed:
+                return
+            await asyncio.sleep(decision.retry_after)
@@ -0,0 +1,246 @@
+# =============================================================================
+# QuranBot - Playback Clock
+# =============================================================================
+# Event-sourced playback position.
+#
+# - Playback emits compact events: track started, paused, resumed, seeked
+#   and stopped, each carrying the track offset at that moment
+# - The position is a pure function of the last event and the monotonic
+#   clock, so the control panel, rich presence and state saver read it
+#   without any polling loop
+# - Listeners persist a snapshot on each event instead of every few seconds;
+#   after a crash the saved position is extrapolated from the snapshot's
+#   wall-clock timestamp up to the process's last heartbeat, so downtime is
+#   never counted as playback
+# =============================================================================
+
+import asyncio
+from dataclasses import dataclass
+from enum import Enum
+import json
+import os
+from pathlib import Path
+import time
+from typing import Callable
+
+from .tree_log import log_error_with_traceback
+
+# Last-alive marker written by the running bot; one tiny file per process
+HEARTBEAT_FILE = Path(__file__).parent.parent.parent / "data" / "heartbeat.json"
+HEARTBEAT_INTERVAL_SECONDS = 30
+
+
+class PlaybackEventType(Enum):
+    """Things that change how the playback position evolves"""
+
+    TRACK_STARTED = "track_started"
+    PAUSED = "paused"
+    RESUMED = "resumed"
+    SEEKED = "seeked"
+    STOPPED = "stopped"
+
+
+@dataclass(frozen=True)
+class PlaybackEvent:
+    """A playback event and the track position it fixes"""
+
+    type: PlaybackEventType
+    offset: float  # Position in the track when the event happened
+    at: float  # Monotonic time of the event
+    running: bool  # Whether the position advances after the event
+    duration: float | None = None  # Track length, if known
+
+
+class PlaybackClock:
+    """Current track position derived from the last playback event"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.last_event: PlaybackEvent | None = None
+        self._listeners: list[Callable[[PlaybackEvent], None]] = []
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    @property
+    def is_active(self) -> bool:
+        """True between a track start and the next stop or reset"""
+        return (
+            self.last_event is not None
+            and self.last_event.type is not PlaybackEventType.STOPPED
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """True while the position is advancing"""
+        return self.last_event is not None and self.last_event.running
+
+    @property
+    def duration(self) -> float | None:
+        """Length of the current track, if it was given at track start"""
+        return self.last_event.duration if self.last_event else None
+
+    def position(self, now: float | None = None) -> float:
+        """Position in the current track, clamped to its duration"""
+        event = self.last_event
+        if event is None:
+            return 0.0
+
+        position = event.offset
+        if event.running:
+            now = self._clock() if now is None else now
+            position += max(0.0, now - event.at)
+        if event.duration:
+            position = min(position, event.duration)
+        return position
+
+    # =========================================================================
+    # Events
+    # =========================================================================
+
+    def subscribe(self, listener: Callable[[PlaybackEvent], None]) -> None:
+        """Call `listener` with every event, e.g. to persist a snapshot"""
+        self._listeners.append(listener)
+
+    def track_started(self, offset: float = 0.0, duration: float | None = None) -> None:
+        """A track began playing at `offset` seconds"""
+        self._record(PlaybackEventType.TRACK_STARTED, offset, True, duration)
+
+    def paused(self) -> None:
+        """Freeze the position"""
+        if self.is_running:
+            self._record(PlaybackEventType.PAUSED, self.position(), False)
+
+    def resumed(self) -> None:
+        """Let the position advance again from where it was paused"""
+        if self.is_active and not self.is_running:
+            self._record(PlaybackEventType.RESUMED, self.position(), True)
+
+    def seeked(self, offset: float) -> None:
+        """Move to `offset` within the current track"""
+        if self.is_active:
+            self._record(PlaybackEventType.SEEKED, offset, self.is_running)
+
+    def stopped(self) -> None:
+        """Playback stopped; the final position stays readable"""
+        if self.is_active:
+            self._record(PlaybackEventType.STOPPED, self.position(), False)
+
+    def reset(self) -> None:
+        """Forget the finished track without emitting an event"""
+        self.last_event = None
+
+    def _record(
+        self,
+        event_type: PlaybackEventType,
+        offset: float,
+        running: bool,
+        duration: float | None = None,
+    ) -> None:
+        """Store an event and notify listeners"""
+        if (
+            event_type is not PlaybackEventType.TRACK_STARTED
+            and duration is None
+            and self.last_event
+        ):
+            duration = self.last_event.duration
+        if duration:
+            offset = min(offset, duration)
+
+        event = PlaybackEvent(event_type, max(0.0, offset), self._clock(), running, duration)
+        self.last_event = event
+
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                log_error_with_traceback(
+                    f"Error handling playback event: {event_type.value}", e
+                )
+
+
+def extrapolate_position(
+    position: float,
+    running: bool,
+    saved_at: float | None,
+    alive_at: float | None,
+    now: float | None = None,
+) -> float:
+    """
+    Position a saved snapshot implies when the process last stopped.
+
+    A snapshot written while the position was running (track started,
+    resumed) kept advancing from its timestamp until the bot's last
+    heartbeat (`alive_at`), never past `now`. Without a heartbeat there is
+    no telling how long playback lasted, so the saved position is used.
+    Callers clamp the result to the track's duration.
+    """
+    if not running or not saved_at or not alive_at:
+        return position
+    now = time.time() if now is None else now
+    return position + max(0.0, min(alive_at, now) - saved_at)
+
+
+# =============================================================================
+# Heartbeat
+# =============================================================================
+
+
+class Heartbeat:
+    """
+    Periodic last-alive timestamp that bounds crash extrapolation.
+
+    The previous run's final beat is read once, before this run's first
+    beat overwrites it.
+    """
+
+    def __init__(self, path: str | Path = HEARTBEAT_FILE):
+        self.path = Path(path)
+        self._previous: float | None = None
+        self._previous_read = False
+
+    def previous_alive_at(self) -> float | None:
+        """Unix time of the previous run's last beat, if there was one"""
+        if not self._previous_read:
+            self._previous_read = True
+            try:
+                with open(self.path) as f:
+                    self._previous = float(json.load(f)["alive_at"])
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                log_error_with_traceback("Error reading playback heartbeat", e)
+        return self._previous
+
+    def beat(self) -> None:
+        """Record that the bot is alive now (blocking; tiny atomic write)"""
+        self.previous_alive_at()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.path.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump({"alive_at": time.time()}, f)
+        os.replace(temp_file, self.path)
+
+    def start(self, scheduler) -> None:
+        """Beat every HEARTBEAT_INTERVAL_SECONDS on the event scheduler"""
+        self.previous_alive_at()
+
+        async def beat_job():
+            await asyncio.to_thread(self.beat)
+
+        scheduler.schedule(
+            "playback_heartbeat", beat_job, interval_seconds=HEARTBEAT_INTERVAL_SECONDS
+        )
+
+
+# Global instance
+_heartbeat: Heartbeat | None = None
+
+
+def get_heartbeat() -> Heartbeat:
+    """Get the process-wide playback heartbeat"""
+    global _heartbeat
+    if _heartbeat is None:
+        _heartbeat = Heartbeat()
+    return _heartbeat
@@ -47,6 +47,8 @@ import pytz
 from src.config import get_config_service
 
 from .discord_logger import get_discord_logger
+from .interaction_middleware import fast_ack
+from .scheduler import get_event_scheduler
 from .tree_log import (
     log_error_with_traceback,
     log_perfect_tree_section,
@@ -54,8 +56,11 @@ from .tree_log import (
 )
 from .user_cache import cache_user_from_interaction
 
-# Global scheduler task reference
-_quiz_scheduler_task = None
+# Name of the quiz job registered with the event scheduler
+QUIZ_JOB_NAME = "scheduled_quiz"
+
+# Random delay added to each quiz deadline so restarts don't post in lockstep
+QUIZ_JOB_JITTER_SECONDS = 60
 
 # =============================================================================
 # Interactive Quiz UI Components
@@ -701,6 +706,7 @@ class QuizButton(discord.ui.Button):
         self.letter = letter
         self.is_correct = is_correct
 
+    @fast_ack("quiz_answer", always_defer=True)
     async def callback(self, interaction: discord.Interaction):
         """Handle button click"""
         # Check if user already answered
@@ -1661,6 +1667,9 @@ class QuizManager:
             with open(quiz_config_file, "w") as f:
                 json.dump(config_data, f, indent=2)
 
+            # Apply the new interval immediately instead of at the next check
+            get_event_scheduler().reschedule(QUIZ_JOB_NAME)
+
             return True
         except Exception as e:
             log_error_with_traceback("Error saving question interval config", e)
@@ -1683,11 +1692,18 @@ class QuizManager:
             log_error_with_traceback("Error checking question send time", e)
             return True
 
+    def get_next_send_timestamp(self) -> float:
+        """Get the Unix timestamp at which the next question is due"""
+        if not self.last_sent_time:
+            return datetime.now(pytz.UTC).timestamp()  # Due immediately
+        return self.last_sent_time.timestamp() + self.get_interval_hours() * 3600
+
     def update_last_sent_time(self):
         """Update the last sent time to now"""
         try:
             self.last_sent_time = datetime.now(pytz.UTC)
             self.save_state()
+            get_event_scheduler().reschedule(QUIZ_JOB_NAME)
         except Exception as e:
             log_error_with_traceback("Error updating last sent time", e)
 
@@ -2200,68 +2216,38 @@ async def check_and_send_scheduled_question(bot, channel_id: int) -> None:
         log_error_with_traceback("Error checking and sending scheduled question", e)
 
 
-async def quiz_scheduler_loop(bot, channel_id: int) -> None:
-    """
-    Background task that checks for scheduled questions every 30 seconds.
-
-    Args:
-        bot: Discord bot instance
-        channel_id: Channel ID for question posts
-    """
-    log_perfect_tree_section(
-        "Quiz Scheduler - Started",
-        [
-            ("status", "🔄 Quiz scheduler running"),
-            ("check_interval", "30 seconds"),
-            ("channel_id", str(channel_id)),
-        ],
-        "⏰",
-    )
-
-    while True:
-        try:
-            await asyncio.sleep(30)  # Check every 30 seconds
-            await check_and_send_scheduled_question(bot, channel_id)
-        except asyncio.CancelledError:
-            log_perfect_tree_section(
-                "Quiz Scheduler - Stopped",
-                [
-                    ("status", "🛑 Quiz scheduler stopped"),
-                    ("reason", "Task cancelled"),
-                ],
-                "⏰",
-            )
-            break
-        except Exception as e:
-            log_error_with_traceback("Error in quiz scheduler loop", e)
-            await asyncio.sleep(30)  # Wait before retrying
-
-
 def start_quiz_scheduler(bot, channel_id: int) -> None:
     """
-    Start the background quiz scheduler.
+    Register the scheduled quiz job with the event scheduler.
+
+    The job fires exactly when the next question is due (last sent time plus
+    the configured interval) rather than polling every 30 seconds.
 
     Args:
         bot: Discord bot instance
         channel_id: Channel ID for question posts
     """
-    global _quiz_scheduler_task
-
     try:
-        # Cancel existing task if running
-        if _quiz_scheduler_task and not _quiz_scheduler_task.done():
-            _quiz_scheduler_task.cancel()
+        if not quiz_manager:
+            return
 
-        # Start new scheduler task
-        _quiz_scheduler_task = asyncio.create_task(quiz_scheduler_loop(bot, channel_id))
+        scheduler = get_event_scheduler()
+        job = scheduler.schedule(
+            QUIZ_JOB_NAME,
+            lambda: check_and_send_scheduled_question(bot, channel_id),
+            next_run_func=quiz_manager.get_next_send_timestamp,
+            retry_seconds=30,
+            jitter_seconds=QUIZ_JOB_JITTER_SECONDS,
+            persist=True,
+        )
 
         log_perfect_tree_section(
             "Quiz Scheduler - Initialized",
             [
-                ("status", "✅ Quiz scheduler started"),
+                ("status", "✅ Quiz job registered with event scheduler"),
                 ("channel_id", str(channel_id)),
-                ("check_frequency", "Every 30 seconds"),
-                ("task_id", f"🆔 {id(_quiz_scheduler_task)}"),
+                ("interval", f"{quiz_manager.get_interval_hours()}h"),
+                ("next_run", job.to_dict()["next_run"] or "Dormant"),
             ],
             "⏰",
         )
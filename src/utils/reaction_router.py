@@ -0,0 +1,216 @@
+# =============================================================================
+# QuranBot - Reaction Router
+# =============================================================================
+# Dispatches reactions on bot messages from a single on_raw_reaction_add
+# listener instead of per-message wait_for() monitors.
+#
+# - Each watched message is a route: message id -> handler kind, expiry and
+#   a small JSON payload (surah, ayah, ...)
+# - Handlers are registered by kind name, so routes survive restarts and
+#   keep working on messages that are no longer in the message cache
+# - Lookup is a single dict access per reaction; expired routes are dropped
+#   when hit and whenever routes are saved
+# - Routes are persisted to data/reaction_routes.json
+# =============================================================================
+
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+import discord
+
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+REACTION_ROUTES_FILE = DATA_DIR / "reaction_routes.json"
+
+ReactionHandler = Callable[[Any, "ReactionEvent"], Awaitable[None]]
+
+
+@dataclass
+class ReactionRoute:
+    """A watched message and the handler kind its reactions go to"""
+
+    message_id: int
+    channel_id: int
+    kind: str
+    expires_at: float
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def is_expired(self, now: float | None = None) -> bool:
+        return (time.time() if now is None else now) >= self.expires_at
+
+
+@dataclass
+class ReactionEvent:
+    """A reaction on a routed message, as passed to handlers"""
+
+    route: ReactionRoute
+    emoji: discord.PartialEmoji
+    user: discord.abc.User
+    message: discord.PartialMessage | None
+
+    @property
+    def emoji_name(self) -> str:
+        return str(self.emoji)
+
+    async def remove(self) -> None:
+        """Remove this reaction, ignoring missing permissions or messages"""
+        if self.message is None:
+            return
+        try:
+            await self.message.remove_reaction(self.emoji, self.user)
+        except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+            pass
+
+
+class ReactionRouter:
+    """Routes raw reaction events to handlers by message id"""
+
+    def __init__(self, state_file: str | Path = REACTION_ROUTES_FILE):
+        self.state_file = Path(state_file)
+        self.routes: dict[int, ReactionRoute] = {}
+        self.handlers: dict[str, ReactionHandler] = {}
+        self._bot = None
+        self._load_routes()
+
+    def register_handler(self, kind: str, handler: ReactionHandler) -> None:
+        """Handle reactions on routes of `kind` with `handler(bot, event)`"""
+        self.handlers[kind] = handler
+
+    def attach(self, bot) -> None:
+        """Install the raw reaction listener on `bot` (once)"""
+        if self._bot is bot:
+            return
+        if self._bot is not None:
+            self._bot.remove_listener(self.on_raw_reaction_add, "on_raw_reaction_add")
+        self._bot = bot
+        bot.add_listener(self.on_raw_reaction_add, "on_raw_reaction_add")
+
+        log_perfect_tree_section(
+            "Reaction Router",
+            [
+                ("status", "✅ Listening for reactions"),
+                ("routes", str(len(self.routes))),
+                ("handlers", ", ".join(sorted(self.handlers)) or "None yet"),
+            ],
+            "🤲",
+        )
+
+    def route(
+        self,
+        message: discord.Message,
+        kind: str,
+        ttl: float,
+        data: dict[str, Any] | None = None,
+    ) -> ReactionRoute:
+        """Send reactions on `message` to the `kind` handler for `ttl` seconds"""
+        route = ReactionRoute(
+            message_id=message.id,
+            channel_id=message.channel.id,
+            kind=kind,
+            expires_at=time.time() + ttl,
+            data=data or {},
+        )
+        self.routes[route.message_id] = route
+        self._purge_expired()
+        self._save_routes()
+        return route
+
+    def unroute(self, message_id: int) -> None:
+        """Stop routing reactions on a message"""
+        if self.routes.pop(message_id, None) is not None:
+            self._save_routes()
+
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
+        """Dispatch a reaction to its route's handler"""
+        route = self.routes.get(payload.message_id)
+        if route is None:
+            return
+
+        if route.is_expired():
+            self.unroute(payload.message_id)
+            return
+
+        handler = self.handlers.get(route.kind)
+        if handler is None:
+            return
+
+        bot = self._bot
+        user = payload.member
+        if user is None and bot is not None:
+            user = bot.get_user(payload.user_id)
+        if user is None or user.bot:
+            return
+
+        channel = bot.get_channel(payload.channel_id) if bot is not None else None
+        message = (
+            channel.get_partial_message(payload.message_id)
+            if channel is not None and hasattr(channel, "get_partial_message")
+            else None
+        )
+
+        try:
+            await handler(bot, ReactionEvent(route, payload.emoji, user, message))
+        except Exception as e:
+            log_error_with_traceback(f"Error handling {route.kind} reaction", e)
+
+    def _purge_expired(self) -> None:
+        now = time.time()
+        for message_id in [
+            message_id
+            for message_id, route in self.routes.items()
+            if route.is_expired(now)
+        ]:
+            del self.routes[message_id]
+
+    def _load_routes(self) -> None:
+        """Restore routes that have not expired yet"""
+        try:
+            if self.state_file.exists():
+                with open(self.state_file) as f:
+                    data = json.load(f)
+                for entry in data.get("routes", []):
+                    route = ReactionRoute(**entry)
+                    self.routes[route.message_id] = route
+                self._purge_expired()
+        except Exception as e:
+            log_error_with_traceback("Error loading reaction routes", e)
+
+    def _save_routes(self) -> None:
+        """Atomically write the active routes"""
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.state_file.with_suffix(".tmp")
+            with open(temp_file, "w") as f:
+                json.dump(
+                    {
+                        "version": 1,
+                        "routes": [asdict(route) for route in self.routes.values()],
+                    },
+                    f,
+                    indent=2,
+                )
+            os.replace(temp_file, self.state_file)
+        except Exception as e:
+            log_error_with_traceback("Error saving reaction routes", e)
+
+
+# Global instance
+_reaction_router: ReactionRouter | None = None
+
+
+def get_reaction_router() -> ReactionRouter:
+    """Get the global reaction router"""
+    global _reaction_router
+    if _reaction_router is None:
+        _reaction_router = ReactionRouter()
+    return _reaction_router
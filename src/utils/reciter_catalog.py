@@ -0,0 +1,309 @@
+# =============================================================================
+# QuranBot - Reciter Catalog
+# =============================================================================
+# One persisted catalogue of the audio library that every audio component
+# queries instead of walking reciter folders itself.
+#
+# - Each reciter folder is scanned once and stored as
+#   (reciter, file) -> surah number, size, mtime and duration
+# - Changes are detected incrementally from directory mtimes: adding,
+#   removing or renaming a file bumps its folder's mtime, so an unchanged
+#   library costs one stat() per reciter folder instead of a full re-walk
+# - Durations are read lazily (mutagen) and kept across restarts; new
+#   durations mark the catalogue dirty and are written at most once per
+#   flush interval, or when a bulk read calls flush()
+# =============================================================================
+
+import atexit
+import json
+import os
+from pathlib import Path
+import re
+from stat import S_ISDIR
+import threading
+import time
+
+from mutagen.mp3 import MP3
+
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+CATALOG_FILE_NAME = "audio_catalog.json"  # Created next to the audio base folder
+AUDIO_EXTENSIONS = {".mp3", ".wav", ".ogg", ".m4a", ".flac"}
+DURATION_FLUSH_INTERVAL_SECONDS = 30.0  # Max delay before new durations are saved
+
+
+def _extract_surah_number(filename: str) -> int | None:
+    """Surah number from a filename such as 001.mp3 or surah_1.mp3"""
+    match = re.search(r"(\d+)", filename)
+    if match:
+        surah_number = int(match.group(1))
+        return surah_number if 1 <= surah_number <= 114 else None
+    return None
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Modification time of a directory, or None if it is not a directory"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns if S_ISDIR(stat.st_mode) else None
+
+
+class ReciterCatalog:
+    """Incrementally refreshed catalogue of reciters and their audio files"""
+
+    def __init__(self, audio_base_folder: str, catalog_file: str | None = None):
+        self.audio_base_folder = Path(audio_base_folder)
+        self.catalog_file = (
+            Path(catalog_file)
+            if catalog_file
+            else self.audio_base_folder.parent / CATALOG_FILE_NAME
+        )
+
+        # {reciter: {"mtime_ns": int, "files": {filename: {size, mtime_ns, surah, duration}}}}
+        self.reciters: dict[str, dict] = {}
+        self._base_mtime_ns: int | None = None
+        self._lock = threading.RLock()  # Durations are read from worker threads
+        self._dirty = False
+        self._last_save = 0.0
+
+        self._load()
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def get_reciters(self, suffix: str = ".mp3") -> list[str]:
+        """Reciters with at least one file of the given type, sorted by name"""
+        self.refresh()
+        return sorted(
+            name
+            for name, reciter in self.reciters.items()
+            if any(filename.endswith(suffix) for filename in reciter["files"])
+        )
+
+    def get_files(self, reciter: str, suffix: str = ".mp3") -> list[str]:
+        """Sorted paths of a reciter's files of the given type"""
+        entry = self._refresh_one(reciter)
+        if not entry:
+            return []
+        folder = self.audio_base_folder / reciter
+        return [
+            str(folder / filename)
+            for filename in sorted(entry["files"])
+            if filename.endswith(suffix)
+        ]
+
+    def get_surahs(self, reciter: str, suffix: str = ".mp3") -> dict[int, str]:
+        """Map of surah number -> file path for a reciter"""
+        entry = self._refresh_one(reciter)
+        if not entry:
+            return {}
+        folder = self.audio_base_folder / reciter
+        surahs = {}
+        for filename in sorted(entry["files"]):
+            surah = entry["files"][filename]["surah"]
+            if surah and filename.endswith(suffix) and surah not in surahs:
+                surahs[surah] = str(folder / filename)
+        return surahs
+
+    def get_file_entries(self, reciter: str) -> dict[str, dict]:
+        """All of a reciter's audio files as {filename: {size, mtime_ns, surah, duration}}"""
+        entry = self._refresh_one(reciter)
+        return dict(entry["files"]) if entry else {}
+
+    def get_duration(self, file_path: str) -> float:
+        """An MP3's duration in seconds, read once and kept in the catalogue"""
+        path = Path(file_path)
+        with self._lock:
+            entry = self.reciters.get(path.parent.name)
+            info = entry["files"].get(path.name) if entry else None
+
+            try:
+                stat = path.stat()
+            except OSError:
+                return 0.0
+
+            if (
+                info
+                and info["duration"] is not None
+                and info["size"] == stat.st_size
+                and info["mtime_ns"] == stat.st_mtime_ns
+            ):
+                return info["duration"]
+
+        try:
+            audio = MP3(str(path))
+            duration = float(audio.info.length) if audio.info else 0.0
+        except Exception as e:
+            log_error_with_traceback(f"Error getting MP3 duration: {path.name}", e)
+            return 0.0
+
+        with self._lock:
+            if info is not None:
+                info.update(
+                    size=stat.st_size, mtime_ns=stat.st_mtime_ns, duration=duration
+                )
+                self._dirty = True
+                if time.monotonic() - self._last_save >= DURATION_FLUSH_INTERVAL_SECONDS:
+                    self._save()
+        return duration
+
+    def flush(self) -> bool:
+        """Write pending durations now; returns True if anything was saved"""
+        with self._lock:
+            if not self._dirty:
+                return False
+            self._save()
+            return True
+
+    # =========================================================================
+    # Change Detection
+    # =========================================================================
+
+    def refresh(self) -> bool:
+        """Bring every reciter up to date; returns True if anything changed"""
+        with self._lock:
+            changed = self._refresh_reciter_list()
+            for name in list(self.reciters):
+                changed |= self._refresh_reciter(name)
+            if changed:
+                self._save()
+            return changed
+
+    def _refresh_one(self, reciter: str) -> dict | None:
+        """Bring a single reciter up to date and return its entry"""
+        with self._lock:
+            if self._refresh_reciter(reciter):
+                self._save()
+            return self.reciters.get(reciter)
+
+    def _refresh_reciter_list(self) -> bool:
+        """Pick up added and removed reciter folders"""
+        base_mtime = _mtime_ns(self.audio_base_folder)
+        if base_mtime == self._base_mtime_ns:
+            return False
+
+        names = set()
+        if base_mtime is not None:
+            with os.scandir(self.audio_base_folder) as entries:
+                names = {entry.name for entry in entries if entry.is_dir()}
+
+        for removed in set(self.reciters) - names:
+            del self.reciters[removed]
+        for added in names - set(self.reciters):
+            self._refresh_reciter(added)
+        self._base_mtime_ns = base_mtime
+        return True
+
+    def _refresh_reciter(self, name: str) -> bool:
+        """Rescan one reciter folder if its mtime changed"""
+        folder = self.audio_base_folder / name
+        folder_mtime = _mtime_ns(folder)
+        entry = self.reciters.get(name)
+
+        if folder_mtime is None:
+            return self.reciters.pop(name, None) is not None
+        if entry and entry["mtime_ns"] == folder_mtime:
+            return False
+
+        previous = entry["files"] if entry else {}
+        files = {}
+        with os.scandir(folder) as items:
+            for item in items:
+                if os.path.splitext(item.name)[1].lower() not in AUDIO_EXTENSIONS:
+                    continue
+                if not item.is_file():
+                    continue
+
+                stat = item.stat()
+                old = previous.get(item.name)
+                unchanged = (
+                    old
+                    and old["size"] == stat.st_size
+                    and old["mtime_ns"] == stat.st_mtime_ns
+                )
+                files[item.name] = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "surah": _extract_surah_number(item.name),
+                    "duration": old["duration"] if unchanged else None,
+                }
+
+        self.reciters[name] = {"mtime_ns": folder_mtime, "files": files}
+        if entry is not None:
+            log_perfect_tree_section(
+                "Reciter Catalog - Folder Changed",
+                [
+                    ("reciter", name),
+                    ("files", f"{len(previous)} → {len(files)}"),
+                ],
+                "📚",
+            )
+        return True
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def _load(self) -> None:
+        """Load the saved catalogue for this audio folder"""
+        try:
+            if self.catalog_file.exists():
+                with open(self.catalog_file) as f:
+                    data = json.load(f)
+                if data.get("audio_base_folder") == str(self.audio_base_folder.resolve()):
+                    self.reciters = data.get("reciters", {})
+                    self._base_mtime_ns = data.get("base_mtime_ns")
+        except Exception as e:
+            log_error_with_traceback("Error loading reciter catalog", e)
+            self.reciters = {}
+            self._base_mtime_ns = None
+
+    def _save(self) -> None:
+        """Atomically write the catalogue"""
+        try:
+            self.catalog_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.catalog_file.with_suffix(".tmp")
+            with open(temp_file, "w") as f:
+                json.dump(
+                    {
+                        "version": 1,
+                        "audio_base_folder": str(self.audio_base_folder.resolve()),
+                        "base_mtime_ns": self._base_mtime_ns,
+                        "reciters": self.reciters,
+                    },
+                    f,
+                )
+            os.replace(temp_file, self.catalog_file)
+            self._dirty = False
+            self._last_save = time.monotonic()
+        except Exception as e:
+            log_error_with_traceback("Error saving reciter catalog", e)
+
+
+# =============================================================================
+# Global Catalogs
+# =============================================================================
+
+_catalogs: dict[str, ReciterCatalog] = {}
+
+
+def get_reciter_catalog(audio_base_folder: str = "audio") -> ReciterCatalog:
+    """Get the shared catalogue for an audio folder, creating it on first use"""
+    key = str(Path(audio_base_folder).resolve())
+    if key not in _catalogs:
+        _catalogs[key] = ReciterCatalog(audio_base_folder)
+    return _catalogs[key]
+
+
+@atexit.register
+def flush_reciter_catalogs() -> None:
+    """Write pending durations of every shared catalogue"""
+    for catalog in _catalogs.values():
+        catalog.flush()
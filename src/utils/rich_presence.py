@@ -12,6 +12,7 @@
 #
 # Key Features:
 # - Template-based presence updates
+# - Coalesced, rate-limited presence sends (latest activity wins)
 # - State persistence across restarts
 # - Activity type management
 # - Elapsed time tracking
@@ -20,7 +21,8 @@
 #
 # Technical Implementation:
 # - Async/await for Discord operations
-# - JSON-based state storage
+# - Single sender task paced by the shared rate limit engine
+# - JSON-based state storage, written on a debounce
 # - Template string formatting
 # - Timezone-aware timing
 # - Fallback mechanisms
@@ -34,6 +36,7 @@
 # - pytz: Timezone handling
 # =============================================================================
 
+import asyncio
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
@@ -41,8 +44,19 @@ from pathlib import Path
 import discord
 import pytz
 
+from src.core.rate_limit_engine import RateLimitRule, get_rate_limit_engine
+
 from .tree_log import log_error_with_traceback, log_perfect_tree_section
 
+# Gateway presence updates allowed: 5 every 20 seconds
+PRESENCE_RULE = RateLimitRule("presence_updates", limit=5, period_seconds=20.0)
+
+# Delay before presence changes are written to the state file
+PRESENCE_SAVE_DELAY = 30.0
+
+# Marks "no activity waiting to be sent" (None means "clear the presence")
+_NOTHING_PENDING = object()
+
 
 def validate_rich_presence_dependencies() -> bool:
     """
@@ -180,6 +194,16 @@ class RichPresenceManager:
         self.current_state = ""
         self.start_time = None
 
+        # Presence pipeline: only the latest desired activity is kept, and
+        # a single sender task delivers it at the gateway's allowed rate
+        self._pending_activity = _NOTHING_PENDING
+        self._desired_key = _NOTHING_PENDING
+        self._sent_key = _NOTHING_PENDING
+        self._sender: asyncio.Task | None = None
+        self._save_handle: asyncio.TimerHandle | None = None
+        self.sends = 0  # Presence updates actually sent
+        self.coalesced = 0  # Updates replaced before they were sent
+
         # Create data directory if it doesn't exist
         try:
             self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -226,30 +250,18 @@ class RichPresenceManager:
                 self.start_time = start_time
 
             activity = discord.Activity(**activity_kwargs)
-            # Schedule the coroutine to be run in the event loop
-            if (
-                hasattr(self.client, "loop")
-                and self.client.loop
-                and self.client.loop.is_running()
-            ):
-                import asyncio
-
-                asyncio.create_task(self.client.change_presence(activity=activity))
-            else:
-                # Fallback for when loop is not available
-                import asyncio
-
-                try:
-                    asyncio.get_event_loop().create_task(
-                        self.client.change_presence(activity=activity)
-                    )
-                except RuntimeError:
-                    # If no event loop is running, we can't update presence
-                    pass
+
+            # Repeating the activity already on its way costs nothing
+            if self._activity_key(activity) == self._desired_key:
+                return True
+
+            if not self._publish(activity):
+                return False
+
             self.current_status = status
             self.current_details = details
             self.current_state = state
-            self.save_state(silent=silent)
+            self._schedule_save()
 
             # Only log if not silent
             if not silent:
@@ -343,26 +355,7 @@ class RichPresenceManager:
     def clear_presence(self) -> bool:
         """Clear rich presence"""
         try:
-            # Schedule the coroutine to be run in the event loop
-            if (
-                hasattr(self.client, "loop")
-                and self.client.loop
-                and self.client.loop.is_running()
-            ):
-                import asyncio
-
-                asyncio.create_task(self.client.change_presence(activity=None))
-            else:
-                # Fallback for when loop is not available
-                import asyncio
-
-                try:
-                    asyncio.get_event_loop().create_task(
-                        self.client.change_presence(activity=None)
-                    )
-                except RuntimeError:
-                    # If no event loop is running, we can't update presence
-                    pass
+            published = self._publish(None)
             self.current_status = ""
             self.current_details = ""
             self.current_state = ""
@@ -374,7 +367,7 @@ class RichPresenceManager:
                 [("status", "✅ Cleared successfully")],
                 "🧹",
             )
-            return True
+            return published
         except Exception as e:
             log_error_with_traceback("Error clearing rich presence", e)
             return False
@@ -393,6 +386,11 @@ class RichPresenceManager:
 
     def save_state(self, silent: bool = False) -> bool:
         """Save current state to file"""
+        # Writing now supersedes any pending debounced write
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+
         try:
             state = {
                 "is_enabled": self.is_enabled,
@@ -450,3 +448,80 @@ class RichPresenceManager:
         except Exception as e:
             log_error_with_traceback("Error loading rich presence state", e)
             return False
+
+    # =========================================================================
+    # Presence Pipeline
+    # =========================================================================
+
+    @staticmethod
+    def _activity_key(activity: discord.Activity | None) -> tuple | None:
+        """What Discord would display for an activity"""
+        if activity is None:
+            return None
+        return (
+            activity.type,
+            activity.name,
+            activity.details,
+            activity.state,
+            activity.start,
+        )
+
+    def _publish(self, activity: discord.Activity | None) -> bool:
+        """
+        Make `activity` the desired presence and ensure it gets sent.
+
+        Returns False when there is no running event loop to send it from.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        if self._pending_activity is not _NOTHING_PENDING:
+            self.coalesced += 1
+        self._pending_activity = activity
+        self._desired_key = self._activity_key(activity)
+
+        if self._sender is None or self._sender.done():
+            self._sender = loop.create_task(self._send_pending())
+        return True
+
+    async def _send_pending(self) -> None:
+        """Send the latest desired activity, at most PRESENCE_RULE's rate"""
+        rate_limiter = get_rate_limit_engine()
+
+        while self._pending_activity is not _NOTHING_PENDING:
+            if self._activity_key(self._pending_activity) == self._sent_key:
+                self._pending_activity = _NOTHING_PENDING
+                break
+
+            decision = rate_limiter.acquire(PRESENCE_RULE, id(self.client))
+            if not decision.allowed:
+                # Anything published while waiting replaces the pending activity
+                await asyncio.sleep(decision.retry_after)
+                continue
+
+            activity = self._pending_activity
+            self._pending_activity = _NOTHING_PENDING
+            try:
+                await self.client.change_presence(activity=activity)
+                self._sent_key = self._activity_key(activity)
+                self.sends += 1
+            except Exception as e:
+                # Let the next update retry even if it is identical
+                self._desired_key = _NOTHING_PENDING
+                log_error_with_traceback("Error sending rich presence", e)
+                return
+
+    def _schedule_save(self) -> None:
+        """Write the state file once PRESENCE_SAVE_DELAY passes"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save_state(silent=True)
+            return
+
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(
+                PRESENCE_SAVE_DELAY, self.save_state, True
+            )
@@ -0,0 +1,526 @@
+# =============================================================================
+# QuranBot - Event Scheduler
+# =============================================================================
+# Single deadline-driven scheduler shared by every periodic component.
+#
+# Instead of each subsystem running its own "sleep N seconds and check"
+# loop, components register jobs with a next-fire time. The scheduler keeps
+# those deadlines in a heap and sleeps until the earliest one is due, so the
+# process only wakes up when there is real work to do.
+#
+# Key Features:
+# - Heap-ordered deadlines with lazy invalidation on reschedule
+# - Fixed-interval jobs and jobs that compute their own next deadline
+# - Optional random jitter to spread out simultaneous jobs
+# - Persistence of next-fire times across restarts, coalesced into at most
+#   one state write per flush interval
+# - Immediate wake-up when a job is rescheduled earlier (e.g. /interval)
+# - Introspection of upcoming jobs for commands and dashboards
+# =============================================================================
+
+import asyncio
+import atexit
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import heapq
+import itertools
+import json
+from pathlib import Path
+import random
+import time
+from typing import Any
+
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+# Persisted next-fire times for jobs registered with persist=True
+SCHEDULER_STATE_FILE = Path("data/scheduler_state.json")
+
+# Persisted deadlines are written at most this often; stop() and interpreter
+# exit flush whatever is still pending
+STATE_FLUSH_INTERVAL_SECONDS = 30.0
+
+# Upper bound on a single sleep so wall-clock jumps (NTP, suspend) are noticed
+MAX_SLEEP_SECONDS = 3600.0
+
+
+@dataclass
+class ScheduledJob:
+    """A unit of work registered with the EventScheduler"""
+
+    name: str
+    callback: Callable[[], Awaitable[Any]]
+    interval_seconds: float | None = None
+    next_run_func: Callable[[], float | None] | None = None
+    jitter_seconds: float = 0.0
+    retry_seconds: float = 60.0
+    persist: bool = False
+    next_run: float | None = None  # Unix timestamp of the next fire
+    last_run: float | None = None  # Unix timestamp of the last completed fire
+    run_count: int = 0
+    error_count: int = 0
+    running: bool = False
+    version: int = field(default=0, repr=False)
+
+    def compute_next_run(self, now: float) -> float | None:
+        """Work out the next deadline after a run, without jitter"""
+        if self.next_run_func is not None:
+            return self.next_run_func()
+        if self.interval_seconds is not None:
+            return now + self.interval_seconds
+        return None
+
+    def to_dict(self, now: float | None = None) -> dict:
+        """Serialize job details for status reporting"""
+        now = now if now is not None else time.time()
+        return {
+            "name": self.name,
+            "next_run": (
+                datetime.fromtimestamp(self.next_run, UTC).isoformat()
+                if self.next_run is not None
+                else None
+            ),
+            "seconds_until": (
+                max(0.0, self.next_run - now) if self.next_run is not None else None
+            ),
+            "last_run": (
+                datetime.fromtimestamp(self.last_run, UTC).isoformat()
+                if self.last_run is not None
+                else None
+            ),
+            "interval_seconds": self.interval_seconds,
+            "jitter_seconds": self.jitter_seconds,
+            "persist": self.persist,
+            "run_count": self.run_count,
+            "error_count": self.error_count,
+            "running": self.running,
+        }
+
+
+class EventScheduler:
+    """
+    Heap-based scheduler that sleeps until the next real deadline.
+
+    Jobs are identified by name; registering a job with an existing name
+    replaces it. Each heap entry carries the job's version so that
+    rescheduling simply pushes a new entry and stale ones are discarded
+    when they reach the top of the heap.
+
+    Usage Example:
+    ```python
+    scheduler = get_event_scheduler()
+    scheduler.schedule(
+        "leaderboard_update",
+        update_leaderboard,
+        interval_seconds=300,
+        persist=True,
+    )
+
+    # Later, after a config change:
+    scheduler.reschedule("leaderboard_update")
+    ```
+    """
+
+    def __init__(
+        self,
+        state_file: Path | None = SCHEDULER_STATE_FILE,
+        max_sleep_seconds: float = MAX_SLEEP_SECONDS,
+        state_flush_interval: float = STATE_FLUSH_INTERVAL_SECONDS,
+    ):
+        self.state_file = Path(state_file) if state_file else None
+        self.max_sleep_seconds = max_sleep_seconds
+        self.state_flush_interval = state_flush_interval
+
+        self._jobs: dict[str, ScheduledJob] = {}
+        self._heap: list[tuple[float, int, str, int]] = []
+        self._sequence = itertools.count()
+        self._persisted: dict[str, dict] = self._load_state()
+        self._dirty = False
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._running_jobs: set[asyncio.Task] = set()
+        self.wakeups = 0  # Loop iterations, exposed for diagnostics
+
+    # =========================================================================
+    # Registration
+    # =========================================================================
+
+    def schedule(
+        self,
+        name: str,
+        callback: Callable[[], Awaitable[Any]],
+        *,
+        interval_seconds: float | None = None,
+        next_run_func: Callable[[], float | None] | None = None,
+        first_run: float | datetime | None = None,
+        jitter_seconds: float = 0.0,
+        retry_seconds: float = 60.0,
+        persist: bool = False,
+    ) -> ScheduledJob:
+        """
+        Register (or replace) a job.
+
+        Args:
+            name: Unique job name
+            callback: Coroutine function to run when the job fires
+            interval_seconds: Fixed delay between runs
+            next_run_func: Returns the Unix timestamp of the next run, or None
+                to leave the job dormant until rescheduled. Takes precedence
+                over interval_seconds.
+            first_run: Explicit first deadline; defaults to the persisted
+                deadline, then next_run_func, then now + interval
+            jitter_seconds: Random delay of up to this many seconds added to
+                every deadline
+            retry_seconds: Delay before retrying after the callback raised
+            persist: Save next-fire times so they survive restarts
+
+        Returns:
+            ScheduledJob: The registered job
+        """
+        if interval_seconds is None and next_run_func is None:
+            raise ValueError("Either interval_seconds or next_run_func is required")
+
+        existing = self._jobs.get(name)
+        job = ScheduledJob(
+            name=name,
+            callback=callback,
+            interval_seconds=interval_seconds,
+            next_run_func=next_run_func,
+            jitter_seconds=jitter_seconds,
+            retry_seconds=retry_seconds,
+            persist=persist,
+            version=existing.version + 1 if existing else 0,
+        )
+        if existing:
+            job.run_count = existing.run_count
+            job.error_count = existing.error_count
+            job.last_run = existing.last_run
+
+        now = time.time()
+        if isinstance(first_run, datetime):
+            first_run = first_run.timestamp()
+
+        if first_run is None and persist and name in self._persisted:
+            first_run = self._persisted[name].get("next_run")
+            job.last_run = job.last_run or self._persisted[name].get("last_run")
+
+        if first_run is None:
+            if next_run_func is not None:
+                first_run = self._apply_jitter(job, next_run_func())
+            else:
+                first_run = self._apply_jitter(job, now + interval_seconds)
+
+        self._jobs[name] = job
+        self._set_deadline(job, first_run)
+        self._ensure_running()
+        return job
+
+    def reschedule(self, name: str, run_at: float | datetime | None = None) -> bool:
+        """
+        Move a job's next deadline.
+
+        With no run_at the deadline is recomputed from the job's own policy,
+        which is how configuration changes (like /interval) take effect
+        immediately instead of at the next poll.
+        """
+        job = self._jobs.get(name)
+        if not job:
+            return False
+
+        if isinstance(run_at, datetime):
+            run_at = run_at.timestamp()
+        if run_at is None:
+            run_at = self._apply_jitter(job, job.compute_next_run(time.time()))
+
+        self._set_deadline(job, run_at)
+        return True
+
+    def run_now(self, name: str) -> bool:
+        """Fire a job as soon as possible"""
+        return self.reschedule(name, time.time())
+
+    def cancel(self, name: str) -> bool:
+        """Remove a job; its heap entries become stale and are dropped"""
+        job = self._jobs.pop(name, None)
+        if not job:
+            return False
+        job.version += 1
+        if job.persist and self._persisted.pop(name, None) is not None:
+            self._mark_dirty()
+        return True
+
+    def get_job(self, name: str) -> ScheduledJob | None:
+        """Get a registered job by name"""
+        return self._jobs.get(name)
+
+    def get_upcoming_jobs(self, limit: int | None = None) -> list[dict]:
+        """List registered jobs ordered by next deadline (dormant jobs last)"""
+        now = time.time()
+        jobs = sorted(
+            self._jobs.values(),
+            key=lambda j: (j.next_run is None, j.next_run or 0.0),
+        )
+        if limit is not None:
+            jobs = jobs[:limit]
+        return [job.to_dict(now) for job in jobs]
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start the dispatch loop on the running event loop"""
+        if self._task and not self._task.done():
+            return
+
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._dispatch_loop())
+
+        log_perfect_tree_section(
+            "Event Scheduler - Started",
+            [
+                ("status", "✅ Deadline-driven scheduler running"),
+                ("registered_jobs", len(self._jobs)),
+                ("state_file", str(self.state_file) if self.state_file else "None"),
+            ],
+            "⏰",
+        )
+
+    async def stop(self) -> None:
+        """Stop the dispatch loop and cancel in-flight job runs"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+        for task in list(self._running_jobs):
+            task.cancel()
+        self._running_jobs.clear()
+
+        self.flush()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the dispatch loop is active"""
+        return self._task is not None and not self._task.done()
+
+    def _ensure_running(self) -> None:
+        """Start the loop lazily once an event loop is available"""
+        if self.is_running:
+            self._wake()
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop yet; start() will be called from async code
+        self.start()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    # =========================================================================
+    # Dispatch
+    # =========================================================================
+
+    def _apply_jitter(self, job: ScheduledJob, deadline: float | None) -> float | None:
+        if deadline is None or job.jitter_seconds <= 0:
+            return deadline
+        return deadline + random.uniform(0, job.jitter_seconds)
+
+    def _set_deadline(self, job: ScheduledJob, deadline: float | None) -> None:
+        """Record a new deadline and push a fresh heap entry"""
+        job.version += 1
+        job.next_run = deadline
+        if deadline is not None and not job.running:
+            heapq.heappush(
+                self._heap, (deadline, next(self._sequence), job.name, job.version)
+            )
+            self._wake()
+        if job.persist:
+            self._persisted[job.name] = {
+                "next_run": job.next_run,
+                "last_run": job.last_run,
+            }
+            self._mark_dirty()
+
+    def _pop_due_job(self, now: float) -> tuple[ScheduledJob | None, float | None]:
+        """Return a due job, or the delay until the next live deadline"""
+        while self._heap:
+            deadline, _, name, version = self._heap[0]
+            job = self._jobs.get(name)
+            if job is None or job.version != version or job.running:
+                heapq.heappop(self._heap)  # Stale entry
+                continue
+            if deadline > now:
+                return None, deadline - now
+            heapq.heappop(self._heap)
+            return job, None
+        return None, None
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            try:
+                self.wakeups += 1
+                job, delay = self._pop_due_job(time.time())
+
+                if job is not None:
+                    task = asyncio.create_task(self._execute(job))
+                    self._running_jobs.add(task)
+                    task.add_done_callback(self._running_jobs.discard)
+                    continue
+
+                self._wakeup.clear()
+                timeout = (
+                    self.max_sleep_seconds
+                    if delay is None
+                    else min(delay, self.max_sleep_seconds)
+                )
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                log_perfect_tree_section(
+                    "Event Scheduler - Stopped",
+                    [
+                        ("status", "🛑 Event scheduler stopped"),
+                        ("reason", "Task cancelled"),
+                    ],
+                    "⏰",
+                )
+                raise
+            except Exception as e:
+                log_error_with_traceback("Error in event scheduler loop", e)
+                await asyncio.sleep(1)
+
+    async def _execute(self, job: ScheduledJob) -> None:
+        """Run a job and queue its next deadline"""
+        job.running = True
+        failed = False
+        try:
+            await job.callback()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            failed = True
+            job.error_count += 1
+            log_error_with_traceback(
+                f"Error running scheduled job '{job.name}' "
+                f"(retrying in {job.retry_seconds:.0f}s)",
+                e,
+            )
+        finally:
+            job.running = False
+
+        if self._jobs.get(job.name) is not job:
+            return  # Cancelled or replaced while running
+
+        now = time.time()
+        job.last_run = now
+        job.run_count += 1
+
+        if failed:
+            next_run = now + job.retry_seconds
+        else:
+            try:
+                next_run = self._apply_jitter(job, job.compute_next_run(now))
+            except Exception as e:
+                log_error_with_traceback(
+                    f"Error computing next run for job '{job.name}'", e
+                )
+                next_run = now + job.retry_seconds
+
+            # A job that reports itself due again right after running made no
+            # progress (e.g. its channel was unavailable); back off instead of
+            # spinning.
+            if next_run is not None and next_run <= now:
+                next_run = now + job.retry_seconds
+
+        self._set_deadline(job, next_run)
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def flush(self) -> bool:
+        """Write pending deadlines now; returns True if anything was saved"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._dirty:
+            return False
+        self._save_state()
+        return True
+
+    def _mark_dirty(self) -> None:
+        """Queue a state write, coalescing changes within the flush interval"""
+        if not self.state_file:
+            return
+        self._dirty = True
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()  # No loop to defer to (setup code); write now
+            return
+        self._flush_handle = loop.call_later(self.state_flush_interval, self.flush)
+
+    def _load_state(self) -> dict[str, dict]:
+        if not self.state_file or not self.state_file.exists():
+            return {}
+        try:
+            with open(self.state_file) as f:
+                return json.load(f).get("jobs", {})
+        except Exception as e:
+            log_error_with_traceback("Error loading scheduler state", e)
+            return {}
+
+    def _save_state(self) -> None:
+        if not self.state_file:
+            return
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.state_file.with_suffix(".tmp")
+            with open(temp_file, "w") as f:
+                json.dump(
+                    {
+                        "jobs": self._persisted,
+                        "saved_at": datetime.now(UTC).isoformat(),
+                    },
+                    f,
+                    indent=2,
+                )
+            temp_file.replace(self.state_file)
+            self._dirty = False
+        except Exception as e:
+            log_error_with_traceback("Error saving scheduler state", e)
+
+
+# =============================================================================
+# Global Scheduler Instance
+# =============================================================================
+
+_event_scheduler: EventScheduler | None = None
+
+
+def get_event_scheduler() -> EventScheduler:
+    """Get the global event scheduler, creating it on first use"""
+    global _event_scheduler
+    if _event_scheduler is None:
+        _event_scheduler = EventScheduler()
+    return _event_scheduler
+
+
+@atexit.register
+def flush_event_scheduler() -> None:
+    """Write the global scheduler's pending deadlines"""
+    if _event_scheduler is not None:
+        _event_scheduler.flush()
@@ -0,0 +1,344 @@
+# =============================================================================
+# QuranBot - MP3 Seek Index
+# =============================================================================
+# Per-file seek tables so resuming a long surah does not make FFmpeg scan
+# the MP3 to find the resume position.
+#
+# - Each MP3 is walked frame by frame once, in the background, recording
+#   (time, byte offset) every SEEK_INDEX_INTERVAL_SECONDS
+# - The table is stored with the file's size and mtime so edits invalidate it
+# - On resume FFmpeg opens the file at the nearest frame boundary with
+#   -skip_initial_bytes and decodes at most one interval to the exact spot
+#
+# Restart-to-audio latency is therefore the same at minute 1 of Al-Fatiha
+# and at hour 2 of Al-Baqarah.
+# =============================================================================
+
+import asyncio
+from bisect import bisect_right
+import json
+import mmap
+import os
+from pathlib import Path
+import time
+
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+SEEK_INDEX_FILE_NAME = "seek_index.json"
+SEEK_INDEX_INTERVAL_SECONDS = 10.0
+
+# Bitrates in kbps by (MPEG-1?, layer); index 0 is "free format"
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Sample rates by MPEG version bits (0 = 2.5, 2 = 2, 3 = 1)
+_SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+
+def _parse_frame_header(header: bytes) -> tuple[int, int, int] | None:
+    """Return (frame length, samples, sample rate) for an MPEG audio frame header"""
+    if header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+
+    version = (header[1] >> 3) & 0x03
+    layer = 4 - ((header[1] >> 1) & 0x03)
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    padding = (header[2] >> 1) & 0x01
+
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate
+
+    samples = 576 if layer == 3 and not mpeg1 else 1152
+    return samples // 8 * bitrate // sample_rate + padding, samples, sample_rate
+
+
+def _id3v2_size(data) -> int:
+    """Size of a leading ID3v2 tag, including its header and footer"""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def build_seek_table(
+    path: str, interval: float = SEEK_INDEX_INTERVAL_SECONDS
+) -> tuple[list[list[float]], float]:
+    """
+    Walk an MP3's frames and return ([[time, byte offset], ...], duration).
+
+    One entry is recorded for the first frame at or after each multiple of
+    `interval`. Xing/Info/VBRI header frames carry no audio and are not
+    counted towards time.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return [], 0.0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            size = len(data)
+            position = _id3v2_size(data)
+            elapsed = 0.0
+            next_mark = 0.0
+            first_frame = True
+            table: list[list[float]] = []
+
+            while position + 4 <= size:
+                parsed = _parse_frame_header(data[position : position + 4])
+                if parsed is None:
+                    position += 1  # Resync on the next byte
+                    continue
+
+                frame_length, samples, sample_rate = parsed
+                if first_frame:
+                    first_frame = False
+                    head = data[position : position + 64]
+                    if b"Xing" in head or b"Info" in head or b"VBRI" in head:
+                        position += frame_length
+                        continue
+
+                if elapsed >= next_mark:
+                    table.append([round(elapsed, 3), position])
+                    next_mark += interval
+
+                elapsed += samples / sample_rate
+                position += frame_length
+
+    return table, elapsed
+
+
+class SeekIndex:
+    """Persisted byte-offset seek tables for a library of MP3 files"""
+
+    def __init__(
+        self,
+        index_file: str | Path,
+        interval: float = SEEK_INDEX_INTERVAL_SECONDS,
+    ):
+        self.index_file = Path(index_file)
+        self.interval = interval
+
+        # {resolved source path: {size, mtime_ns, duration, table}}
+        self.entries: dict[str, dict] = {}
+        self._index_task: asyncio.Task | None = None
+        self._queued_folders: list[Path] = []
+
+        self._load()
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    def _current_entry(self, source_path: str) -> dict | None:
+        """Entry for a file, if it still matches the file on disk"""
+        entry = self.entries.get(self._key(source_path))
+        if not entry:
+            return None
+
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+
+        if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime_ns"]:
+            return None
+        return entry
+
+    def lookup(self, source_path: str, position: float) -> tuple[int, float] | None:
+        """
+        Return (byte offset, remaining seconds) to start playback at `position`.
+
+        The offset is the frame boundary nearest before `position`; the
+        remainder is decoded and discarded by FFmpeg. Returns None when the
+        file has not been indexed (or changed since).
+        """
+        entry = self._current_entry(source_path)
+        if not entry or not entry["table"]:
+            return None
+
+        table = entry["table"]
+        times = [point[0] for point in table]
+        index = max(0, bisect_right(times, position) - 1)
+        seek_time, offset = table[index]
+        return int(offset), max(0.0, position - seek_time)
+
+    def get_duration(self, source_path: str) -> float | None:
+        """Exact duration from the frame scan, if the file is indexed"""
+        entry = self._current_entry(source_path)
+        return entry["duration"] if entry else None
+
+    def ffmpeg_options(
+        self, source_path: str, position: float, options: str
+    ) -> tuple[str | None, str]:
+        """
+        FFmpeg (before_options, options) to start an MP3 at `position`.
+
+        Falls back to input-side -ss when the file has no seek table.
+        """
+        if position <= 0:
+            return None, options
+
+        seek = self.lookup(source_path, position)
+        if seek is None:
+            return f"-ss {position}", options
+
+        offset, remainder = seek
+        before_options = f"-skip_initial_bytes {offset}" if offset else None
+        if remainder > 0:
+            options = f"-ss {remainder:.3f} {options}"
+        return before_options, options
+
+    # =========================================================================
+    # Indexing
+    # =========================================================================
+
+    def index_track(self, source_path: str) -> bool:
+        """Build and store the seek table for one file; returns True if built"""
+        if self._current_entry(source_path):
+            return False
+
+        stat = os.stat(source_path)
+        table, duration = build_seek_table(source_path, self.interval)
+        self.entries[self._key(source_path)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "duration": round(duration, 3),
+            "table": table,
+        }
+        return True
+
+    async def index_folder(self, folder: str) -> int:
+        """Index every new or changed MP3 in a folder; returns count"""
+        indexed = 0
+        for source in sorted(Path(folder).glob("*.mp3")):
+            try:
+                if await asyncio.to_thread(self.index_track, str(source)):
+                    indexed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log_error_with_traceback(f"Error building seek index for {source}", e)
+
+        if indexed:
+            self._save()
+        return indexed
+
+    def start_background_index(self, folder: str) -> None:
+        """Queue a reciter folder for indexing in the background"""
+        folder_path = Path(folder)
+        if folder_path not in self._queued_folders:
+            self._queued_folders.append(folder_path)
+
+        if self._index_task and not self._index_task.done():
+            return
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No running event loop yet; the next call will start the worker
+            return
+        self._index_task = asyncio.create_task(self._index_queue())
+
+    async def stop(self) -> None:
+        """Cancel background indexing"""
+        self._queued_folders.clear()
+        if self._index_task and not self._index_task.done():
+            self._index_task.cancel()
+            try:
+                await self._index_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _index_queue(self) -> None:
+        """Work through queued folders one at a time"""
+        while self._queued_folders:
+            folder = self._queued_folders[0]
+            try:
+                started = time.time()
+                indexed = await self.index_folder(str(folder))
+                if indexed:
+                    log_perfect_tree_section(
+                        "Seek Index - Folder Indexed",
+                        [
+                            ("folder", folder.name),
+                            ("indexed", f"{indexed} tracks"),
+                            ("interval", f"{self.interval:.0f}s"),
+                            ("duration", f"{time.time() - started:.1f}s"),
+                        ],
+                        "🧭",
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log_error_with_traceback(f"Error indexing audio folder: {folder}", e)
+            finally:
+                if self._queued_folders and self._queued_folders[0] == folder:
+                    self._queued_folders.pop(0)
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    @staticmethod
+    def _key(source_path: str) -> str:
+        """Index key for a source file"""
+        return Path(source_path).resolve().as_posix()
+
+    def _load(self) -> None:
+        """Load saved seek tables built with the current interval"""
+        try:
+            if self.index_file.exists():
+                with open(self.index_file) as f:
+                    data = json.load(f)
+                if data.get("interval") == self.interval:
+                    self.entries = data.get("entries", {})
+        except Exception as e:
+            log_error_with_traceback("Error loading seek index", e)
+            self.entries = {}
+
+    def _save(self) -> None:
+        """Atomically write the seek tables"""
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.index_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump(
+                {"version": 1, "interval": self.interval, "entries": self.entries}, f
+            )
+        os.replace(temp_file, self.index_file)
+
+
+# =============================================================================
+# Global Seek Index
+# =============================================================================
+
+_seek_indexes: dict[str, SeekIndex] = {}
+
+
+def get_seek_index(index_file: str | Path) -> SeekIndex:
+    """
+    Get the shared seek index for an index file, creating it on first use.
+
+    Every library over the same mirror must use this one instance so
+    concurrent saves never drop each other's tables.
+    """
+    key = str(Path(index_file).resolve())
+    if key not in _seek_indexes:
+        _seek_indexes[key] = SeekIndex(index_file)
+    return _seek_indexes[key]
@@ -0,0 +1,253 @@
+# =============================================================================
+# QuranBot - Shuffle Playlists
+# =============================================================================
+# Precomputed shuffle order per reciter, persisted across restarts.
+#
+# - Each cycle is a seeded permutation of the reciter's surahs, so every
+#   surah plays exactly once before any repeats
+# - A cursor into the permutation makes next/peek O(1)
+# - The first surah of a new cycle is never the last one of the previous
+# - Modes: uniform, weighted by duration (shorter surahs tend to come
+#   earlier in each cycle) and exclude long surahs
+# - peek_next() lets the gapless prefetch stage see the next pick without
+#   consuming it
+# =============================================================================
+
+from enum import Enum
+import json
+import math
+import os
+from pathlib import Path
+import random
+
+from .tree_log import log_error_with_traceback
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+SHUFFLE_STATE_FILE_NAME = "shuffle_playlists.json"
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+LONG_SURAH_SECONDS = 30 * 60  # Excluded in EXCLUDE_LONG mode
+
+
+class ShuffleMode(Enum):
+    """How a shuffle cycle is ordered"""
+
+    UNIFORM = "uniform"
+    WEIGHTED_BY_DURATION = "weighted_by_duration"
+    EXCLUDE_LONG = "exclude_long"
+
+
+class ShufflePlaylist:
+    """Seeded shuffle order for one reciter with an O(1) cursor"""
+
+    def __init__(
+        self,
+        items: list[int],
+        seed: int | None = None,
+        mode: ShuffleMode = ShuffleMode.UNIFORM,
+        durations: dict[int, float] | None = None,
+        max_duration: float = LONG_SURAH_SECONDS,
+    ):
+        self.items = sorted(set(items))
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.mode = mode
+        self.durations = durations or {}
+        self.max_duration = max_duration
+        self.cycle = 0
+        self.cursor = 0
+        self.order = self._build_order(self.cycle, previous=None)
+        self.last_played: int | None = None  # Survives the cycle boundary
+
+    # =========================================================================
+    # Cursor
+    # =========================================================================
+
+    def peek_next(self) -> int | None:
+        """The surah advance() will return, without consuming it"""
+        return self.order[self.cursor] if self.order else None
+
+    def advance(self) -> int | None:
+        """Consume and return the next surah, starting a new cycle when done"""
+        if not self.order:
+            return None
+
+        item = self.order[self.cursor]
+        self.last_played = item
+        self.cursor += 1
+        if self.cursor >= len(self.order):
+            self.cycle += 1
+            self.cursor = 0
+            self.order = self._build_order(self.cycle, previous=item)
+        return item
+
+    def step_back(self) -> int | None:
+        """Return to the previously played surah of this cycle, if there is one"""
+        if self.cursor < 2:
+            return None
+        self.cursor -= 1
+        self.last_played = self.order[self.cursor - 1]
+        return self.last_played
+
+    def mark_played(self, item: int) -> bool:
+        """
+        Record that `item` is playing now (e.g. after a jump).
+
+        It is moved to the cursor and consumed so it does not come up again
+        this cycle. The item consumed last is already playing, even when
+        that consumption started a new cycle. Returns True if the playlist
+        changed.
+        """
+        if item == self.last_played:
+            return False
+        try:
+            position = self.order.index(item, self.cursor)
+        except ValueError:
+            return False  # Already played this cycle, or not in the pool
+
+        self.order[self.cursor], self.order[position] = (
+            self.order[position],
+            self.order[self.cursor],
+        )
+        self.advance()
+        return True
+
+    # =========================================================================
+    # Ordering
+    # =========================================================================
+
+    def _pool(self) -> list[int]:
+        """Surahs eligible for this playlist's mode"""
+        if self.mode is ShuffleMode.EXCLUDE_LONG and self.durations:
+            pool = [
+                item
+                for item in self.items
+                if self.durations.get(item, 0.0) <= self.max_duration
+            ]
+            return pool or list(self.items)
+        return list(self.items)
+
+    def _build_order(self, cycle: int, previous: int | None) -> list[int]:
+        """Deterministic permutation for one cycle"""
+        rng = random.Random(f"{self.seed}:{cycle}")
+        order = self._pool()
+
+        if self.mode is ShuffleMode.WEIGHTED_BY_DURATION and self.durations:
+            # Weighted sampling without replacement (Efraimidis-Spirakis) with
+            # weight 1/duration, computed in log space to avoid underflow
+            order.sort(
+                key=lambda item: math.log(1.0 - rng.random())
+                * max(self.durations.get(item, 0.0), 1.0),
+                reverse=True,
+            )
+        else:
+            rng.shuffle(order)
+
+        # Never repeat across the cycle boundary
+        if previous is not None and len(order) > 1 and order[0] == previous:
+            swap = rng.randrange(1, len(order))
+            order[0], order[swap] = order[swap], order[0]
+        return order
+
+    # =========================================================================
+    # Serialization
+    # =========================================================================
+
+    def to_dict(self) -> dict:
+        """Persistable state (durations are re-supplied on load)"""
+        return {
+            "items": self.items,
+            "seed": self.seed,
+            "mode": self.mode.value,
+            "max_duration": self.max_duration,
+            "cycle": self.cycle,
+            "cursor": self.cursor,
+            "order": self.order,
+            "last_played": self.last_played,
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: dict, durations: dict[int, float] | None = None
+    ) -> "ShufflePlaylist":
+        """Restore a playlist at the position it was saved"""
+        playlist = cls(
+            data["items"],
+            seed=data["seed"],
+            mode=ShuffleMode(data["mode"]),
+            durations=durations,
+            max_duration=data.get("max_duration", LONG_SURAH_SECONDS),
+        )
+        playlist.cycle = data["cycle"]
+        playlist.order = data["order"]
+        playlist.cursor = min(data["cursor"], max(len(playlist.order) - 1, 0))
+        playlist.last_played = data.get("last_played")
+        if playlist.last_played is None and playlist.cursor > 0:
+            playlist.last_played = playlist.order[playlist.cursor - 1]
+        return playlist
+
+
+class ShufflePlaylistStore:
+    """Per-reciter shuffle playlists persisted to one JSON file"""
+
+    def __init__(self, state_file: str | Path = DATA_DIR / SHUFFLE_STATE_FILE_NAME):
+        self.state_file = Path(state_file)
+        self.playlists: dict[str, ShufflePlaylist] = {}
+        self._saved: dict[str, dict] = self._load()
+
+    def get(
+        self,
+        reciter: str,
+        items: list[int],
+        mode: ShuffleMode = ShuffleMode.UNIFORM,
+        durations: dict[int, float] | None = None,
+    ) -> ShufflePlaylist:
+        """
+        Get a reciter's playlist, restoring it from disk on first use.
+
+        A new permutation is generated when the reciter's surahs or the
+        shuffle mode change.
+        """
+        playlist = self.playlists.get(reciter)
+        if playlist is None and reciter in self._saved:
+            try:
+                playlist = ShufflePlaylist.from_dict(self._saved[reciter], durations)
+            except (KeyError, TypeError, ValueError) as e:
+                log_error_with_traceback(
+                    f"Discarding unreadable shuffle playlist for {reciter}", e
+                )
+
+        if playlist is None or playlist.items != sorted(set(items)) or playlist.mode != mode:
+            playlist = ShufflePlaylist(items, mode=mode, durations=durations)
+            self.playlists[reciter] = playlist
+            self.save()
+        else:
+            self.playlists[reciter] = playlist
+            if durations:
+                playlist.durations = durations
+        return playlist
+
+    def save(self) -> None:
+        """Atomically write every playlist's cursor and order"""
+        try:
+            self._saved.update(
+                {reciter: playlist.to_dict() for reciter, playlist in self.playlists.items()}
+            )
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.state_file.with_suffix(".tmp")
+            with open(temp_file, "w") as f:
+                json.dump({"version": 1, "playlists": self._saved}, f)
+            os.replace(temp_file, self.state_file)
+        except Exception as e:
+            log_error_with_traceback("Error saving shuffle playlists", e)
+
+    def _load(self) -> dict[str, dict]:
+        """Load saved playlists if the file exists"""
+        try:
+            if self.state_file.exists():
+                with open(self.state_file) as f:
+                    return json.load(f).get("playlists", {})
+        except Exception as e:
+            log_error_with_traceback("Error loading shuffle playlists", e)
+        return {}
@@ -0,0 +1,434 @@
+# =============================================================================
+# QuranBot - Snapshot Store
+# =============================================================================
+# Content-addressed, incremental backups of the data directory.
+#
+# - Every file is identified by its SHA-256; files whose size and mtime are
+#   unchanged since the last snapshot are not even re-read
+# - Each distinct file content is stored once, gzip-compressed, under
+#   objects/<first two hex digits>/<sha256>.gz
+# - A snapshot is a small JSON manifest mapping paths relative to the data
+#   directory to blob hashes, so an hourly snapshot only costs as much as
+#   what changed
+# - Full snapshots cover the whole data directory; partial ones (e.g. the
+#   state files saved on disconnect) are never the default restore target
+#   and are kept separately, so they can't push full snapshots out
+# - Retention keeps the most recent snapshots plus one per day; blobs that
+#   no remaining snapshot references are garbage collected
+# - Restores only rewrite files whose content differs from the snapshot
+#
+# All methods block; async callers run them with asyncio.to_thread().
+# =============================================================================
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+
+from .tree_log import log_error_with_traceback
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+SNAPSHOT_STORE_DIR = Path(__file__).parent.parent.parent / "backup" / "snapshots"
+
+# Retention: the newest KEEP_RECENT_SNAPSHOTS, plus the newest snapshot of
+# each of the last KEEP_DAILY_SNAPSHOTS days
+KEEP_RECENT_SNAPSHOTS = 24
+KEEP_DAILY_SNAPSHOTS = 7
+KEEP_PARTIAL_SNAPSHOTS = 10
+
+# Snapshot kinds
+SNAPSHOT_KIND_FULL = "full"  # Every data file
+SNAPSHOT_KIND_PARTIAL = "partial"  # A subset, e.g. just the state files
+
+# gzip level for blobs; data files are small JSON so 6 is plenty
+BLOB_COMPRESSION_LEVEL = 6
+
+
+@dataclass
+class SnapshotResult:
+    """Outcome of taking a snapshot"""
+
+    snapshot_id: str | None  # None when nothing changed since the last one
+    files: int = 0
+    changed_files: int = 0
+    new_blobs: int = 0
+    bytes_stored: int = 0  # Compressed bytes written for new blobs
+    total_size: int = 0  # Uncompressed size of every file in the snapshot
+    failed: list[str] = field(default_factory=list)
+
+
+class SnapshotStore:
+    """Incremental, deduplicating snapshots of a data directory"""
+
+    def __init__(
+        self,
+        root: str | Path = SNAPSHOT_STORE_DIR,
+        data_dir: str | Path = DATA_DIR,
+    ):
+        self.root = Path(root)
+        self.data_dir = Path(data_dir)
+        self.objects_dir = self.root / "objects"
+        self.manifests_dir = self.root / "manifests"
+        self.index_file = self.root / "index.json"
+        self._lock = threading.Lock()
+
+        # {file path: {"size", "mtime_ns", "sha256"}} from the last snapshot
+        self._index: dict[str, dict] | None = None
+
+    # =========================================================================
+    # Snapshots
+    # =========================================================================
+
+    def snapshot(
+        self,
+        files: list[Path],
+        reason: str = "hourly",
+        kind: str = SNAPSHOT_KIND_FULL,
+        description: str | None = None,
+    ) -> SnapshotResult:
+        """
+        Record the current content of `files`.
+
+        Files are keyed by their path relative to the data directory. Only
+        content not already in the store is read, compressed and written.
+        If every file matches the latest snapshot of the same kind, no new
+        snapshot is created.
+        """
+        with self._lock:
+            index = self._load_index()
+            latest = self._latest_manifest(kind)
+            previous = latest["files"] if latest else {}
+
+            result = SnapshotResult(snapshot_id=None)
+            entries: dict[str, dict] = {}
+
+            for path in files:
+                path = Path(path)
+                try:
+                    name = self._relative_name(path)
+                    entry, stored = self._store_file(path, index)
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    result.failed.append(path.name)
+                    log_error_with_traceback(f"Failed to snapshot {path.name}", e)
+                    continue
+
+                entries[name] = entry
+                result.files += 1
+                result.total_size += entry["size"]
+                if previous.get(name, {}).get("sha256") != entry["sha256"]:
+                    result.changed_files += 1
+                if stored:
+                    result.new_blobs += 1
+                    result.bytes_stored += stored
+
+            self._save_index(index)
+
+            if latest and entries == previous:
+                return result
+
+            snapshot_id = self._new_snapshot_id()
+            self._write_json(
+                self.manifests_dir / f"{snapshot_id}.json",
+                {
+                    "version": 2,
+                    "id": snapshot_id,
+                    "created_at": datetime.now(UTC).isoformat(),
+                    "kind": kind,
+                    "reason": reason,
+                    "description": description,
+                    "files": entries,
+                },
+            )
+            result.snapshot_id = snapshot_id
+            return result
+
+    def list_snapshots(self) -> list[dict]:
+        """Snapshot summaries, newest first"""
+        summaries = []
+        for manifest in self._manifests():
+            summaries.append(
+                {
+                    "id": manifest["id"],
+                    "created_at": manifest["created_at"],
+                    "kind": manifest.get("kind", SNAPSHOT_KIND_FULL),
+                    "reason": manifest.get("reason", ""),
+                    "description": manifest.get("description"),
+                    "files": len(manifest["files"]),
+                    "size": sum(entry["size"] for entry in manifest["files"].values()),
+                }
+            )
+        return summaries
+
+    def load_manifest(self, snapshot_id: str | None = None) -> dict | None:
+        """A snapshot's manifest; the latest full one if no id is given"""
+        if snapshot_id is None:
+            return self._latest_manifest()
+        try:
+            with open(self.manifests_dir / f"{snapshot_id}.json") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    # =========================================================================
+    # Restore
+    # =========================================================================
+
+    def restore(
+        self,
+        snapshot_id: str | None = None,
+        target_dir: str | Path | None = None,
+        names: list[str] | None = None,
+    ) -> list[str]:
+        """
+        Restore files from a snapshot (the latest full one by default).
+
+        Files that already have the snapshot's content are left untouched.
+        `names` are paths relative to the data directory.
+
+        Returns:
+            list[str]: Relative paths of the files that were rewritten
+        """
+        with self._lock:
+            manifest = self.load_manifest(snapshot_id)
+            if manifest is None:
+                raise FileNotFoundError(f"Snapshot not found: {snapshot_id or 'latest'}")
+
+            target_dir = Path(target_dir) if target_dir else self.data_dir
+            target_dir.mkdir(parents=True, exist_ok=True)
+            index = self._load_index()
+            restored = []
+
+            for name, entry in sorted(manifest["files"].items()):
+                if names is not None and name not in names:
+                    continue
+
+                target = target_dir / name
+                if target.exists() and self._current_hash(target, index) == entry["sha256"]:
+                    continue
+
+                with gzip.open(self._blob_path(entry["sha256"]), "rb") as f:
+                    data = f.read()
+                if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+                    raise ValueError(f"Corrupt blob for {name} in snapshot {manifest['id']}")
+
+                self._write_bytes(target, data)
+                restored.append(name)
+
+            return restored
+
+    # =========================================================================
+    # Retention
+    # =========================================================================
+
+    def prune(
+        self,
+        keep_recent: int = KEEP_RECENT_SNAPSHOTS,
+        keep_daily: int = KEEP_DAILY_SNAPSHOTS,
+        keep_partial: int = KEEP_PARTIAL_SNAPSHOTS,
+    ) -> tuple[int, int]:
+        """
+        Apply the retention policy and drop unreferenced blobs.
+
+        The recent and daily limits count full snapshots only; partial
+        snapshots are capped at the newest `keep_partial`.
+
+        Returns:
+            tuple[int, int]: (snapshots removed, blobs removed)
+        """
+        with self._lock:
+            manifests = self._manifests()
+            full = self._manifests_of_kind(manifests, SNAPSHOT_KIND_FULL)
+            partial = self._manifests_of_kind(manifests, SNAPSHOT_KIND_PARTIAL)
+            keep = {manifest["id"] for manifest in full[:keep_recent]}
+            keep.update(manifest["id"] for manifest in partial[:keep_partial])
+
+            days_kept: set[str] = set()
+            for manifest in full:
+                day = manifest["created_at"][:10]
+                if day not in days_kept and len(days_kept) < keep_daily:
+                    days_kept.add(day)
+                    keep.add(manifest["id"])
+
+            removed_snapshots = 0
+            referenced: set[str] = set()
+            for manifest in manifests:
+                if manifest["id"] in keep:
+                    referenced.update(entry["sha256"] for entry in manifest["files"].values())
+                    continue
+                try:
+                    (self.manifests_dir / f"{manifest['id']}.json").unlink()
+                    removed_snapshots += 1
+                except FileNotFoundError:
+                    pass
+
+            removed_blobs = 0
+            if self.objects_dir.exists():
+                for blob in self.objects_dir.glob("*/*.gz"):
+                    if blob.name[: -len(".gz")] not in referenced:
+                        blob.unlink()
+                        removed_blobs += 1
+
+            return removed_snapshots, removed_blobs
+
+    def get_stats(self) -> dict:
+        """Snapshot count and on-disk size of the store"""
+        blobs = list(self.objects_dir.glob("*/*.gz")) if self.objects_dir.exists() else []
+        manifests = (
+            list(self.manifests_dir.glob("*.json")) if self.manifests_dir.exists() else []
+        )
+        return {
+            "snapshots": len(manifests),
+            "blobs": len(blobs),
+            "store_size": sum(path.stat().st_size for path in blobs + manifests),
+        }
+
+    # =========================================================================
+    # Private Methods
+    # =========================================================================
+
+    def _store_file(self, path: Path, index: dict) -> tuple[dict, int]:
+        """
+        Hash a file and store its blob if the store lacks it.
+
+        Returns the manifest entry and the compressed bytes written.
+        """
+        stat = path.stat()
+        key = str(path.resolve())
+        cached = index.get(key)
+
+        data = None
+        if (
+            cached
+            and cached["size"] == stat.st_size
+            and cached["mtime_ns"] == stat.st_mtime_ns
+        ):
+            sha256 = cached["sha256"]
+        else:
+            data = path.read_bytes()
+            sha256 = hashlib.sha256(data).hexdigest()
+
+        stored = 0
+        blob_path = self._blob_path(sha256)
+        if not blob_path.exists():
+            if data is None:
+                data = path.read_bytes()
+                sha256 = hashlib.sha256(data).hexdigest()
+                blob_path = self._blob_path(sha256)
+            compressed = gzip.compress(data, compresslevel=BLOB_COMPRESSION_LEVEL)
+            self._write_bytes(blob_path, compressed)
+            stored = len(compressed)
+
+        size = len(data) if data is not None else stat.st_size
+        index[key] = {"size": size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+        return {"sha256": sha256, "size": size}, stored
+
+    def _relative_name(self, path: Path) -> str:
+        """Manifest key for a file: its path relative to the data directory"""
+        try:
+            return path.resolve().relative_to(self.data_dir.resolve()).as_posix()
+        except ValueError:
+            raise ValueError(f"{path} is outside the data directory {self.data_dir}") from None
+
+    def _current_hash(self, path: Path, index: dict) -> str:
+        """Hash of a file, trusting the index when size and mtime match"""
+        stat = path.stat()
+        cached = index.get(str(path.resolve()))
+        if (
+            cached
+            and cached["size"] == stat.st_size
+            and cached["mtime_ns"] == stat.st_mtime_ns
+        ):
+            return cached["sha256"]
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / f"{sha256}.gz"
+
+    def _new_snapshot_id(self) -> str:
+        """Sortable UTC timestamp id, unique within the store"""
+        base = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+        snapshot_id, suffix = base, 1
+        while (self.manifests_dir / f"{snapshot_id}.json").exists():
+            suffix += 1
+            snapshot_id = f"{base}-{suffix}"
+        return snapshot_id
+
+    def _manifests(self) -> list[dict]:
+        """Every manifest, newest first"""
+        if not self.manifests_dir.exists():
+            return []
+        manifests = []
+        for path in self.manifests_dir.glob("*.json"):
+            try:
+                with open(path) as f:
+                    manifests.append(json.load(f))
+            except Exception as e:
+                log_error_with_traceback(f"Unreadable snapshot manifest {path.name}", e)
+        return sorted(manifests, key=lambda m: (m["created_at"], m["id"]), reverse=True)
+
+    @staticmethod
+    def _manifests_of_kind(manifests: list[dict], kind: str) -> list[dict]:
+        # Manifests written before kinds existed were all full snapshots
+        return [m for m in manifests if m.get("kind", SNAPSHOT_KIND_FULL) == kind]
+
+    def _latest_manifest(self, kind: str = SNAPSHOT_KIND_FULL) -> dict | None:
+        manifests = self._manifests_of_kind(self._manifests(), kind)
+        return manifests[0] if manifests else None
+
+    def _load_index(self) -> dict[str, dict]:
+        if self._index is None:
+            self._index = {}
+            try:
+                if self.index_file.exists():
+                    with open(self.index_file) as f:
+                        self._index = json.load(f).get("files", {})
+            except Exception as e:
+                log_error_with_traceback("Error loading snapshot index", e)
+        return self._index
+
+    def _save_index(self, index: dict[str, dict]) -> None:
+        try:
+            self._write_json(self.index_file, {"version": 1, "files": index})
+        except Exception as e:
+            log_error_with_traceback("Error saving snapshot index", e)
+
+    def _write_json(self, path: Path, data: dict) -> None:
+        self._write_bytes(path, json.dumps(data, indent=2).encode("utf-8"))
+
+    @staticmethod
+    def _write_bytes(path: Path, data: bytes) -> None:
+        """Atomically write `data` to `path`"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_file, "wb") as f:
+            f.write(data)
+        os.replace(temp_file, path)
+
+
+# Global instances, one per store directory
+_snapshot_stores: dict[str, SnapshotStore] = {}
+
+
+def get_snapshot_store(
+    root: str | Path = SNAPSHOT_STORE_DIR, data_dir: str | Path = DATA_DIR
+) -> SnapshotStore:
+    """
+    Get the shared snapshot store for a store directory.
+
+    Everything that snapshots into the same directory must use one
+    instance, so its lock covers every write, prune and restore.
+    """
+    key = str(Path(root).resolve())
+    if key not in _snapshot_stores:
+        _snapshot_stores[key] = SnapshotStore(root, data_dir)
+    return _snapshot_stores[key]
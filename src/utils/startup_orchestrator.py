@@ -0,0 +1,156 @@
+# =============================================================================
+# QuranBot - Startup Orchestrator
+# =============================================================================
+# Runs startup phases concurrently in dependency order.
+#
+# - Each phase declares the phases it depends on; independent phases start
+#   together instead of one after another
+# - A phase starts as soon as its own dependencies finish, so voice and
+#   playback never wait on unrelated setup such as panels or commands
+# - A failed phase skips its dependents; a failed critical phase is raised
+#   once every other phase has settled
+# - Per-phase timings (start offset, duration, outcome) are logged as a
+#   breakdown and kept on the orchestrator
+# =============================================================================
+
+import asyncio
+from dataclasses import dataclass
+import time
+from typing import Any, Awaitable, Callable
+
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+
+@dataclass
+class StartupPhase:
+    """One unit of startup work and the phases it waits for"""
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+    critical: bool = True
+
+
+@dataclass
+class PhaseTiming:
+    """When a phase ran and how it ended"""
+
+    started_at: float = 0.0  # Seconds after the orchestrator started
+    duration: float = 0.0
+    status: str = "pending"  # ok, failed or skipped
+    error: Exception | None = None
+
+
+class StartupOrchestrator:
+    """Dependency-ordered, concurrent startup with a timing breakdown"""
+
+    def __init__(self, name: str = "Startup"):
+        self.name = name
+        self.phases: dict[str, StartupPhase] = {}
+        self.timings: dict[str, PhaseTiming] = {}
+        self.total_duration = 0.0
+
+    def add(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[Any]],
+        depends_on: tuple[str, ...] | list[str] = (),
+        critical: bool = True,
+    ) -> None:
+        """Register a phase; `run` is awaited once its dependencies succeed"""
+        if name in self.phases:
+            raise ValueError(f"Duplicate startup phase: {name}")
+        self.phases[name] = StartupPhase(name, run, tuple(depends_on), critical)
+
+    async def run(self) -> dict[str, PhaseTiming]:
+        """
+        Run every phase and return their timings.
+
+        Raises the error of the first failed critical phase (in registration
+        order) after all other phases have finished or been skipped.
+        """
+        self._validate()
+        started = time.perf_counter()
+        self.timings = {name: PhaseTiming() for name in self.phases}
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run_phase(phase: StartupPhase) -> bool:
+            results = [await tasks[dependency] for dependency in phase.depends_on]
+            timing = self.timings[phase.name]
+            timing.started_at = time.perf_counter() - started
+
+            if not all(results):
+                timing.status = "skipped"
+                return False
+
+            try:
+                await phase.run()
+                timing.status = "ok"
+            except Exception as e:
+                timing.status = "failed"
+                timing.error = e
+                log_error_with_traceback(f"{self.name} phase failed: {phase.name}", e)
+            timing.duration = time.perf_counter() - started - timing.started_at
+            return timing.status == "ok"
+
+        for phase in self.phases.values():
+            tasks[phase.name] = asyncio.create_task(run_phase(phase))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            self.total_duration = time.perf_counter() - started
+
+        self._log_breakdown()
+
+        for phase in self.phases.values():
+            timing = self.timings[phase.name]
+            if phase.critical and timing.status == "failed":
+                raise timing.error
+            if phase.critical and timing.status == "skipped":
+                raise RuntimeError(
+                    f"Critical startup phase {phase.name} skipped: a dependency failed"
+                )
+        return self.timings
+
+    def _validate(self) -> None:
+        """Reject unknown dependencies and dependency cycles"""
+        for phase in self.phases.values():
+            for dependency in phase.depends_on:
+                if dependency not in self.phases:
+                    raise ValueError(
+                        f"Startup phase {phase.name} depends on unknown phase {dependency}"
+                    )
+
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Startup phase dependency cycle at {name}")
+            visiting.add(name)
+            for dependency in self.phases[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.phases:
+            visit(name)
+
+    def _log_breakdown(self) -> None:
+        """Log each phase's start offset, duration and outcome"""
+        items = []
+        for name, timing in sorted(
+            self.timings.items(), key=lambda item: item[1].started_at
+        ):
+            if timing.status == "ok":
+                outcome = f"✅ {timing.duration:.2f}s (at +{timing.started_at:.2f}s)"
+            elif timing.status == "failed":
+                outcome = f"❌ failed after {timing.duration:.2f}s"
+            else:
+                outcome = "⏭️ skipped (dependency failed)"
+            items.append((name, outcome))
+        items.append(("total", f"{self.total_duration:.2f}s"))
+
+        log_perfect_tree_section(f"{self.name} - Phase Timing", items, "⏱️")
@@ -23,6 +23,7 @@
 # - Backup rotation with configurable retention
 # - Data integrity verification
 # - Emergency backup system
+# - Writes serialized across threads (completions are saved off the loop)
 #
 # File Structure:
 # /data/
@@ -37,9 +38,11 @@
 # - python-dotenv: Environment configuration
 # =============================================================================
 
+import functools
 import json
 import os
 import shutil
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -48,12 +51,28 @@ from typing import Any, Dict, Optional
 import pytz
 from dotenv import load_dotenv
 
+from .snapshot_store import SNAPSHOT_KIND_PARTIAL, get_snapshot_store
 from .tree_log import log_error_with_traceback, log_perfect_tree_section
 
 # Load environment variables from standardized location
 env_path = os.path.join(os.path.dirname(__file__), "..", "..", "config", ".env")
 load_dotenv(env_path)
 
+# Every StateManager shares one lock: read-modify-writes of the same files
+# (and their shared .tmp) run from worker threads as well as the event loop
+_state_write_lock = threading.RLock()
+
+
+def _serialized(method):
+    """Run a state-writing method under the shared write lock"""
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with _state_write_lock:
+            return method(*args, **kwargs)
+
+    return wrapper
+
 
 class StateManager:
     """
@@ -177,6 +196,7 @@ class StateManager:
             log_error_with_traceback("Error initializing StateManager", e)
             raise
 
+    @_serialized
     def save_playback_state(
         self,
         current_surah: int,
@@ -186,8 +206,14 @@ class StateManager:
         loop_enabled: bool = False,
         shuffle_enabled: bool = False,
         silent: bool = False,
+        position_running: bool = False,
     ) -> bool:
-        """Save current playback state"""
+        """
+        Save current playback state.
+
+        `position_running` marks a snapshot taken while the position was
+        advancing, so a restart can extrapolate from its timestamp.
+        """
         try:
             # Validate surah number
             if not (1 <= current_surah <= 114):
@@ -197,7 +223,7 @@ class StateManager:
                 )
                 return False
 
-            # Individual backup files disabled - using hourly ZIP backup system instead
+            # Individual backup files disabled - using hourly snapshot backups instead
 
             # Save new state
             state = {
@@ -207,6 +233,7 @@ class StateManager:
                 "is_playing": is_playing,
                 "loop_enabled": loop_enabled,
                 "shuffle_enabled": shuffle_enabled,
+                "position_running": position_running,
                 "timestamp": datetime.now(pytz.UTC).timestamp(),
             }
 
@@ -449,6 +476,7 @@ class StateManager:
             log_error_with_traceback("Unexpected error loading playback state", e)
             return self.default_playback_state.copy()
 
+    @_serialized
     def save_bot_stats(
         self,
         total_runtime: float = None,
@@ -482,7 +510,7 @@ class StateManager:
 
             # Create backup before saving (in temp directory to keep data/ clean)
             backup_file = self.temp_backup_dir / f"{self.bot_stats_file.stem}.backup"
-            # Individual backup files disabled - using hourly ZIP backup system instead
+            # Individual backup files disabled - using hourly snapshot backups instead
 
             validation_items = []
 
@@ -871,6 +899,7 @@ class StateManager:
             log_error_with_traceback("Error marking surah completion", e)
             return False
 
+    @_serialized
     def mark_disconnect(self) -> bool:
         """
         Mark bot disconnection in state.
@@ -939,6 +968,7 @@ class StateManager:
                 "should_resume": False,
             }
 
+    @_serialized
     def clear_state(self) -> bool:
         """
         Clear all saved state files for a fresh start.
@@ -978,17 +1008,19 @@ class StateManager:
 
     def backup_state(self, backup_name: str = None) -> bool:
         """
-        Create a timestamped backup of current state files.
+        Snapshot the current state files into the shared snapshot store.
 
-        Creates backup copies of all state files in a backups subdirectory
-        with optional custom naming. Useful for state preservation before
-        major updates or troubleshooting.
+        Uses the same content-addressed store as the hourly backups, so a
+        state file that hasn't changed since the last snapshot costs nothing
+        to back up again. These are partial snapshots, so restores default
+        to the latest hourly one. Useful for state preservation before major updates
+        or troubleshooting.
 
         Args:
-            backup_name: Custom backup name (optional, auto-generated if None)
+            backup_name: Snapshot label (optional, auto-generated if None)
 
         Returns:
-            bool: True if backup was created successfully, False otherwise
+            bool: True if the state was snapshotted successfully, False otherwise
         """
         try:
             if not backup_name:
@@ -1000,69 +1032,12 @@ class StateManager:
 
             backup_name = backup_name.strip()
 
-            backup_dir = self.data_dir / "backups"
-            backup_dir.mkdir(exist_ok=True)
-
-            files_backed_up = 0
-
-            # Copy state files to backup with error handling for each
-            if self.playback_state_file.exists():
-                try:
-                    backup_playback = backup_dir / f"{backup_name}_playback_state.json"
-                    backup_playback.write_text(
-                        self.playback_state_file.read_text(encoding="utf-8")
-                    )
-                    files_backed_up += 1
-                except Exception as e:
-                    log_error_with_traceback("Error backing up playback state", e)
-
-            if self.bot_stats_file.exists():
-                try:
-                    backup_stats = backup_dir / f"{backup_name}_bot_stats.json"
-                    backup_stats.write_text(
-                        self.bot_stats_file.read_text(encoding="utf-8")
-                    )
-                    files_backed_up += 1
-                except Exception as e:
-                    log_error_with_traceback("Error backing up bot stats", e)
-
-            if files_backed_up > 0:
-                # Calculate total backup size
-                total_backup_size = 0
-                backup_details = []
-
-                if self.playback_state_file.exists():
-                    backup_playback = backup_dir / f"{backup_name}_playback_state.json"
-                    if backup_playback.exists():
-                        size = backup_playback.stat().st_size
-                        total_backup_size += size
-                        backup_details.append(f"playback_state ({size} bytes)")
-
-                if self.bot_stats_file.exists():
-                    backup_stats = backup_dir / f"{backup_name}_bot_stats.json"
-                    if backup_stats.exists():
-                        size = backup_stats.stat().st_size
-                        total_backup_size += size
-                        backup_details.append(f"bot_stats ({size} bytes)")
-
-                log_perfect_tree_section(
-                    "State Backup - Success",
-                    [
-                        ("backup_name", f"📦 Backup: {backup_name}"),
-                        ("files_backed_up", f"💾 {files_backed_up} files backed up"),
-                        ("total_size", f"📊 Total size: {total_backup_size} bytes"),
-                        ("backup_details", f"📋 Files: {', '.join(backup_details)}"),
-                        ("backup_location", f"📁 Location: {backup_dir}"),
-                        (
-                            "timestamp",
-                            f"🕒 Created: {datetime.now().strftime('%Y-%m-%d %I:%M:%S %p')}",
-                        ),
-                        ("integrity_check", f"✅ All backups verified"),
-                    ],
-                    "💾",
-                )
-                return True
-            else:
+            state_files = [
+                path
+                for path in (self.playback_state_file, self.bot_stats_file)
+                if path.exists()
+            ]
+            if not state_files:
                 log_perfect_tree_section(
                     "State Backup - Warning",
                     [
@@ -1072,6 +1047,29 @@ class StateManager:
                 )
                 return False
 
+            # Partial snapshot: never the default restore target, and kept
+            # apart from the hourly retention
+            result = get_snapshot_store().snapshot(
+                state_files, reason=backup_name, kind=SNAPSHOT_KIND_PARTIAL
+            )
+            if result.failed:
+                return False
+
+            log_perfect_tree_section(
+                "State Backup - Success",
+                [
+                    ("backup_name", f"📦 Backup: {backup_name}"),
+                    (
+                        "snapshot",
+                        f"💾 {result.snapshot_id or 'Unchanged since last snapshot'}",
+                    ),
+                    ("files_backed_up", f"📁 {result.files} files"),
+                    ("new_data", f"📊 {result.bytes_stored} bytes stored"),
+                ],
+                "💾",
+            )
+            return True
+
         except (IOError, OSError) as e:
             log_error_with_traceback("File system error creating backup", e)
             return False
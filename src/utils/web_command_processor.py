@@ -7,100 +7,292 @@
 # =============================================================================
 
 import asyncio
+from collections import deque
+import ctypes
+import ctypes.util
 import json
 import os
+import struct
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Set
 
 import pytz
 
+from .scheduler import get_event_scheduler
 from .tree_log import log_error_with_traceback, log_perfect_tree_section
 
 
+# Queue layout: new commands land in QUEUE_DIR, finished ones are moved out so
+# the watched directory only ever holds work that still needs doing
+QUEUE_DIR = Path("web/command_queue")
+DONE_DIR_NAME = "done"
+FAILED_DIR_NAME = "failed"
+JOURNAL_FILE_NAME = "journal.jsonl"
+JOURNAL_MAX_ENTRIES = 500  # Entries kept after compaction
+
+# Polling fallback when inotify is unavailable (non-Linux hosts)
+WEB_COMMAND_JOB_NAME = "web_command_queue"
+WEB_COMMAND_POLL_SECONDS = 2
+PARTIAL_WRITE_GRACE_SECONDS = 5  # Unparseable files younger than this are retried
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """
+    Minimal inotify binding for a single directory via ctypes.
+
+    Reports the names of files that were fully written or moved into the
+    directory, without walking it. Only available on Linux; use
+    InotifyWatcher.is_supported() before constructing.
+    """
+
+    def __init__(self, directory: Path):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        wd = self._libc.inotify_add_watch(
+            self.fd, os.fsencode(str(directory)), IN_CLOSE_WRITE | IN_MOVED_TO
+        )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Check whether the platform libc exposes inotify"""
+        if not sys.platform.startswith("linux"):
+            return False
+        library = ctypes.util.find_library("c")
+        if not library:
+            return False
+        return hasattr(ctypes.CDLL(library), "inotify_init1")
+
+    def read_names(self) -> List[str]:
+        """Drain pending events and return the affected file names"""
+        names = []
+        while True:
+            try:
+                buffer = os.read(self.fd, 4096)
+            except BlockingIOError:
+                break
+            if not buffer:
+                break
+
+            offset = 0
+            while offset + _INOTIFY_EVENT_HEADER.size <= len(buffer):
+                _, _, _, name_length = _INOTIFY_EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _INOTIFY_EVENT_HEADER.size
+                name = buffer[offset:offset + name_length].rstrip(b"\0")
+                offset += name_length
+                if name:
+                    names.append(os.fsdecode(name))
+        return names
+
+    def close(self):
+        """Release the inotify file descriptor"""
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
 class WebCommandProcessor:
     """Processes commands sent from the web dashboard"""
     
-    def __init__(self, bot):
+    def __init__(self, bot, queue_dir: Path = QUEUE_DIR):
         self.bot = bot
-        self.queue_dir = Path("web/command_queue")
-        self.processing_task = None
+        self.queue_dir = Path(queue_dir)
+        self.done_dir = self.queue_dir / DONE_DIR_NAME
+        self.failed_dir = self.queue_dir / FAILED_DIR_NAME
+        self.journal_file = self.queue_dir / JOURNAL_FILE_NAME
         self.is_running = False
+        self.intake_mode = None  # "inotify" or "polling"
+
+        self._watcher: Optional[InotifyWatcher] = None
+        self._intake: Optional[asyncio.Queue] = None
+        self._queued_names: Set[str] = set()
+        self._consumer_task: Optional[asyncio.Task] = None
+        self._last_dir_mtime_ns: Optional[int] = None
+        self._journal_entries = 0
         
     def start_processing(self):
-        """Start the command processing loop"""
-        if not self.is_running:
-            self.is_running = True
-            self.processing_task = asyncio.create_task(self._processing_loop())
-            log_perfect_tree_section(
-                "Web Command Processor - Started",
-                [
-                    ("status", "🔄 Command processor running"),
-                    ("queue_directory", str(self.queue_dir)),
-                    ("check_interval", "5 seconds"),
-                ],
-                "🌐",
+        """Start event-driven intake of new command files"""
+        if self.is_running:
+            return
+
+        self.is_running = True
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self.done_dir.mkdir(exist_ok=True)
+        self.failed_dir.mkdir(exist_ok=True)
+        self._journal_entries = self._count_journal_entries()
+
+        self._intake = asyncio.Queue()
+        self._consumer_task = asyncio.create_task(self._consume_commands())
+
+        # Prefer inotify; fall back to a cheap mtime-gated poll
+        try:
+            if InotifyWatcher.is_supported():
+                self._watcher = InotifyWatcher(self.queue_dir)
+                asyncio.get_running_loop().add_reader(
+                    self._watcher.fd, self._on_inotify_readable
+                )
+                self.intake_mode = "inotify"
+        except Exception as e:
+            log_error_with_traceback("inotify unavailable for web command queue", e)
+            self._close_watcher()
+
+        if self._watcher is None:
+            self.intake_mode = "polling"
+            get_event_scheduler().schedule(
+                WEB_COMMAND_JOB_NAME,
+                self._poll_queue_directory,
+                interval_seconds=WEB_COMMAND_POLL_SECONDS,
+                retry_seconds=WEB_COMMAND_POLL_SECONDS,
             )
+
+        # Pick up anything written while the bot was offline
+        self._scan_queue_directory()
+
+        log_perfect_tree_section(
+            "Web Command Processor - Started",
+            [
+                ("status", "🔄 Command processor running"),
+                ("queue_directory", str(self.queue_dir)),
+                ("intake", "⚡ inotify" if self.intake_mode == "inotify" else f"🔁 Polling every {WEB_COMMAND_POLL_SECONDS}s"),
+                ("results", f"{self.done_dir.name}/, {self.failed_dir.name}/, {self.journal_file.name}"),
+            ],
+            "🌐",
+        )
     
     def stop_processing(self):
-        """Stop the command processing loop"""
+        """Stop command intake and processing"""
+        if not self.is_running:
+            return
+
         self.is_running = False
-        if self.processing_task:
-            self.processing_task.cancel()
-            log_perfect_tree_section(
-                "Web Command Processor - Stopped",
-                [
-                    ("status", "🛑 Command processor stopped"),
-                    ("reason", "Manual stop"),
-                ],
-                "🌐",
-            )
-    
-    async def _processing_loop(self):
-        """Main processing loop that checks for new commands"""
-        while self.is_running:
+        self._close_watcher()
+        get_event_scheduler().cancel(WEB_COMMAND_JOB_NAME)
+        if self._consumer_task:
+            self._consumer_task.cancel()
+            self._consumer_task = None
+
+        log_perfect_tree_section(
+            "Web Command Processor - Stopped",
+            [
+                ("status", "🛑 Command processor stopped"),
+                ("reason", "Manual stop"),
+            ],
+            "🌐",
+        )
+
+    def _close_watcher(self):
+        """Detach and close the inotify watcher if one is active"""
+        if self._watcher is None:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(self._watcher.fd)
+        except Exception:
+            pass
+        self._watcher.close()
+        self._watcher = None
+
+    # =========================================================================
+    # Intake
+    # =========================================================================
+
+    def _enqueue(self, name: str):
+        """Queue a command file by name, ignoring duplicates and non-commands"""
+        if not name.endswith(".json") or name in self._queued_names:
+            return
+        self._queued_names.add(name)
+        self._intake.put_nowait(name)
+
+    def _on_inotify_readable(self):
+        """Event loop reader callback for inotify events"""
+        try:
+            for name in self._watcher.read_names():
+                self._enqueue(name)
+        except Exception as e:
+            log_error_with_traceback("Error reading web command queue events", e)
+
+    def _scan_queue_directory(self):
+        """Queue every command file currently in the queue directory"""
+        try:
+            with os.scandir(self.queue_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        self._enqueue(entry.name)
+            self._last_dir_mtime_ns = self.queue_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            pass
+
+    async def _poll_queue_directory(self):
+        """Polling fallback: rescan only when the directory itself changed"""
+        try:
+            mtime_ns = self.queue_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime_ns != self._last_dir_mtime_ns:
+            self._scan_queue_directory()
+
+    async def _consume_commands(self):
+        """Process queued command files one at a time"""
+        while True:
             try:
-                await self._process_pending_commands()
-                await asyncio.sleep(5)  # Check every 5 seconds
+                name = await self._intake.get()
+                try:
+                    await self._process_command_file(self.queue_dir / name)
+                finally:
+                    self._queued_names.discard(name)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 log_error_with_traceback("Error in web command processing loop", e)
-                await asyncio.sleep(5)
-    
-    async def _process_pending_commands(self):
-        """Process all pending commands in the queue"""
+
+    async def _process_command_file(self, command_file: Path):
+        """Load a newly arrived command file and dispatch it"""
         try:
-            if not self.queue_dir.exists():
+            with open(command_file, 'r') as f:
+                command = json.load(f)
+        except FileNotFoundError:
+            return  # Already handled or withdrawn by the dashboard
+        except json.JSONDecodeError as e:
+            # The dashboard may still be writing it; polling will see it again
+            try:
+                age = datetime.now().timestamp() - command_file.stat().st_mtime
+            except FileNotFoundError:
                 return
-            
-            # Get all command files
-            command_files = list(self.queue_dir.glob("*.json"))
-            
-            for command_file in command_files:
-                try:
-                    with open(command_file, 'r') as f:
-                        command = json.load(f)
-                    
-                    # Only process pending commands
-                    if command.get("status") == "pending":
-                        await self._process_command(command, command_file)
-                        
-                except Exception as e:
-                    log_error_with_traceback(f"Error processing command file {command_file}", e)
-                    # Mark command as failed
-                    try:
-                        with open(command_file, 'r') as f:
-                            command = json.load(f)
-                        command["status"] = "failed"
-                        command["error"] = str(e)
-                        command["processed_at"] = datetime.now(pytz.UTC).isoformat()
-                        with open(command_file, 'w') as f:
-                            json.dump(command, f, indent=2)
-                    except:
-                        pass
-        except Exception as e:
-            log_error_with_traceback("Error processing pending commands", e)
+            if self.intake_mode == "polling" and age < PARTIAL_WRITE_GRACE_SECONDS:
+                self._last_dir_mtime_ns = None
+                return
+            log_error_with_traceback(f"Error processing command file {command_file}", e)
+            self._finalize_command(
+                {
+                    "id": command_file.stem,
+                    "status": "failed",
+                    "error": str(e),
+                    "processed_at": datetime.now(pytz.UTC).isoformat(),
+                },
+                command_file,
+            )
+            return
+
+        if command.get("status") == "pending":
+            await self._process_command(command, command_file)
+        else:
+            # Result left behind by the old in-place queue; just archive it
+            self._finalize_command(command, command_file)
     
     async def _process_command(self, command: Dict, command_file: Path):
         """Process a single command"""
@@ -141,8 +333,7 @@ class WebCommandProcessor:
             command["result"] = result
             command["processed_at"] = datetime.now(pytz.UTC).isoformat()
             
-            with open(command_file, 'w') as f:
-                json.dump(command, f, indent=2)
+            self._finalize_command(command, command_file)
             
             # Log successful processing
             if result.get("success"):
@@ -176,10 +367,79 @@ class WebCommandProcessor:
                 command["status"] = "failed"
                 command["error"] = str(e)
                 command["processed_at"] = datetime.now(pytz.UTC).isoformat()
-                with open(command_file, 'w') as f:
-                    json.dump(command, f, indent=2)
+                self._finalize_command(command, command_file)
             except:
                 pass
+
+    # =========================================================================
+    # Results
+    # =========================================================================
+
+    def _finalize_command(self, command: Dict, command_file: Path):
+        """Move a finished command out of the queue and journal its result"""
+        target_dir = self.done_dir if command.get("status") == "completed" else self.failed_dir
+        target_file = target_dir / command_file.name
+
+        temp_file = target_file.with_suffix(".tmp")
+        with open(temp_file, 'w') as f:
+            json.dump(command, f, indent=2)
+        temp_file.replace(target_file)
+        command_file.unlink(missing_ok=True)
+
+        self._append_journal_entry(
+            {
+                "id": command.get("id", command_file.stem),
+                "type": command.get("type"),
+                "status": command.get("status"),
+                "processed_at": command.get("processed_at"),
+                "message": (command.get("result") or {}).get("message"),
+                "error": command.get("error") or (command.get("result") or {}).get("error"),
+                "file": str(target_file.relative_to(self.queue_dir)),
+            }
+        )
+
+    def _count_journal_entries(self) -> int:
+        """Count journal lines once at startup"""
+        try:
+            with open(self.journal_file, 'rb') as f:
+                return sum(1 for _ in f)
+        except FileNotFoundError:
+            return 0
+
+    def _append_journal_entry(self, entry: Dict):
+        """Append a result line, compacting once the journal doubles its cap"""
+        try:
+            with open(self.journal_file, 'a') as f:
+                f.write(json.dumps(entry) + "\n")
+            self._journal_entries += 1
+
+            if self._journal_entries > JOURNAL_MAX_ENTRIES * 2:
+                self._compact_journal()
+        except Exception as e:
+            log_error_with_traceback("Error writing web command journal", e)
+
+    def _compact_journal(self):
+        """Keep only the most recent JOURNAL_MAX_ENTRIES journal lines"""
+        with open(self.journal_file, 'r') as f:
+            recent = deque(f, maxlen=JOURNAL_MAX_ENTRIES)
+
+        temp_file = self.journal_file.with_suffix(".tmp")
+        with open(temp_file, 'w') as f:
+            f.writelines(recent)
+        temp_file.replace(self.journal_file)
+        self._journal_entries = len(recent)
+
+    def get_recent_results(self, limit: int = 20) -> List[Dict]:
+        """Get the most recent command results from the journal"""
+        try:
+            with open(self.journal_file, 'r') as f:
+                recent = deque(f, maxlen=limit)
+            return [json.loads(line) for line in recent if line.strip()]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            log_error_with_traceback("Error reading web command journal", e)
+            return []
     
     async def _handle_quiz_send(self, command_data: Dict) -> Dict:
         """Handle quiz send command"""
@@ -11,6 +11,7 @@ import os
 import shutil
 import sys
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -21,6 +22,8 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from utils.audio_manager import AudioManager
+from utils.shuffle_playlist import ShufflePlaylistStore
+from utils.state_manager import StateManager
 
 
 @pytest.mark.asyncio
@@ -811,3 +814,332 @@ class TestAudioManager:
         await self.manager.start_playback()  # Should handle error gracefully
         assert not self.manager.is_playing
         assert self.manager.playback_task.done()
+
+
+@pytest.mark.asyncio
+class TestGaplessPrefetch:
+    """Test suite for next-track prefetch and handoff"""
+
+    @pytest.fixture(autouse=True)
+    async def setup_test(self):
+        """Create a manager over five empty tracks without background tasks"""
+        self.temp_dir = tempfile.mkdtemp()
+        reciter_dir = Path(self.temp_dir) / "audio" / "Test Reciter"
+        reciter_dir.mkdir(parents=True)
+        for i in range(1, 6):
+            (reciter_dir / f"{i:03d}.mp3").touch()
+
+        self.manager = AudioManager(
+            bot=None,
+            ffmpeg_path="/usr/local/bin/ffmpeg",
+            audio_base_folder=str(Path(self.temp_dir) / "audio"),
+            default_reciter="Test Reciter",
+            state_store=StateManager(data_dir=Path(self.temp_dir) / "data"),
+        )
+        self.manager.load_audio_files()
+        self.manager.current_file_index = 0
+        self.manager.opus_library.create_audio_source = MagicMock(
+            side_effect=lambda path: MagicMock(name=os.path.basename(path))
+        )
+
+        yield
+
+        shutil.rmtree(self.temp_dir)
+
+    async def test_prefetch_hands_over_next_track(self):
+        """The prepared source is used when the loop reaches that track"""
+        await self.manager._prefetch_next_track()
+        next_file = self.manager.current_audio_files[1]
+
+        source = self.manager._take_prefetched_source(1, next_file)
+        assert source is not None
+        self.manager.opus_library.create_audio_source.assert_called_once_with(
+            next_file
+        )
+        assert self.manager._prefetched_track is None
+
+    async def test_stale_prefetch_is_released(self):
+        """A skip or jump after prefetching discards the prepared source"""
+        await self.manager._prefetch_next_track()
+        prepared = self.manager._prefetched_track.source
+
+        other_file = self.manager.current_audio_files[3]
+        assert self.manager._take_prefetched_source(3, other_file) is None
+        prepared.cleanup.assert_called_once()
+
+    async def test_shuffle_pick_is_stable(self):
+        """The shuffled next index is chosen once and reused for the advance"""
+        self.manager.is_shuffle_enabled = True
+        first = self.manager._resolve_next_file_index()
+        assert all(
+            self.manager._resolve_next_file_index() == first for _ in range(20)
+        )
+
+    async def test_shuffle_follows_persisted_playlist(self):
+        """Shuffle plays every other track once, agreeing with the prefetch peek"""
+        self.manager.is_shuffle_enabled = True
+        self.manager.shuffle_playlists = ShufflePlaylistStore(
+            Path(self.temp_dir) / "shuffle_playlists.json"
+        )
+        self.manager.current_surah = 1
+
+        picks = []
+        for _ in range(4):
+            peeked = self.manager._resolve_next_file_index()
+            self.manager.current_file_index = self.manager._advance_shuffle_file_index()
+            assert self.manager.current_file_index == peeked
+            self.manager._update_current_surah()
+            picks.append(self.manager.current_file_index)
+
+        assert sorted(picks) == [1, 2, 3, 4]
+
+    async def test_shuffle_cycles_are_permutations(self):
+        """Crossing a cycle boundary neither replays nor skips a surah"""
+        self.manager.is_shuffle_enabled = True
+        for attempt in range(5):
+            self.manager.shuffle_playlists = ShufflePlaylistStore(
+                Path(self.temp_dir) / f"shuffle_{attempt}.json"
+            )
+            self.manager.current_file_index = 0
+            self.manager.current_surah = 1
+
+            played = [1]
+            for _ in range(14):
+                peeked = self.manager._resolve_next_file_index()
+                self.manager.current_file_index = (
+                    self.manager._advance_shuffle_file_index()
+                )
+                assert self.manager.current_file_index == peeked
+                self.manager._update_current_surah()
+                played.append(self.manager.current_surah)
+
+            cycles = [played[i : i + 5] for i in range(0, 15, 5)]
+            assert all(sorted(cycle) == [1, 2, 3, 4, 5] for cycle in cycles), cycles
+
+    async def test_loop_and_wraparound(self):
+        """Loop mode repeats the track and the last track wraps to the first"""
+        self.manager.is_loop_enabled = True
+        assert self.manager._resolve_next_file_index() == 0
+
+        self.manager.is_loop_enabled = False
+        self.manager.current_file_index = 4
+        assert self.manager._resolve_next_file_index() == 0
+
+    async def test_missing_next_file_skips_prefetch(self):
+        """Unreadable files are left for the handoff to report"""
+        os.remove(self.manager.current_audio_files[1])
+        await self.manager._prefetch_next_track()
+        assert self.manager._prefetched_track is None
+
+
+@pytest.mark.asyncio
+class TestTrackCompletion:
+    """Test suite for `after`-driven track completion and on-demand position"""
+
+    @pytest.fixture(autouse=True)
+    async def setup_test(self):
+        """Create a manager without background tasks or audio files"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = AudioManager(
+            bot=None,
+            ffmpeg_path="/usr/local/bin/ffmpeg",
+            audio_base_folder=self.temp_dir,
+            default_reciter="Test Reciter",
+            state_store=StateManager(data_dir=Path(self.temp_dir) / "data"),
+        )
+        self.manager.voice_client = MagicMock(spec=discord.VoiceClient)
+        self.manager.voice_client.is_paused.return_value = False
+
+        yield
+
+        shutil.rmtree(self.temp_dir)
+
+    async def test_after_callback_from_player_thread(self):
+        """The player thread's `after` call wakes the waiting loop"""
+        finished = asyncio.Event()
+        after = self.manager._make_after_callback(finished)
+
+        await asyncio.to_thread(after, None)
+        await asyncio.wait_for(finished.wait(), timeout=1)
+        assert self.manager._track_error is None
+
+    async def test_watchdog_stops_overrunning_track(self):
+        """A track that outlives its duration plus grace is force-stopped"""
+        self.manager.playback_clock.track_started(0.0)
+        with (
+            patch.object(self.manager, "_get_current_file_duration", return_value=0.2),
+            patch("utils.audio_manager.WATCHDOG_GRACE_SECONDS", 0),
+        ):
+            completed = await self.manager._wait_for_track_end(asyncio.Event())
+
+        assert completed is False
+        self.manager.voice_client.stop.assert_called_once()
+
+    async def test_position_computed_on_demand(self):
+        """Position follows the last playback event and each event saves it"""
+        with patch.object(self.manager.state_manager, "save_playback_state") as save:
+            self.manager.playback_clock.track_started(42.0)
+            assert self.manager.get_current_position() == pytest.approx(42, abs=0.5)
+
+            await self.manager.pause_playback()
+            paused_at = self.manager.get_current_position()
+            await asyncio.sleep(0.05)
+            assert self.manager.get_current_position() == paused_at
+
+            await self.manager.stop_playback()
+            assert self.manager.current_position == paused_at
+
+        assert [call.kwargs["position_running"] for call in save.call_args_list] == [
+            True,
+            False,
+            False,
+        ]
+        assert save.call_args_list[-1].kwargs["is_playing"] is False
+
+    async def test_completion_recorded_off_the_event_loop(self):
+        """The stats write runs in a worker thread, not on the loop"""
+        loop_thread = threading.get_ident()
+        writer_threads = []
+        self.manager.state_manager = MagicMock()
+        self.manager.state_manager.mark_surah_completed.side_effect = (
+            lambda: writer_threads.append(threading.get_ident())
+        )
+
+        await self.manager._run_in_background(
+            self.manager._record_track_completed("001.mp3", 1)
+        )
+
+        assert writer_threads and writer_threads[0] != loop_thread
+
+
+@pytest.mark.asyncio
+class TestListenerClients:
+    """Test suite for relaying one decoded stream to extra voice clients"""
+
+    @pytest.fixture(autouse=True)
+    async def setup_test(self):
+        """Create a manager mid-track on a broadcast of numbered frames"""
+        from utils.broadcast_audio import BroadcastAudioSource
+
+        class NumberedOpusSource(discord.AudioSource):
+            def __init__(self, frames):
+                self.frames = frames
+                self.reads = 0
+
+            def read(self):
+                if self.reads >= self.frames:
+                    return b""
+                self.reads += 1
+                return f"frame-{self.reads}".encode()
+
+            def is_opus(self):
+                return True
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = AudioManager(
+            bot=None,
+            ffmpeg_path="/usr/local/bin/ffmpeg",
+            audio_base_folder=self.temp_dir,
+            default_reciter="Test Reciter",
+            state_store=StateManager(data_dir=Path(self.temp_dir) / "data"),
+        )
+        self.upstream = NumberedOpusSource(frames=5)
+        self.manager._broadcast = BroadcastAudioSource(self.upstream)
+        self.manager.voice_client = MagicMock(spec=discord.VoiceClient)
+        self.manager.voice_client.play(self.manager._broadcast.subscribe())
+        self.manager.is_playing = True
+
+        yield
+
+        shutil.rmtree(self.temp_dir)
+
+    def make_listener(self):
+        listener = MagicMock(spec=discord.VoiceClient)
+        listener.channel = MagicMock()
+        listener.is_connected.return_value = True
+        listener.is_playing.return_value = False
+        listener.is_paused.return_value = False
+        return listener
+
+    async def test_two_listeners_share_one_decode(self):
+        """Both subscribers receive every frame from a single upstream read"""
+        listeners = [self.make_listener(), self.make_listener()]
+        for listener in listeners:
+            self.manager.add_listener_client(listener)
+
+        primary = self.manager.voice_client.play.call_args.args[0]
+        subscribers = [primary] + [
+            listener.play.call_args.args[0] for listener in listeners
+        ]
+        received = [[] for _ in subscribers]
+        for _ in range(6):
+            for frames, subscriber in zip(received, subscribers):
+                frames.append(subscriber.read())
+
+        expected = [f"frame-{n}".encode() for n in range(1, 6)] + [b""]
+        assert received == [expected] * 3
+        assert self.upstream.reads == 5
+        assert self.manager.listener_clients == set(listeners)
+
+    async def test_removed_listener_is_stopped(self):
+        """Removing a listener stops its playback and forgets it"""
+        listener = self.make_listener()
+        self.manager.add_listener_client(listener)
+        listener.is_playing.return_value = True
+
+        self.manager.remove_listener_client(listener)
+
+        listener.stop.assert_called_once()
+        assert listener not in self.manager.listener_clients
+
+
+@pytest.mark.asyncio
+class TestWeightedShuffleDurations:
+    """Test suite for reading shuffle weights without blocking the loop"""
+
+    @pytest.fixture(autouse=True)
+    async def setup_test(self):
+        """Create a manager in weighted shuffle mode over three surahs"""
+        from utils.shuffle_playlist import ShuffleMode
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = AudioManager(
+            bot=None,
+            ffmpeg_path="/usr/local/bin/ffmpeg",
+            audio_base_folder=self.temp_dir,
+            default_reciter="Test Reciter",
+            state_store=StateManager(data_dir=Path(self.temp_dir) / "data"),
+            shuffle_mode=ShuffleMode.WEIGHTED_BY_DURATION,
+        )
+        self.manager.shuffle_playlists = ShufflePlaylistStore(
+            Path(self.temp_dir) / "shuffle.json"
+        )
+        self.files = {n: f"{self.temp_dir}/{n:03d}.mp3" for n in (1, 2, 3)}
+        self.manager.current_audio_files = list(self.files.values())
+        self.manager.current_surah = 1
+
+        yield
+
+        shutil.rmtree(self.temp_dir)
+
+    async def test_durations_read_in_background_thread(self):
+        """The playlist uses cached durations; missing ones load off the loop"""
+        loop_thread = threading.get_ident()
+        reader_threads = set()
+
+        def get_duration(path):
+            reader_threads.add(threading.get_ident())
+            return 60.0 * int(Path(path).stem)
+
+        with (
+            patch.object(self.manager.catalog, "get_surahs", return_value=self.files),
+            patch.object(self.manager.catalog, "get_duration", side_effect=get_duration),
+        ):
+            playlist = self.manager._get_shuffle_playlist()
+            assert playlist.durations == {}
+            await self.manager._duration_warmup
+
+            playlist = self.manager._get_shuffle_playlist()
+
+        assert reader_threads and loop_thread not in reader_threads
+        assert playlist.durations == {1: 60.0, 2: 120.0, 3: 180.0}
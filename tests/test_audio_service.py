@@ -30,6 +30,7 @@ from src.data.models import (
 )
 from src.services.audio_service import AudioService
 from src.services.metadata_cache import MetadataCache
+from src.utils.shuffle_playlist import ShufflePlaylistStore
 
 # =============================================================================
 # Test Fixtures
@@ -181,7 +182,6 @@ class TestAudioServiceInitialization:
         # Mock active playback task
         audio_service._playback_task = AsyncMock()
         audio_service._monitoring_task = AsyncMock()
-        audio_service._position_save_task = AsyncMock()
 
         # Mock voice client
         mock_voice_client = AsyncMock()
@@ -482,6 +482,33 @@ class TestStateAndInfoRetrieval:
         assert state.current_reciter == "Test Reciter"
         assert state.last_updated is not None
 
+    @pytest.mark.asyncio
+    async def test_playback_status_snapshot(self, audio_service):
+        """Control panel status is rebuilt on state changes, not on read"""
+        audio_service._available_reciters = [
+            ReciterInfo(
+                name="Test Reciter",
+                folder_name="Test Reciter",
+                total_surahs=100,
+                file_count=100,
+            )
+        ]
+        audio_service._current_state.current_reciter = "Test Reciter"
+        await audio_service.set_surah(5)
+        await audio_service.set_playback_mode(PlaybackMode.LOOP_TRACK)
+
+        status = audio_service.get_playback_status()
+        assert status["current_surah"] == 5
+        assert status["is_loop_enabled"] is True
+        assert status["is_shuffle_enabled"] is False
+        assert status["total_tracks"] == 100
+        assert status["available_reciters"] == ["Test Reciter"]
+        assert status["current_time"] == 0.0
+
+        # Direct state edits are not picked up until the next state change
+        audio_service._current_state.current_position.surah_number = 9
+        assert audio_service.get_playback_status()["current_surah"] == 5
+
     @pytest.mark.asyncio
     async def test_get_available_reciters(self, audio_service):
         """Test getting available reciters"""
@@ -601,6 +628,36 @@ class TestPlaybackLoop:
             "Voice client disconnected, stopping playback"
         )
 
+    @pytest.mark.asyncio
+    async def test_resume_past_end_of_track_skips_ahead(
+        self, audio_service, mock_cache
+    ):
+        """A saved position at the end of the track never seeks past EOF"""
+        audio_service._voice_client = Mock()
+        audio_service._voice_client.is_connected.return_value = True
+        audio_service._current_state.current_position.position_seconds = 95.0
+        mock_cache.get_file_info.return_value = Mock(duration_seconds=100.0)
+
+        def disconnect():
+            audio_service._voice_client = None
+
+        with (
+            patch.object(
+                audio_service,
+                "_get_current_audio_file_path",
+                AsyncMock(return_value=Path("001.mp3")),
+            ),
+            patch.object(
+                audio_service, "_advance_to_next_track", AsyncMock(side_effect=disconnect)
+            ) as advance,
+            patch.object(audio_service, "_create_audio_source", AsyncMock()) as create,
+        ):
+            await audio_service._playback_loop()
+
+        advance.assert_awaited_once()
+        create.assert_not_called()
+        assert audio_service._current_state.current_position.position_seconds == 0.0
+
     @pytest.mark.asyncio
     async def test_advance_to_next_track_normal_mode(self, audio_service):
         """Test advancing to next track in normal mode"""
@@ -629,23 +686,19 @@ class TestPlaybackLoop:
         """Test advancing to next track in shuffle mode"""
         audio_service._current_state.mode = PlaybackMode.SHUFFLE
         audio_service._current_state.current_position.surah_number = 1
-
-        # Mock reciter info
-        reciter_info = ReciterInfo(
-            name="Test Reciter",
-            folder_name="Test Reciter",
-            total_surahs=3,
-            file_count=3,
+        audio_service._shuffle_playlists = ShufflePlaylistStore(
+            audio_config.audio_base_folder.parent / "shuffle_playlists.json"
         )
 
-        with patch.object(audio_service, "_get_reciter_info") as mock_get_reciter:
-            with patch("random.choice") as mock_choice:
-                mock_get_reciter.return_value = reciter_info
-                mock_choice.return_value = 3
-
-                await audio_service._advance_to_next_track()
+        # Every surah plays once before any repeats
+        played = []
+        for _ in range(3):
+            await audio_service._advance_to_next_track()
+            played.append(audio_service._current_state.current_position.surah_number)
 
-                assert audio_service._current_state.current_position.surah_number == 3
+        assert 1 not in played[:2]
+        assert sorted(played[:2]) == [2, 3]
+        assert played[2] != played[1]
 
     @pytest.mark.asyncio
     async def test_advance_to_next_track_loop_track_mode(self, audio_service):
@@ -0,0 +1,111 @@
+# =============================================================================
+# QuranBot - Broadcast Audio Tests
+# =============================================================================
+# Tests for the single-decode fan-out source: shared upstream reads,
+# mid-track joins, lagging subscribers and upstream release.
+# =============================================================================
+
+from unittest.mock import MagicMock, patch
+
+import discord
+
+from src.utils import broadcast_audio
+from src.utils.broadcast_audio import BroadcastAudioSource
+
+
+class FakeOpusSource(discord.AudioSource):
+    """Upstream that yields a fixed number of numbered frames"""
+
+    def __init__(self, frames: int, opus: bool = True):
+        self.frames = frames
+        self.opus = opus
+        self.reads = 0
+        self.cleaned_up = False
+
+    def read(self) -> bytes:
+        if self.reads >= self.frames:
+            return b""
+        self.reads += 1
+        return f"frame-{self.reads}".encode()
+
+    def is_opus(self) -> bool:
+        return self.opus
+
+    def cleanup(self) -> None:
+        self.cleaned_up = True
+
+
+def drain(subscriber) -> list[bytes]:
+    """Read a subscriber until the end of the track"""
+    frames = []
+    while frame := subscriber.read():
+        frames.append(frame)
+    return frames
+
+
+class TestBroadcastAudioSource:
+    """Test cases for BroadcastAudioSource"""
+
+    def test_upstream_read_once_for_all_subscribers(self):
+        """Every subscriber gets every frame from a single upstream read"""
+        upstream = FakeOpusSource(frames=10)
+        broadcast = BroadcastAudioSource(upstream)
+        subscribers = [broadcast.subscribe() for _ in range(5)]
+
+        # Interleave reads the way independent player threads would
+        results = [[] for _ in subscribers]
+        for _ in range(10):
+            for result, subscriber in zip(results, subscribers):
+                result.append(subscriber.read())
+
+        assert upstream.reads == 10
+        assert all(result == results[0] for result in results)
+        assert all(subscriber.is_opus() for subscriber in subscribers)
+
+    def test_late_subscriber_joins_at_live_edge(self):
+        """A subscriber added mid-track starts at the newest frame"""
+        broadcast = BroadcastAudioSource(FakeOpusSource(frames=6))
+        first = broadcast.subscribe()
+        for _ in range(4):
+            first.read()
+
+        late = broadcast.subscribe()
+        assert drain(late) == [b"frame-5", b"frame-6"]
+        assert drain(first) == [b"frame-5", b"frame-6"]
+        assert broadcast.upstream.reads == 6
+
+    def test_lagging_subscriber_skips_ahead(self):
+        """Subscribers behind the buffer resume from the oldest kept frame"""
+        broadcast = BroadcastAudioSource(FakeOpusSource(frames=20), buffer_frames=3)
+        leader, lagging = broadcast.subscribe(), broadcast.subscribe()
+        for _ in range(10):
+            leader.read()
+
+        assert lagging.read() == b"frame-8"
+
+    def test_upstream_released_with_last_subscriber(self):
+        """Disconnecting every subscriber stops the upstream source"""
+        upstream = FakeOpusSource(frames=5)
+        broadcast = BroadcastAudioSource(upstream)
+        first, second = broadcast.subscribe(), broadcast.subscribe()
+
+        first.cleanup()
+        assert not upstream.cleaned_up
+        assert broadcast.subscriber_count == 1
+
+        second.cleanup()
+        assert upstream.cleaned_up
+        assert broadcast.ended
+
+    def test_pcm_upstream_encoded_once(self):
+        """PCM frames are Opus-encoded once, not per subscriber"""
+        encoder = MagicMock()
+        encoder.encode.side_effect = lambda pcm, frame_size: b"opus:" + pcm
+        with patch.object(broadcast_audio, "Encoder", return_value=encoder) as cls:
+            cls.SAMPLES_PER_FRAME = 960
+            broadcast = BroadcastAudioSource(FakeOpusSource(frames=3, opus=False))
+            subscribers = [broadcast.subscribe() for _ in range(4)]
+            for subscriber in subscribers:
+                assert drain(subscriber)[0] == b"opus:frame-1"
+
+        assert encoder.encode.call_count == 3
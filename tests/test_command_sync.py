@@ -0,0 +1,91 @@
+# =============================================================================
+# QuranBot - Command Tree Sync Tests
+# =============================================================================
+# Tests for hash-gated slash command syncing: stable fingerprints, skipped
+# syncs for unchanged trees and forced syncs.
+# =============================================================================
+
+from pathlib import Path
+import tempfile
+from unittest.mock import AsyncMock
+
+import discord
+from discord import app_commands
+import pytest
+
+from src.utils.command_sync import command_tree_fingerprint, sync_command_tree
+
+
+def build_tree(*commands, application_id=1234):
+    """A command tree with the given commands and a mocked sync()"""
+    client = discord.Client(intents=discord.Intents.none())
+    client._connection.application_id = application_id
+    tree = app_commands.CommandTree(client)
+    for command in commands:
+        tree.add_command(command)
+    tree.sync = AsyncMock(return_value=[])
+    return tree
+
+
+def make_command(name, description="A command"):
+    """A slash command with one option"""
+
+    async def callback(interaction: discord.Interaction, surah: int):
+        pass
+
+    return app_commands.Command(name=name, description=description, callback=callback)
+
+
+@pytest.fixture
+def state_file():
+    """Provide a temporary command sync state file"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir) / "command_sync.json"
+
+
+class TestCommandTreeFingerprint:
+    """Test cases for command_tree_fingerprint"""
+
+    def test_fingerprint_ignores_registration_order(self):
+        """The same commands in any order hash the same"""
+        first = build_tree(make_command("verse"), make_command("credits"))
+        second = build_tree(make_command("credits"), make_command("verse"))
+        assert command_tree_fingerprint(first) == command_tree_fingerprint(second)
+
+    def test_fingerprint_tracks_definitions(self):
+        """Changing a description changes the fingerprint"""
+        before = build_tree(make_command("verse"))
+        after = build_tree(make_command("verse", description="Send a verse"))
+        assert command_tree_fingerprint(before) != command_tree_fingerprint(after)
+
+
+class TestSyncCommandTree:
+    """Test cases for sync_command_tree"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_tree_skips_sync(self, state_file):
+        """Only the first sync of an unchanged tree reaches Discord"""
+        tree = build_tree(make_command("verse"))
+        assert await sync_command_tree(tree, force=False, state_file=state_file)
+
+        restarted = build_tree(make_command("verse"))
+        assert not await sync_command_tree(restarted, force=False, state_file=state_file)
+        restarted.sync.assert_not_awaited()
+
+        changed = build_tree(make_command("verse"), make_command("credits"))
+        assert await sync_command_tree(changed, force=False, state_file=state_file)
+        changed.sync.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_force_and_new_application_sync(self, state_file):
+        """Forcing or switching applications always syncs"""
+        await sync_command_tree(build_tree(make_command("verse")), False, state_file)
+
+        assert await sync_command_tree(
+            build_tree(make_command("verse")), force=True, state_file=state_file
+        )
+        assert await sync_command_tree(
+            build_tree(make_command("verse"), application_id=5678),
+            force=False,
+            state_file=state_file,
+        )
@@ -6,6 +6,7 @@ covering all functionality including service registration, resolution,
 error handling, and edge cases.
 """
 
+import asyncio
 import threading
 import time
 from typing import Protocol
@@ -16,6 +17,7 @@ import pytest
 from src.core.di_container import (
     CircularDependencyError,
     DIContainer,
+    DIError,
     ServiceNotRegisteredError,
     ServiceRegistrationError,
 )
@@ -471,3 +473,118 @@ class TestDIContainerEdgeCases:
         assert service1.get_value() == "container1"
         assert service2.get_value() == "container2"
         assert service1 is not service2
+
+
+class TestDIContainerResolutionCache:
+    """Test the lock-free singleton cache, async factories and validation."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.container = DIContainer()
+
+    def test_built_singletons_skip_the_lock(self):
+        """Once built, a singleton is served without taking the lock."""
+        self.container.register_singleton(
+            ITestService, lambda: MockTestService("cached")
+        )
+        service = self.container.get(ITestService)
+
+        class FailingLock:
+            def __enter__(self):
+                raise AssertionError("lock taken on cached lookup")
+
+            def __exit__(self, *args):
+                return False
+
+        self.container._lock = FailingLock()
+        assert self.container.get(ITestService) is service
+
+    @pytest.mark.asyncio
+    async def test_async_factory_runs_once(self):
+        """Concurrent get_async() calls share one async construction."""
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return MockTestService("async")
+
+        self.container.register_singleton(ITestService, factory)
+
+        with pytest.raises(DIError):
+            self.container.get(ITestService)
+
+        first, second = await asyncio.gather(
+            self.container.get_async(ITestService),
+            self.container.get_async(ITestService),
+        )
+        assert first is second and calls == 1
+        assert self.container.get(ITestService) is first
+
+    @pytest.mark.asyncio
+    async def test_async_circular_dependency_detection(self):
+        """Async factories that depend on each other fail instead of deadlocking."""
+
+        async def factory_a():
+            return MockCircularServiceA(
+                await self.container.get_async(ICircularServiceB)
+            )
+
+        async def factory_b():
+            return MockCircularServiceB(
+                await self.container.get_async(ICircularServiceA)
+            )
+
+        self.container.register_singleton(ICircularServiceA, factory_a)
+        self.container.register_singleton(ICircularServiceB, factory_b)
+
+        with pytest.raises(CircularDependencyError) as exc_info:
+            await self.container.get_async(ICircularServiceA)
+
+        assert "ICircularServiceA -> ICircularServiceB -> ICircularServiceA" in str(
+            exc_info.value
+        )
+
+    @pytest.mark.asyncio
+    async def test_validate_resolves_graph_and_reports_failures(self):
+        """validate() builds every singleton and lists the ones that fail."""
+        self.container.register_singleton(ITestService, MockTestService("instance"))
+        self.container.register_singleton(
+            IDependentService,
+            lambda: MockDependentService(self.container.get(ITestService)),
+        )
+
+        timings = await self.container.validate()
+
+        assert set(timings) == {"ITestService", "IDependentService"}
+        assert all(seconds >= 0 for seconds in timings.values())
+
+        def failing_factory():
+            raise ValueError("missing config")
+
+        self.container.register_singleton(ICircularServiceA, failing_factory)
+        with pytest.raises(DIError, match="ICircularServiceA: missing config"):
+            await self.container.validate()
+
+    @pytest.mark.asyncio
+    async def test_validate_drops_failing_optional_services(self):
+        """An optional singleton that fails is unregistered, not fatal."""
+        self.container.register_singleton(ITestService, MockTestService("instance"))
+
+        def failing_factory():
+            raise ValueError("webhook unreachable")
+
+        self.container.register_singleton(
+            ICircularServiceA, failing_factory, optional=True
+        )
+
+        timings = await self.container.validate()
+
+        assert set(timings) == {"ITestService"}
+        assert self.container.optional_failures == {
+            "ICircularServiceA": "webhook unreachable"
+        }
+        assert not self.container.is_registered(ICircularServiceA)
+        with pytest.raises(ServiceNotRegisteredError):
+            self.container.get(ICircularServiceA)
@@ -0,0 +1,134 @@
+# =============================================================================
+# QuranBot - Discord API Monitor Tests
+# =============================================================================
+# Tests for the rolling API aggregates that back health snapshots and
+# metric summaries without rescanning the raw call history.
+# =============================================================================
+
+from pathlib import Path
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils import discord_api_monitor as dam
+from src.utils.scheduler import EventScheduler
+
+
+@pytest.fixture
+def monitor():
+    """Provide a monitor backed by a temporary data file and scheduler"""
+    scheduler = EventScheduler(state_file=None)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_dir = Path(temp_dir)
+        with (
+            patch.object(dam, "DATA_DIR", data_dir),
+            patch.object(dam, "MONITOR_DATA_FILE", data_dir / "monitor.json"),
+            patch.object(dam, "get_event_scheduler", return_value=scheduler),
+        ):
+            bot = MagicMock()
+            bot.latency = 0.05
+            yield dam.DiscordAPIMonitor(bot)
+
+
+def record_call(monitor, endpoint, response_time, status_code=200, timestamp=None):
+    """Record an API call as monitored_request would"""
+    metric = dam.APICallMetric(
+        timestamp=timestamp if timestamp is not None else dam.time.time(),
+        endpoint=endpoint,
+        method="GET",
+        response_time=response_time,
+        status_code=status_code,
+    )
+    monitor.api_metrics.append(metric)
+    monitor.aggregates.record(
+        metric.timestamp, endpoint, response_time, status_code >= 400
+    )
+
+
+class TestRollingAPIAggregates:
+    """Test cases for RollingAPIAggregates"""
+
+    def test_calls_share_a_bucket(self):
+        """Calls within one bucket width update the same bucket"""
+        aggregates = dam.RollingAPIAggregates(bucket_seconds=60)
+        aggregates.record(120.0, "/a", 0.2, False)
+        aggregates.record(150.0, "/b", 0.4, True)
+        aggregates.record(190.0, "/a", 3.0, False)
+
+        assert len(aggregates.buckets) == 2
+        totals, endpoints = aggregates.summarize(0)
+        assert totals.count == 3
+        assert totals.error_count == 1
+        assert endpoints["/a"].count == 2
+        assert sum(totals.histogram) == 3
+
+    def test_summarize_respects_window(self):
+        """Buckets that ended before the window start are skipped"""
+        aggregates = dam.RollingAPIAggregates(bucket_seconds=60)
+        aggregates.record(0.0, "/old", 0.1, False)
+        aggregates.record(600.0, "/new", 0.1, False)
+
+        totals, endpoints = aggregates.summarize(300.0)
+        assert totals.count == 1
+        assert list(endpoints) == ["/new"]
+
+    def test_prune_and_capacity(self):
+        """Old buckets are pruned and the deque never exceeds its cap"""
+        aggregates = dam.RollingAPIAggregates(bucket_seconds=60, max_buckets=3)
+        for minute in range(5):
+            aggregates.record(minute * 60.0, "/a", 0.1, False)
+        assert len(aggregates.buckets) == 3
+
+        aggregates.prune(240.0)
+        assert [b.start for b in aggregates.buckets] == [240.0]
+
+
+class TestDiscordAPIMonitor:
+    """Test cases for DiscordAPIMonitor"""
+
+    def test_summary_from_aggregates(self, monitor):
+        """The summary keeps its keys and adds a latency histogram"""
+        record_call(monitor, "/fast", 0.03)
+        record_call(monitor, "/fast", 0.07)
+        record_call(monitor, "/slow", 4.0, status_code=500)
+
+        summary = monitor.get_api_metrics_summary(hours=1)
+        assert summary["total_calls"] == 3
+        assert summary["error_rate"] == pytest.approx(1 / 3)
+        assert summary["slowest_endpoint"] == "/slow"
+        assert summary["most_used_endpoint"] == "/fast"
+        assert summary["latency_histogram"]["<=0.05s"] == 1
+        assert summary["latency_histogram"]["<=5.0s"] == 1
+
+    def test_health_snapshot_uses_recent_window(self, monitor):
+        """Health ignores calls older than the health window"""
+        old = dam.time.time() - dam.HEALTH_WINDOW_SECONDS - 2 * dam.BUCKET_SECONDS
+        record_call(monitor, "/old", 9.0, status_code=500, timestamp=old)
+        record_call(monitor, "/new", 0.1)
+
+        monitor._update_health_status()
+        health = monitor.health_history[-1]
+        assert health.error_rate == 0.0
+        assert health.avg_response_time == pytest.approx(0.1)
+
+    def test_aggregates_rebuilt_on_load(self, monitor):
+        """Saved API metrics repopulate the aggregates on restart"""
+        record_call(monitor, "/a", 0.2)
+        monitor._save_data()
+
+        with patch.object(dam, "get_event_scheduler") as get_scheduler:
+            get_scheduler.return_value = EventScheduler(state_file=None)
+            restarted = dam.DiscordAPIMonitor(MagicMock())
+
+        assert restarted.get_api_metrics_summary()["total_calls"] == 1
+
+    def test_jobs_registered_and_cancelled(self, monitor):
+        """Periodic work runs as scheduler jobs that stop() removes"""
+        scheduler = dam.get_event_scheduler()
+        for job_name in (dam.HEALTH_JOB_NAME, dam.SAVE_JOB_NAME, dam.CLEANUP_JOB_NAME):
+            assert scheduler.get_job(job_name) is not None
+
+        monitor.stop()
+        for job_name in (dam.HEALTH_JOB_NAME, dam.SAVE_JOB_NAME, dam.CLEANUP_JOB_NAME):
+            assert scheduler.get_job(job_name) is None
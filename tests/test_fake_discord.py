@@ -0,0 +1,145 @@
+# =============================================================================
+# QuranBot - Fake Discord Backend Tests
+# =============================================================================
+# Tests for the offline Discord stand-in used by tools/load_test.py: gateway
+# events reaching real handlers, REST and interaction responses, role edits
+# echoed back and audio streamed into the voice sink.
+# =============================================================================
+
+import asyncio
+import io
+
+import discord
+from discord.ext import commands
+import pytest
+
+from tools.fake_discord import FakeDiscordBackend, FakeGuildLayout
+
+GUILD_ID = 1000
+VOICE_CHANNEL_ID = 2000
+TEXT_CHANNEL_ID = 3000
+ROLE_ID = 4000
+
+
+@pytest.fixture
+async def connected():
+    """A plain bot connected to a fake guild"""
+    intents = discord.Intents.default()
+    intents.message_content = True
+    intents.voice_states = True
+    bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
+    backend = FakeDiscordBackend(
+        FakeGuildLayout(
+            guild_id=GUILD_ID,
+            voice_channel_ids=[VOICE_CHANNEL_ID],
+            text_channel_ids=[TEXT_CHANNEL_ID],
+            role_ids=[ROLE_ID],
+            member_count=20,
+        ),
+        voice_speed=100,
+    )
+    await backend.connect(bot)
+    yield bot, backend
+    await bot.close()
+    backend.uninstall()
+
+
+async def settle():
+    await asyncio.sleep(0.05)
+
+
+class AnswerView(discord.ui.View):
+    def __init__(self, answers):
+        super().__init__(timeout=None)
+        self.answers = answers
+
+    @discord.ui.button(label="A", custom_id="quiz_choice_A")
+    async def choose(self, interaction: discord.Interaction, button):
+        self.answers.append(interaction.user.id)
+        await interaction.response.send_message("Recorded", ephemeral=True)
+
+
+class TestFakeDiscordBackend:
+    """Test cases for FakeDiscordBackend"""
+
+    async def test_connect_delivers_ready_guild(self, connected):
+        """The bot logs in and sees the fake guild"""
+        bot, backend = connected
+
+        assert bot.is_ready()
+        guild = bot.get_guild(GUILD_ID)
+        assert guild.get_channel(VOICE_CHANNEL_ID) is not None
+        assert guild.get_role(ROLE_ID) is not None
+        assert backend.rest.calls["GET /users/@me"] == 1
+
+    async def test_voice_states_reach_handlers(self, connected):
+        """Joins and leaves fire on_voice_state_update with real members"""
+        bot, backend = connected
+        events = []
+
+        async def on_voice_state_update(member, before, after):
+            events.append((member.id, after.channel.id if after.channel else None))
+
+        bot.add_listener(on_voice_state_update)
+        member_id = backend.member_ids()[0]
+        backend.voice_state(member_id, VOICE_CHANNEL_ID)
+        await settle()
+        backend.voice_state(member_id, None)
+        await settle()
+
+        assert events == [(member_id, VOICE_CHANNEL_ID), (member_id, None)]
+
+    async def test_mention_reply_and_button_round_trip(self, connected):
+        """Messages go out over REST and button presses come back to the view"""
+        bot, backend = connected
+        answers = []
+
+        async def on_message(message):
+            if bot.user in message.mentions:
+                await message.channel.send("Question?", view=AnswerView(answers))
+
+        bot.add_listener(on_message)
+        user_id = backend.member_ids()[1]
+        backend.send_message(TEXT_CHANNEL_ID, user_id, "quiz me", mention_bot=True)
+        await settle()
+
+        question = backend.find_message("quiz_choice_")
+        assert question is not None and question["content"] == "Question?"
+
+        backend.press_button(int(question["id"]), "quiz_choice_A", user_id)
+        await settle()
+
+        assert answers == [user_id]
+        assert backend.rest.count("POST", "/interactions/") == 1
+        assert not backend.rest.unhandled
+
+    async def test_role_edits_are_echoed_to_the_cache(self, connected):
+        """A role grant over REST shows up on the cached member"""
+        bot, backend = connected
+        guild = bot.get_guild(GUILD_ID)
+        member_id = backend.member_ids()[2]
+        backend.voice_state(member_id, VOICE_CHANNEL_ID)  # Caches the member
+        member = guild.get_member(member_id)
+
+        await member.add_roles(guild.get_role(ROLE_ID))
+        await settle()
+
+        assert ROLE_ID in [role.id for role in guild.get_member(member_id).roles]
+        assert backend.rest.count("PUT", "/guilds/") == 1
+
+    async def test_voice_client_streams_into_sink(self, connected):
+        """Audio played on a voice connection is consumed frame by frame"""
+        bot, backend = connected
+        finished = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        voice_client = await bot.get_channel(VOICE_CHANNEL_ID).connect()
+        voice_client.play(
+            discord.PCMAudio(io.BytesIO(b"\0" * 3840 * 5)),
+            after=lambda error: loop.call_soon_threadsafe(finished.set),
+        )
+        await asyncio.wait_for(finished.wait(), timeout=2)
+        await voice_client.disconnect()
+
+        assert backend.voice.frames == 5 and backend.voice.tracks == 1
+        assert backend.voice.connects == 1 and backend.voice.disconnects == 1
@@ -0,0 +1,204 @@
+# =============================================================================
+# QuranBot - Guild Session Manager Tests
+# =============================================================================
+# Tests for per-guild playback sessions: isolation, shared caches, idle
+# eviction, lazy revival on voice join and configured startup with a
+# control panel per session.
+# =============================================================================
+
+from pathlib import Path
+import tempfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from src.utils.guild_sessions import (
+    GuildSessionManager,
+    SessionConfig,
+    parse_session_configs,
+)
+from src.utils.scheduler import EventScheduler
+from src.utils.state_manager import state_manager
+
+PRIMARY_GUILD = 1
+COMMUNITY_GUILD = 2
+COMMUNITY_CHANNEL = 20
+COMMUNITY_PANEL = 21
+
+
+@pytest.fixture
+def manager():
+    """Provide a session manager writing to a temporary data directory"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield GuildSessionManager(
+            None,
+            "ffmpeg",
+            audio_base_folder=str(Path(temp_dir) / "audio"),
+            primary_guild_id=PRIMARY_GUILD,
+            idle_timeout=60,
+            data_dir=Path(temp_dir) / "sessions",
+        )
+
+
+def voice_event(guild_id, channel_id, bot=False):
+    """Build (member, before, after) for a member joining a channel"""
+    member = MagicMock(bot=bot)
+    before = MagicMock(channel=None)
+    after = MagicMock()
+    after.channel.id = channel_id
+    after.channel.guild.id = guild_id
+    return member, before, after
+
+
+class TestGuildSessionManager:
+    """Test cases for GuildSessionManager"""
+
+    def test_sessions_are_independent(self, manager):
+        """Each guild has its own manager and state but shares caches"""
+        primary = manager.get_or_create_session(PRIMARY_GUILD)
+        community = manager.get_or_create_session(COMMUNITY_GUILD, COMMUNITY_CHANNEL)
+
+        assert primary.audio_manager is not community.audio_manager
+        assert primary.audio_manager.state_manager is state_manager
+        assert community.audio_manager.state_manager.data_dir == (
+            manager.data_dir / str(COMMUNITY_GUILD)
+        )
+        assert community.audio_manager.channel_id == COMMUNITY_CHANNEL
+        assert community.audio_manager.opus_library is manager.opus_library
+        assert (
+            community.audio_manager._duration_cache
+            is primary.audio_manager._duration_cache
+        )
+        assert manager.get_or_create_session(COMMUNITY_GUILD) is community
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_evicted_except_primary(self, manager):
+        """Idle community sessions are evicted; the primary guild is kept"""
+        manager.get_or_create_session(PRIMARY_GUILD)
+        community = manager.get_or_create_session(COMMUNITY_GUILD, COMMUNITY_CHANNEL)
+
+        assert await manager.evict_idle_sessions(now=community.last_active + 30) == []
+        evicted = await manager.evict_idle_sessions(now=community.last_active + 61)
+
+        assert evicted == [COMMUNITY_GUILD]
+        assert list(manager.sessions) == [PRIMARY_GUILD]
+
+    @pytest.mark.asyncio
+    async def test_playing_sessions_are_not_evicted(self, manager):
+        """A session that is playing refreshes its activity time"""
+        session = manager.get_or_create_session(COMMUNITY_GUILD, COMMUNITY_CHANNEL)
+        session.audio_manager.voice_client = MagicMock()
+        session.audio_manager.is_playing = True
+
+        assert await manager.evict_idle_sessions(now=session.last_active + 3600) == []
+
+    @pytest.mark.asyncio
+    async def test_voice_join_revives_evicted_session(self, manager):
+        """Joining a known channel revives its session; other channels do not"""
+        manager.get_or_create_session(COMMUNITY_GUILD, COMMUNITY_CHANNEL)
+        await manager.end_session(COMMUNITY_GUILD)
+
+        with patch.object(manager, "start_session", AsyncMock()) as start_session:
+            assert await manager.handle_voice_join(
+                *voice_event(COMMUNITY_GUILD, 99)
+            ) is None
+            assert await manager.handle_voice_join(
+                *voice_event(COMMUNITY_GUILD, COMMUNITY_CHANNEL, bot=True)
+            ) is None
+            start_session.assert_not_called()
+
+            member, before, after = voice_event(COMMUNITY_GUILD, COMMUNITY_CHANNEL)
+            await manager.handle_voice_join(member, before, after)
+            start_session.assert_awaited_once_with(after.channel)
+
+    @pytest.mark.asyncio
+    async def test_only_primary_session_drives_health_monitor(self, manager):
+        """Community sessions keep their own monitor and never start the loop"""
+        from src.utils import audio_manager as audio_module
+
+        manager.bot = MagicMock()
+        with patch.object(audio_module, "_start_monitoring_loop") as start_loop:
+            start_loop.return_value = MagicMock(done=MagicMock(return_value=False))
+            primary = manager.get_or_create_session(PRIMARY_GUILD).audio_manager
+            community = manager.get_or_create_session(
+                COMMUNITY_GUILD, COMMUNITY_CHANNEL
+            ).audio_manager
+
+        start_loop.assert_called_once_with(primary)
+        assert primary.monitor is audio_module._audio_monitor
+        assert community.monitor is not audio_module._audio_monitor
+        assert community.monitor._audio_manager is community
+
+        loop_task = primary._monitoring_task
+        community._monitoring_task = MagicMock(done=MagicMock(return_value=False))
+        community_task = community._monitoring_task
+        await manager.end_session(COMMUNITY_GUILD)
+        community_task.cancel.assert_called_once()
+        loop_task.cancel.assert_not_called()
+
+    def test_eviction_job_registered(self, manager):
+        """start() and stop() manage the scheduler job"""
+        scheduler = EventScheduler(state_file=None)
+        with patch("src.utils.guild_sessions.get_event_scheduler", return_value=scheduler):
+            manager.start()
+            assert scheduler.get_job("guild_session_eviction") is not None
+            manager.stop()
+            assert scheduler.get_job("guild_session_eviction") is None
+
+
+class TestConfiguredSessions:
+    """Test cases for GUILD_SESSIONS startup and per-session panels"""
+
+    def test_parse_session_configs(self):
+        """Entries are guild:voice with an optional panel channel"""
+        assert parse_session_configs(" 2:20:21, 3:30 ,") == [
+            SessionConfig(2, 20, 21),
+            SessionConfig(3, 30),
+        ]
+        with pytest.raises(ValueError, match="4:abc"):
+            parse_session_configs("2:20,4:abc")
+
+    @pytest.mark.asyncio
+    async def test_configured_session_gets_its_own_panel(self, manager):
+        """Startup connects, plays and posts a panel bound to the session"""
+        channel = MagicMock(spec=discord.VoiceChannel)
+        channel.id = COMMUNITY_CHANNEL
+        channel.guild.id = COMMUNITY_GUILD
+        manager.bot = MagicMock()
+        manager.bot.get_channel.side_effect = lambda channel_id: (
+            channel if channel_id == COMMUNITY_CHANNEL else None
+        )
+
+        with (
+            patch(
+                "src.utils.guild_sessions.setup_control_panel",
+                AsyncMock(return_value=True),
+            ) as setup_panel,
+            patch("src.utils.guild_sessions.cleanup_control_panels") as cleanup,
+            patch(
+                "src.utils.audio_manager.AudioManager.connect_to_voice_channel",
+                AsyncMock(return_value=True),
+            ),
+            patch(
+                "src.utils.audio_manager.AudioManager.start_playback", AsyncMock()
+            ),
+        ):
+            started = await manager.start_configured_sessions(
+                [
+                    SessionConfig(PRIMARY_GUILD, 10, 11),
+                    SessionConfig(COMMUNITY_GUILD, 99),
+                    SessionConfig(COMMUNITY_GUILD, COMMUNITY_CHANNEL, COMMUNITY_PANEL),
+                ]
+            )
+
+            assert [session.guild_id for session in started] == [COMMUNITY_GUILD]
+            setup_panel.assert_awaited_once_with(
+                manager.bot, COMMUNITY_PANEL, started[0].audio_manager
+            )
+            assert manager._load_session_info(COMMUNITY_GUILD)["panel_channel_id"] == (
+                COMMUNITY_PANEL
+            )
+
+            await manager.end_session(COMMUNITY_GUILD)
+            cleanup.assert_called_once_with(COMMUNITY_PANEL)
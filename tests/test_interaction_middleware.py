@@ -0,0 +1,123 @@
+# =============================================================================
+# QuranBot - Interaction Middleware Tests
+# =============================================================================
+# Tests for fast acknowledgement: watchdog and predicted defers, follow-up
+# routing after a defer, and latency recording.
+# =============================================================================
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import discord
+import pytest
+
+from src.core.performance_monitor import PerformanceMonitor
+from src.utils import interaction_middleware
+from src.utils.interaction_middleware import fast_ack, get_interaction_latency_stats
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Record base InteractionResponse calls instead of hitting Discord"""
+    calls = []
+
+    async def fake_defer(self, *, ephemeral=False, thinking=False):
+        calls.append(("defer", ephemeral, thinking))
+        self._response_type = discord.InteractionResponseType.deferred_channel_message
+
+    async def fake_send_message(self, content=None, **kwargs):
+        calls.append(("send_message", content))
+        self._response_type = discord.InteractionResponseType.channel_message
+
+    monkeypatch.setattr(discord.InteractionResponse, "defer", fake_defer)
+    monkeypatch.setattr(discord.InteractionResponse, "send_message", fake_send_message)
+    monkeypatch.setattr(interaction_middleware, "SLOW_HANDLER_SECONDS", 0.05)
+    monkeypatch.setattr(interaction_middleware, "AUTO_DEFER_SECONDS", 0.02)
+    monkeypatch.setattr(
+        interaction_middleware,
+        "_latency_stats",
+        interaction_middleware.InteractionLatencyStats(),
+    )
+    return calls
+
+
+def make_interaction():
+    """A slash command interaction with a mocked follow-up webhook"""
+    interaction = discord.Interaction.__new__(discord.Interaction)
+    interaction.type = discord.InteractionType.application_command
+    interaction._cs_followup = Mock(send=AsyncMock())
+    return interaction
+
+
+class FakeCog:
+    """Cog whose container provides a PerformanceMonitor"""
+
+    def __init__(self, monitor=None):
+        self.container = Mock()
+        self.container.is_registered.return_value = monitor is not None
+        self.container.get.return_value = monitor
+
+    @fast_ack("quick")
+    async def quick(self, interaction):
+        await interaction.response.send_message("done")
+
+    @fast_ack("slow", ephemeral=False)
+    async def slow(self, interaction):
+        await asyncio.sleep(0.08)
+        await interaction.response.send_message("late")
+
+    @fast_ack("modal", auto_defer=False)
+    async def modal(self, interaction):
+        await asyncio.sleep(0.05)
+
+
+class TestFastAck:
+    """Test cases for the fast_ack middleware"""
+
+    @pytest.mark.asyncio
+    async def test_fast_handler_responds_itself(self, sent):
+        """A quick handler's reply is the acknowledgement"""
+        monitor = Mock(spec=PerformanceMonitor)
+        interaction = make_interaction()
+
+        await FakeCog(monitor).quick(interaction)
+
+        assert sent == [("send_message", "done")]
+        stats = get_interaction_latency_stats().summary()["quick"]
+        assert stats["count"] == 1 and stats["deferred"] == 0
+        recorded = [call.args[0] for call in monitor.record_duration.call_args_list]
+        assert recorded == ["interaction_ack.quick", "interaction_total.quick"]
+
+    @pytest.mark.asyncio
+    async def test_silent_handler_is_deferred_then_followed_up(self, sent):
+        """The watchdog defers; the handler's late reply becomes a follow-up"""
+        interaction = make_interaction()
+
+        await FakeCog().slow(interaction)
+
+        assert sent == [("defer", False, True)]
+        interaction.followup.send.assert_awaited_once_with(wait=True, content="late")
+        stats = get_interaction_latency_stats().summary()["slow"]
+        assert stats["deferred"] == 1
+        assert stats["ack_p99_ms"] < stats["total_p99_ms"]
+
+    @pytest.mark.asyncio
+    async def test_predicted_slow_handler_defers_up_front(self, sent):
+        """Once a handler is known to be slow it is deferred before it runs"""
+        cog = FakeCog()
+        await cog.slow(make_interaction())
+        sent.clear()
+
+        interaction = make_interaction()
+        task = asyncio.create_task(cog.slow(interaction))
+        await asyncio.sleep(0)
+        assert sent == [("defer", False, True)]
+        await task
+
+    @pytest.mark.asyncio
+    async def test_modal_handlers_are_never_deferred(self, sent):
+        """auto_defer=False only measures"""
+        await FakeCog().modal(make_interaction())
+
+        assert sent == []
+        assert get_interaction_latency_stats().summary()["modal"]["deferred"] == 0
@@ -0,0 +1,141 @@
+# =============================================================================
+# QuranBot - Opus Library Tests
+# =============================================================================
+# Tests for the pre-transcoded Opus mirror: background conversion,
+# content-hash deduplication, stale-manifest detection and source selection.
+# =============================================================================
+
+import os
+from pathlib import Path
+import stat
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.opus_library import OpusLibrary, get_opus_library
+
+# Stand-in for ffmpeg that copies the input file to the output path
+FAKE_FFMPEG = """#!/bin/sh
+input=""
+while [ $# -gt 1 ]; do
+    if [ "$1" = "-i" ]; then input="$2"; fi
+    shift
+done
+cp "$input" "$1"
+"""
+
+
+@pytest.fixture
+def library_dirs():
+    """Provide an audio folder with two tracks and a fake ffmpeg"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        reciter = root / "audio" / "Test Reciter"
+        reciter.mkdir(parents=True)
+        (reciter / "001.mp3").write_bytes(b"fatiha")
+        (reciter / "002.mp3").write_bytes(b"baqarah")
+
+        ffmpeg = root / "ffmpeg"
+        ffmpeg.write_text(FAKE_FFMPEG)
+        ffmpeg.chmod(ffmpeg.stat().st_mode | stat.S_IEXEC)
+
+        yield root, reciter, str(ffmpeg)
+
+
+class TestOpusLibrary:
+    """Test cases for OpusLibrary"""
+
+    @pytest.mark.asyncio
+    async def test_transcode_folder_builds_mirror(self, library_dirs):
+        """Every track is converted once and recorded in the manifest"""
+        root, reciter, ffmpeg = library_dirs
+        library = OpusLibrary(str(root / "audio"), ffmpeg)
+
+        assert await library.transcode_folder(str(reciter)) == 2
+        assert library.get_coverage(str(reciter)) == (2, 2)
+        assert await library.transcode_folder(str(reciter)) == 0
+
+        opus_path = library.get_opus_path(str(reciter / "001.mp3"))
+        assert opus_path.startswith(str(root / "audio_opus"))
+        assert Path(opus_path).read_bytes() == b"fatiha"
+
+        # A fresh instance reuses the saved manifest
+        restarted = OpusLibrary(str(root / "audio"), ffmpeg)
+        assert restarted.get_opus_path(str(reciter / "001.mp3")) == opus_path
+
+    @pytest.mark.asyncio
+    async def test_duplicate_content_shares_one_file(self, library_dirs):
+        """Tracks with identical content point at the same Opus file"""
+        root, reciter, ffmpeg = library_dirs
+        (reciter / "003.mp3").write_bytes(b"fatiha")
+        library = OpusLibrary(str(root / "audio"), ffmpeg)
+
+        await library.transcode_folder(str(reciter))
+        assert library.get_opus_path(str(reciter / "001.mp3")) == (
+            library.get_opus_path(str(reciter / "003.mp3"))
+        )
+        assert len(list((root / "audio_opus" / reciter.name).glob("*.opus"))) == 2
+
+    @pytest.mark.asyncio
+    async def test_modified_source_is_stale(self, library_dirs):
+        """Changing a source file invalidates its mirror until reconverted"""
+        root, reciter, ffmpeg = library_dirs
+        library = OpusLibrary(str(root / "audio"), ffmpeg)
+        await library.transcode_folder(str(reciter))
+
+        source = reciter / "002.mp3"
+        source.write_bytes(b"re-recorded baqarah")
+        os.utime(source, ns=(0, 0))
+        assert library.get_opus_path(str(source)) is None
+
+        assert await library.transcode_folder(str(reciter)) == 1
+        assert Path(library.get_opus_path(str(source))).read_bytes() == (
+            b"re-recorded baqarah"
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_audio_source_prefers_opus(self, library_dirs):
+        """Converted tracks use copy-codec Opus; others fall back to PCM"""
+        root, reciter, ffmpeg = library_dirs
+        library = OpusLibrary(str(root / "audio"), ffmpeg)
+        await library.transcode_folder(str(reciter))
+        (reciter / "003.mp3").write_bytes(b"new")
+
+        with (
+            patch("discord.FFmpegOpusAudio") as opus_audio,
+            patch("discord.FFmpegPCMAudio") as pcm_audio,
+        ):
+            library.create_audio_source(str(reciter / "001.mp3"), position=12.5)
+            library.create_audio_source(str(reciter / "003.mp3"))
+
+        opus_kwargs = opus_audio.call_args.kwargs
+        assert opus_kwargs["codec"] == "copy"
+        assert opus_kwargs["before_options"] == "-ss 12.5"
+        assert pcm_audio.call_args.args[0] == str(reciter / "003.mp3")
+        assert pcm_audio.call_args.kwargs["before_options"] is None
+
+    def test_missing_ffmpeg_skips_background_work(self, library_dirs):
+        """Without FFmpeg no background conversion is started"""
+        root, reciter, _ = library_dirs
+        library = OpusLibrary(str(root / "audio"), str(root / "missing-ffmpeg"))
+
+        library.start_background_transcode(str(reciter))
+        assert library._transcode_task is None
+        assert library.get_coverage(str(reciter)) == (0, 2)
+
+    def test_shared_library_per_audio_folder(self, library_dirs):
+        """Callers on the same audio folder share one library and manifest"""
+        root, _, ffmpeg = library_dirs
+        library = get_opus_library(str(root / "audio"), ffmpeg)
+
+        assert get_opus_library(str(root / "audio" / ".." / "audio")) is library
+        assert get_opus_library(str(root / "other"), ffmpeg) is not library
+
+    def test_libraries_on_one_mirror_share_a_seek_index(self, library_dirs):
+        """Libraries writing to the same mirror share one seek index"""
+        root, _, ffmpeg = library_dirs
+        first = OpusLibrary(str(root / "audio"), ffmpeg)
+        second = OpusLibrary(str(root / "audio"), ffmpeg)
+
+        assert first.seek_index is second.seek_index
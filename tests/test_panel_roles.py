@@ -0,0 +1,142 @@
+# =============================================================================
+# QuranBot - Panel Access Role Reconciler Tests
+# =============================================================================
+# Tests for debounced panel role updates: collapsing voice channel flapping,
+# applying net changes, rate limiting and reconciliation.
+# =============================================================================
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core.rate_limit_engine import RateLimitEngine
+from src.utils.panel_roles import PanelRoleReconciler
+
+ROLE_ID = 10
+CHANNEL_ID = 20
+
+
+def make_guild(members=(), role_members=()):
+    """A guild with the panel role and the Quran voice channel"""
+    guild = Mock()
+    guild.id = 1
+    role = Mock()
+    role.members = list(role_members)
+    channel = Mock(id=CHANNEL_ID)
+    channel.members = list(members)
+    guild.get_role.side_effect = lambda role_id: role if role_id == ROLE_ID else None
+    guild.get_channel.side_effect = lambda channel_id: (
+        channel if channel_id == CHANNEL_ID else None
+    )
+    guild.get_member.return_value = None
+    return guild, role, channel
+
+
+def make_member(guild, member_id=100, roles=()):
+    return Mock(id=member_id, guild=guild, bot=False, roles=list(roles))
+
+
+def voice_state(channel_id=None):
+    return Mock(channel=Mock(id=channel_id) if channel_id else None)
+
+
+def make_reconciler(debounce=0.02):
+    return PanelRoleReconciler(
+        ROLE_ID,
+        CHANNEL_ID,
+        assign=AsyncMock(),
+        remove=AsyncMock(),
+        debounce_seconds=debounce,
+        rate_limiter=RateLimitEngine(),
+    )
+
+
+async def settle(reconciler):
+    """Wait until every pending change has been applied"""
+    while reconciler.pending_count:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+    await reconciler.stop()
+
+
+class TestPanelRoleReconciler:
+    """Test cases for PanelRoleReconciler"""
+
+    @pytest.mark.asyncio
+    async def test_flapping_member_collapses_to_net_change(self):
+        """join -> leave -> join applies one role grant"""
+        guild, role, _ = make_guild()
+        member = make_member(guild)
+        reconciler = make_reconciler()
+
+        reconciler.note_voice_state(member, voice_state(), voice_state(CHANNEL_ID))
+        reconciler.note_voice_state(member, voice_state(CHANNEL_ID), voice_state())
+        reconciler.note_voice_state(member, voice_state(), voice_state(CHANNEL_ID))
+        await settle(reconciler)
+
+        reconciler.assign.assert_awaited_once()
+        reconciler.remove.assert_not_awaited()
+        assert reconciler.events == 3 and reconciler.applied == 1
+
+    @pytest.mark.asyncio
+    async def test_round_trip_needs_no_role_edit(self):
+        """leave -> join for a member who keeps the role is a no-op"""
+        guild, role, _ = make_guild()
+        member = make_member(guild, roles=[role])
+        reconciler = make_reconciler()
+
+        reconciler.note_voice_state(member, voice_state(CHANNEL_ID), voice_state(5))
+        reconciler.note_voice_state(member, voice_state(5), voice_state(CHANNEL_ID))
+        await settle(reconciler)
+
+        reconciler.assign.assert_not_awaited()
+        reconciler.remove.assert_not_awaited()
+        assert reconciler.collapsed == 1
+
+    @pytest.mark.asyncio
+    async def test_other_channels_and_bots_are_ignored(self):
+        """Only the Quran voice channel and human members count"""
+        guild, _, _ = make_guild()
+        member = make_member(guild)
+        bot_member = make_member(guild, member_id=101)
+        bot_member.bot = True
+        reconciler = make_reconciler()
+
+        reconciler.note_voice_state(member, voice_state(), voice_state(5))
+        reconciler.note_voice_state(bot_member, voice_state(), voice_state(CHANNEL_ID))
+
+        assert reconciler.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_reconcile_matches_channel_membership(self):
+        """Listeners without the role gain it; holders outside lose it"""
+        guild, role, channel = make_guild()
+        listener = make_member(guild, member_id=1)
+        departed = make_member(guild, member_id=2, roles=[role])
+        settled = make_member(guild, member_id=3, roles=[role])
+        channel.members = [listener, settled]
+        role.members = [departed, settled]
+        reconciler = make_reconciler()
+
+        assert reconciler.reconcile(guild) == 2
+        await settle(reconciler)
+
+        assert reconciler.assign.await_args.args[0] is listener
+        assert reconciler.remove.await_args.args[0] is departed
+
+    @pytest.mark.asyncio
+    async def test_role_edits_are_rate_limited(self):
+        """Edits beyond the per-guild budget wait for the next slot"""
+        guild, _, _ = make_guild()
+        reconciler = make_reconciler(debounce=0)
+        started = time.monotonic()
+
+        for member_id in range(6):
+            reconciler.request(make_member(guild, member_id=member_id), grant=True)
+        await settle(reconciler)
+
+        # 5 edits per 5 seconds: the sixth waits about a second
+        assert reconciler.applied == 6
+        assert time.monotonic() - started >= 0.9
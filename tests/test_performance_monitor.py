@@ -0,0 +1,141 @@
+# =============================================================================
+# QuranBot - Performance Monitor Sketch Tests
+# =============================================================================
+# Tests for the mergeable quantile sketches behind timer metrics and
+# operation statistics in the performance monitor.
+# =============================================================================
+
+import random
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.performance_monitor import (
+    MetricSeries,
+    MetricType,
+    PerformanceMonitor,
+    QuantileSketch,
+    WindowedQuantileSketch,
+)
+
+
+def exact_percentile(values, percentile):
+    """Nearest-rank percentile used as the reference answer"""
+    ordered = sorted(values)
+    return ordered[int((len(ordered) - 1) * percentile / 100)]
+
+
+class TestQuantileSketch:
+    """Test cases for QuantileSketch"""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Estimates stay within the configured relative error"""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(0, 1.5) for _ in range(20000)]
+        sketch = QuantileSketch(relative_accuracy=0.02)
+        for value in values:
+            sketch.add(value)
+
+        for percentile in (50, 95, 99):
+            expected = exact_percentile(values, percentile)
+            assert sketch.quantile(percentile) == pytest.approx(expected, rel=0.03)
+        assert sketch.quantile(0) == min(values)
+        assert sketch.quantile(100) == max(values)
+
+    def test_merge_matches_single_sketch(self):
+        """Merging two sketches equals recording everything in one"""
+        combined, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i in range(1, 1001):
+            combined.add(i / 10)
+            (left if i % 2 else right).add(i / 10)
+
+        left.merge(right)
+        assert left.count == combined.count
+        assert left.buckets == combined.buckets
+        assert left.quantile(95) == combined.quantile(95)
+        assert left.mean == pytest.approx(combined.mean)
+
+    def test_export_round_trip(self):
+        """Exported sketches rebuild identically"""
+        sketch = QuantileSketch()
+        for value in (0.0, 0.5, 1.5, 20.0):
+            sketch.add(value)
+
+        restored = QuantileSketch.from_dict(sketch.to_dict())
+        assert restored.to_dict() == sketch.to_dict()
+        assert restored.quantile(50) == sketch.quantile(50)
+
+    def test_merge_rejects_different_accuracy(self):
+        """Sketches with different bucket layouts cannot be merged"""
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+class TestWindowedQuantileSketch:
+    """Test cases for WindowedQuantileSketch"""
+
+    def test_window_selects_recent_slots(self):
+        """Only slots overlapping the window are merged"""
+        windowed = WindowedQuantileSketch(slot_seconds=60, slot_count=10)
+        windowed.add(100.0, now=0)
+        windowed.add(1.0, now=300)
+        windowed.add(2.0, now=310)
+
+        assert windowed.merged(60, now=320).count == 2
+        assert windowed.merged(now=320).count == 3
+
+    def test_old_slots_rotate_out(self):
+        """Slots older than the retained span are dropped"""
+        windowed = WindowedQuantileSketch(slot_seconds=60, slot_count=2)
+        windowed.add(1.0, now=0)
+        windowed.add(1.0, now=60)
+        windowed.add(1.0, now=120)
+
+        assert windowed.merged(now=120).count == 2
+        assert windowed.merged(now=1000).count == 0
+
+
+class TestPerformanceMonitorSketches:
+    """Test cases for sketch-backed timing in PerformanceMonitor"""
+
+    @pytest.fixture
+    def monitor(self):
+        """Create a monitor without starting background loops"""
+        logger = MagicMock()
+        logger.debug = AsyncMock()
+        return PerformanceMonitor(MagicMock(), logger)
+
+    def test_timer_series_uses_sketch(self):
+        """Timer series answer percentiles from their sketch"""
+        series = MetricSeries(name="op_ms", metric_type=MetricType.TIMER)
+        gauge = MetricSeries(name="cpu", metric_type=MetricType.GAUGE)
+        for value in range(1, 101):
+            series.add_value(float(value))
+
+        assert gauge.sketch is None
+        assert series.get_percentile(50) == pytest.approx(50, rel=0.03)
+        assert series.get_average() == pytest.approx(50.5)
+
+    @pytest.mark.asyncio
+    async def test_underscored_operation_names_kept(self, monitor):
+        """Operation names with underscores are recorded under their full name"""
+        async with monitor.time_operation("play_command"):
+            pass
+
+        stats = await monitor.get_operation_stats("play_command")
+        assert stats["count"] == 1
+        assert "play" not in monitor._operation_timers
+
+    @pytest.mark.asyncio
+    async def test_operation_stats_and_commands_per_minute(self, monitor):
+        """Recorded durations feed stats and the commands-per-minute rate"""
+        for duration in (0.1, 0.2, 0.3, 0.4):
+            monitor.record_duration("verse_command", duration)
+
+        stats = await monitor.get_operation_stats("verse_command")
+        assert stats["count"] == 4
+        assert stats["average_ms"] == pytest.approx(250)
+        assert stats["max_ms"] == pytest.approx(400)
+
+        await monitor._collect_application_metrics()
+        assert monitor._app_metrics.commands_per_minute == 4
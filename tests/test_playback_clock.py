@@ -0,0 +1,158 @@
+# =============================================================================
+# QuranBot - Playback Clock Tests
+# =============================================================================
+# Tests for event-sourced playback position: derivation from the last
+# event, pause/resume/seek/stop, listeners and crash extrapolation bounded
+# by the heartbeat.
+# =============================================================================
+
+from pathlib import Path
+import tempfile
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils.playback_clock import (
+    HEARTBEAT_INTERVAL_SECONDS,
+    Heartbeat,
+    PlaybackClock,
+    PlaybackEventType,
+    extrapolate_position,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    """Provide a controllable monotonic clock"""
+    return FakeClock()
+
+
+class TestPlaybackClock:
+    """Test cases for PlaybackClock"""
+
+    def test_position_follows_last_event(self, fake_clock):
+        """Position runs after a start, freezes on pause and continues on resume"""
+        clock = PlaybackClock(clock=fake_clock)
+        assert clock.position() == 0.0 and not clock.is_active
+
+        clock.track_started(30.0)
+        fake_clock.now += 12
+        assert clock.position() == pytest.approx(42.0)
+
+        clock.paused()
+        fake_clock.now += 100
+        assert clock.position() == pytest.approx(42.0)
+
+        clock.resumed()
+        fake_clock.now += 8
+        assert clock.position() == pytest.approx(50.0)
+
+        clock.seeked(5.0)
+        fake_clock.now += 1
+        assert clock.position() == pytest.approx(6.0)
+
+        clock.stopped()
+        fake_clock.now += 60
+        assert clock.position() == pytest.approx(6.0)
+        assert not clock.is_active
+
+    def test_position_is_clamped_to_duration(self, fake_clock):
+        """A running position never passes the end of the track"""
+        clock = PlaybackClock(clock=fake_clock)
+        clock.track_started(0.0, duration=47.0)
+        fake_clock.now += 600
+        assert clock.position() == 47.0
+
+        clock.track_started(0.0)
+        fake_clock.now += 600
+        assert clock.duration is None and clock.position() == 600.0
+
+    def test_listeners_receive_only_state_changes(self, fake_clock):
+        """Redundant pauses, resumes and stops emit nothing"""
+        clock = PlaybackClock(clock=fake_clock)
+        events = []
+        clock.subscribe(events.append)
+
+        clock.resumed()
+        clock.stopped()
+        clock.track_started(10.0)
+        fake_clock.now += 5
+        clock.paused()
+        clock.paused()
+        clock.resumed()
+        clock.resumed()
+        clock.stopped()
+
+        assert [(e.type, e.offset, e.running) for e in events] == [
+            (PlaybackEventType.TRACK_STARTED, 10.0, True),
+            (PlaybackEventType.PAUSED, 15.0, False),
+            (PlaybackEventType.RESUMED, 15.0, True),
+            (PlaybackEventType.STOPPED, 15.0, False),
+        ]
+
+    def test_failing_listener_does_not_break_playback(self, fake_clock):
+        """A listener error is logged and the event still applies"""
+        clock = PlaybackClock(clock=fake_clock)
+        clock.subscribe(lambda event: 1 / 0)
+
+        clock.track_started(3.0)
+        assert clock.is_running and clock.position() == 3.0
+
+
+class TestExtrapolatePosition:
+    """Test cases for restoring a saved snapshot"""
+
+    def test_running_snapshot_advances(self):
+        """A mid-track snapshot continues from its timestamp; a paused one does not"""
+        assert extrapolate_position(60.0, True, 1000.0, 1090.0, now=1090.0) == 150.0
+        assert extrapolate_position(60.0, False, 1000.0, 1090.0, now=1090.0) == 60.0
+        assert extrapolate_position(60.0, True, None, 1090.0, now=1090.0) == 60.0
+
+    def test_downtime_is_not_counted(self):
+        """Playback stops advancing at the last heartbeat, not at restart"""
+        # Crashed 60s after the snapshot, restarted 30 minutes later
+        assert extrapolate_position(600.0, True, 1000.0, 1060.0, now=2860.0) == 660.0
+        # No heartbeat: how long it played is unknown
+        assert extrapolate_position(600.0, True, 1000.0, None, now=2860.0) == 600.0
+        # A heartbeat older than the snapshot adds nothing
+        assert extrapolate_position(600.0, True, 1000.0, 900.0, now=2860.0) == 600.0
+
+
+class TestHeartbeat:
+    """Test cases for the last-alive heartbeat"""
+
+    def test_previous_beat_survives_first_beat(self):
+        """The previous run's beat is read before this run overwrites it"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "heartbeat.json"
+            assert Heartbeat(path).previous_alive_at() is None
+
+            Heartbeat(path).beat()
+            heartbeat = Heartbeat(path)
+            previous = heartbeat.previous_alive_at()
+            assert previous is not None
+
+            heartbeat.beat()
+            assert heartbeat.previous_alive_at() == previous
+
+    def test_start_registers_interval_job(self):
+        """start() beats on the scheduler"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scheduler = MagicMock()
+            Heartbeat(Path(temp_dir) / "heartbeat.json").start(scheduler)
+
+        assert scheduler.schedule.call_args.args[0] == "playback_heartbeat"
+        assert (
+            scheduler.schedule.call_args.kwargs["interval_seconds"]
+            == HEARTBEAT_INTERVAL_SECONDS
+        )
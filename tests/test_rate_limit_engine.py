@@ -0,0 +1,98 @@
+# =============================================================================
+# QuranBot - Rate Limit Engine Tests
+# =============================================================================
+# Tests for the shared GCRA rate limit engine: bursts, refill, multi-tier
+# all-or-nothing checks, idle-key eviction, status and persistence.
+# =============================================================================
+
+from pathlib import Path
+import tempfile
+
+import pytest
+
+from src.core.rate_limit_engine import RateLimitEngine, RateLimitRule
+
+
+@pytest.fixture
+def state_file():
+    """Provide a temporary rate limit state file path"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir) / "rate_limit_state.json"
+
+
+class TestRateLimitEngine:
+    """Test cases for RateLimitEngine"""
+
+    def test_burst_then_steady_refill(self):
+        """A full window may burst, then requests refill one interval at a time"""
+        engine = RateLimitEngine()
+        rule = RateLimitRule("test", limit=5, period_seconds=60)
+
+        for _ in range(5):
+            assert engine.acquire(rule, "user", now=0).allowed
+
+        denied = engine.acquire(rule, "user", now=0)
+        assert not denied.allowed
+        assert denied.used == 5
+        assert denied.retry_after == pytest.approx(12)
+
+        assert not engine.acquire(rule, "user", now=11.9).allowed
+        assert engine.acquire(rule, "user", now=12).allowed
+
+    def test_keys_are_isolated(self):
+        """One key exhausting its limit does not affect another"""
+        engine = RateLimitEngine()
+        rule = RateLimitRule("test", limit=1, period_seconds=60)
+
+        assert engine.acquire(rule, 1, now=0).allowed
+        assert not engine.acquire(rule, 1, now=0).allowed
+        assert engine.acquire(rule, 2, now=0).allowed
+
+    def test_acquire_all_is_all_or_nothing(self):
+        """A denial on one tier leaves the other tiers uncharged"""
+        engine = RateLimitEngine()
+        user_rule = RateLimitRule("user", limit=5, period_seconds=60)
+        global_rule = RateLimitRule("global", limit=1, period_seconds=60)
+
+        assert engine.acquire_all([(user_rule, 1), (global_rule, "all")], now=0).allowed
+        assert not engine.acquire_all(
+            [(user_rule, 1), (global_rule, "all")], now=0
+        ).allowed
+        assert engine.peek(user_rule, 1, now=0).used == 1
+
+    def test_peek_does_not_consume(self):
+        """Status checks report remaining capacity without charging it"""
+        engine = RateLimitEngine()
+        rule = RateLimitRule("test", limit=2, period_seconds=60)
+        engine.acquire(rule, "user", now=0)
+
+        status = engine.peek(rule, "user", now=0)
+        assert status.allowed
+        assert status.remaining == 1
+        assert engine.peek(rule, "user", now=0).remaining == 1
+
+    def test_idle_keys_evicted(self):
+        """Keys whose bucket has refilled are dropped automatically"""
+        engine = RateLimitEngine(eviction_interval=10)
+        rule = RateLimitRule("test", limit=1, period_seconds=5)
+
+        for user in range(100):
+            engine.acquire(rule, user, now=0)
+        assert engine.tracked_keys == 100
+
+        engine.acquire(rule, "late", now=20)
+        assert engine.tracked_keys == 1
+
+    def test_persisted_rules_survive_restart(self, state_file):
+        """Persisted limits are restored from the state file"""
+        rule = RateLimitRule("ai", limit=1, period_seconds=3600, persist=True)
+        transient = RateLimitRule("cmd", limit=1, period_seconds=3600)
+
+        engine = RateLimitEngine(state_file=state_file)
+        assert engine.acquire(rule, 42).allowed
+        assert engine.acquire(transient, 42).allowed
+
+        restarted = RateLimitEngine(state_file=state_file)
+        assert not restarted.acquire(rule, 42).allowed
+        assert restarted.acquire(transient, 42).allowed
+        assert restarted.peek(rule, 42).retry_after > 3500
@@ -0,0 +1,109 @@
+# =============================================================================
+# QuranBot - Reaction Router Tests
+# =============================================================================
+# Tests for message-id reaction routing: dispatch by kind, bot and expiry
+# filtering, and routes persisting across restarts.
+# =============================================================================
+
+from pathlib import Path
+import tempfile
+import time
+from unittest.mock import AsyncMock, Mock
+
+import discord
+import pytest
+
+from src.utils.reaction_router import ReactionRouter
+
+
+@pytest.fixture
+def state_file():
+    """Provide a temporary reaction routes file"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir) / "reaction_routes.json"
+
+
+def make_message(message_id=111, channel_id=222):
+    message = Mock()
+    message.id = message_id
+    message.channel.id = channel_id
+    return message
+
+
+def make_bot():
+    """A bot whose channel hands out partial messages with mocked removal"""
+    bot = Mock()
+    partial = Mock(remove_reaction=AsyncMock())
+    bot.get_channel.return_value.get_partial_message.return_value = partial
+    return bot, partial
+
+
+def make_payload(emoji="👍", message_id=111, bot_user=False):
+    payload = Mock(spec=discord.RawReactionActionEvent)
+    payload.message_id = message_id
+    payload.channel_id = 222
+    payload.user_id = 333
+    payload.emoji = discord.PartialEmoji(name=emoji)
+    payload.member = Mock(bot=bot_user, display_name="user")
+    return payload
+
+
+class TestReactionRouter:
+    """Test cases for ReactionRouter"""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_to_handler_by_kind(self, state_file):
+        """Reactions on a routed message reach its kind's handler"""
+        router = ReactionRouter(state_file)
+        bot, partial = make_bot()
+        handler = AsyncMock()
+        router.register_handler("daily_verse", handler)
+        router.attach(bot)
+        router.route(make_message(), "daily_verse", 60, {"surah": 1})
+
+        await router.on_raw_reaction_add(make_payload())
+        await router.on_raw_reaction_add(make_payload(message_id=999))
+        await router.on_raw_reaction_add(make_payload(bot_user=True))
+
+        handler.assert_awaited_once()
+        event = handler.await_args.args[1]
+        assert event.route.data == {"surah": 1}
+        assert event.emoji_name == "👍"
+
+        await event.remove()
+        partial.remove_reaction.assert_awaited_once_with(event.emoji, event.user)
+
+    @pytest.mark.asyncio
+    async def test_expired_routes_are_dropped(self, state_file):
+        """A reaction after the TTL drops the route without dispatching"""
+        router = ReactionRouter(state_file)
+        handler = AsyncMock()
+        router.register_handler("prayer_notification", handler)
+        router.attach(make_bot()[0])
+        router.route(make_message(), "prayer_notification", 60)
+        router.routes[111].expires_at = time.time() - 1
+
+        await router.on_raw_reaction_add(make_payload())
+
+        handler.assert_not_awaited()
+        assert 111 not in router.routes
+
+    def test_routes_survive_restart(self, state_file):
+        """Active routes are reloaded; expired ones are not"""
+        router = ReactionRouter(state_file)
+        router.route(make_message(111), "daily_verse", 3600, {"surah": 2})
+        router.route(make_message(112), "daily_verse", 3600)
+        router.routes[112].expires_at = time.time() - 1
+        router.route(make_message(113), "prayer_notification", 3600)
+
+        restarted = ReactionRouter(state_file)
+        assert set(restarted.routes) == {111, 113}
+        assert restarted.routes[111].data == {"surah": 2}
+
+    def test_attach_is_idempotent(self, state_file):
+        """Attaching twice to the same bot adds one listener"""
+        router = ReactionRouter(state_file)
+        bot = make_bot()[0]
+        router.attach(bot)
+        router.attach(bot)
+        bot.add_listener.assert_called_once()
@@ -0,0 +1,135 @@
+# =============================================================================
+# QuranBot - Reciter Catalog Tests
+# =============================================================================
+# Tests for the audio library catalogue: scanning, surah lookup,
+# mtime-based change detection, persistence and cached durations.
+# =============================================================================
+
+import os
+from pathlib import Path
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils.reciter_catalog import ReciterCatalog
+
+
+@pytest.fixture
+def audio_base():
+    """Provide an audio folder with a complete and a sparse reciter"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base = Path(temp_dir) / "audio"
+        for name, surahs in (("Full Reciter", range(1, 4)), ("Sparse Reciter", (2, 7))):
+            folder = base / name
+            folder.mkdir(parents=True)
+            for surah in surahs:
+                (folder / f"{surah:03d}.mp3").write_bytes(b"mp3")
+        (base / "Sparse Reciter" / "notes.txt").write_text("not audio")
+        (base / "Empty Folder").mkdir()
+        yield base
+
+
+def bump_mtime(path: Path) -> None:
+    """Move a folder's mtime forward so the change is visible at any resolution"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestReciterCatalog:
+    """Test cases for ReciterCatalog"""
+
+    def test_scan_and_queries(self, audio_base):
+        """Reciters, files and surah maps come from a single scan"""
+        catalog = ReciterCatalog(str(audio_base))
+
+        assert catalog.get_reciters() == ["Full Reciter", "Sparse Reciter"]
+        assert [Path(f).name for f in catalog.get_files("Full Reciter")] == [
+            "001.mp3",
+            "002.mp3",
+            "003.mp3",
+        ]
+        surahs = catalog.get_surahs("Sparse Reciter")
+        assert sorted(surahs) == [2, 7]
+        assert surahs[7] == str(audio_base / "Sparse Reciter" / "007.mp3")
+        assert catalog.get_files("Missing Reciter") == []
+
+    def test_unchanged_library_is_not_rewalked(self, audio_base):
+        """Only folders whose mtime changed are rescanned"""
+        catalog = ReciterCatalog(str(audio_base))
+        catalog.get_reciters()
+
+        with patch("src.utils.reciter_catalog.os.scandir", wraps=os.scandir) as scandir:
+            assert catalog.refresh() is False
+            assert scandir.call_count == 0
+
+            (audio_base / "Sparse Reciter" / "114.mp3").write_bytes(b"mp3")
+            bump_mtime(audio_base / "Sparse Reciter")
+            assert catalog.refresh() is True
+            assert scandir.call_count == 1
+
+        assert sorted(catalog.get_surahs("Sparse Reciter")) == [2, 7, 114]
+
+    def test_reciter_folders_added_and_removed(self, audio_base):
+        """New folders appear and deleted folders disappear"""
+        catalog = ReciterCatalog(str(audio_base))
+        catalog.get_reciters()
+
+        new_folder = audio_base / "New Reciter"
+        new_folder.mkdir()
+        (new_folder / "001.mp3").write_bytes(b"mp3")
+        for path in (audio_base / "Full Reciter").iterdir():
+            path.unlink()
+        (audio_base / "Full Reciter").rmdir()
+        bump_mtime(audio_base)
+
+        assert catalog.get_reciters() == ["New Reciter", "Sparse Reciter"]
+
+    def test_catalog_persists_across_restarts(self, audio_base):
+        """A restart loads the manifest instead of walking the library"""
+        ReciterCatalog(str(audio_base)).get_reciters()
+
+        with patch("src.utils.reciter_catalog.os.scandir", wraps=os.scandir) as scandir:
+            catalog = ReciterCatalog(str(audio_base))
+            assert catalog.get_reciters() == ["Full Reciter", "Sparse Reciter"]
+            assert scandir.call_count == 0
+
+    def test_durations_are_read_once(self, audio_base):
+        """Durations survive restarts and are re-read when a file changes"""
+        track = audio_base / "Full Reciter" / "002.mp3"
+        mp3 = MagicMock(return_value=MagicMock(info=MagicMock(length=95.5)))
+
+        with patch("src.utils.reciter_catalog.MP3", mp3):
+            catalog = ReciterCatalog(str(audio_base))
+            catalog.get_reciters()
+            assert catalog.get_duration(str(track)) == 95.5
+            catalog.flush()
+            assert ReciterCatalog(str(audio_base)).get_duration(str(track)) == 95.5
+            assert mp3.call_count == 1
+
+            track.write_bytes(b"re-encoded mp3")
+            assert catalog.get_duration(str(track)) == 95.5
+            assert mp3.call_count == 2
+
+    def test_new_durations_are_written_in_one_flush(self, audio_base):
+        """A burst of duration reads marks the catalogue dirty instead of saving each"""
+        tracks = sorted((audio_base / "Full Reciter").glob("*.mp3"))
+        mp3 = MagicMock(return_value=MagicMock(info=MagicMock(length=60.0)))
+
+        with patch("src.utils.reciter_catalog.MP3", mp3):
+            catalog = ReciterCatalog(str(audio_base))
+            catalog.get_reciters()
+            with patch.object(catalog, "_save", wraps=catalog._save) as save:
+                for track in tracks:
+                    catalog.get_duration(str(track))
+                assert save.call_count == 0
+
+                assert catalog.flush() is True
+                assert catalog.flush() is False
+                assert save.call_count == 1
+
+        reloaded = ReciterCatalog(str(audio_base))
+        assert all(
+            info["duration"] == 60.0
+            for info in reloaded.get_file_entries("Full Reciter").values()
+        )
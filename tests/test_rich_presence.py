@@ -5,18 +5,21 @@
 # Comprehensive tests for Discord rich presence functionality
 # =============================================================================
 
+import asyncio
 from datetime import datetime, timedelta
 import os
 from pathlib import Path
 import sys
 import tempfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 import pytz
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from src.core.rate_limit_engine import RateLimitEngine, RateLimitRule
 from utils.rich_presence import RichPresenceManager
 
 
@@ -211,3 +214,70 @@ class TestRichPresenceManager:
             {"test": "data"},
         )
         assert result is False
+
+
+class TestPresencePipeline:
+    """Test suite for coalesced, rate-limited presence sends"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.client = MagicMock()
+        self.client.change_presence = AsyncMock()
+        self.manager = RichPresenceManager(client=self.client, data_dir=self.temp_dir)
+
+    def show(self, surah):
+        return self.manager.update_presence(
+            status=surah, details="Verse 1", state="Recited by Example", silent=True
+        )
+
+    async def settle(self):
+        while self.manager._sender and not self.manager._sender.done():
+            await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_rapid_updates_coalesce_to_latest(self, monkeypatch):
+        """Skipping through surahs sends at the allowed rate and ends on the latest"""
+        import utils.rich_presence as rich_presence
+
+        monkeypatch.setattr(
+            rich_presence,
+            "PRESENCE_RULE",
+            RateLimitRule("presence_test", limit=2, period_seconds=0.2),
+        )
+        monkeypatch.setattr(rich_presence, "get_rate_limit_engine", RateLimitEngine)
+
+        for surah in range(1, 11):
+            assert self.show(f"Surah {surah}")
+        await self.settle()
+
+        sent = [
+            call.kwargs["activity"].name
+            for call in self.client.change_presence.await_args_list
+        ]
+        assert sent[-1] == "Surah 10"
+        assert len(sent) < 10
+        assert self.manager.coalesced > 0
+
+    @pytest.mark.asyncio
+    async def test_identical_updates_are_not_resent(self):
+        """The 30 second refresh loop costs no gateway ops when nothing changed"""
+        for _ in range(3):
+            self.show("Al-Fatiha")
+            await self.settle()
+
+        assert self.client.change_presence.await_count == 1
+        assert self.manager.sends == 1
+
+    @pytest.mark.asyncio
+    async def test_state_is_saved_on_a_debounce(self):
+        """Updates schedule one write instead of writing every time"""
+        self.show("Al-Fatiha")
+        self.show("Al-Baqarah")
+        await self.settle()
+
+        assert not self.manager.state_file.exists()
+        assert self.manager._save_handle is not None
+
+        self.manager.save_state(silent=True)
+        assert self.manager._save_handle is None
+        assert self.manager.state_file.exists()
@@ -0,0 +1,236 @@
+# =============================================================================
+# QuranBot - Event Scheduler Tests
+# =============================================================================
+# Tests for the deadline-driven event scheduler including ordering,
+# rescheduling, dormant jobs, error retries, jitter and persistence.
+# =============================================================================
+
+import asyncio
+import json
+from pathlib import Path
+import tempfile
+import time
+
+import pytest
+
+from src.utils.scheduler import EventScheduler
+
+
+@pytest.fixture
+def state_file():
+    """Provide a temporary scheduler state file path"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir) / "scheduler_state.json"
+
+
+class TestEventScheduler:
+    """Test cases for EventScheduler"""
+
+    def test_schedule_requires_policy(self):
+        """A job needs either an interval or a next-run function"""
+        scheduler = EventScheduler(state_file=None)
+
+        async def noop():
+            pass
+
+        with pytest.raises(ValueError):
+            scheduler.schedule("job", noop)
+
+    def test_upcoming_jobs_ordered_by_deadline(self):
+        """Introspection lists jobs by next deadline, dormant jobs last"""
+        scheduler = EventScheduler(state_file=None)
+
+        async def noop():
+            pass
+
+        now = time.time()
+        scheduler.schedule("later", noop, interval_seconds=60, first_run=now + 60)
+        scheduler.schedule("sooner", noop, interval_seconds=60, first_run=now + 5)
+        scheduler.schedule("dormant", noop, next_run_func=lambda: None)
+
+        names = [job["name"] for job in scheduler.get_upcoming_jobs()]
+        assert names == ["sooner", "later", "dormant"]
+        assert scheduler.get_upcoming_jobs(limit=1)[0]["seconds_until"] <= 5
+
+    @pytest.mark.asyncio
+    async def test_fires_in_deadline_order(self):
+        """Jobs run in deadline order without fixed polling"""
+        scheduler = EventScheduler(state_file=None)
+        fired = []
+
+        def make_job(name):
+            async def job():
+                fired.append(name)
+
+            return job
+
+        now = time.time()
+        scheduler.schedule(
+            "second", make_job("second"), interval_seconds=60, first_run=now + 0.1
+        )
+        scheduler.schedule(
+            "first", make_job("first"), interval_seconds=60, first_run=now + 0.05
+        )
+
+        await asyncio.sleep(0.3)
+        await scheduler.stop()
+
+        assert fired == ["first", "second"]
+        assert scheduler.get_job("first").run_count == 1
+        assert scheduler.get_job("first").next_run > time.time() + 50
+
+    @pytest.mark.asyncio
+    async def test_reschedule_wakes_sleeping_loop(self):
+        """Moving a deadline earlier takes effect immediately"""
+        scheduler = EventScheduler(state_file=None)
+        fired = asyncio.Event()
+
+        async def job():
+            fired.set()
+
+        scheduler.schedule("job", job, interval_seconds=3600)
+        await asyncio.sleep(0.05)
+        assert not fired.is_set()
+
+        scheduler.run_now("job")
+        await asyncio.wait_for(fired.wait(), timeout=1)
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_reschedule_recomputes_from_policy(self):
+        """Reschedule without a time re-reads the job's next-run function"""
+        scheduler = EventScheduler(state_file=None)
+        deadline = {"value": time.time() + 3600}
+
+        async def noop():
+            pass
+
+        scheduler.schedule("job", noop, next_run_func=lambda: deadline["value"])
+        deadline["value"] = time.time() + 10
+        assert scheduler.reschedule("job") is True
+        assert scheduler.get_job("job").next_run == deadline["value"]
+        assert scheduler.reschedule("missing") is False
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_retried(self):
+        """A raising job is retried after retry_seconds"""
+        scheduler = EventScheduler(state_file=None)
+        attempts = []
+
+        async def flaky():
+            attempts.append(time.time())
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+
+        scheduler.schedule(
+            "flaky",
+            flaky,
+            interval_seconds=3600,
+            first_run=time.time(),
+            retry_seconds=0.05,
+        )
+        await asyncio.sleep(0.3)
+        await scheduler.stop()
+
+        job = scheduler.get_job("flaky")
+        assert len(attempts) == 2
+        assert job.error_count == 1
+        assert job.run_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_progress_backs_off(self):
+        """A job that is still due after running waits retry_seconds"""
+        scheduler = EventScheduler(state_file=None)
+        runs = []
+
+        async def job():
+            runs.append(1)
+
+        scheduler.schedule(
+            "stuck", job, next_run_func=lambda: time.time() - 1, retry_seconds=60
+        )
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+
+        assert len(runs) == 1
+        assert scheduler.get_job("stuck").next_run > time.time() + 50
+
+    @pytest.mark.asyncio
+    async def test_cancel_drops_job(self):
+        """Cancelled jobs never fire"""
+        scheduler = EventScheduler(state_file=None)
+        fired = []
+
+        async def job():
+            fired.append(1)
+
+        scheduler.schedule("job", job, interval_seconds=60, first_run=time.time() + 0.05)
+        assert scheduler.cancel("job") is True
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+
+        assert fired == []
+        assert scheduler.get_job("job") is None
+
+    def test_jitter_delays_deadline(self):
+        """Jitter only ever pushes deadlines later, within the bound"""
+        scheduler = EventScheduler(state_file=None)
+
+        async def noop():
+            pass
+
+        before = time.time()
+        job = scheduler.schedule("job", noop, interval_seconds=10, jitter_seconds=5)
+        assert before + 10 <= job.next_run <= time.time() + 15
+
+    def test_jitter_applies_to_next_run_func(self):
+        """Policy-driven first deadlines are jittered too"""
+        scheduler = EventScheduler(state_file=None)
+        deadline = time.time() + 100
+
+        async def noop():
+            pass
+
+        job = scheduler.schedule(
+            "job", noop, next_run_func=lambda: deadline, jitter_seconds=5
+        )
+        assert deadline <= job.next_run <= deadline + 5
+
+    def test_persisted_deadline_survives_restart(self, state_file):
+        """Persistent jobs resume from the saved next-fire time"""
+
+        async def noop():
+            pass
+
+        saved_deadline = time.time() + 1234
+        scheduler = EventScheduler(state_file=state_file)
+        scheduler.schedule(
+            "job", noop, interval_seconds=60, first_run=saved_deadline, persist=True
+        )
+
+        with open(state_file) as f:
+            assert json.load(f)["jobs"]["job"]["next_run"] == saved_deadline
+
+        restarted = EventScheduler(state_file=state_file)
+        job = restarted.schedule("job", noop, interval_seconds=60, persist=True)
+        assert job.next_run == saved_deadline
+
+    @pytest.mark.asyncio
+    async def test_state_writes_are_coalesced(self, state_file):
+        """Reschedules on the loop share one deferred write, flushed on stop"""
+
+        async def noop():
+            pass
+
+        scheduler = EventScheduler(state_file=state_file, state_flush_interval=60)
+        scheduler.schedule("job", noop, interval_seconds=60, persist=True)
+        for _ in range(5):
+            scheduler.reschedule("job")
+
+        assert not state_file.exists()
+
+        await scheduler.stop()
+        with open(state_file) as f:
+            saved = json.load(f)["jobs"]["job"]["next_run"]
+        assert saved == scheduler.get_job("job").next_run
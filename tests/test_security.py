@@ -12,6 +12,7 @@ import discord
 import pytest
 
 from src.core.exceptions import RateLimitError, SecurityError, ValidationError
+from src.core.rate_limit_engine import RateLimitEngine
 from src.core.security import (
     InputValidator,
     RateLimiter,
@@ -41,15 +42,7 @@ async def mock_logger():
 @pytest.fixture
 async def rate_limiter(mock_logger):
     """Create a RateLimiter instance for testing"""
-    limiter = RateLimiter(logger=mock_logger)
-    yield limiter
-    # Cleanup
-    if limiter._cleanup_task and not limiter._cleanup_task.done():
-        limiter._cleanup_task.cancel()
-        try:
-            await limiter._cleanup_task
-        except asyncio.CancelledError:
-            pass
+    return RateLimiter(logger=mock_logger, engine=RateLimitEngine())
 
 
 @pytest.fixture
@@ -15,6 +15,7 @@ import pytest
 
 from src.config.bot_config import BotConfig
 from src.core.exceptions import ConfigurationError, SecurityError, ValidationError
+from src.core.rate_limit_engine import RateLimitEngine
 from src.core.security import (
     InputValidator,
     RateLimiter,
@@ -66,7 +67,7 @@ def mock_ctx():
 @pytest.fixture
 async def rate_limiter(mock_logger):
     """Create RateLimiter instance for testing"""
-    return RateLimiter(logger=mock_logger)
+    return RateLimiter(logger=mock_logger, engine=RateLimitEngine())
 
 
 @pytest.fixture
@@ -0,0 +1,109 @@
+# =============================================================================
+# QuranBot - Seek Index Tests
+# =============================================================================
+# Tests for MP3 seek tables: frame scanning, byte-offset lookup, FFmpeg
+# option generation, invalidation and persistence.
+# =============================================================================
+
+import os
+from pathlib import Path
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.opus_library import OpusLibrary
+from src.utils.seek_index import SeekIndex, build_seek_table
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, no padding: 417-byte frames of 1152 samples
+FRAME_HEADER = b"\xff\xfb\x90\x00"
+FRAME_LENGTH = 417
+FRAME_SECONDS = 1152 / 44100
+ID3_TAG = b"ID3\x04\x00\x00\x00\x00\x00\x16" + b"\x00" * 22  # 32-byte tag
+
+
+def write_mp3(path: Path, frames: int, xing: bool = True) -> None:
+    """Write a synthetic MP3 with an ID3 tag, optional Xing frame and silent frames"""
+    frame = FRAME_HEADER + b"\x00" * (FRAME_LENGTH - 4)
+    data = ID3_TAG
+    if xing:
+        data += FRAME_HEADER + b"\x00" * 32 + b"Xing" + b"\x00" * (FRAME_LENGTH - 40)
+    path.write_bytes(data + frame * frames)
+
+
+@pytest.fixture
+def audio_dir():
+    """Provide a reciter folder with one ~26 second track"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        reciter = Path(temp_dir) / "audio" / "Test Reciter"
+        reciter.mkdir(parents=True)
+        write_mp3(reciter / "002.mp3", frames=1000)
+        yield Path(temp_dir), reciter
+
+
+class TestSeekIndex:
+    """Test cases for SeekIndex"""
+
+    def test_build_seek_table_walks_frames(self, audio_dir):
+        """Entries land on frame boundaries; tags and Xing frames are skipped"""
+        _, reciter = audio_dir
+        table, duration = build_seek_table(str(reciter / "002.mp3"), interval=10)
+
+        first_audio_frame = len(ID3_TAG) + FRAME_LENGTH
+        assert duration == pytest.approx(1000 * FRAME_SECONDS)
+        assert [round(t) for t, _ in table] == [0, 10, 20]
+        assert table[0][1] == first_audio_frame
+        for seek_time, offset in table:
+            frame_number = (offset - first_audio_frame) / FRAME_LENGTH
+            assert frame_number == int(frame_number)
+            assert seek_time == pytest.approx(frame_number * FRAME_SECONDS, abs=1e-3)
+
+    def test_ffmpeg_options_use_byte_offset(self, audio_dir):
+        """Indexed files skip straight to a frame; others fall back to -ss"""
+        root, reciter = audio_dir
+        track = str(reciter / "002.mp3")
+        index = SeekIndex(root / "seek_index.json", interval=10)
+
+        assert index.ffmpeg_options(track, 15.0, "-vn") == ("-ss 15.0", "-vn")
+
+        index.index_track(track)
+        offset, remainder = index.lookup(track, 15.0)
+        before_options, options = index.ffmpeg_options(track, 15.0, "-vn")
+
+        assert before_options == f"-skip_initial_bytes {offset}"
+        assert options == f"-ss {remainder:.3f} -vn"
+        assert 0 <= remainder < 10
+        assert index.ffmpeg_options(track, 0, "-vn") == (None, "-vn")
+
+    @pytest.mark.asyncio
+    async def test_index_persists_and_invalidates(self, audio_dir):
+        """Tables survive a restart and are dropped when the file changes"""
+        root, reciter = audio_dir
+        track = str(reciter / "002.mp3")
+        index = SeekIndex(root / "seek_index.json", interval=10)
+
+        assert await index.index_folder(str(reciter)) == 1
+        assert await index.index_folder(str(reciter)) == 0
+
+        reloaded = SeekIndex(root / "seek_index.json", interval=10)
+        assert reloaded.lookup(track, 25.0) == index.lookup(track, 25.0)
+        assert reloaded.get_duration(track) == pytest.approx(26.122, abs=1e-3)
+        assert SeekIndex(root / "seek_index.json", interval=5).entries == {}
+
+        write_mp3(Path(track), frames=2000)
+        os.utime(track, ns=(0, 0))
+        assert reloaded.lookup(track, 25.0) is None
+
+    def test_opus_library_resumes_mp3_from_index(self, audio_dir):
+        """Unconverted tracks resume through the seek index"""
+        root, reciter = audio_dir
+        track = str(reciter / "002.mp3")
+        library = OpusLibrary(str(root / "audio"), "ffmpeg")
+        library.seek_index.index_track(track)
+
+        with patch("discord.FFmpegPCMAudio") as pcm_audio:
+            library.create_audio_source(track, position=12.0, pcm_options="-vn")
+
+        kwargs = pcm_audio.call_args.kwargs
+        assert kwargs["before_options"].startswith("-skip_initial_bytes ")
+        assert kwargs["options"].endswith(" -vn")
@@ -0,0 +1,124 @@
+# =============================================================================
+# QuranBot - Shuffle Playlist Tests
+# =============================================================================
+# Tests for persisted shuffle order: no-repeat cycles, peek/advance,
+# jumps, restart persistence and duration-aware modes.
+# =============================================================================
+
+from pathlib import Path
+import tempfile
+
+import pytest
+
+from src.utils.shuffle_playlist import ShuffleMode, ShufflePlaylist, ShufflePlaylistStore
+
+SURAHS = list(range(1, 115))
+
+
+@pytest.fixture
+def state_file():
+    """Provide a temporary playlist state file"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir) / "shuffle_playlists.json"
+
+
+class TestShufflePlaylist:
+    """Test cases for ShufflePlaylist"""
+
+    def test_every_surah_once_per_cycle(self):
+        """Each cycle is a permutation and never repeats across its boundary"""
+        playlist = ShufflePlaylist(SURAHS, seed=7)
+        played = [playlist.advance() for _ in range(len(SURAHS) * 5)]
+
+        for cycle in range(5):
+            chunk = played[cycle * len(SURAHS) : (cycle + 1) * len(SURAHS)]
+            assert sorted(chunk) == SURAHS
+        assert all(a != b for a, b in zip(played, played[1:]))
+        assert played[: len(SURAHS)] != SURAHS
+
+    def test_peek_matches_advance_and_seed_is_deterministic(self):
+        """peek_next() never consumes; the same seed gives the same order"""
+        playlist = ShufflePlaylist(SURAHS, seed=42)
+        twin = ShufflePlaylist(SURAHS, seed=42)
+
+        for _ in range(200):
+            peeked = playlist.peek_next()
+            assert playlist.peek_next() == peeked
+            assert playlist.advance() == peeked == twin.advance()
+
+    def test_jumps_and_step_back(self):
+        """A jumped-to surah is consumed; step_back returns the previous pick"""
+        playlist = ShufflePlaylist(SURAHS, seed=3)
+        first = playlist.advance()
+        jumped = 114 if first != 114 else 113
+        assert playlist.mark_played(jumped)
+        assert playlist.mark_played(jumped) is False
+
+        remaining = [playlist.advance() for _ in range(len(SURAHS) - 2)]
+        assert sorted(remaining) == sorted(set(SURAHS) - {first, jumped})
+
+        playlist = ShufflePlaylist(SURAHS, seed=3)
+        picks = [playlist.advance() for _ in range(3)]
+        assert playlist.step_back() == picks[1]
+        assert playlist.advance() == picks[2]
+
+    def test_last_pick_of_a_cycle_is_not_replayed(self):
+        """Marking the surah that ended a cycle leaves the next cycle intact"""
+        playlist = ShufflePlaylist(SURAHS, seed=7)
+        last = [playlist.advance() for _ in SURAHS][-1]
+
+        assert playlist.mark_played(last) is False
+        restored = ShufflePlaylist.from_dict(playlist.to_dict())
+        assert restored.mark_played(last) is False
+        assert sorted(restored.advance() for _ in SURAHS) == SURAHS
+
+    def test_exclude_long_mode(self):
+        """Surahs over the length limit are left out of the cycle"""
+        durations = {surah: 3600.0 if surah <= 10 else 300.0 for surah in SURAHS}
+        playlist = ShufflePlaylist(
+            SURAHS, seed=1, mode=ShuffleMode.EXCLUDE_LONG, durations=durations
+        )
+        played = {playlist.advance() for _ in range(200)}
+        assert played == set(range(11, 115))
+
+    def test_weighted_mode_plays_short_surahs_earlier(self):
+        """Shorter surahs tend to come earlier while all still play once"""
+        durations = {surah: 7200.0 / surah for surah in SURAHS}
+        positions = {2: 0, 114: 0}
+        for seed in range(100):
+            playlist = ShufflePlaylist(
+                SURAHS, seed=seed, mode=ShuffleMode.WEIGHTED_BY_DURATION, durations=durations
+            )
+            assert sorted(playlist.order) == SURAHS
+            for surah in positions:
+                positions[surah] += playlist.order.index(surah)
+
+        assert positions[114] < positions[2]
+
+
+class TestShufflePlaylistStore:
+    """Test cases for ShufflePlaylistStore"""
+
+    def test_cursor_survives_restart(self, state_file):
+        """A restored playlist continues where it left off"""
+        store = ShufflePlaylistStore(state_file)
+        playlist = store.get("Test Reciter", SURAHS)
+        for _ in range(10):
+            playlist.advance()
+        store.save()
+
+        restored = ShufflePlaylistStore(state_file).get("Test Reciter", SURAHS)
+        assert restored.order == playlist.order
+        assert restored.peek_next() == playlist.peek_next()
+
+    def test_library_or_mode_change_reshuffles(self, state_file):
+        """New surahs or a new mode start a fresh permutation"""
+        store = ShufflePlaylistStore(state_file)
+        playlist = store.get("Test Reciter", SURAHS[:100])
+        playlist.advance()
+
+        grown = store.get("Test Reciter", SURAHS)
+        assert grown is not playlist
+        assert sorted(grown.order) == SURAHS and grown.cursor == 0
+
+        assert store.get("Test Reciter", SURAHS, ShuffleMode.EXCLUDE_LONG) is not grown
@@ -0,0 +1,163 @@
+# =============================================================================
+# QuranBot - Snapshot Store Tests
+# =============================================================================
+# Tests for incremental, content-addressed backups: storing only changed
+# content, skipping unchanged snapshots, restoring, retention and keeping
+# partial snapshots out of the way of full ones.
+# =============================================================================
+
+import json
+from pathlib import Path
+import tempfile
+
+import pytest
+
+from src.utils.snapshot_store import SNAPSHOT_KIND_PARTIAL, SnapshotStore
+
+
+@pytest.fixture
+def dirs():
+    """A temporary data directory and snapshot store"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_dir = Path(temp_dir) / "data"
+        data_dir.mkdir()
+        yield data_dir, SnapshotStore(Path(temp_dir) / "snapshots", data_dir)
+
+
+def write(data_dir, name, content):
+    path = data_dir / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(content))
+    return path
+
+
+class TestSnapshotStore:
+    """Test cases for SnapshotStore"""
+
+    def test_only_changed_files_are_stored(self, dirs):
+        """A second snapshot stores just the file that changed"""
+        data_dir, store = dirs
+        files = [
+            write(data_dir, "playback_state.json", {"surah": 1}),
+            write(data_dir, "quiz_stats.json", {"scores": {}}),
+        ]
+
+        first = store.snapshot(files)
+        assert first.snapshot_id and first.new_blobs == 2
+
+        write(data_dir, "playback_state.json", {"surah": 2})
+        second = store.snapshot(files)
+        assert second.snapshot_id != first.snapshot_id
+        assert second.changed_files == 1 and second.new_blobs == 1
+        assert store.get_stats()["blobs"] == 3
+
+    def test_unchanged_data_creates_no_snapshot(self, dirs):
+        """Nothing changed, nothing written"""
+        data_dir, store = dirs
+        files = [write(data_dir, "bot_stats.json", {"runtime": 1})]
+        store.snapshot(files)
+
+        result = store.snapshot(files)
+
+        assert result.snapshot_id is None and result.new_blobs == 0
+        assert len(store.list_snapshots()) == 1
+
+    def test_identical_content_is_deduplicated(self, dirs):
+        """Two files with the same content share one blob"""
+        data_dir, store = dirs
+        files = [write(data_dir, name, {}) for name in ("a.json", "b.json")]
+
+        result = store.snapshot(files)
+
+        assert result.files == 2 and result.new_blobs == 1
+
+    def test_restore_rewrites_only_differing_files(self, dirs):
+        """Restoring brings back the snapshot's content"""
+        data_dir, store = dirs
+        state = write(data_dir, "playback_state.json", {"surah": 1})
+        stats = write(data_dir, "bot_stats.json", {"runtime": 1})
+        snapshot_id = store.snapshot([state, stats]).snapshot_id
+
+        write(data_dir, "playback_state.json", {"surah": 99})
+        restored = store.restore(snapshot_id)
+
+        assert restored == ["playback_state.json"]
+        assert json.loads(state.read_text()) == {"surah": 1}
+
+        other_dir = data_dir.parent / "restore"
+        assert sorted(store.restore(target_dir=other_dir)) == [
+            "bot_stats.json",
+            "playback_state.json",
+        ]
+
+    def test_prune_applies_retention_and_collects_blobs(self, dirs):
+        """Old snapshots and the blobs only they used are removed"""
+        data_dir, store = dirs
+        path = data_dir / "playback_state.json"
+        for surah in range(1, 6):
+            write(data_dir, "playback_state.json", {"surah": surah})
+            store.snapshot([path])
+
+        removed_snapshots, removed_blobs = store.prune(keep_recent=2, keep_daily=1)
+
+        assert removed_snapshots == 3 and removed_blobs == 3
+        assert len(store.list_snapshots()) == 2
+        assert store.restore() == []  # Latest still matches the data
+
+    def test_nested_files_are_keyed_by_relative_path(self, dirs):
+        """Per-guild files with the same name don't collide"""
+        data_dir, store = dirs
+        files = [
+            write(data_dir, f"sessions/{guild_id}/session.json", {"guild": guild_id})
+            for guild_id in (1, 2)
+        ]
+        store.snapshot(files)
+
+        write(data_dir, "sessions/2/session.json", {"guild": 0})
+        restored = store.restore()
+
+        assert restored == ["sessions/2/session.json"]
+        assert json.loads(files[1].read_text()) == {"guild": 2}
+
+    def test_files_outside_data_dir_are_rejected(self, dirs):
+        """A file the data directory can't hold is reported, not renamed"""
+        data_dir, store = dirs
+        outside = write(data_dir.parent, "stray.json", {})
+
+        result = store.snapshot([outside])
+
+        assert result.failed == ["stray.json"] and result.files == 0
+
+    def test_partial_snapshots_are_not_the_latest(self, dirs):
+        """A partial snapshot is neither the restore target nor the baseline"""
+        data_dir, store = dirs
+        state = write(data_dir, "playback_state.json", {"surah": 1})
+        quiz = write(data_dir, "quiz_stats.json", {"scores": {}})
+        full_id = store.snapshot([state, quiz]).snapshot_id
+
+        write(data_dir, "playback_state.json", {"surah": 2})
+        partial = store.snapshot([state], "disconnect", kind=SNAPSHOT_KIND_PARTIAL)
+        assert partial.snapshot_id
+        assert store.load_manifest()["id"] == full_id
+
+        # Still changed relative to the last full snapshot
+        result = store.snapshot([state, quiz])
+        assert result.snapshot_id and result.changed_files == 1
+        assert [s["kind"] for s in store.list_snapshots()].count("partial") == 1
+
+    def test_partial_snapshots_have_their_own_retention(self, dirs):
+        """Partial snapshots can't push full snapshots out"""
+        data_dir, store = dirs
+        path = data_dir / "playback_state.json"
+        write(data_dir, "playback_state.json", {"surah": 0})
+        full_id = store.snapshot([path]).snapshot_id
+        for surah in range(1, 6):
+            write(data_dir, "playback_state.json", {"surah": surah})
+            store.snapshot([path], kind=SNAPSHOT_KIND_PARTIAL)
+
+        removed_snapshots, _ = store.prune(keep_recent=1, keep_daily=1, keep_partial=2)
+
+        assert removed_snapshots == 3
+        kinds = [s["kind"] for s in store.list_snapshots()]
+        assert kinds.count("full") == 1 and kinds.count("partial") == 2
+        assert store.load_manifest()["id"] == full_id
@@ -0,0 +1,121 @@
+# =============================================================================
+# QuranBot - Startup Orchestrator Tests
+# =============================================================================
+# Tests for dependency-ordered startup: concurrency, ordering, skipping
+# dependents of failed phases, critical failures and validation.
+# =============================================================================
+
+import asyncio
+
+import pytest
+
+from src.utils.startup_orchestrator import StartupOrchestrator
+
+
+def recording_phase(name, events, delay=0.0, error=None):
+    """Build a phase that records its start and end"""
+
+    async def run():
+        events.append(f"{name}:start")
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        events.append(f"{name}:end")
+
+    return run
+
+
+class TestStartupOrchestrator:
+    """Test cases for StartupOrchestrator"""
+
+    @pytest.mark.asyncio
+    async def test_independent_phases_run_concurrently(self):
+        """Phases without dependencies start together"""
+        events = []
+        startup = StartupOrchestrator()
+        startup.add("voice", recording_phase("voice", events, delay=0.05))
+        startup.add("panel", recording_phase("panel", events, delay=0.05))
+
+        timings = await startup.run()
+
+        assert events[:2] == ["voice:start", "panel:start"]
+        assert startup.total_duration < 0.09
+        assert {timing.status for timing in timings.values()} == {"ok"}
+
+    @pytest.mark.asyncio
+    async def test_dependents_wait_only_for_their_dependencies(self):
+        """A phase starts once its dependencies end, not after unrelated ones"""
+        events = []
+        startup = StartupOrchestrator()
+        startup.add("state", recording_phase("state", events, delay=0.01))
+        startup.add("slow", recording_phase("slow", events, delay=0.05))
+        startup.add(
+            "audio", recording_phase("audio", events), depends_on=("state",)
+        )
+
+        await startup.run()
+
+        assert events.index("audio:start") > events.index("state:end")
+        assert events.index("audio:end") < events.index("slow:end")
+        assert startup.timings["audio"].started_at >= startup.timings["state"].duration
+
+    @pytest.mark.asyncio
+    async def test_failed_phase_skips_dependents(self):
+        """Non-critical failures skip dependents without failing startup"""
+        events = []
+        startup = StartupOrchestrator()
+        startup.add(
+            "verses",
+            recording_phase("verses", events, error=RuntimeError("no channel")),
+            critical=False,
+        )
+        startup.add(
+            "quiz",
+            recording_phase("quiz", events),
+            depends_on=("verses",),
+            critical=False,
+        )
+        startup.add("playback", recording_phase("playback", events))
+
+        timings = await startup.run()
+
+        assert timings["verses"].status == "failed"
+        assert timings["quiz"].status == "skipped"
+        assert timings["playback"].status == "ok"
+        assert "quiz:start" not in events
+
+    @pytest.mark.asyncio
+    async def test_critical_failure_is_raised_after_others_settle(self):
+        """The critical phase's own error is raised once everything finishes"""
+        events = []
+        startup = StartupOrchestrator()
+        startup.add(
+            "playback", recording_phase("playback", events, error=ValueError("boom"))
+        )
+        startup.add(
+            "panel", recording_phase("panel", events, delay=0.02), critical=False
+        )
+
+        with pytest.raises(ValueError, match="boom"):
+            await startup.run()
+
+        assert "panel:end" in events
+
+    def test_invalid_graphs_are_rejected(self):
+        """Duplicates, unknown dependencies and cycles fail before anything runs"""
+        events = []
+        startup = StartupOrchestrator()
+        startup.add("a", recording_phase("a", events))
+        with pytest.raises(ValueError):
+            startup.add("a", recording_phase("a", events))
+
+        startup.add("b", recording_phase("b", events), depends_on=("missing",))
+        with pytest.raises(ValueError, match="unknown"):
+            asyncio.run(startup.run())
+
+        startup = StartupOrchestrator()
+        startup.add("a", recording_phase("a", events), depends_on=("b",))
+        startup.add("b", recording_phase("b", events), depends_on=("a",))
+        with pytest.raises(ValueError, match="cycle"):
+            asyncio.run(startup.run())
+        assert events == []
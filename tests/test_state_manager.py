@@ -9,6 +9,7 @@ import json
 import os
 import shutil
 import sys
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -201,6 +202,19 @@ class TestStateManager:
         stats = self.manager.load_bot_stats()
         assert stats["surahs_completed"] == 3
 
+    def test_concurrent_completions_are_all_counted(self):
+        """Completions saved from worker threads don't lose updates"""
+        manager = StateManager(data_dir=str(self.data_dir))
+        threads = [
+            threading.Thread(target=manager.mark_surah_completed) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert manager.load_bot_stats()["surahs_completed"] == 8
+
     def test_resume_info(self):
         """Test resume information retrieval"""
         # Save playback state
@@ -361,6 +361,9 @@ class TestBackupAndRecovery:
         # Create a few manual backups with some delay to ensure different timestamps
         backup1 = await state_service.create_manual_backup("Backup 1")
         await asyncio.sleep(0.1)  # Small delay to ensure different timestamps
+        await state_service.save_playback_state(
+            surah_number=4, position_seconds=10.0, reciter="Listing Test Reciter"
+        )
         backup2 = await state_service.create_manual_backup("Backup 2")
 
         # Verify backups were created
@@ -411,6 +414,17 @@ class TestBackupAndRecovery:
         success = await state_service.restore_from_backup("nonexistent_backup")
         assert success is False
 
+    @pytest.mark.asyncio
+    async def test_unchanged_state_is_not_backed_up_twice(self, state_service):
+        """A backup of unchanged state reuses the latest snapshot"""
+        await state_service.initialize()
+
+        first = await state_service.create_manual_backup("First")
+        second = await state_service.create_manual_backup("Second")
+
+        assert second.backup_id == first.backup_id
+        assert len(await state_service.list_backups()) == 1
+
 
 class TestStateValidation:
     """Test state validation and integrity checking"""
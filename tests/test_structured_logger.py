@@ -169,6 +169,16 @@ class TestStructuredLogger:
         assert logger._logger.level == logging.DEBUG
         assert len(logger._logger.handlers) == 1  # File handler only
 
+    def test_is_enabled_for(self):
+        """Test level checks used to gate debug output."""
+        logger = StructuredLogger("test_level_logger", console_output=False)
+
+        assert logger.is_enabled_for(logging.INFO)
+        assert not logger.is_enabled_for(logging.DEBUG)
+
+        logger._logger.setLevel(logging.DEBUG)
+        assert logger.is_enabled_for(logging.DEBUG)
+
     def test_correlation_id_management(self):
         """Test correlation ID setting and getting."""
         logger = StructuredLogger("test_logger", console_output=False)
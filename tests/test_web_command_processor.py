@@ -0,0 +1,141 @@
+# =============================================================================
+# QuranBot - Web Command Processor Tests
+# =============================================================================
+# Tests for the web dashboard command queue: event-driven intake, moving
+# finished commands out of the queue and the compacted results journal.
+# =============================================================================
+
+import asyncio
+import json
+from pathlib import Path
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils import web_command_processor as wcp
+from src.utils.scheduler import EventScheduler
+
+
+@pytest.fixture
+def queue_dir():
+    """Provide a temporary command queue directory"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir) / "command_queue"
+
+
+@pytest.fixture(autouse=True)
+def isolated_scheduler():
+    """Keep polling jobs off the global scheduler"""
+    scheduler = EventScheduler(state_file=None)
+    with patch.object(wcp, "get_event_scheduler", return_value=scheduler):
+        yield scheduler
+
+
+def write_command(queue_dir: Path, command_id: str, **fields) -> Path:
+    """Write a command file the way the dashboard does"""
+    command = {"id": command_id, "type": "bot_control", "status": "pending"}
+    command.update(fields)
+    command_file = queue_dir / f"{command_id}.json"
+    with open(command_file, "w") as f:
+        json.dump(command, f)
+    return command_file
+
+
+async def wait_for(condition, timeout: float = 3.0):
+    """Poll a condition until it holds or the timeout expires"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise TimeoutError("condition not met")
+        await asyncio.sleep(0.02)
+
+
+class TestWebCommandProcessor:
+    """Test cases for WebCommandProcessor"""
+
+    @pytest.mark.asyncio
+    async def test_existing_commands_processed_on_start(self, queue_dir):
+        """Commands queued while offline are picked up at startup"""
+        queue_dir.mkdir(parents=True)
+        command_file = write_command(queue_dir, "cmd1", data={"action": "start"})
+
+        processor = wcp.WebCommandProcessor(MagicMock(), queue_dir=queue_dir)
+        processor.start_processing()
+        try:
+            done_file = queue_dir / "done" / "cmd1.json"
+            await wait_for(done_file.exists)
+        finally:
+            processor.stop_processing()
+
+        assert not command_file.exists()
+        with open(done_file) as f:
+            assert json.load(f)["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_new_command_detected(self, queue_dir):
+        """Commands written after startup are processed promptly"""
+        processor = wcp.WebCommandProcessor(MagicMock(), queue_dir=queue_dir)
+        processor.start_processing()
+        try:
+            if processor.intake_mode == "polling":
+                pytest.skip("inotify not available on this platform")
+            write_command(queue_dir, "cmd2", data={"action": "bogus"})
+            await wait_for((queue_dir / "failed" / "cmd2.json").exists, timeout=1.0)
+        finally:
+            processor.stop_processing()
+
+        results = processor.get_recent_results()
+        assert results[-1]["id"] == "cmd2"
+        assert results[-1]["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_polling_fallback(self, queue_dir, isolated_scheduler):
+        """Without inotify the queue is polled via the event scheduler"""
+        with patch.object(wcp.InotifyWatcher, "is_supported", return_value=False):
+            processor = wcp.WebCommandProcessor(MagicMock(), queue_dir=queue_dir)
+            processor.start_processing()
+
+        try:
+            assert processor.intake_mode == "polling"
+            assert isolated_scheduler.get_job(wcp.WEB_COMMAND_JOB_NAME) is not None
+
+            write_command(queue_dir, "cmd3", data={"action": "start"})
+            processor._last_dir_mtime_ns = None  # Coarse mtime filesystems
+            await processor._poll_queue_directory()
+            await wait_for((queue_dir / "done" / "cmd3.json").exists)
+        finally:
+            processor.stop_processing()
+            await isolated_scheduler.stop()
+
+        assert isolated_scheduler.get_job(wcp.WEB_COMMAND_JOB_NAME) is None
+
+    @pytest.mark.asyncio
+    async def test_legacy_results_archived_not_rerun(self, queue_dir):
+        """Already-processed files from the old in-place queue are only moved"""
+        queue_dir.mkdir(parents=True)
+        write_command(queue_dir, "old", status="completed")
+
+        processor = wcp.WebCommandProcessor(MagicMock(), queue_dir=queue_dir)
+        with patch.object(processor, "_process_command") as process:
+            processor.start_processing()
+            try:
+                await wait_for((queue_dir / "done" / "old.json").exists)
+            finally:
+                processor.stop_processing()
+            process.assert_not_called()
+
+    def test_journal_compaction(self, queue_dir):
+        """The results journal is trimmed once it doubles its cap"""
+        queue_dir.mkdir(parents=True)
+        processor = wcp.WebCommandProcessor(MagicMock(), queue_dir=queue_dir)
+
+        with patch.object(wcp, "JOURNAL_MAX_ENTRIES", 5):
+            for i in range(11):
+                processor._append_journal_entry({"id": f"cmd{i}"})
+
+        with open(processor.journal_file) as f:
+            lines = f.readlines()
+        assert len(lines) == 5
+        assert json.loads(lines[-1])["id"] == "cmd10"
+        assert [r["id"] for r in processor.get_recent_results(2)] == ["cmd9", "cmd10"]
@@ -12,6 +12,8 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from src.core import webhook_logger as webhook_logger_module
+from src.core.rate_limit_engine import RateLimitEngine
 from src.core.structured_logger import StructuredLogger
 from src.core.webhook_logger import (
     EmbedField,
@@ -29,6 +31,12 @@ from src.core.webhook_logger import (
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def fresh_rate_limit_engine(monkeypatch):
+    """Give each test its own engine instead of the shared one"""
+    monkeypatch.setattr(webhook_logger_module, "get_rate_limit_engine", RateLimitEngine)
+
+
 @pytest.fixture
 def webhook_config():
     """Create a test webhook configuration."""
@@ -240,6 +248,27 @@ class TestRateLimitTracker:
         retry_after = await tracker.get_retry_after()
         assert 55 <= retry_after <= 60  # Should be close to window size
 
+    @pytest.mark.asyncio
+    async def test_trackers_have_separate_budgets(self):
+        """Two trackers on the shared engine don't consume each other's limit."""
+        engine = RateLimitEngine()
+        first = RateLimitTracker(max_requests=1, window_seconds=60, engine=engine)
+        second = RateLimitTracker(max_requests=1, window_seconds=60, engine=engine)
+
+        assert await first.can_proceed() is True
+        assert await second.can_proceed() is True
+        assert await first.can_proceed() is False
+
+    @pytest.mark.asyncio
+    async def test_trackers_for_one_webhook_share_a_budget(self):
+        """Trackers given the same key draw on one limit."""
+        engine = RateLimitEngine()
+        first = RateLimitTracker(1, 60, engine=engine, key="hook")
+        second = RateLimitTracker(1, 60, engine=engine, key="hook")
+
+        assert await first.can_proceed() is True
+        assert await second.can_proceed() is False
+
 
 # =============================================================================
 # Message Formatting Tests
@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Hot Path Benchmarks
+# =============================================================================
+# Reproducible benchmarks for the code the bot actually runs on every event,
+# against synthetic fixtures sized like a busy server:
+#
+# - Surah lookups and searches (control panel, commands, presence)
+# - Listening stats join/leave/save with 10k tracked users
+# - Quiz question selection with 1k questions and stats updates with 10k scores
+# - Tree logger file writes into large existing log files
+# - Control panel embed rendering
+# - The Discord API monitor's HTTP request wrapper
+#
+# Fixtures and log output live in a temporary directory; live data files are
+# never read or written by the benchmarks themselves. Results are written as JSON and compared against a stored
+# baseline; any benchmark slower than the baseline by more than the
+# threshold fails the run with exit code 1.
+#
+# Usage:
+#   python tools/benchmark.py                   # Run and compare to baseline
+#   python tools/benchmark.py --save-baseline   # Record a new baseline
+#   python tools/benchmark.py --quick           # Smaller fixtures, fewer runs
+#   python tools/benchmark.py --only quiz       # Benchmarks matching "quiz"
+# =============================================================================
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import contextlib
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+import io
+import json
+import os
+from pathlib import Path
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+RESULTS_DIR = project_root / "performance_data"
+BASELINE_FILE = RESULTS_DIR / "benchmark_baseline.json"
+
+# A benchmark regresses when its median is this much slower than baseline
+DEFAULT_THRESHOLD = 0.25
+
+# Medians below this are too noisy to compare meaningfully
+MIN_COMPARABLE_MS = 0.005
+
+# Fixed seed so every run builds identical fixtures
+FIXTURE_SEED = 1234
+
+
+@dataclass
+class FixtureSizes:
+    """How large the synthetic data sets are"""
+
+    users: int = 10_000
+    questions: int = 1_000
+    log_mb: int = 20
+    repeat: int = 1  # Multiplier for iteration counts
+
+
+FULL_SIZES = FixtureSizes()
+QUICK_SIZES = FixtureSizes(users=1_000, questions=200, log_mb=2, repeat=0)
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing summary for one benchmark, in milliseconds per operation"""
+
+    name: str
+    iterations: int
+    mean_ms: float
+    median_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_samples(cls, name: str, samples: list[float]) -> "BenchmarkResult":
+        ordered = sorted(samples)
+        ms = [sample * 1000 for sample in ordered]
+        return cls(
+            name=name,
+            iterations=len(ms),
+            mean_ms=round(statistics.fmean(ms), 4),
+            median_ms=round(statistics.median(ms), 4),
+            p95_ms=round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 4),
+            min_ms=round(ms[0], 4),
+            max_ms=round(ms[-1], 4),
+        )
+
+
+# =============================================================================
+# Timing
+# =============================================================================
+
+
+def iterations(base: int, sizes: FixtureSizes) -> int:
+    """Scale an iteration count; quick runs use a fifth of it"""
+    return max(3, base * sizes.repeat if sizes.repeat else base // 5)
+
+
+def time_calls(operation: Callable[[], object], count: int, warmup: int = 2) -> list[float]:
+    """Seconds taken by each of `count` calls to `operation`"""
+    for _ in range(warmup):
+        operation()
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def time_async_calls(operation, count: int, warmup: int = 2) -> list[float]:
+    """Seconds taken by each of `count` awaits of `operation()`"""
+    for _ in range(warmup):
+        await operation()
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        await operation()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+# Each benchmark takes the fixture directory and sizes and returns a list of
+# results. Project modules are imported inside the benchmarks so they load
+# after logging has been redirected into the fixture directory.
+
+BENCHMARKS: dict[str, Callable[[Path, FixtureSizes], list[BenchmarkResult]]] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark function under `name`"""
+
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+@benchmark("surah_mapper")
+def bench_surah_mapper(root: Path, sizes: FixtureSizes) -> list[BenchmarkResult]:
+    from src.utils.surah_mapper import get_surah_info, search_surahs
+
+    numbers = iter(range(10**9))
+    queries = ["Al-Fatiha", "baqarah", "36", "Yasin", "rahman", "nas", "zzz"]
+
+    def lookup():
+        get_surah_info(next(numbers) % 114 + 1)
+
+    def search():
+        search_surahs(queries[next(numbers) % len(queries)])
+
+    return [
+        BenchmarkResult.from_samples(
+            "surah_mapper.get_surah_info", time_calls(lookup, iterations(2000, sizes))
+        ),
+        BenchmarkResult.from_samples(
+            "surah_mapper.search_surahs", time_calls(search, iterations(500, sizes))
+        ),
+    ]
+
+
+@benchmark("listening_stats")
+def bench_listening_stats(root: Path, sizes: FixtureSizes) -> list[BenchmarkResult]:
+    from src.utils import listening_stats
+
+    data_dir = root / "listening_stats"
+    data_dir.mkdir()
+    listening_stats.DATA_DIR = data_dir
+    listening_stats.STATS_FILE = data_dir / "listening_stats.json"
+    listening_stats.TEMP_BACKUP_DIR = data_dir / "backup"
+
+    manager = listening_stats.ListeningStatsManager()
+    rng = random.Random(FIXTURE_SEED)
+    for user_id in range(sizes.users):
+        manager.users[user_id] = listening_stats.UserStats(
+            user_id, total_time=rng.uniform(0, 500_000), sessions=rng.randint(1, 400)
+        )
+    manager.total_listening_time = sum(user.total_time for user in manager.users.values())
+    manager.total_sessions = sum(user.sessions for user in manager.users.values())
+    manager.save_stats()
+
+    user_ids = iter(range(10**9))
+
+    def join_leave():
+        user_id = next(user_ids) % sizes.users
+        manager.user_joined_voice(user_id)
+        manager.user_left_voice(user_id)
+
+    return [
+        BenchmarkResult.from_samples(
+            "listening_stats.join_leave", time_calls(join_leave, iterations(20, sizes))
+        ),
+        BenchmarkResult.from_samples(
+            "listening_stats.save_stats", time_calls(manager.save_stats, iterations(20, sizes))
+        ),
+        BenchmarkResult.from_samples(
+            "listening_stats.load_stats", time_calls(manager.load_stats, iterations(10, sizes))
+        ),
+    ]
+
+
+@benchmark("quiz_manager")
+def bench_quiz_manager(root: Path, sizes: FixtureSizes) -> list[BenchmarkResult]:
+    from src.utils import quiz_manager
+
+    data_dir = root / "quiz"
+    data_dir.mkdir()
+    quiz_manager.QUIZ_DATA_FILE = data_dir / "quiz_data.json"
+    quiz_manager.QUIZ_STATS_FILE = data_dir / "quiz_stats.json"
+    quiz_manager.RECENT_QUESTIONS_FILE = data_dir / "recent_questions.json"
+    quiz_manager.QUIZ_STATE_FILE = data_dir / "quiz_state.json"
+
+    rng = random.Random(FIXTURE_SEED)
+    manager = quiz_manager.QuizManager(data_dir)
+    manager.questions = [
+        {
+            "question": f"Synthetic question {n}: which surah comes after surah {n % 113 + 1}?",
+            "options": [f"Option {n}-{letter}" for letter in "ABCD"],
+            "correct_answer": rng.randint(0, 3),
+            "difficulty": rng.choice(["easy", "medium", "hard"]),
+            "category": rng.choice(["general", "quran", "history", "fiqh"]),
+            "created_at": "2025-01-01T00:00:00+00:00",
+            "times_asked": 0,
+            "times_correct": 0,
+            "last_asked": None,
+        }
+        for n in range(sizes.questions)
+    ]
+    manager.save_state()
+
+    with open(quiz_manager.QUIZ_STATS_FILE, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "user_scores": {
+                    str(user_id): {
+                        "correct": rng.randint(0, 200),
+                        "total": 200,
+                        "points": rng.randint(0, 2000),
+                        "streak": rng.randint(0, 10),
+                        "best_streak": rng.randint(0, 30),
+                    }
+                    for user_id in range(sizes.users)
+                }
+            },
+            f,
+        )
+
+    user_ids = iter(range(10**9))
+
+    def update_stats():
+        manager.update_quiz_stats_file(next(user_ids) % sizes.users, True)
+
+    return [
+        BenchmarkResult.from_samples(
+            "quiz_manager.get_random_question",
+            time_calls(manager.get_random_question, iterations(30, sizes)),
+        ),
+        BenchmarkResult.from_samples(
+            "quiz_manager.update_quiz_stats_file",
+            time_calls(update_stats, iterations(20, sizes)),
+        ),
+    ]
+
+
+@benchmark("tree_log")
+def bench_tree_log(root: Path, sizes: FixtureSizes) -> list[BenchmarkResult]:
+    from src.utils.tree_log import TreeLogger
+
+    logger = TreeLogger()
+    logger.log_dir = root / "tree_log" / logger._get_log_date()
+    logger.log_dir.mkdir(parents=True)
+
+    # Pre-fill the day's log files so appends land on large files
+    line = f"{logger._get_timestamp()} [INFO] ├─ synthetic: {'x' * 100}\n"
+    json_line = json.dumps({"timestamp": "", "level": "INFO", "message": "x" * 100}) + "\n"
+    for name, content in (("logs.log", line), ("logs.json", json_line)):
+        with open(logger.log_dir / name, "w", encoding="utf-8") as f:
+            chunk = content * 1000
+            for _ in range(sizes.log_mb * 1024 * 1024 // len(chunk)):
+                f.write(chunk)
+
+    messages = iter(range(10**9))
+
+    def write_info():
+        logger._write_to_log_files(f"├─ listener_{next(messages)}: 🎧 joined", "INFO", "voice")
+
+    def write_error():
+        logger._write_to_log_files("└─ error: ❌ synthetic failure", "ERROR", "error")
+
+    return [
+        BenchmarkResult.from_samples(
+            "tree_log.write_info", time_calls(write_info, iterations(1000, sizes))
+        ),
+        BenchmarkResult.from_samples(
+            "tree_log.write_error", time_calls(write_error, iterations(500, sizes))
+        ),
+    ]
+
+
+@benchmark("control_panel")
+def bench_control_panel(root: Path, sizes: FixtureSizes) -> list[BenchmarkResult]:
+    from src.utils.control_panel import SimpleControlPanelView
+
+    bot = Mock()
+    bot.user.avatar.url = "https://cdn.discordapp.com/avatars/1/a.png"
+
+    audio_manager = Mock()
+    audio_manager.get_playback_status.return_value = {
+        "is_playing": True,
+        "is_paused": False,
+        "current_surah": 36,
+        "current_reciter": "Saad Al Ghamdi",
+        "current_time": 754,
+        "total_time": 1460,
+    }
+
+    async def run() -> list[float]:
+        # Views need a running event loop
+        view = SimpleControlPanelView(bot, audio_manager)
+        view._update_last_activity(Mock(mention="<@1>", display_name="Listener"), "Play")
+        return time_calls(view._create_panel_embed, iterations(300, sizes))
+
+    return [BenchmarkResult.from_samples("control_panel.create_panel_embed", asyncio.run(run()))]
+
+
+@benchmark("discord_api_monitor")
+def bench_discord_api_monitor(root: Path, sizes: FixtureSizes) -> list[BenchmarkResult]:
+    from src.utils import discord_api_monitor
+
+    data_dir = root / "discord_api_monitor"
+    data_dir.mkdir()
+    discord_api_monitor.DATA_DIR = data_dir
+    discord_api_monitor.MONITOR_DATA_FILE = data_dir / "discord_api_monitor.json"
+
+    response = SimpleNamespace(
+        headers={
+            "X-RateLimit-Remaining": "4",
+            "X-RateLimit-Limit": "5",
+            "X-RateLimit-Reset-After": "1.0",
+        }
+    )
+
+    async def original_request(route, **kwargs):
+        return response
+
+    bot = SimpleNamespace(
+        http=SimpleNamespace(request=original_request),
+        event=lambda func: func,
+        latency=0.05,
+    )
+    routes = [
+        SimpleNamespace(path=f"/channels/{n}/messages", method="POST") for n in range(50)
+    ]
+
+    async def run() -> list[float]:
+        monitor = discord_api_monitor.DiscordAPIMonitor(bot)
+        calls = iter(range(10**9))
+
+        async def request():
+            await bot.http.request(routes[next(calls) % len(routes)])
+
+        try:
+            return await time_async_calls(request, iterations(5000, sizes))
+        finally:
+            monitor.stop()
+
+    return [BenchmarkResult.from_samples("discord_api_monitor.request", asyncio.run(run()))]
+
+
+# =============================================================================
+# Running and Comparing
+# =============================================================================
+
+
+def run_benchmarks(
+    sizes: FixtureSizes, only: list[str] | None = None
+) -> tuple[list[BenchmarkResult], dict[str, str]]:
+    """
+    Run the selected benchmarks in a scratch directory.
+
+    Returns:
+        tuple: (results, {benchmark: error} for benchmarks that failed)
+    """
+    results: list[BenchmarkResult] = []
+    errors: dict[str, str] = {}
+
+    with tempfile.TemporaryDirectory(prefix="quranbot-bench-") as temp_dir:
+        root = Path(temp_dir)
+        previous_cwd = os.getcwd()
+        os.chdir(root)  # Relative paths ("data", "audio") resolve in here
+
+        try:
+            # Console logging would drown the report; keep stdout for --json
+            with contextlib.redirect_stdout(io.StringIO()):
+                from src.utils import tree_log
+
+                # Send the global logger's files into the scratch directory too
+                logger = tree_log._global_logger
+                logger.log_dir = root / "logs" / logger._get_log_date()
+                logger.log_dir.mkdir(parents=True)
+
+                for name, func in BENCHMARKS.items():
+                    if only and not any(pattern in name for pattern in only):
+                        continue
+                    random.seed(FIXTURE_SEED)
+                    print(f"⏱️  {name} ...", file=sys.stderr)
+                    try:
+                        results.extend(func(root, sizes))
+                    except Exception as e:
+                        errors[name] = f"{type(e).__name__}: {e}"
+        finally:
+            os.chdir(previous_cwd)
+
+    return results, errors
+
+
+def compare_results(
+    results: list[BenchmarkResult], baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list[dict]:
+    """
+    Compare medians against a baseline report.
+
+    Returns:
+        list[dict]: One entry per benchmark present in both, with the ratio
+        and whether it regressed past the threshold
+    """
+    baseline_results = baseline.get("results", {})
+    comparisons = []
+    for result in results:
+        previous = baseline_results.get(result.name)
+        if not previous:
+            continue
+        before = previous["median_ms"]
+        ratio = result.median_ms / before if before > 0 else 1.0
+        comparisons.append(
+            {
+                "name": result.name,
+                "baseline_ms": before,
+                "current_ms": result.median_ms,
+                "ratio": round(ratio, 3),
+                "regressed": (
+                    ratio > 1 + threshold and result.median_ms >= MIN_COMPARABLE_MS
+                ),
+            }
+        )
+    return comparisons
+
+
+def build_report(
+    results: list[BenchmarkResult],
+    errors: dict[str, str],
+    sizes: FixtureSizes,
+    comparisons: list[dict] | None = None,
+) -> dict:
+    """Machine-readable report of a benchmark run"""
+    return {
+        "version": 1,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fixtures": asdict(sizes),
+        "results": {result.name: asdict(result) for result in results},
+        "errors": errors,
+        "comparison": comparisons or [],
+    }
+
+
+def print_summary(results: list[BenchmarkResult], comparisons: list[dict], errors: dict):
+    """Human-readable table on stderr; stdout is left for --json"""
+    by_name = {comparison["name"]: comparison for comparison in comparisons}
+    print(f"\n{'benchmark':<40} {'median ms':>11} {'p95 ms':>11} {'vs base':>9}", file=sys.stderr)
+    for result in results:
+        comparison = by_name.get(result.name)
+        change = ""
+        if comparison:
+            change = f"{(comparison['ratio'] - 1) * 100:+.0f}%"
+            if comparison["regressed"]:
+                change += " ❌"
+        print(
+            f"{result.name:<40} {result.median_ms:>11.4f} {result.p95_ms:>11.4f} {change:>9}",
+            file=sys.stderr,
+        )
+    for name, error in errors.items():
+        print(f"{name:<40} ❌ {error}", file=sys.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark QuranBot's hot paths")
+    parser.add_argument("--quick", action="store_true", help="Smaller fixtures, fewer runs")
+    parser.add_argument("--only", nargs="+", help="Only run benchmarks matching these names")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline report")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as baseline")
+    parser.add_argument("--output", type=Path, help="Where to write the JSON report")
+    parser.add_argument("--json", action="store_true", help="Also print the report to stdout")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown before failing (0.25 = 25%%)",
+    )
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    sizes = QUICK_SIZES if args.quick else FULL_SIZES
+    results, errors = run_benchmarks(sizes, args.only)
+
+    comparisons = []
+    if args.baseline.exists() and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("fixtures") != asdict(sizes):
+            print("⚠️  Baseline used different fixture sizes; comparison skipped", file=sys.stderr)
+        else:
+            comparisons = compare_results(results, baseline, args.threshold)
+
+    report = build_report(results, errors, sizes, comparisons)
+    output = args.output or RESULTS_DIR / (
+        f"benchmark_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    print_summary(results, comparisons, errors)
+    print(f"\n📄 Report: {output}", file=sys.stderr)
+    if args.save_baseline:
+        print(f"📌 Baseline saved: {args.baseline}", file=sys.stderr)
+    if args.json:
+        print(json.dumps(report, indent=2))
+
+    regressions = [comparison for comparison in comparisons if comparison["regressed"]]
+    if regressions:
+        print(f"❌ {len(regressions)} benchmark(s) regressed", file=sys.stderr)
+    return 1 if regressions or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
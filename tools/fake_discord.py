@@ -0,0 +1,896 @@
+# =============================================================================
+# QuranBot - Fake Discord Backend
+# =============================================================================
+# An offline stand-in for Discord, used to load-test the real bot on a dev
+# box. It plugs into discord.py at its own seams, so the bot's code runs
+# unchanged:
+#
+# - REST: bot.http.request and the interaction webhook adapter are answered
+#   locally with realistic payloads (messages, interaction callbacks, role
+#   edits, command sync) and every call is counted by route
+# - Gateway: events are fed straight into discord.py's gateway parsers,
+#   building real Guild/Member/Message objects and firing the bot's handlers;
+#   presence updates sent by the bot are recorded
+# - Voice: channel.connect() returns a voice client whose player thread reads
+#   audio frames at the real 20ms pace and discards them
+#
+# Lives with the tools, outside the bot package; see tools/load_test.py.
+# =============================================================================
+
+import asyncio
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import itertools
+import json
+import re
+import threading
+import time
+from typing import Any
+
+import discord
+from discord.webhook import async_ as webhook_async
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+# Long enough to pass BotConfig's token validation
+FAKE_TOKEN = "fake-discord-token." + "x" * 60
+
+# Discord voice sends one 20ms Opus frame at a time
+VOICE_FRAME_SECONDS = 0.02
+
+# How many recent REST calls are kept for inspection
+REST_HISTORY_SIZE = 5000
+
+ADMINISTRATOR = str(discord.Permissions.all().value)
+
+_snowflake_counter = itertools.count()
+
+
+def snowflake() -> int:
+    """A unique, time-ordered Discord ID"""
+    return discord.utils.time_snowflake(datetime.now(UTC)) + next(_snowflake_counter) % 4096
+
+
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _route_pattern(template: str) -> re.Pattern:
+    """Regex for a discord.py route template such as /channels/{channel_id}"""
+    return re.compile(
+        "^" + re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(template)) + "$"
+    )
+
+
+@dataclass
+class RestCall:
+    """One request the bot made"""
+
+    timestamp: float
+    method: str
+    path: str  # Route template, e.g. /channels/{channel_id}/messages
+    params: dict[str, str]
+    payload: dict | None
+
+
+@dataclass
+class VoiceSink:
+    """Audio the bot streamed into the fake voice connection"""
+
+    frames: int = 0
+    bytes: int = 0
+    tracks: int = 0
+    connects: int = 0
+    disconnects: int = 0
+
+
+@dataclass
+class FakeGuildLayout:
+    """IDs of the fake guild, normally taken from the bot's configuration"""
+
+    guild_id: int
+    voice_channel_ids: list[int]
+    text_channel_ids: list[int]
+    role_ids: list[int] = field(default_factory=list)
+    member_count: int = 100
+    first_member_id: int = 10_000
+
+
+# =============================================================================
+# REST
+# =============================================================================
+
+
+class FakeRest:
+    """Answers the REST calls the bot makes, recording each one"""
+
+    def __init__(self, backend: "FakeDiscordBackend", latency: float = 0.0):
+        self.backend = backend
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+        self.history: deque[RestCall] = deque(maxlen=REST_HISTORY_SIZE)
+        self.unhandled: Counter[str] = Counter()
+
+        self._routes = [
+            (method, _route_pattern(path), path, handler)
+            for method, path, handler in (
+                ("GET", "/users/@me", self._get_me),
+                ("GET", "/oauth2/applications/@me", self._get_application),
+                ("POST", "/channels/{channel_id}/messages", self._create_message),
+                ("GET", "/channels/{channel_id}/messages", self._channel_history),
+                ("GET", "/channels/{channel_id}/messages/{message_id}", self._get_message),
+                ("PATCH", "/channels/{channel_id}/messages/{message_id}", self._edit_message),
+                ("DELETE", "/channels/{channel_id}/messages/{message_id}", self._delete_message),
+                ("POST", "/interactions/{webhook_id}/{webhook_token}/callback", self._interaction_callback),
+                ("POST", "/webhooks/{webhook_id}/{webhook_token}", self._followup),
+                ("PATCH", "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}", self._edit_followup),
+                ("PATCH", "/webhooks/{webhook_id}/{webhook_token}/messages/@original", self._edit_followup),
+                ("DELETE", "/webhooks/{webhook_id}/{webhook_token}/messages/@original", self._delete_followup),
+                ("PUT", "/guilds/{guild_id}/members/{user_id}/roles/{role_id}", self._add_role),
+                ("DELETE", "/guilds/{guild_id}/members/{user_id}/roles/{role_id}", self._remove_role),
+                ("PUT", "/applications/{application_id}/commands", self._sync_commands),
+                ("PUT", "/applications/{application_id}/guilds/{guild_id}/commands", self._sync_commands),
+            )
+        ]
+
+    async def request(self, route, **kwargs) -> Any:
+        """Drop-in replacement for discord.http.HTTPClient.request"""
+        return await self.handle(route.method, route.path, route.url, self._payload(kwargs))
+
+    async def handle(self, method: str, template: str, url: str, payload: dict | None) -> Any:
+        path = url.split("/api/v10", 1)[-1].split("?", 1)[0]
+        key = f"{method} {template}"
+        self.calls[key] += 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        for route_method, pattern, route_path, handler in self._routes:
+            if route_method != method or route_path != template:
+                continue
+            match = pattern.match(path)
+            params = match.groupdict() if match else {}
+            self.history.append(RestCall(time.time(), method, template, params, payload))
+            return handler(params, payload or {})
+
+        self.history.append(RestCall(time.time(), method, template, {}, payload))
+        self.unhandled[key] += 1
+        return None
+
+    def count(self, method: str | None = None, path_prefix: str = "") -> int:
+        """Calls made, optionally filtered by method and route prefix"""
+        return sum(
+            calls
+            for key, calls in self.calls.items()
+            if (method is None or key.startswith(f"{method} "))
+            and key.split(" ", 1)[1].startswith(path_prefix)
+        )
+
+    @staticmethod
+    def _payload(kwargs: dict) -> dict | None:
+        """The JSON body of a request, including multipart uploads"""
+        if kwargs.get("json") is not None:
+            return kwargs["json"]
+        for part in kwargs.get("form") or ():
+            if part.get("name") == "payload_json":
+                return json.loads(part["value"])
+        return None
+
+    # =========================================================================
+    # Route Handlers
+    # =========================================================================
+
+    def _get_me(self, params, payload):
+        return self.backend.user_payload(self.backend.bot_user_id, "QuranBot", bot=True)
+
+    def _get_application(self, params, payload):
+        return {
+            "id": str(self.backend.application_id),
+            "name": "QuranBot",
+            "description": "",
+            "icon": None,
+            "bot_public": False,
+            "bot_require_code_grant": False,
+            "owner": self.backend.user_payload(self.backend.first_member_id, "owner"),
+            "verify_key": "0" * 64,
+            "flags": 0,
+        }
+
+    def _create_message(self, params, payload):
+        return self.backend.store_message(int(params["channel_id"]), payload)
+
+    def _channel_history(self, params, payload):
+        channel_id = int(params["channel_id"])
+        return [
+            message
+            for message in reversed(self.backend.messages.values())
+            if message["channel_id"] == str(channel_id)
+        ][:50]
+
+    def _get_message(self, params, payload):
+        message = self.backend.messages.get(int(params["message_id"]))
+        if message is None:
+            raise self.backend.not_found("Unknown Message")
+        return message
+
+    def _edit_message(self, params, payload):
+        message = self._get_message(params, payload)
+        message.update({k: v for k, v in payload.items() if k in ("content", "embeds", "components")})
+        message["edited_timestamp"] = _now_iso()
+        return message
+
+    def _delete_message(self, params, payload):
+        self.backend.messages.pop(int(params["message_id"]), None)
+
+    def _interaction_callback(self, params, payload):
+        response_type = payload.get("type", 4)
+        data = payload.get("data") or {}
+        interaction = {
+            "id": params["webhook_id"],
+            "type": 3,
+            "response_message_loading": response_type == 5,
+            "response_message_ephemeral": bool(data.get("flags", 0) & 64),
+        }
+        resource: dict[str, Any] = {"type": response_type}
+
+        interaction_data = self.backend.interactions.get(int(params["webhook_id"]), {})
+        if response_type in (4, 5):
+            message = self.backend.store_message(
+                int(interaction_data.get("channel_id", 0)), data, interaction=True
+            )
+            interaction["response_message_id"] = message["id"]
+            interaction_data["response_message_id"] = int(message["id"])
+            resource["message"] = message
+        elif response_type == 7 and interaction_data.get("message"):
+            message = interaction_data["message"]
+            message.update({k: v for k, v in data.items() if k in ("content", "embeds", "components")})
+            resource["message"] = message
+
+        return {"interaction": interaction, "resource": resource}
+
+    def _followup(self, params, payload):
+        interaction_data = self.backend.interaction_by_token(params["webhook_token"])
+        return self.backend.store_message(
+            int(interaction_data.get("channel_id", 0)), payload, interaction=True
+        )
+
+    def _edit_followup(self, params, payload):
+        message = self._followup_message(params)
+        if message is None:
+            return self._followup(params, payload)
+        message.update({k: v for k, v in payload.items() if k in ("content", "embeds", "components")})
+        message["edited_timestamp"] = _now_iso()
+        return message
+
+    def _delete_followup(self, params, payload):
+        message = self._followup_message(params)
+        if message is not None:
+            self.backend.messages.pop(int(message["id"]), None)
+
+    def _followup_message(self, params) -> dict | None:
+        """The message an interaction webhook route refers to"""
+        message_id = params.get("message_id")
+        if message_id is None:
+            interaction_data = self.backend.interaction_by_token(params["webhook_token"])
+            message_id = interaction_data.get("response_message_id")
+        return self.backend.messages.get(int(message_id)) if message_id else None
+
+    def _add_role(self, params, payload):
+        self.backend.update_member_roles(int(params["user_id"]), add=int(params["role_id"]))
+
+    def _remove_role(self, params, payload):
+        self.backend.update_member_roles(int(params["user_id"]), remove=int(params["role_id"]))
+
+    def _sync_commands(self, params, payload):
+        return [
+            {
+                **command,
+                "id": str(snowflake()),
+                "application_id": str(self.backend.application_id),
+                "version": "1",
+                "default_member_permissions": command.get("default_member_permissions"),
+            }
+            for command in payload or []
+        ]
+
+
+class FakeWebhookAdapter(webhook_async.AsyncWebhookAdapter):
+    """Routes interaction responses and followups to FakeRest"""
+
+    def __init__(self, rest: FakeRest):
+        super().__init__()
+        self.rest = rest
+
+    async def request(self, route, session, *, payload=None, multipart=None, **kwargs):
+        if payload is None and multipart:
+            for part in multipart:
+                if part.get("name") == "payload_json":
+                    payload = json.loads(part["value"])
+        return await self.rest.handle(route.method, route.path, route.url, payload)
+
+
+# =============================================================================
+# Gateway
+# =============================================================================
+
+
+class FakeGatewaySocket:
+    """Stands in for bot.ws, recording what the bot sends to the gateway"""
+
+    def __init__(self, latency: float = 0.05):
+        self.latency = latency
+        self.open = True
+        self.presence_updates = 0
+        self.last_presence: tuple[Any, str] | None = None
+        self.voice_state_requests = 0
+
+    async def change_presence(self, *, activity=None, status=None, since=0.0):
+        self.presence_updates += 1
+        self.last_presence = (activity, status)
+
+    async def voice_state(self, guild_id, channel_id, self_mute=False, self_deaf=False):
+        self.voice_state_requests += 1
+
+    async def request_chunks(self, guild_id, query=None, *, limit, user_ids=None, presences=False, nonce=None):
+        pass
+
+    def is_ratelimited(self) -> bool:
+        return False
+
+    async def close(self, code: int = 1000):
+        self.open = False
+
+
+# =============================================================================
+# Voice
+# =============================================================================
+
+
+class FakeVoiceClient(discord.VoiceProtocol):
+    """
+    A voice connection that plays into a VoiceSink.
+
+    Like discord.py's AudioPlayer, a thread reads one frame from the source
+    every 20ms (divided by the backend's voice_speed) and calls `after` when
+    the source runs dry or playback is stopped.
+    """
+
+    def __init__(self, client, channel, backend: "FakeDiscordBackend"):
+        super().__init__(client, channel)
+        self.backend = backend
+        self.guild = channel.guild
+        self.source: discord.AudioSource | None = None
+        self._connected = True
+        self._player: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._resumed = threading.Event()
+        self._resumed.set()
+
+    # discord.py calls these for gateway voice events
+    async def on_voice_state_update(self, data):
+        pass
+
+    async def on_voice_server_update(self, data):
+        pass
+
+    @property
+    def latency(self) -> float:
+        return 0.0
+
+    average_latency = latency
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    def is_playing(self) -> bool:
+        return self._player is not None and self._player.is_alive() and self._resumed.is_set()
+
+    def is_paused(self) -> bool:
+        return self._player is not None and self._player.is_alive() and not self._resumed.is_set()
+
+    def play(self, source, *, after=None, **kwargs) -> None:
+        if not self._connected:
+            raise discord.ClientException("Not connected to voice.")
+        if self.is_playing() or self.is_paused():
+            raise discord.ClientException("Already playing audio.")
+
+        self.source = source
+        self._stop.clear()
+        self._resumed.set()
+        self.backend.voice.tracks += 1
+        self._player = threading.Thread(target=self._play, args=(source, after), daemon=True)
+        self._player.start()
+
+    def pause(self) -> None:
+        self._resumed.clear()
+
+    def resume(self) -> None:
+        self._resumed.set()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._resumed.set()
+
+    async def move_to(self, channel, *, timeout=30.0) -> None:
+        self.channel = channel
+        self.backend.voice_state(self.backend.bot_user_id, channel.id)
+
+    async def disconnect(self, *, force: bool = False) -> None:
+        if not self._connected:
+            return
+        self.stop()
+        self._connected = False
+        self.backend.voice.disconnects += 1
+        self.backend.voice_state(self.backend.bot_user_id, None)
+        self.cleanup()
+
+    def _play(self, source, after) -> None:
+        error = None
+        interval = VOICE_FRAME_SECONDS / self.backend.voice_speed
+        try:
+            while not self._stop.is_set():
+                if not self._resumed.wait(timeout=0.1):
+                    continue
+                data = source.read()
+                if not data:
+                    break
+                self.backend.voice.frames += 1
+                self.backend.voice.bytes += len(data)
+                time.sleep(interval)
+        except Exception as e:
+            error = e
+        finally:
+            try:
+                source.cleanup()
+            except Exception:
+                pass
+        if after is not None:
+            after(error)
+
+
+# =============================================================================
+# Backend
+# =============================================================================
+
+
+class FakeDiscordBackend:
+    """
+    A local Discord for one guild.
+
+    Typical use:
+
+        backend = FakeDiscordBackend(layout)
+        await backend.connect(bot)        # login, READY, GUILD_CREATE
+        backend.voice_state(user_id, voice_channel_id)
+        backend.send_message(channel_id, user_id, "hello", mention_bot=True)
+        backend.press_button(message_id, "quiz_choice_A", user_id)
+        print(backend.get_stats())
+        backend.uninstall()
+    """
+
+    def __init__(
+        self,
+        layout: FakeGuildLayout,
+        rest_latency: float = 0.0,
+        voice_speed: float = 1.0,
+    ):
+        self.layout = layout
+        self.guild_id = layout.guild_id
+        self.bot_user_id = snowflake()
+        self.application_id = self.bot_user_id
+        self.bot_role_id = snowflake()
+        self.first_member_id = layout.first_member_id
+        self.voice_speed = voice_speed
+
+        self.rest = FakeRest(self, latency=rest_latency)
+        self.gateway = FakeGatewaySocket()
+        self.voice = VoiceSink()
+
+        self.messages: dict[int, dict] = {}
+        self.interactions: dict[int, dict] = {}
+        self.member_roles: dict[int, set[int]] = {}
+        self.gateway_events: Counter[str] = Counter()
+
+        self.bot = None
+        self._original_connect = None
+        self._original_request = None
+        self._webhook_token = None
+
+    # =========================================================================
+    # Installing
+    # =========================================================================
+
+    def install(self, bot) -> None:
+        """Point a not-yet-started bot at this backend"""
+        self.bot = bot
+        self._original_request = bot.http.request
+        bot.http.request = self.rest.request
+        bot.ws = self.gateway
+
+        self._webhook_token = webhook_async.async_context.set(FakeWebhookAdapter(self.rest))
+
+        backend = self
+        self._original_connect = discord.abc.Connectable.connect
+
+        async def connect(channel, *, timeout=30.0, reconnect=True, cls=None, self_deaf=False, self_mute=False):
+            state = channel._state
+            if state._get_voice_client(channel.guild.id):
+                raise discord.ClientException("Already connected to a voice channel.")
+            client = FakeVoiceClient(state._get_client(), channel, backend)
+            state._add_voice_client(channel.guild.id, client)
+            backend.voice.connects += 1
+            backend.voice_state(backend.bot_user_id, channel.id)
+            return client
+
+        discord.abc.Connectable.connect = connect
+
+    def uninstall(self) -> None:
+        """Restore discord.py's voice connect and webhook adapter"""
+        if self._original_connect is not None:
+            discord.abc.Connectable.connect = self._original_connect
+            self._original_connect = None
+        if self._webhook_token is not None:
+            try:
+                webhook_async.async_context.reset(self._webhook_token)
+            except ValueError:
+                pass  # Reset from a different context; the set value just lingers there
+            self._webhook_token = None
+
+    async def connect(self, bot, ready_timeout: float = 10.0) -> None:
+        """Log the bot in and deliver READY plus the guild, as bot.start() would"""
+        self.install(bot)
+        bot._connection.guild_ready_timeout = 0.05
+        await bot.login(FAKE_TOKEN)
+
+        self.emit(
+            "READY",
+            {
+                "v": 10,
+                "user": self.user_payload(self.bot_user_id, "QuranBot", bot=True),
+                "guilds": [{"id": str(self.guild_id), "unavailable": True}],
+                "session_id": "fake-session",
+                "resume_gateway_url": "wss://gateway.invalid",
+                "application": {"id": str(self.application_id), "flags": 0},
+            },
+        )
+        self.emit("GUILD_CREATE", self.guild_payload())
+        await asyncio.wait_for(bot.wait_until_ready(), timeout=ready_timeout)
+
+    # =========================================================================
+    # Gateway Traffic
+    # =========================================================================
+
+    def emit(self, event: str, data: dict) -> None:
+        """Deliver a gateway dispatch event to the bot"""
+        self.gateway_events[event] += 1
+        self.bot._connection.parsers[event](data)
+
+    def voice_state(self, user_id: int, channel_id: int | None) -> None:
+        """A member joins, moves or (channel_id=None) leaves voice"""
+        self.emit(
+            "VOICE_STATE_UPDATE",
+            {
+                "guild_id": str(self.guild_id),
+                "channel_id": str(channel_id) if channel_id else None,
+                "user_id": str(user_id),
+                "member": self.member_payload(user_id),
+                "session_id": f"fake-voice-{user_id}",
+                "deaf": False,
+                "mute": False,
+                "self_deaf": False,
+                "self_mute": False,
+                "self_video": False,
+                "suppress": False,
+                "request_to_speak_timestamp": None,
+            },
+        )
+
+    def send_message(
+        self, channel_id: int, user_id: int, content: str, mention_bot: bool = False
+    ) -> dict:
+        """A member posts a message"""
+        mentions = []
+        if mention_bot:
+            content = f"<@{self.bot_user_id}> {content}"
+            mentions.append(self.user_payload(self.bot_user_id, "QuranBot", bot=True))
+
+        message = self._message_payload(
+            channel_id, self.user_payload(user_id, self.member_name(user_id)), content
+        )
+        message["mentions"] = mentions
+        message["member"] = {k: v for k, v in self.member_payload(user_id).items() if k != "user"}
+        self.emit("MESSAGE_CREATE", message)
+        return message
+
+    def add_reaction(self, message_id: int, user_id: int, emoji: str) -> None:
+        """A member reacts to a message"""
+        message = self.messages.get(message_id)
+        channel_id = int(message["channel_id"]) if message else self.layout.text_channel_ids[0]
+        self.emit(
+            "MESSAGE_REACTION_ADD",
+            {
+                "user_id": str(user_id),
+                "channel_id": str(channel_id),
+                "message_id": str(message_id),
+                "guild_id": str(self.guild_id),
+                "member": self.member_payload(user_id),
+                "emoji": {"id": None, "name": emoji},
+                "burst": False,
+                "type": 0,
+            },
+        )
+
+    def press_button(self, message_id: int, custom_id: str, user_id: int) -> int:
+        """A member clicks a button on a message the bot sent"""
+        message = self.messages[message_id]
+        return self._interaction(
+            int(message["channel_id"]),
+            user_id,
+            interaction_type=3,
+            data={"custom_id": custom_id, "component_type": 2},
+            message=message,
+        )
+
+    def run_command(
+        self, name: str, user_id: int, channel_id: int | None = None, options: list | None = None
+    ) -> int:
+        """A member runs a slash command"""
+        return self._interaction(
+            channel_id or self.layout.text_channel_ids[0],
+            user_id,
+            interaction_type=2,
+            data={"id": str(snowflake()), "name": name, "type": 1, "options": options or []},
+        )
+
+    # =========================================================================
+    # State Used by REST Handlers
+    # =========================================================================
+
+    def store_message(self, channel_id: int, payload: dict | None, interaction: bool = False) -> dict:
+        """Record a message the bot sent and return its payload"""
+        payload = payload or {}
+        message = self._message_payload(
+            channel_id,
+            self.user_payload(self.bot_user_id, "QuranBot", bot=True),
+            payload.get("content") or "",
+        )
+        message["embeds"] = payload.get("embeds") or []
+        message["components"] = payload.get("components") or []
+        message["flags"] = payload.get("flags", 0)
+        if interaction:
+            message["webhook_id"] = str(self.application_id)
+        self.messages[int(message["id"])] = message
+        return message
+
+    def interaction_by_token(self, token: str) -> dict:
+        for data in reversed(self.interactions.values()):
+            if data["token"] == token:
+                return data
+        return {}
+
+    def update_member_roles(self, user_id: int, add: int | None = None, remove: int | None = None) -> None:
+        """Apply a role edit and echo it back as GUILD_MEMBER_UPDATE, like Discord"""
+        roles = self.member_roles.setdefault(user_id, set())
+        if add is not None:
+            roles.add(add)
+        if remove is not None:
+            roles.discard(remove)
+        member = self.member_payload(user_id)
+        self.emit(
+            "GUILD_MEMBER_UPDATE",
+            {**member, "guild_id": str(self.guild_id)},
+        )
+
+    def messages_in(self, channel_id: int) -> list[dict]:
+        return [m for m in self.messages.values() if m["channel_id"] == str(channel_id)]
+
+    def find_message(self, custom_id_prefix: str) -> dict | None:
+        """The newest bot message with a component whose custom_id starts with the prefix"""
+        for message in reversed(self.messages.values()):
+            for row in message.get("components", []):
+                for component in row.get("components", []):
+                    if str(component.get("custom_id", "")).startswith(custom_id_prefix):
+                        return message
+        return None
+
+    def not_found(self, text: str) -> discord.NotFound:
+        response = type("Response", (), {"status": 404, "reason": "Not Found"})()
+        return discord.NotFound(response, {"code": 10008, "message": text})
+
+    # =========================================================================
+    # Stats
+    # =========================================================================
+
+    def get_stats(self) -> dict:
+        """REST, gateway and voice counters"""
+        return {
+            "rest_calls": sum(self.rest.calls.values()),
+            "rest_by_route": dict(self.rest.calls.most_common()),
+            "rest_unhandled": dict(self.rest.unhandled),
+            "gateway_events": dict(self.gateway_events),
+            "presence_updates": self.gateway.presence_updates,
+            "messages_sent": len(self.messages),
+            "voice": {
+                "connects": self.voice.connects,
+                "disconnects": self.voice.disconnects,
+                "tracks": self.voice.tracks,
+                "frames": self.voice.frames,
+                "bytes": self.voice.bytes,
+            },
+        }
+
+    # =========================================================================
+    # Payloads
+    # =========================================================================
+
+    def member_ids(self) -> list[int]:
+        return list(range(self.first_member_id, self.first_member_id + self.layout.member_count))
+
+    def member_name(self, user_id: int) -> str:
+        return f"listener{user_id - self.first_member_id}"
+
+    @staticmethod
+    def user_payload(user_id: int, name: str, bot: bool = False) -> dict:
+        return {
+            "id": str(user_id),
+            "username": name,
+            "discriminator": "0",
+            "global_name": name,
+            "avatar": None,
+            "bot": bot,
+        }
+
+    def member_payload(self, user_id: int) -> dict:
+        is_bot = user_id == self.bot_user_id
+        roles = {self.bot_role_id} if is_bot else self.member_roles.get(user_id, set())
+        return {
+            "user": self.user_payload(
+                user_id, "QuranBot" if is_bot else self.member_name(user_id), bot=is_bot
+            ),
+            "roles": [str(role_id) for role_id in roles],
+            "joined_at": "2025-01-01T00:00:00+00:00",
+            "nick": None,
+            "deaf": False,
+            "mute": False,
+            "flags": 0,
+        }
+
+    def guild_payload(self) -> dict:
+        channels = []
+        for position, channel_id in enumerate(self.layout.text_channel_ids):
+            channels.append(
+                {
+                    "id": str(channel_id),
+                    "type": 0,
+                    "name": f"text-{position}",
+                    "position": position,
+                    "permission_overwrites": [],
+                    "nsfw": False,
+                    "parent_id": None,
+                    "topic": None,
+                    "rate_limit_per_user": 0,
+                }
+            )
+        for position, channel_id in enumerate(self.layout.voice_channel_ids):
+            channels.append(
+                {
+                    "id": str(channel_id),
+                    "type": 2,
+                    "name": f"voice-{position}",
+                    "position": position,
+                    "permission_overwrites": [],
+                    "bitrate": 64000,
+                    "user_limit": 0,
+                    "parent_id": None,
+                    "rtc_region": None,
+                }
+            )
+
+        roles = [self._role_payload(self.guild_id, "@everyone", 0, "0")]
+        roles.append(self._role_payload(self.bot_role_id, "QuranBot", 1, ADMINISTRATOR))
+        for position, role_id in enumerate(self.layout.role_ids, start=2):
+            roles.append(self._role_payload(role_id, f"role-{position}", position, "0"))
+
+        return {
+            "id": str(self.guild_id),
+            "name": "Fake Quran Server",
+            "icon": None,
+            "owner_id": str(self.first_member_id),
+            "roles": roles,
+            "emojis": [],
+            "stickers": [],
+            "features": [],
+            "member_count": self.layout.member_count + 1,
+            "members": [self.member_payload(self.bot_user_id)]
+            + [self.member_payload(user_id) for user_id in self.member_ids()],
+            "channels": channels,
+            "voice_states": [],
+            "presences": [],
+            "threads": [],
+            "stage_instances": [],
+            "guild_scheduled_events": [],
+            "soundboard_sounds": [],
+            "large": False,
+            "unavailable": False,
+            "verification_level": 0,
+            "explicit_content_filter": 0,
+            "default_message_notifications": 0,
+            "mfa_level": 0,
+            "afk_timeout": 300,
+            "system_channel_flags": 0,
+            "premium_tier": 0,
+            "preferred_locale": "en-US",
+            "nsfw_level": 0,
+            "joined_at": "2025-01-01T00:00:00+00:00",
+        }
+
+    @staticmethod
+    def _role_payload(role_id: int, name: str, position: int, permissions: str) -> dict:
+        return {
+            "id": str(role_id),
+            "name": name,
+            "color": 0,
+            "hoist": False,
+            "position": position,
+            "permissions": permissions,
+            "managed": False,
+            "mentionable": False,
+            "flags": 0,
+        }
+
+    def _message_payload(self, channel_id: int, author: dict, content: str) -> dict:
+        return {
+            "id": str(snowflake()),
+            "channel_id": str(channel_id),
+            "guild_id": str(self.guild_id),
+            "author": author,
+            "content": content,
+            "timestamp": _now_iso(),
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "components": [],
+            "pinned": False,
+            "type": 0,
+            "flags": 0,
+        }
+
+    def _interaction(
+        self,
+        channel_id: int,
+        user_id: int,
+        interaction_type: int,
+        data: dict,
+        message: dict | None = None,
+    ) -> int:
+        interaction_id = snowflake()
+        payload = {
+            "id": str(interaction_id),
+            "application_id": str(self.application_id),
+            "type": interaction_type,
+            "token": f"fake-interaction-{interaction_id}",
+            "version": 1,
+            "guild_id": str(self.guild_id),
+            "channel_id": str(channel_id),
+            "member": {**self.member_payload(user_id), "permissions": "0"},
+            "data": data,
+            "locale": "en-US",
+            "guild_locale": "en-US",
+            "app_permissions": ADMINISTRATOR,
+            "entitlements": [],
+            "authorizing_integration_owners": {"0": str(self.guild_id)},
+            "context": 0,
+            "attachment_size_limit": 8 * 1024 * 1024,
+        }
+        if message is not None:
+            payload["message"] = message
+        self.interactions[interaction_id] = payload
+        self.emit("INTERACTION_CREATE", payload)
+        return interaction_id
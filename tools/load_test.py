@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Offline Load Test
+# =============================================================================
+# Runs the real ModernizedQuranBot against the fake Discord backend in
+# tools/fake_discord.py and drives it with synthetic traffic:
+#
+# - voice: a wave of members joining (and later leaving) the Quran channel
+# - quiz: many members answering the current quiz question at once
+# - mentions: a storm of messages mentioning the bot
+#
+# For every scenario it reports event loop lag, REST calls by route,
+# presence updates and memory, and writes a JSON report to
+# performance_data/load_test_<timestamp>.json.
+#
+# Nothing leaves the machine: Discord is the fake backend, webhook logging is
+# disabled and OpenAI requests are pointed at a closed local port. Other
+# third-party lookups (e.g. prayer times) simply fail. Like tools/benchmark.py,
+# the bot runs in a scratch directory: its data, backups and logs go there,
+# and only the audio folder is shared (read-only) with the working tree.
+#
+# Usage:
+#   python tools/load_test.py                       # All scenarios
+#   python tools/load_test.py --scenarios voice     # Just the voice wave
+#   python tools/load_test.py --voice-joins 1000 --rest-latency 0.05
+# =============================================================================
+
+import argparse
+import asyncio
+from collections import Counter
+from datetime import UTC, datetime
+import importlib
+import inspect
+import json
+import os
+from pathlib import Path
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from dotenv import dotenv_values
+import psutil
+
+# Add project root to path for imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.fake_discord import FAKE_TOKEN, FakeDiscordBackend, FakeGuildLayout
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+RESULTS_DIR = project_root / "performance_data"
+
+# IDs the bot is configured with for the run, overriding config/.env
+OFFLINE_ENVIRONMENT = {
+    "GUILD_ID": "900000000000000001",
+    "TARGET_CHANNEL_ID": "900000000000000010",
+    "PANEL_CHANNEL_ID": "900000000000000011",
+    "DAILY_VERSE_CHANNEL_ID": "900000000000000012",
+    "LOGS_CHANNEL_ID": "900000000000000013",
+    "PANEL_ACCESS_ROLE_ID": "900000000000000020",
+    "ADMIN_USER_ID": "10000",  # The first fake member
+    "GUILD_SESSIONS": "",
+    "LISTENER_CHANNEL_IDS": "",
+}
+
+# Working tree directories the bot writes to, redirected into the scratch dir
+SANDBOXED_DIRS = ("data", "backup", "logs")
+
+# Modules that build those paths from __file__; patched before the bot is
+# imported, so modules importing their constants see the scratch paths
+PATH_MODULES = (
+    "src.core.rate_limit_engine",
+    "src.utils.backup_manager",
+    "src.utils.command_sync",
+    "src.utils.discord_api_monitor",
+    "src.utils.guild_sessions",
+    "src.utils.listening_stats",
+    "src.utils.reaction_router",
+    "src.utils.shuffle_playlist",
+    "src.utils.snapshot_store",
+    "src.utils.user_cache",
+)
+
+# How often the lag monitor checks in on the event loop
+LAG_SAMPLE_INTERVAL = 0.05
+
+SCENARIOS = ("voice", "quiz", "mentions")
+
+
+def configure_offline_environment(root: Path) -> None:
+    """Point the bot's configuration at the fake backend, before it loads"""
+    # Forced, so config/.env can't point the run at a real guild
+    os.environ.update(OFFLINE_ENVIRONMENT)
+
+    # The real recordings, reached through the scratch directory so the
+    # reciter catalogue is written next to the link rather than the tree
+    audio_folder = Path(
+        os.environ.get("AUDIO_FOLDER")
+        or dotenv_values(project_root / "config" / ".env").get("AUDIO_FOLDER")
+        or "audio"
+    )
+    if not audio_folder.is_absolute():
+        audio_folder = project_root / audio_folder
+    (root / "audio").symlink_to(audio_folder, target_is_directory=True)
+    os.environ["AUDIO_FOLDER"] = "audio"
+
+    os.environ["DISCORD_TOKEN"] = FAKE_TOKEN
+    os.environ["USE_WEBHOOK_LOGGING"] = "false"
+    os.environ["OPENAI_API_KEY"] = "sk-offline-load-test-" + "0" * 40
+    os.environ["OPENAI_BASE_URL"] = "http://127.0.0.1:9/v1"
+
+
+def _sandboxed(value, root: Path):
+    """`value` moved into `root` if it is a path under a sandboxed directory"""
+    if not isinstance(value, Path):
+        return value
+    try:
+        relative = value.relative_to(project_root)
+    except ValueError:
+        return value
+    if relative.parts and relative.parts[0] in SANDBOXED_DIRS:
+        return root / relative
+    return value
+
+
+def _sandbox_defaults(func, root: Path) -> None:
+    if func.__defaults__:
+        func.__defaults__ = tuple(_sandboxed(value, root) for value in func.__defaults__)
+    if func.__kwdefaults__:
+        func.__kwdefaults__ = {
+            key: _sandboxed(value, root) for key, value in func.__kwdefaults__.items()
+        }
+
+
+def sandbox_module_paths(root: Path) -> None:
+    """
+    Redirect the bot's data, backup and log paths into `root`.
+
+    Relative paths ("data/...") already resolve there after os.chdir(); this
+    rebinds the absolute ones built from __file__, both module constants and
+    the argument defaults that captured them.
+    """
+    for name in PATH_MODULES:
+        importlib.import_module(name)
+
+    for name, module in list(sys.modules.items()):
+        if not name.startswith("src."):
+            continue
+        for attr, value in list(vars(module).items()):
+            moved = _sandboxed(value, root)
+            if moved is not value:
+                setattr(module, attr, moved)
+            elif inspect.isfunction(value):
+                _sandbox_defaults(value, root)
+            elif inspect.isclass(value) and value.__module__ == name:
+                for member in vars(value).values():
+                    if inspect.isfunction(member):
+                        _sandbox_defaults(member, root)
+
+    from src.utils import tree_log
+
+    logger = tree_log._global_logger
+    logger.log_dir = root / "logs" / logger._get_log_date()
+    logger.log_dir.mkdir(parents=True, exist_ok=True)
+
+
+def build_layout(members: int) -> FakeGuildLayout:
+    """The fake guild, with the channels and role the bot is configured for"""
+    text_channels = [
+        int(os.environ[key])
+        for key in ("PANEL_CHANNEL_ID", "DAILY_VERSE_CHANNEL_ID", "LOGS_CHANNEL_ID")
+        if os.environ.get(key)
+    ]
+    return FakeGuildLayout(
+        guild_id=int(os.environ["GUILD_ID"]),
+        voice_channel_ids=[int(os.environ["TARGET_CHANNEL_ID"])],
+        text_channel_ids=list(dict.fromkeys(text_channels)),
+        role_ids=[int(os.environ["PANEL_ACCESS_ROLE_ID"])],
+        member_count=members,
+    )
+
+
+# =============================================================================
+# Measurements
+# =============================================================================
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes a sleeping task"""
+
+    def __init__(self, interval: float = LAG_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def mark(self) -> int:
+        return len(self.samples)
+
+    def summarize(self, since: int = 0) -> dict:
+        samples = sorted(self.samples[since:]) or [0.0]
+        return {
+            "samples": len(samples),
+            "mean_ms": round(statistics.fmean(samples) * 1000, 2),
+            "p95_ms": round(samples[int((len(samples) - 1) * 0.95)] * 1000, 2),
+            "max_ms": round(samples[-1] * 1000, 2),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - started - self.interval))
+
+
+def memory_snapshot() -> dict:
+    rss = psutil.Process().memory_info().rss
+    current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+    return {
+        "rss_mb": round(rss / 1024 / 1024, 1),
+        "python_current_mb": round(current / 1024 / 1024, 1),
+        "python_peak_mb": round(peak / 1024 / 1024, 1),
+    }
+
+
+async def paced(count: int, seconds: float, action) -> None:
+    """Call action(i) `count` times spread evenly over `seconds`"""
+    started = time.perf_counter()
+    for index in range(count):
+        action(index)
+        delay = started + seconds * (index + 1) / count - time.perf_counter()
+        # Yield even when behind schedule so handlers get to run
+        await asyncio.sleep(max(0.0, delay))
+
+
+# =============================================================================
+# Scenarios
+# =============================================================================
+
+
+async def scenario_voice(backend: FakeDiscordBackend, bot, args) -> dict:
+    """Members join the Quran channel, stay a moment, then leave"""
+    channel_id = backend.layout.voice_channel_ids[0]
+    members = backend.member_ids()[: args.voice_joins]
+    await paced(len(members), args.voice_seconds, lambda i: backend.voice_state(members[i], channel_id))
+    await asyncio.sleep(args.settle)
+    await paced(len(members), args.voice_seconds, lambda i: backend.voice_state(members[i], None))
+    return {"joins": len(members), "leaves": len(members)}
+
+
+async def scenario_quiz(backend: FakeDiscordBackend, bot, args) -> dict:
+    """Members answer the current quiz question"""
+    message = backend.find_message("quiz_choice_")
+    if message is None:
+        from src.utils import quiz_manager as quiz_module
+
+        if quiz_module.quiz_manager is None:
+            return {"skipped": "quiz system not initialized"}
+        quiz_module.quiz_manager.last_sent_time = None
+        channel_id = backend.layout.text_channel_ids[0]
+        await quiz_module.check_and_send_scheduled_question(bot, channel_id)
+        message = backend.find_message("quiz_choice_")
+        if message is None:
+            return {"skipped": "bot did not post a quiz question"}
+
+    message_id = int(message["id"])
+    members = backend.member_ids()[: args.quiz_answers]
+    letters = [
+        component["custom_id"]
+        for row in message["components"]
+        for component in row["components"]
+        if component.get("custom_id", "").startswith("quiz_choice_")
+    ]
+    rng = random.Random(0)
+    await paced(
+        len(members),
+        args.quiz_seconds,
+        lambda i: backend.press_button(message_id, rng.choice(letters), members[i]),
+    )
+    return {"answers": len(members), "message_id": message_id}
+
+
+async def scenario_mentions(backend: FakeDiscordBackend, bot, args) -> dict:
+    """A burst of messages mentioning the bot from a handful of members"""
+    channel_id = backend.layout.text_channel_ids[0]
+    members = backend.member_ids()[: args.mention_users]
+    questions = [
+        "What is the meaning of Surah Al-Fatiha?",
+        "When is the next prayer?",
+        "Which reciter is playing?",
+        "Tell me about Ayat al-Kursi",
+    ]
+    await paced(
+        args.mentions,
+        args.mention_seconds,
+        lambda i: backend.send_message(
+            channel_id, members[i % len(members)], questions[i % len(questions)], mention_bot=True
+        ),
+    )
+    return {"messages": args.mentions, "users": len(members)}
+
+
+SCENARIO_FUNCTIONS = {
+    "voice": scenario_voice,
+    "quiz": scenario_quiz,
+    "mentions": scenario_mentions,
+}
+
+
+async def run_scenario(name, backend, bot, lag: LoopLagMonitor, args) -> dict:
+    """Run one scenario and measure what it cost"""
+    rest_before = Counter(backend.rest.calls)
+    presence_before = backend.gateway.presence_updates
+    lag_mark = lag.mark()
+    memory_before = memory_snapshot()
+    started = time.perf_counter()
+
+    try:
+        details = await SCENARIO_FUNCTIONS[name](backend, bot, args)
+    except Exception as e:
+        details = {"error": f"{type(e).__name__}: {e}"}
+    # Let debounced work (role edits, presence, saves) catch up
+    await asyncio.sleep(args.settle)
+
+    rest_delta = Counter(backend.rest.calls)
+    rest_delta.subtract(rest_before)
+    rest_by_route = {route: calls for route, calls in rest_delta.most_common() if calls}
+
+    return {
+        "scenario": name,
+        "duration_seconds": round(time.perf_counter() - started, 2),
+        "details": details,
+        "loop_lag": lag.summarize(lag_mark),
+        "rest_calls": sum(rest_by_route.values()),
+        "rest_by_route": rest_by_route,
+        "presence_updates": backend.gateway.presence_updates - presence_before,
+        "memory_before": memory_before,
+        "memory_after": memory_snapshot(),
+    }
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+
+async def run_load_test(args) -> dict:
+    with tempfile.TemporaryDirectory(prefix="quranbot-load-") as temp_dir:
+        root = Path(temp_dir)
+        previous_cwd = os.getcwd()
+        os.chdir(root)  # Relative paths ("data", "backup", "logs") resolve in here
+
+        try:
+            configure_offline_environment(root)
+            sandbox_module_paths(root)
+
+            from main import ModernizedQuranBot
+
+            return await _run_bot(ModernizedQuranBot, args)
+        finally:
+            os.chdir(previous_cwd)
+
+
+async def _run_bot(bot_class, args) -> dict:
+    quran_bot = bot_class()
+    if not await quran_bot.initialize():
+        raise RuntimeError("ModernizedQuranBot failed to initialize")
+    quran_bot.is_running = True
+
+    backend = FakeDiscordBackend(
+        build_layout(args.members),
+        rest_latency=args.rest_latency,
+        voice_speed=args.voice_speed,
+    )
+    lag = LoopLagMonitor()
+    lag.start()
+    results = []
+
+    try:
+        connect_started = time.perf_counter()
+        await backend.connect(quran_bot.bot)
+        await asyncio.sleep(args.startup_settle)
+        startup = {
+            "ready_seconds": round(time.perf_counter() - connect_started, 2),
+            "loop_lag": lag.summarize(),
+            "rest_calls": sum(backend.rest.calls.values()),
+            "memory": memory_snapshot(),
+        }
+
+        for name in args.scenarios:
+            print(f"🚦 {name} ...", file=sys.stderr)
+            results.append(await run_scenario(name, backend, quran_bot.bot, lag, args))
+    finally:
+        await lag.stop()
+        try:
+            await quran_bot.shutdown()
+        finally:
+            backend.uninstall()
+
+    return {
+        "version": 1,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "settings": {
+            key: value for key, value in vars(args).items() if key not in ("output", "json")
+        },
+        "startup": startup,
+        "scenarios": results,
+        "backend": backend.get_stats(),
+        "loop_lag": lag.summarize(),
+    }
+
+
+def print_summary(report: dict) -> None:
+    """Human-readable table on stderr; stdout is left for --json"""
+    print(
+        f"\n{'scenario':<12} {'seconds':>8} {'REST':>7} {'presence':>9} "
+        f"{'lag p95':>9} {'lag max':>9} {'RSS MB':>8}",
+        file=sys.stderr,
+    )
+    for result in report["scenarios"]:
+        print(
+            f"{result['scenario']:<12} {result['duration_seconds']:>8} "
+            f"{result['rest_calls']:>7} {result['presence_updates']:>9} "
+            f"{result['loop_lag']['p95_ms']:>8}ms {result['loop_lag']['max_ms']:>8}ms "
+            f"{result['memory_after']['rss_mb']:>8}",
+            file=sys.stderr,
+        )
+        for key in ("skipped", "error"):
+            if key in result["details"]:
+                print(f"{'':<12} ⚠️  {result['details'][key]}", file=sys.stderr)
+    voice = report["backend"]["voice"]
+    print(
+        f"\n🎧 Voice: {voice['connects']} connects, {voice['tracks']} tracks, "
+        f"{voice['frames']} frames streamed",
+        file=sys.stderr,
+    )
+    if report["backend"]["rest_unhandled"]:
+        print(f"⚠️  Unhandled REST routes: {report['backend']['rest_unhandled']}", file=sys.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load-test QuranBot against a fake Discord")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--members", type=int, default=1000, help="Members in the fake guild")
+    parser.add_argument("--voice-joins", type=int, default=500)
+    parser.add_argument("--voice-seconds", type=float, default=10.0)
+    parser.add_argument("--quiz-answers", type=int, default=200)
+    parser.add_argument("--quiz-seconds", type=float, default=10.0)
+    parser.add_argument("--mentions", type=int, default=100)
+    parser.add_argument("--mention-users", type=int, default=20)
+    parser.add_argument("--mention-seconds", type=float, default=5.0)
+    parser.add_argument("--rest-latency", type=float, default=0.0, help="Seconds per fake REST call")
+    parser.add_argument("--voice-speed", type=float, default=1.0, help="Audio playback speed factor")
+    parser.add_argument("--settle", type=float, default=5.0, help="Seconds to wait after each scenario")
+    parser.add_argument("--startup-settle", type=float, default=10.0)
+    parser.add_argument("--tracemalloc", action="store_true", help="Also track Python allocations")
+    parser.add_argument("--output", type=Path, help="Where to write the JSON report")
+    parser.add_argument("--json", action="store_true", help="Also print the report to stdout")
+    args = parser.parse_args()
+
+    needed = max(args.voice_joins, args.quiz_answers, args.mention_users)
+    if args.members < needed:
+        parser.error(f"--members must be at least {needed}")
+
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    report = asyncio.run(run_load_test(args))
+
+    output = args.output or RESULTS_DIR / (
+        f"load_test_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, default=str)
+
+    print_summary(report)
+    print(f"\n📄 Report: {output}", file=sys.stderr)
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    return 1 if any("error" in result["details"] for result in report["scenarios"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())